@@ -20,6 +20,7 @@ import math
 import os
 
 from typing import Generator
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
@@ -36,11 +37,20 @@ class BaseConfig:
     r"""Configuration for text-generation model.
 
     Attributes:
+        accumulation_steps:
+            Number of mini-batches whose gradients are accumulated before each
+            optimizer step. Must be bigger than or equal to `1`. Effective
+            batch size is `batch_size * accumulation_steps`.
+        adaptive_softmax_cutoffs:
+            Cutoffs of adaptive softmax output layer. Each cutoff must be
+            bigger than or equal to `1` and cutoffs must be strictly
+            increasing. Use empty tuple to predict with embedding matrix (full
+            softmax) instead.
         batch_size:
             Training batch size. Must be bigger than or equal to `1`.
         checkpoint_step:
-            Checkpoint interval based on number of mini-batch. Must be bigger
-            than or equal to `1`.
+            Checkpoint interval based on number of optimizer steps. Must be
+            bigger than or equal to `1`.
         d_emb:
             Embedding dimension. Must be bigger than or equal to `1`.
         d_hid:
@@ -53,6 +63,14 @@ class BaseConfig:
             Number of training epochs. Must be bigger than or equal to `1`.
         experiment:
             Name of the experiment. Must not be empty.
+        is_compact:
+            Whether to store samples of language model dataset in
+            `lmp.dataset.StringPool` instead of `list[str]`. Must be `True` or
+            `False`.
+        is_file_backed:
+            Whether to read samples of language model dataset on demand from
+            normalized file cached in `lmp.path.DATA_PATH`. Must be `True` or
+            `False`.
         is_uncased:
             Convert all upper case to lower case. Must be `True` or `False`.
         learning_rate:
@@ -63,6 +81,11 @@ class BaseConfig:
         max_seq_len
             Maximum input sequence length. Must be greater than `1` or equal to
             `-1`.'
+        max_tokens:
+            Maximum number of tokens (including padding) in each mini-batch.
+            Must be bigger than or equal to `1` or equal to `-1`. When
+            `max_tokens != -1`, mini-batches are sampled by
+            `lmp.dataset.TokenBudgetBatchSampler` and `batch_size` is ignored.
         min_count:
             Filter out tokens occur less than `min_count`. Must be bigger than
             or equal to `1`.
@@ -70,14 +93,49 @@ class BaseConfig:
             Language model's class. Must not be empty.
         num_linear_layers:
             Number of Linear layers. Must be bigger than or equal to `1`.
+        num_negative_samples:
+            Number of negative samples of sampled softmax training objective.
+            Must be bigger than or equal to `0`. Train with full softmax when
+            `num_negative_samples == 0`. Must be `0` when
+            `adaptive_softmax_cutoffs` is not empty.
+        num_preprocess_workers:
+            Number of subprocesses used to normalize samples when loading
+            dataset. Must be bigger than or equal to `0`. When
+            `num_preprocess_workers == 0`, samples are normalized in the main
+            process.
         num_rnn_layers:
             Number of rnn layers. Must be bigger than or equal to `1`.
+        num_workers:
+            Number of subprocesses used for data loading. Must be bigger than
+            or equal to `0`. When `num_workers == 0`, data will be loaded in
+            the main process.
         optimizer_class:
             Optimizer's class. Must not be empty.
+        persistent_workers:
+            Keep data loading subprocesses alive between epochs. Only used
+            when `num_workers > 0`. Must be `True` or `False`.
+        pin_memory:
+            Copy mini-batches into page-locked memory before returning them.
+            Must be `True` or `False`.
+        prefetch_batches:
+            Number of mini-batches prepared in advance on background thread
+            of training process. Must be bigger than or equal to `0`. When
+            `prefetch_batches == 0`, mini-batches will not be prefetched.
+        prefetch_factor:
+            Number of mini-batches loaded in advance by each data loading
+            subprocess. Only used when `num_workers > 0`. Must be bigger than
+            or equal to `1`.
+        precision:
+            Floating point precision of forward pass. Must be either `'fp32'`
+            or `'bf16'`. Use `'fp32'` for full precision or `'bf16'` for
+            `torch.bfloat16` autocast.
         seed:
             Control random seed. Must be bigger than or equal to `1`.
         tokenizer_class:
             Tokenizer's class. Must not be empty.
+        unigram_alpha:
+            Smoothing power of unigram distribution which negative samples
+            are drawn from. Must be bigger than or equal to `0.0`.
 
     Raises:
         TypeError:
@@ -90,6 +148,8 @@ class BaseConfig:
 
     def __init__(
             self,
+            accumulation_steps: int = 1,
+            adaptive_softmax_cutoffs: Sequence[int] = (),
             batch_size: int = 1,
             checkpoint_step: int = 500,
             d_emb: int = 1,
@@ -98,19 +158,48 @@ class BaseConfig:
             dropout: float = 0.1,
             epoch: int = 10,
             experiment: str = '',
+            is_compact: bool = False,
+            is_file_backed: bool = False,
             is_uncased: bool = False,
             learning_rate: float = 1e-4,
             max_norm: float = 1.0,
             max_seq_len: int = 60,
+            max_tokens: int = -1,
             min_count: int = 1,
             model_class: str = 'lstm',
             num_linear_layers: int = 1,
+            num_negative_samples: int = 0,
+            num_preprocess_workers: int = 0,
             num_rnn_layers: int = 1,
+            num_workers: int = 0,
             optimizer_class: str = 'adam',
+            persistent_workers: bool = False,
+            pin_memory: bool = False,
+            prefetch_batches: int = 0,
+            prefetch_factor: int = 2,
+            precision: str = 'fp32',
             seed: int = 1,
-            tokenizer_class: str = 'char_dict'
+            tokenizer_class: str = 'char_dict',
+            unigram_alpha: float = 0.75
     ):
         # Type check.
+        if not isinstance(accumulation_steps, int):
+            raise TypeError(
+                '`accumulation_steps` must be an instance of `int`.'
+            )
+
+        if not (
+                isinstance(adaptive_softmax_cutoffs, (list, tuple)) and
+                all(map(
+                    lambda cutoff: isinstance(cutoff, int),
+                    adaptive_softmax_cutoffs
+                ))
+        ):
+            raise TypeError(
+                '`adaptive_softmax_cutoffs` must be an instance of '
+                '`Sequence[int]`.'
+            )
+
         if not isinstance(batch_size, int):
             raise TypeError('`batch_size` must be an instance of `int`.')
 
@@ -135,6 +224,12 @@ class BaseConfig:
         if not isinstance(epoch, int):
             raise TypeError('`epoch` must be an instance of `int`.')
 
+        if not isinstance(is_compact, bool):
+            raise TypeError('`is_compact` must be an instance of `bool`.')
+
+        if not isinstance(is_file_backed, bool):
+            raise TypeError('`is_file_backed` must be an instance of `bool`.')
+
         if not isinstance(is_uncased, bool):
             raise TypeError('`is_uncased` must be an instance of `bool`.')
 
@@ -147,6 +242,9 @@ class BaseConfig:
         if not isinstance(max_seq_len, int):
             raise TypeError('`max_seq_len` must be an instance of `int`.')
 
+        if not isinstance(max_tokens, int):
+            raise TypeError('`max_tokens` must be an instance of `int`.')
+
         if not isinstance(min_count, int):
             raise TypeError('`min_count` must be an instance of `int`.')
 
@@ -157,19 +255,68 @@ class BaseConfig:
             raise TypeError(
                 '`num_linear_layers` must be an instance of `int`.')
 
+        if not isinstance(num_negative_samples, int):
+            raise TypeError(
+                '`num_negative_samples` must be an instance of `int`.'
+            )
+
+        if not isinstance(num_preprocess_workers, int):
+            raise TypeError(
+                '`num_preprocess_workers` must be an instance of `int`.'
+            )
+
         if not isinstance(num_rnn_layers, int):
             raise TypeError('`num_rnn_layers` must be an instance of `int`.')
 
+        if not isinstance(num_workers, int):
+            raise TypeError('`num_workers` must be an instance of `int`.')
+
         if not isinstance(optimizer_class, str):
             raise TypeError('`optimizer_class` must be an instance of `str`.')
 
+        if not isinstance(persistent_workers, bool):
+            raise TypeError(
+                '`persistent_workers` must be an instance of `bool`.'
+            )
+
+        if not isinstance(pin_memory, bool):
+            raise TypeError('`pin_memory` must be an instance of `bool`.')
+
+        if not isinstance(prefetch_batches, int):
+            raise TypeError('`prefetch_batches` must be an instance of `int`.')
+
+        if not isinstance(prefetch_factor, int):
+            raise TypeError('`prefetch_factor` must be an instance of `int`.')
+
+        if not isinstance(precision, str):
+            raise TypeError('`precision` must be an instance of `str`.')
+
         if not isinstance(seed, int):
             raise TypeError('`seed` must be an instance of `int`.')
 
         if not isinstance(tokenizer_class, str):
             raise TypeError('`tokenizer_class` must be an instance of `str`.')
 
+        if not isinstance(unigram_alpha, float):
+            raise TypeError('`unigram_alpha` must be an instance of `float`.')
+
         # Value check.
+        if accumulation_steps < 1:
+            raise ValueError(
+                '`accumulation_steps` must be bigger than or equal to `1`.'
+            )
+
+        if list(adaptive_softmax_cutoffs) != sorted(
+                set(adaptive_softmax_cutoffs)
+        ) or not all(map(
+            lambda cutoff: cutoff >= 1,
+            adaptive_softmax_cutoffs
+        )):
+            raise ValueError(
+                '`adaptive_softmax_cutoffs` must be strictly increasing and '
+                'bigger than or equal to `1`.'
+            )
+
         if batch_size < 1:
             raise ValueError(
                 '`batch_size` must be bigger than or equal to `1`.'
@@ -209,6 +356,12 @@ class BaseConfig:
                 '`max_seq_len` must be greater than `1` or equal to `-1`.'
             )
 
+        if max_tokens == 0 or max_tokens < -1:
+            raise ValueError(
+                '`max_tokens` must be bigger than or equal to `1` or equal to '
+                '`-1`.'
+            )
+
         if min_count < 1:
             raise ValueError(
                 '`min_count` must be bigger than or equal to `1`.'
@@ -222,21 +375,67 @@ class BaseConfig:
                 '`num_linear_layers` must be bigger than or equal to `1`.'
             )
 
+        if num_negative_samples < 0:
+            raise ValueError(
+                '`num_negative_samples` must be bigger than or equal to `0`.'
+            )
+
+        # Sampled softmax does not support adaptive softmax output layer.
+        if num_negative_samples > 0 and adaptive_softmax_cutoffs:
+            raise ValueError(
+                '`num_negative_samples` must be `0` when '
+                '`adaptive_softmax_cutoffs` is not empty.'
+            )
+
+        if num_preprocess_workers < 0:
+            raise ValueError(
+                '`num_preprocess_workers` must be bigger than or equal to `0`.'
+            )
+
         if num_rnn_layers < 1:
             raise ValueError(
                 '`num_rnn_layers` must be bigger than or equal to `1`.'
             )
 
+        if num_workers < 0:
+            raise ValueError(
+                '`num_workers` must be bigger than or equal to `0`.'
+            )
+
         if not optimizer_class:
             raise ValueError('`optimizer_class` must not be empty.')
 
+        if prefetch_batches < 0:
+            raise ValueError(
+                '`prefetch_batches` must be bigger than or equal to `0`.'
+            )
+
+        if prefetch_factor < 1:
+            raise ValueError(
+                '`prefetch_factor` must be bigger than or equal to `1`.'
+            )
+
+        if precision not in ('fp32', 'bf16'):
+            raise ValueError(
+                "`precision` must be either `'fp32'` or `'bf16'`."
+            )
+
         if seed < 1:
             raise ValueError('`seed` must be bigger than or equal to `1`.')
 
         if not tokenizer_class:
             raise ValueError('`tokenizer_class` must not be empty.')
 
+        if unigram_alpha < 0.0 or math.isnan(unigram_alpha):
+            raise ValueError(
+                '`unigram_alpha` must be bigger than or equal to `0.0`.'
+            )
+
         # Ensure instance have exact type specified in type annotation.
+        self.accumulation_steps = int(accumulation_steps)
+        self.adaptive_softmax_cutoffs = tuple(
+            int(cutoff) for cutoff in adaptive_softmax_cutoffs
+        )
         self.batch_size = int(batch_size)
         self.checkpoint_step = int(checkpoint_step)
         self.d_emb = int(d_emb)
@@ -245,17 +444,29 @@ class BaseConfig:
         self.dropout = float(dropout)
         self.epoch = int(epoch)
         self.experiment = str(experiment)
+        self.is_compact = bool(is_compact)
+        self.is_file_backed = bool(is_file_backed)
         self.is_uncased = bool(is_uncased)
         self.learning_rate = float(learning_rate)
         self.max_norm = float(max_norm)
         self.max_seq_len = int(max_seq_len)
+        self.max_tokens = int(max_tokens)
         self.min_count = int(min_count)
         self.model_class = str(model_class)
         self.num_linear_layers = int(num_linear_layers)
+        self.num_negative_samples = int(num_negative_samples)
+        self.num_preprocess_workers = int(num_preprocess_workers)
         self.num_rnn_layers = int(num_rnn_layers)
+        self.num_workers = int(num_workers)
         self.optimizer_class = str(optimizer_class)
+        self.persistent_workers = bool(persistent_workers)
+        self.pin_memory = bool(pin_memory)
+        self.prefetch_batches = int(prefetch_batches)
+        self.prefetch_factor = int(prefetch_factor)
+        self.precision = str(precision)
         self.seed = int(seed)
         self.tokenizer_class = str(tokenizer_class)
+        self.unigram_alpha = float(unigram_alpha)
 
     @classmethod
     def load(cls, experiment: str):
@@ -292,13 +503,17 @@ class BaseConfig:
             return cls(**json.load(input_file))
 
     def __iter__(self) -> Generator[
-            Tuple[str, Union[bool, float, int, str]], None, None
+            Tuple[str, Union[bool, float, int, str, Tuple[int, ...]]],
+            None,
+            None
     ]:
         r"""Make instance attributes iterable.
 
         Yields:
             All instance attributes.
         """
+        yield 'accumulation_steps', self.accumulation_steps
+        yield 'adaptive_softmax_cutoffs', self.adaptive_softmax_cutoffs
         yield 'batch_size', self.batch_size
         yield 'checkpoint_step', self.checkpoint_step
         yield 'd_emb', self.d_emb
@@ -307,17 +522,29 @@ class BaseConfig:
         yield 'dropout', self.dropout
         yield 'epoch', self.epoch
         yield 'experiment', self.experiment
+        yield 'is_compact', self.is_compact
+        yield 'is_file_backed', self.is_file_backed
         yield 'is_uncased', self.is_uncased
         yield 'learning_rate', self.learning_rate
         yield 'max_norm', self.max_norm
         yield 'max_seq_len', self.max_seq_len
+        yield 'max_tokens', self.max_tokens
         yield 'min_count', self.min_count
         yield 'model_class', self.model_class
         yield 'num_linear_layers', self.num_linear_layers
+        yield 'num_negative_samples', self.num_negative_samples
+        yield 'num_preprocess_workers', self.num_preprocess_workers
         yield 'num_rnn_layers', self.num_rnn_layers
+        yield 'num_workers', self.num_workers
         yield 'optimizer_class', self.optimizer_class
+        yield 'persistent_workers', self.persistent_workers
+        yield 'pin_memory', self.pin_memory
+        yield 'prefetch_batches', self.prefetch_batches
+        yield 'prefetch_factor', self.prefetch_factor
+        yield 'precision', self.precision
         yield 'seed', self.seed
         yield 'tokenizer_class', self.tokenizer_class
+        yield 'unigram_alpha', self.unigram_alpha
 
     def save(self) -> None:
         r"""Save configuration into JSON file.
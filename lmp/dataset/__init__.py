@@ -6,7 +6,12 @@ Usage:
     import lmp.dataset
 
     language_model_dataset = lmp.dataset.LanguageModelDataset(...)
+    file_language_model_dataset = lmp.dataset.FileLanguageModelDataset(...)
     analogy_dataset = lmp.dataset.AnalogyDataset(...)
+    batch_sampler = lmp.dataset.TokenBudgetBatchSampler(...)
+    batch_sampler = lmp.dataset.ResumableBatchSampler(...)
+    sampler = lmp.dataset.DistributedShardSampler(...)
+    string_pool = lmp.dataset.StringPool(...)
 """
 
 # built-in modules
@@ -20,3 +25,8 @@ from __future__ import unicode_literals
 
 from lmp.dataset._language_model_dataset import LanguageModelDataset
 from lmp.dataset._analogy_dataset import AnalogyDataset
+from lmp.dataset._file_language_model_dataset import FileLanguageModelDataset
+from lmp.dataset._string_pool import StringPool
+from lmp.dataset._distributed_shard_sampler import DistributedShardSampler
+from lmp.dataset._token_budget_batch_sampler import TokenBudgetBatchSampler
+from lmp.dataset._resumable_batch_sampler import ResumableBatchSampler
@@ -20,8 +20,15 @@ from typing import Tuple
 
 # 3rd-party modules
 
+import torch
 import torch.utils.data
 
+# self-made modules
+
+import lmp.tokenizer
+
+from lmp.dataset._string_pool import StringPool
+
 
 # Define types for type annotation.
 CollateFnReturn = Tuple[
@@ -35,6 +42,12 @@ CollateFn = Callable[
     [List[List[str]]],
     CollateFnReturn
 ]
+EncodeReturn = Tuple[
+    torch.Tensor,
+    torch.Tensor,
+    List[str],
+    torch.Tensor,
+]
 
 
 class AnalogyDataset(torch.utils.data.Dataset):
@@ -59,14 +72,27 @@ class AnalogyDataset(torch.utils.data.Dataset):
             For the rest code and comments in this class, we will refer to each
             5 `str` as `word_a`, `word_b`, `word_c`, `word_d` and `category`.
 
+            When `is_compact == True`, all samples are flattened and stored
+            in `lmp.dataset.StringPool`, i.e., `str` of sample `i` are stored
+            from index `5 * i` to `5 * i + 4`.
+        is_compact:
+            Whether to store samples in one contiguous UTF-8 buffer. This save
+            memory for large dataset and let dataset shared across processes
+            without copying, at the cost of decoding each sample on access.
+
     Raises:
         TypeError:
-            `samples` must be an instance of `Iterable[Iterable[str]]`.
+            `samples` must be an instance of `Iterable[Iterable[str]]` or
+            `is_compact` is not an instance of `bool`.
         ValueError:
             When some of the samples are not consist of 5 `str`.
     """
 
-    def __init__(self, samples: Iterable[Iterable[str]]):
+    def __init__(
+            self,
+            samples: Iterable[Iterable[str]],
+            is_compact: bool = False
+    ):
         # Type check.
         type_error_msg = (
             '`samples` must be an instance of `Iterable[Iterable[str]]`.'
@@ -74,6 +100,9 @@ class AnalogyDataset(torch.utils.data.Dataset):
         if not isinstance(samples, Iterable):
             raise TypeError(type_error_msg)
 
+        if not isinstance(is_compact, bool):
+            raise TypeError('`is_compact` must be an instance of `bool`.')
+
         samples = list(samples)
 
         if not all(map(lambda sample: isinstance(sample, Iterable), samples)):
@@ -91,7 +120,84 @@ class AnalogyDataset(torch.utils.data.Dataset):
                     '`word_d` and category.'
                 )
 
+        if is_compact:
+            samples = StringPool(word for sample in samples for word in sample)
+
         self.samples = samples
+        self.is_compact = is_compact
+
+    def encode(self, tokenizer: lmp.tokenizer.BaseTokenizer) -> EncodeReturn:
+        r"""Encode all samples into tensors at once.
+
+        Each distinct word is converted by `tokenizer` only once, thus
+        encoding cost does not depend on how many times a word appears. The
+        result only depends on `tokenizer`'s vocabulary, so it can be reused
+        (or saved by `torch.save`) as long as the vocabulary is unchanged.
+
+        Args:
+            tokenizer:
+                Converting `word_a`, `word_b`, `word_c` and `word_d` of each
+                sample into token ids.
+
+        Raises:
+            TypeError:
+                When `tokenizer` is not an instance of
+                `lmp.tokenizer.BaseTokenizer`.
+
+        Returns:
+            token_ids:
+                Token ids of `word_a`, `word_b`, `word_c` and `word_d` with
+                shape `(N, 4)` and dtype `torch.int64`, where `N` is dataset
+                size.
+            category_ids:
+                Category index of each sample with shape `(N)` and dtype
+                `torch.int64`.
+            categories:
+                Category names. Category of sample `i` is
+                `categories[category_ids[i]]`.
+            is_oov:
+                Whether each word is not in `tokenizer`'s vocabulary (thus
+                encoded as unknown word token's id) with shape `(N, 4)` and
+                dtype `torch.bool`.
+        """
+        # Type check.
+        if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+            raise TypeError(
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.'
+            )
+
+        unk_token_id = tokenizer.convert_token_to_id(tokenizer.unk_token)
+
+        # Look up each distinct word only once.
+        word_to_id = {}
+        category_to_id = {}
+        token_ids = []
+        category_ids = []
+        is_oov = []
+        for sample in self:
+            for word in sample[:4]:
+                if word not in word_to_id:
+                    word_to_id[word] = tokenizer.convert_token_to_id(word)
+
+            if sample[4] not in category_to_id:
+                category_to_id[sample[4]] = len(category_to_id)
+
+            token_ids.append([word_to_id[word] for word in sample[:4]])
+            category_ids.append(category_to_id[sample[4]])
+
+            # Unknown word token itself is in vocabulary.
+            is_oov.append([
+                word_to_id[word] == unk_token_id
+                and word != tokenizer.unk_token
+                for word in sample[:4]
+            ])
+
+        token_ids = torch.LongTensor(token_ids).reshape(-1, 4)
+        category_ids = torch.LongTensor(category_ids)
+        is_oov = torch.BoolTensor(is_oov).reshape(-1, 4)
+
+        return token_ids, category_ids, list(category_to_id), is_oov
 
     def __iter__(self) -> Generator[List[str], None, None]:
         r"""Iterate through each sample in the dataset.
@@ -99,11 +205,14 @@ class AnalogyDataset(torch.utils.data.Dataset):
         Yields:
             Each sample in `self.samples`.
         """
-        for sample in self.samples:
-            yield sample
+        for index in range(len(self)):
+            yield self[index]
 
     def __len__(self) -> int:
         r"""Dataset size."""
+        if self.is_compact:
+            return len(self.samples) // 5
+
         return len(self.samples)
 
     def __getitem__(self, index: int) -> List[str]:
@@ -133,4 +242,13 @@ class AnalogyDataset(torch.utils.data.Dataset):
         if not isinstance(index, int):
             raise TypeError('`index` must be an instance of `int`.')
 
+        if self.is_compact:
+            if index < 0:
+                index += len(self)
+
+            if not 0 <= index < len(self):
+                raise IndexError('`index` out of range.')
+
+            return [self.samples[5 * index + i] for i in range(5)]
+
         return self.samples[index]
@@ -0,0 +1,178 @@
+r"""Sampler splitting dataset across distributed processes.
+
+Usage:
+    import lmp.dataset
+
+    sampler = lmp.dataset.DistributedShardSampler(...)
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=batch_size,
+        sampler=sampler,
+        collate_fn=collate_fn
+    )
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+
+from typing import Generator
+
+# 3rd-party modules
+
+import torch
+import torch.utils.data
+
+
+class DistributedShardSampler(torch.utils.data.Sampler):
+    r"""Sample disjoint shard of dataset for each process.
+
+    For each epoch, all sample indices are shuffled by a `torch.Generator`
+    seeded by `seed + epoch`. Since every process use the same `seed`, every
+    process get the same permutation, and process with rank `rank` take every
+    `num_replicas`-th index starting from `rank`. Thus shards are disjoint and
+    adding processes divides the work.
+
+    Permutation is padded by repeating its beginning so that its length is a
+    multiple of `num_replicas`. Every process thus iterate through the same
+    number of samples, which is required by collective operations such as
+    gradient all-reduce.
+
+    Any map-style dataset with `__len__` can be sharded, including
+    `lmp.dataset.LanguageModelDataset` and
+    `lmp.dataset.FileLanguageModelDataset`.
+
+    Attributes:
+        dataset_size:
+            Number of samples in dataset.
+        epoch:
+            Current epoch. Automatically increased by `1` after each
+            iteration. Use `set_epoch` to override.
+        num_replicas:
+            Number of processes participating in training.
+        num_samples:
+            Number of samples in each shard.
+        rank:
+            Rank of current process.
+        seed:
+            Random seed for shuffling.
+        total_size:
+            Number of samples of all shards (including padding).
+
+    Args:
+        dataset:
+            Map-style dataset to sample from.
+        num_replicas:
+            Number of processes participating in training. Must be bigger
+            than or equal to `1`.
+        rank:
+            Rank of current process. Must be bigger than or equal to `0` and
+            smaller than `num_replicas`.
+        seed:
+            Random seed for shuffling. Must be bigger than or equal to `1`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            dataset: torch.utils.data.Dataset,
+            num_replicas: int,
+            rank: int,
+            seed: int
+    ):
+        # Type check.
+        if not isinstance(dataset, torch.utils.data.Dataset):
+            raise TypeError(
+                '`dataset` must be an instance of `torch.utils.data.Dataset`.'
+            )
+
+        if not isinstance(num_replicas, int):
+            raise TypeError('`num_replicas` must be an instance of `int`.')
+
+        if not isinstance(rank, int):
+            raise TypeError('`rank` must be an instance of `int`.')
+
+        if not isinstance(seed, int):
+            raise TypeError('`seed` must be an instance of `int`.')
+
+        # Value check.
+        if num_replicas < 1:
+            raise ValueError(
+                '`num_replicas` must be bigger than or equal to `1`.'
+            )
+
+        if not 0 <= rank < num_replicas:
+            raise ValueError(
+                '`rank` must be bigger than or equal to `0` and smaller than '
+                '`num_replicas`.'
+            )
+
+        if seed < 1:
+            raise ValueError('`seed` must be bigger than or equal to `1`.')
+
+        self.dataset_size = len(dataset)
+        self.epoch = 0
+        self.num_replicas = num_replicas
+        self.num_samples = math.ceil(self.dataset_size / num_replicas)
+        self.rank = rank
+        self.seed = seed
+        self.total_size = self.num_samples * num_replicas
+
+    def set_epoch(self, epoch: int) -> None:
+        r"""Set epoch used to seed shuffling.
+
+        Args:
+            epoch:
+                Epoch number. Must be bigger than or equal to `0`.
+
+        Raises:
+            TypeError:
+                When `epoch` is not an instance of `int`.
+            ValueError:
+                When `epoch < 0`.
+        """
+        if not isinstance(epoch, int):
+            raise TypeError('`epoch` must be an instance of `int`.')
+
+        if epoch < 0:
+            raise ValueError('`epoch` must be bigger than or equal to `0`.')
+
+        self.epoch = epoch
+
+    def __iter__(self) -> Generator[int, None, None]:
+        r"""Iterate through sample indices of current shard.
+
+        Yields:
+            Sample indices of current process in current epoch.
+        """
+        generator = torch.Generator()
+        generator.manual_seed(self.seed + self.epoch)
+        self.epoch += 1
+
+        indices = torch.randperm(self.dataset_size, generator=generator)
+
+        # Pad to make shards have the same size.
+        if self.total_size > self.dataset_size:
+            indices = indices.repeat(
+                math.ceil(self.total_size / self.dataset_size)
+            )
+
+        yield from indices[
+            self.rank:self.total_size:self.num_replicas
+        ].tolist()
+
+    def __len__(self) -> int:
+        r"""Number of samples in each shard."""
+        return self.num_samples
@@ -0,0 +1,211 @@
+r"""File-backed language model dataset.
+
+Usage:
+    import lmp.dataset
+
+    dataset = lmp.dataset.FileLanguageModelDataset(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import mmap
+import os
+
+from array import array
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+
+
+class FileLanguageModelDataset(LanguageModelDataset):
+    r"""Dataset class generating language model samples from text file.
+
+    Each line of `file_path` is a sample. File must be UTF-8 encoded and
+    samples must already be normalized (in particular, samples must not
+    contain new line). Byte offset of each line is indexed once when dataset
+    is constructed, and samples are decoded on demand from memory-mapped file
+    in `__getitem__`. Thus memory usage does not grow with number of samples
+    (except 8 bytes per sample for offsets).
+
+    Memory-mapped file is opened lazily in each process, so dataset can be
+    pickled and sent to data loading subprocesses.
+
+    Attributes:
+        file_path:
+            Path to text file with one sample per line.
+        offsets:
+            Byte offset of each sample in `file_path`. `offsets[i]` is the
+            start of sample `i` and `offsets[i + 1] - 1` is the end (exclusive)
+            of sample `i`.
+
+    Raises:
+        FileNotFoundError:
+            When `file_path` does not exist.
+        TypeError:
+            When `file_path` is not an instance of `str`.
+    """
+
+    # Scan file with chunk size 64 MB when building index.
+    chunk_size = 2 ** 26
+
+    def __init__(self, file_path: str):
+        # Samples are not loaded into memory, thus we skip
+        # `LanguageModelDataset.__init__`.
+        # pylint: disable=W0231
+        # Type check.
+        if not isinstance(file_path, str):
+            raise TypeError('`file_path` must be an instance of `str`.')
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f'file {file_path} does not exist.')
+
+        self.file_path = file_path
+        self._file = None
+        self._mmap = None
+        self.offsets = self._build_offsets()
+
+    def _open(self) -> Any:
+        r"""Open memory-mapped file if not opened yet in current process.
+
+        Returns:
+            Memory-mapped file, or empty `bytes` when file is empty (empty file
+            cannot be memory-mapped).
+        """
+        if self._mmap is None:
+            if os.path.getsize(self.file_path) == 0:
+                self._mmap = b''
+            else:
+                self._file = open(self.file_path, 'rb')
+                self._mmap = mmap.mmap(
+                    self._file.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+                )
+
+        return self._mmap
+
+    def _build_offsets(self) -> array:
+        r"""Index byte offset of each line in `self.file_path`.
+
+        Returns:
+            Byte offset of each sample. See `self.offsets` for details.
+        """
+        buffer = self._open()
+        file_size = len(buffer)
+        offsets = array('Q', [0])
+
+        for start in range(0, file_size, self.chunk_size):
+            chunk = np.frombuffer(
+                buffer[start:start + self.chunk_size],
+                dtype=np.uint8
+            )
+            # Next sample start right after new line.
+            new_line_positions = np.flatnonzero(chunk == ord('\n')) + start + 1
+            offsets.frombytes(new_line_positions.astype(np.uint64).tobytes())
+
+        # Last sample without trailing new line.
+        if offsets[-1] < file_size:
+            offsets.append(file_size + 1)
+
+        return offsets
+
+    @staticmethod
+    def dump(batch_sequences: Iterable[str], file_path: str) -> None:
+        r"""Write sequences into text file with one sequence per line.
+
+        Output file can be loaded by `FileLanguageModelDataset`.
+
+        Args:
+            batch_sequences:
+                Sequences to write. Sequences must not contain new line.
+            file_path:
+                Path to output file.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` is not an instance of `Iterable[str]`
+                or `file_path` is not an instance of `str`.
+            ValueError:
+                When some of the sequences contain new line.
+        """
+        # Type check.
+        if not isinstance(batch_sequences, Iterable):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Iterable[str]`.'
+            )
+
+        if not isinstance(file_path, str):
+            raise TypeError('`file_path` must be an instance of `str`.')
+
+        with open(file_path, 'w', encoding='utf-8', newline='\n') as out_file:
+            for sequence in batch_sequences:
+                if not isinstance(sequence, str):
+                    raise TypeError(
+                        '`batch_sequences` must be an instance of '
+                        '`Iterable[str]`.'
+                    )
+
+                if '\n' in sequence:
+                    raise ValueError(
+                        '`batch_sequences` must not contain new line.'
+                    )
+
+                out_file.write(f'{sequence}\n')
+
+    def __getstate__(self) -> Dict[str, Any]:
+        r"""Drop memory-mapped file when pickling."""
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_mmap'] = None
+        return state
+
+    def __iter__(self) -> Generator[str, None, None]:
+        r"""Iterate through each sample in the dataset.
+
+        Yields:
+            Each line in `self.file_path`.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        r"""Dataset size."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        r"""Sample single sequence using index.
+
+        Raises:
+            IndexError:
+                When `index >= len(self)`.
+            TypeError:
+                When `index` is not an instance of `int`.
+        """
+        # Type check.
+        if not isinstance(index, int):
+            raise TypeError('`index` must be an instance of `int`.')
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('`index` out of range.')
+
+        buffer = self._open()
+        return buffer[
+            self.offsets[index]:self.offsets[index + 1] - 1
+        ].decode('utf-8')
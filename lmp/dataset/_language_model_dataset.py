@@ -26,6 +26,8 @@ import torch.utils.data
 
 import lmp.tokenizer
 
+from lmp.dataset._string_pool import StringPool
+
 
 # Define types for type annotation.
 
@@ -38,14 +40,25 @@ class LanguageModelDataset(torch.utils.data.Dataset):
 
     Attributes:
         batch_sequences:
-            All sequences in the dataset.
+            All sequences in the dataset. Sequences are stored in
+            `lmp.dataset.StringPool` when `is_compact == True`.
+        is_compact:
+            Whether to store sequences in one contiguous UTF-8 buffer. This
+            save memory for large corpus and let dataset shared across
+            processes without copying, at the cost of decoding each sequence
+            on access.
 
     Raises:
         TypeError:
-            When `batch_sequences` is not an instance of `Iterable[str]`.
+            When `batch_sequences` is not an instance of `Iterable[str]` or
+            `is_compact` is not an instance of `bool`.
     """
 
-    def __init__(self, batch_sequences: Iterable[str]):
+    def __init__(
+            self,
+            batch_sequences: Iterable[str],
+            is_compact: bool = False
+    ):
         super().__init__()
         # Type check.
         if not isinstance(batch_sequences, Iterable):
@@ -53,17 +66,31 @@ class LanguageModelDataset(torch.utils.data.Dataset):
                 '`batch_sequences` must be an instance of `Iterable[str]`.'
             )
 
-        batch_sequences = list(batch_sequences)
+        if not isinstance(is_compact, bool):
+            raise TypeError('`is_compact` must be an instance of `bool`.')
 
-        if not all(map(
-                lambda sequence: isinstance(sequence, str),
-                batch_sequences
-        )):
-            raise TypeError(
-                '`batch_sequences` must be an instance of `Iterable[str]`.'
-            )
+        # Stream sequences into `lmp.dataset.StringPool` without building
+        # `list` first, so that peak memory is bounded by the pool.
+        if is_compact:
+            try:
+                batch_sequences = StringPool(batch_sequences)
+            except TypeError:
+                raise TypeError(
+                    '`batch_sequences` must be an instance of `Iterable[str]`.'
+                )
+        else:
+            batch_sequences = list(batch_sequences)
+
+            if not all(map(
+                    lambda sequence: isinstance(sequence, str),
+                    batch_sequences
+            )):
+                raise TypeError(
+                    '`batch_sequences` must be an instance of `Iterable[str]`.'
+                )
 
         self.batch_sequences = batch_sequences
+        self.is_compact = is_compact
 
     def __iter__(self) -> Generator[str, None, None]:
         r"""Iterate through each sample in the dataset.
@@ -96,32 +123,80 @@ class LanguageModelDataset(torch.utils.data.Dataset):
     @staticmethod
     def create_collate_fn(
             tokenizer: lmp.tokenizer.BaseTokenizer,
-            max_seq_len: int = -1
+            max_seq_len: int = -1,
+            pad_to_longest: bool = False
     ) -> CollateFn:
         r"""Create `collate_fn` for `torch.utils.data.DataLoader`.
 
         Use `tokenizer` to perform tokenization on each mini-batch. Each
         mini-batch will be encoded into tokens' ids with length equal to
         `max_seq_len`. If `max_seq_len == -1`, then `max_seq_len` will be
-        inferred from current mini-batch.
+        inferred from current mini-batch. If `pad_to_longest == True`, then
+        each mini-batch will only be padded to its longest encoded sequence
+        (while still truncated to `max_seq_len`), which is needed when
+        mini-batches are sampled by `lmp.dataset.TokenBudgetBatchSampler`.
 
         Attributes:
             tokenizer:
                 Perform both tokenization and encoding.
             max_seq_len:
                 Mini-batch's maximum encoded sequence length.
+            pad_to_longest:
+                Whether to pad each mini-batch only to its longest encoded
+                sequence.
 
         Raises:
             TypeError:
                 When `tokenizer` is not an instance of
-                `lmp.tokenizer.BaseTokenizer` or `max_seq_len` is not an instance
-                of `int`.
+                `lmp.tokenizer.BaseTokenizer`, `max_seq_len` is not an instance
+                of `int` or `pad_to_longest` is not an instance of `bool`.
             ValueError:
                 When `0 <= max_seq_len <= 1` or `max_seq_len < -1`.
 
         Returns:
-            A function used by `torch.utils.data.DataLoader`.
+            A picklable callable object used by
+            `torch.utils.data.DataLoader`.
         """
+        return LanguageModelCollateFn(
+            tokenizer=tokenizer,
+            max_seq_len=max_seq_len,
+            pad_to_longest=pad_to_longest
+        )
+
+
+class LanguageModelCollateFn:
+    r"""Picklable `collate_fn` for `torch.utils.data.DataLoader`.
+
+    Use `tokenizer` to perform tokenization on each mini-batch. Since this is
+    a module level class instead of a closure, instances can be pickled and
+    sent to data loading subprocesses, which is required when
+    `torch.utils.data.DataLoader` is created with `num_workers > 0` and
+    multiprocessing start method `spawn`.
+
+    Attributes:
+        tokenizer:
+            Perform both tokenization and encoding.
+        max_seq_len:
+            Mini-batch's maximum encoded sequence length.
+        pad_to_longest:
+            Whether to pad each mini-batch only to its longest encoded
+            sequence.
+
+    Raises:
+        TypeError:
+            When `tokenizer` is not an instance of
+            `lmp.tokenizer.BaseTokenizer`, `max_seq_len` is not an instance
+            of `int` or `pad_to_longest` is not an instance of `bool`.
+        ValueError:
+            When `0 <= max_seq_len <= 1` or `max_seq_len < -1`.
+    """
+
+    def __init__(
+            self,
+            tokenizer: lmp.tokenizer.BaseTokenizer,
+            max_seq_len: int = -1,
+            pad_to_longest: bool = False
+    ):
         # Type check
         if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
             raise TypeError(
@@ -134,57 +209,98 @@ class LanguageModelDataset(torch.utils.data.Dataset):
                 '`max_seq_len` must be an instance of `int`.'
             )
 
+        if not isinstance(pad_to_longest, bool):
+            raise TypeError(
+                '`pad_to_longest` must be an instance of `bool`.'
+            )
+
         # Value check.
         if (0 <= max_seq_len <= 1) or (max_seq_len < -1):
             raise ValueError(
                 '`max_seq_len` must be greater than `1` or equal to `-1`.'
             )
 
-        def collate_fn(batch_sequences: Iterable[str]) -> CollateFnReturn:
-            r"""Function used by `torch.utils.data.DataLoader`.
-
-            Each sequence in `batch_sequences` will be first tokenized and
-            encoded by `tokenizer`, the returned batch of tokens' ids will
-            have exact same length. We construct training samples following
-            language model format.
-
-            Raises:
-                TypeError:
-                    When `batch_sequences` is not an instance of `Iterable[str]`.
-                ValueError:
-                    When `batch_sequences` is empty.
-
-            Returns:
-                x:
-                    Model input batch of token's ids with numeric type
-                    `torch.int64`.
-                y:
-                    Model predict target for each token id in `x` with numeric
-                    type `torch.int64`.
-            """
-            if not batch_sequences:
-                raise ValueError('`batch_sequences` must not be empty.')
+        self.tokenizer = tokenizer
+        self.max_seq_len = max_seq_len
+        self.pad_to_longest = pad_to_longest
 
-            try:
-                batch_token_ids = torch.LongTensor(
-                    tokenizer.batch_encode(
-                        batch_sequences,
-                        max_seq_len=max_seq_len
+    def __call__(self, batch_sequences: Iterable[str]) -> CollateFnReturn:
+        r"""Function used by `torch.utils.data.DataLoader`.
+
+        Each sequence in `batch_sequences` will be first tokenized and
+        encoded by `tokenizer`, the returned batch of tokens' ids will have
+        exact same length. We construct training samples following language
+        model format.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` is not an instance of `Iterable[str]`.
+            ValueError:
+                When `batch_sequences` is empty.
+
+        Returns:
+            x:
+                Model input batch of token's ids with numeric type
+                `torch.int64`.
+            y:
+                Model predict target for each token id in `x` with numeric
+                type `torch.int64`.
+        """
+        if not batch_sequences:
+            raise ValueError('`batch_sequences` must not be empty.')
+
+        try:
+            # Tokenize each sequence only once. Mini-batch length is then
+            # calculated from encoded sequences, which are truncated and
+            # padded afterward.
+            batch_token_ids = [
+                self.tokenizer.encode(sequence, max_seq_len=-1)
+                for sequence in batch_sequences
+            ]
+
+            # Pad to the longest encoded sequence in current mini-batch when
+            # `max_seq_len == -1` or `pad_to_longest == True`, while still
+            # truncated to `max_seq_len`.
+            batch_max_seq_len = self.max_seq_len
+            if self.pad_to_longest or self.max_seq_len == -1:
+                batch_max_seq_len = max([2] + list(map(
+                    len,
+                    batch_token_ids
+                )))
+
+                if self.max_seq_len != -1:
+                    batch_max_seq_len = min(
+                        batch_max_seq_len,
+                        self.max_seq_len
                     )
-                )
 
-                # Construct sample following language model:
-                # `batch_sequences[0][0]` must predict `batch_sequences[0][1]`,
-                # `batch_sequences[0][1]` must predict `batch_sequences[0][2]`,
-                # ...
-                # `batch_sequences[n][m]` must predict `batch_sequences[n][m+1]`.
-                x = batch_token_ids[:, :-1]
-                y = batch_token_ids[:, 1:]
+            pad_token_id = self.tokenizer.convert_token_to_id(
+                self.tokenizer.__class__.pad_token
+            )
+            for i, token_ids in enumerate(batch_token_ids):
+                # Truncate but keep `[eos]`, same as `tokenizer.encode`.
+                if len(token_ids) > batch_max_seq_len:
+                    token_ids = (
+                        token_ids[:batch_max_seq_len - 1] +
+                        token_ids[-1:]
+                    )
 
-                return x, y
-            except TypeError:
-                raise TypeError(
-                    '`batch_sequences` must be an instance of `Iterable[str]`.'
+                batch_token_ids[i] = token_ids + [pad_token_id] * (
+                    batch_max_seq_len - len(token_ids)
                 )
 
-        return collate_fn
+            batch_token_ids = torch.LongTensor(batch_token_ids)
+
+            # Construct sample following language model:
+            # `batch_sequences[0][0]` must predict `batch_sequences[0][1]`,
+            # `batch_sequences[0][1]` must predict `batch_sequences[0][2]`,
+            # ...
+            # `batch_sequences[n][m]` must predict `batch_sequences[n][m+1]`.
+            x = batch_token_ids[:, :-1]
+            y = batch_token_ids[:, 1:]
+
+            return x, y
+        except TypeError:
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Iterable[str]`.'
+            )
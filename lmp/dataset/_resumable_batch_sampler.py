@@ -0,0 +1,120 @@
+r"""Batch sampler which can skip mini-batches when resuming training.
+
+Usage:
+    import lmp.dataset
+
+    batch_sampler = lmp.dataset.ResumableBatchSampler(...)
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_sampler=batch_sampler,
+        collate_fn=collate_fn
+    )
+    batch_sampler.skip(num_batches)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import itertools
+
+from typing import Generator
+from typing import List
+
+# 3rd-party modules
+
+import torch
+import torch.utils.data
+
+
+class ResumableBatchSampler(torch.utils.data.Sampler):
+    r"""Wrap batch sampler so that leading mini-batches can be skipped.
+
+    When training continue from checkpoint, mini-batches trained before
+    checkpoint must be skipped. Skipping is done in index space: `skip` make
+    next iteration drop its first `num_batches` lists of sample indices, so
+    `torch.utils.data.DataLoader` never load, collate or move skipped
+    mini-batches to device.
+
+    `batch_sampler` is still iterated through all of its mini-batches, so its
+    random state (for example epoch counter of
+    `lmp.dataset.TokenBudgetBatchSampler` or `torch` global random state used
+    by `torch.utils.data.RandomSampler`) advances exactly as without skipping.
+    Mini-batches after skipped ones are thus identical to training without
+    interruption.
+
+    Attributes:
+        batch_sampler:
+            Wrapped batch sampler which yield lists of sample indices.
+        num_skip_batches:
+            Number of mini-batches to skip in next iteration. Reset to `0`
+            after each iteration.
+
+    Args:
+        batch_sampler:
+            Batch sampler to wrap.
+
+    Raises:
+        TypeError:
+            When `batch_sampler` is not an instance of
+            `torch.utils.data.Sampler`.
+    """
+
+    def __init__(self, batch_sampler: torch.utils.data.Sampler):
+        # Type check.
+        if not isinstance(batch_sampler, torch.utils.data.Sampler):
+            raise TypeError(
+                '`batch_sampler` must be an instance of '
+                '`torch.utils.data.Sampler`.'
+            )
+
+        self.batch_sampler = batch_sampler
+        self.num_skip_batches = 0
+
+    def skip(self, num_batches: int) -> None:
+        r"""Skip leading mini-batches in next iteration.
+
+        Args:
+            num_batches:
+                Number of mini-batches to skip. Must be bigger than or equal
+                to `0`.
+
+        Raises:
+            TypeError:
+                When `num_batches` is not an instance of `int`.
+            ValueError:
+                When `num_batches < 0`.
+        """
+        if not isinstance(num_batches, int):
+            raise TypeError('`num_batches` must be an instance of `int`.')
+
+        if num_batches < 0:
+            raise ValueError(
+                '`num_batches` must be bigger than or equal to `0`.'
+            )
+
+        self.num_skip_batches = num_batches
+
+    def __iter__(self) -> Generator[List[int], None, None]:
+        r"""Iterate through mini-batches after skipped ones.
+
+        Yields:
+            Lists of sample indices of each mini-batch.
+        """
+        num_skip_batches = self.num_skip_batches
+        self.num_skip_batches = 0
+
+        batch_iterator = iter(self.batch_sampler)
+
+        # Advance wrapped batch sampler through skipped mini-batches.
+        for _ in itertools.islice(batch_iterator, num_skip_batches):
+            pass
+
+        yield from batch_iterator
+
+    def __len__(self) -> int:
+        r"""Number of mini-batches in each epoch, including skipped ones."""
+        return len(self.batch_sampler)
@@ -0,0 +1,149 @@
+r"""Compact storage for large number of strings.
+
+Usage:
+    import lmp.dataset
+
+    string_pool = lmp.dataset.StringPool(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from array import array
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+
+
+class StringPool:
+    r"""Store strings in one contiguous UTF-8 buffer.
+
+    Each Python `str` costs around 50 bytes of object overhead, so a `list`
+    of millions of short sequences is dominated by overhead and fragments
+    the heap. Worse, data loading subprocesses forked from training process
+    slowly copy every page holding those objects since accessing an object
+    changes its reference count.
+
+    `StringPool` encodes all strings into a single `torch.uint8` buffer with
+    a `torch.int64` offsets tensor, and only materializes `str` on access.
+    Accessing strings never touch reference counts of the stored data, thus
+    forked subprocesses keep sharing the same pages. Call `share_memory_`
+    to move both tensors into shared memory, so that they are shared instead
+    of copied when sent to subprocesses (for example, data loading
+    subprocesses started with `spawn`).
+
+    Attributes:
+        buffer:
+            UTF-8 encoded strings concatenated together.
+        offsets:
+            Byte offset of each string in `buffer`. String `i` is stored in
+            `buffer[offsets[i]:offsets[i + 1]]`.
+
+    Raises:
+        TypeError:
+            When `strings` is not an instance of `Iterable[str]`.
+    """
+
+    def __init__(self, strings: Iterable[str]):
+        # Type check.
+        if not isinstance(strings, Iterable):
+            raise TypeError(
+                '`strings` must be an instance of `Iterable[str]`.'
+            )
+
+        # Encode strings one by one into growing buffer, so that `strings`
+        # can be a lazy generator and no `str` or `bytes` object is kept.
+        buffer = bytearray()
+        offsets = array('q', [0])
+        for string in strings:
+            if not isinstance(string, str):
+                raise TypeError(
+                    '`strings` must be an instance of `Iterable[str]`.'
+                )
+
+            buffer.extend(string.encode('utf-8'))
+            offsets.append(len(buffer))
+
+        self.buffer = torch.from_numpy(
+            np.frombuffer(buffer, dtype=np.uint8).copy()
+        )
+        self.offsets = torch.from_numpy(
+            np.frombuffer(offsets, dtype=np.int64).copy()
+        )
+        self._init_views()
+
+    def _init_views(self) -> None:
+        r"""Create `numpy` views of `self.buffer` and `self.offsets`.
+
+        Slicing `numpy` arrays is much faster than slicing `torch.Tensor`, and
+        views share memory with original tensors.
+        """
+        self._buffer_view = self.buffer.numpy()
+        self._offsets_view = self.offsets.numpy()
+
+    def share_memory_(self) -> 'StringPool':
+        r"""Move underlying tensors into shared memory.
+
+        Returns:
+            Self.
+        """
+        self.buffer.share_memory_()
+        self.offsets.share_memory_()
+        self._init_views()
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        r"""Drop `numpy` views when pickling."""
+        return {'buffer': self.buffer, 'offsets': self.offsets}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        r"""Re-create `numpy` views when unpickling."""
+        self.buffer = state['buffer']
+        self.offsets = state['offsets']
+        self._init_views()
+
+    def __iter__(self) -> Generator[str, None, None]:
+        r"""Iterate through each string in the pool.
+
+        Yields:
+            Each string in the pool.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        r"""Number of strings in the pool."""
+        return len(self._offsets_view) - 1
+
+    def __getitem__(self, index: int) -> str:
+        r"""Decode single string using index.
+
+        Raises:
+            IndexError:
+                When `index >= len(self)`.
+            TypeError:
+                When `index` is not an instance of `int`.
+        """
+        # Type check.
+        if not isinstance(index, int):
+            raise TypeError('`index` must be an instance of `int`.')
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('`index` out of range.')
+
+        start = self._offsets_view[index]
+        end = self._offsets_view[index + 1]
+        return self._buffer_view[start:end].tobytes().decode('utf-8')
@@ -0,0 +1,277 @@
+r"""Batch sampler bounded by number of tokens.
+
+Usage:
+    import lmp.dataset
+
+    batch_sampler = lmp.dataset.TokenBudgetBatchSampler(...)
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_sampler=batch_sampler,
+        collate_fn=collate_fn
+    )
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+
+from typing import Generator
+from typing import List
+
+# 3rd-party modules
+
+import torch
+import torch.utils.data
+
+# self-made modules
+
+import lmp.tokenizer
+
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+
+
+class TokenBudgetBatchSampler(torch.utils.data.Sampler):
+    r"""Sample mini-batches whose padded size fit in a token budget.
+
+    Each sequence's encoded length (including `[bos]` and `[eos]`, truncated
+    to `max_seq_len`) is calculated once when sampler is constructed. For each
+    epoch, we first shuffle all samples, then sort them by encoded length
+    (samples with the same length stay in shuffled order), and finally pack
+    consecutive samples greedily into mini-batches such that
+    `number of samples * longest encoded length <= max_tokens`. The order of
+    mini-batches is shuffled too. A sample alone exceeding `max_tokens` will
+    become a mini-batch with single sample.
+
+    Since packing is done on sorted lengths, number of mini-batches does not
+    depend on shuffle result, thus `len(sampler)` is the same in every epoch.
+    Shuffling use its own `torch.Generator` seeded by `seed + epoch`, so every
+    epoch yield the same mini-batches when experiment is re-run. This let
+    `lmp.util.train_model` skip exactly the same mini-batches when continue
+    training from checkpoint.
+
+    When training with multiple processes, every process construct sampler
+    with the same `seed` and its own `rank`. All processes get the same
+    shuffled mini-batches, and process with rank `rank` take every
+    `num_replicas`-th mini-batch starting from `rank`. Mini-batches are padded
+    by repeating the beginning so every process get the same number of
+    mini-batches.
+
+    Mini-batches must be padded only to their longest sequence (see
+    `lmp.dataset.LanguageModelDataset.create_collate_fn` with
+    `pad_to_longest=True`), otherwise padding will exceed the token budget.
+
+    Attributes:
+        batch_sizes:
+            Number of samples in each mini-batch (in ascending length order).
+        epoch:
+            Current epoch. Automatically increased by `1` after each
+            iteration. Use `set_epoch` to override.
+        lengths:
+            Encoded length of each sample in `dataset`.
+        max_tokens:
+            Maximum number of tokens (including padding) in each mini-batch.
+        num_replicas:
+            Number of processes participating in training.
+        rank:
+            Rank of current process.
+        seed:
+            Random seed for shuffling.
+
+    Args:
+        dataset:
+            Language model dataset to sample from.
+        max_seq_len:
+            Maximum encoded sequence length. If `max_seq_len == -1`, then
+            sequences will not be truncated. Must be greater than `1` or equal
+            to `-1`.
+        max_tokens:
+            Maximum number of tokens (including padding) in each mini-batch.
+            Must be bigger than or equal to `1`.
+        seed:
+            Random seed for shuffling. Must be bigger than or equal to `1`.
+        tokenizer:
+            Tokenizer used to calculate encoded length of each sequence.
+        num_replicas:
+            Number of processes participating in training. Must be bigger
+            than or equal to `1`.
+        rank:
+            Rank of current process. Must be bigger than or equal to `0` and
+            smaller than `num_replicas`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            dataset: LanguageModelDataset,
+            max_seq_len: int,
+            max_tokens: int,
+            seed: int,
+            tokenizer: lmp.tokenizer.BaseTokenizer,
+            num_replicas: int = 1,
+            rank: int = 0
+    ):
+        # Type check.
+        if not isinstance(dataset, LanguageModelDataset):
+            raise TypeError(
+                '`dataset` must be an instance of '
+                '`lmp.dataset.LanguageModelDataset`.'
+            )
+
+        if not isinstance(max_seq_len, int):
+            raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+        if not isinstance(max_tokens, int):
+            raise TypeError('`max_tokens` must be an instance of `int`.')
+
+        if not isinstance(seed, int):
+            raise TypeError('`seed` must be an instance of `int`.')
+
+        if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+            raise TypeError(
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.'
+            )
+
+        if not isinstance(num_replicas, int):
+            raise TypeError('`num_replicas` must be an instance of `int`.')
+
+        if not isinstance(rank, int):
+            raise TypeError('`rank` must be an instance of `int`.')
+
+        # Value check.
+        if (0 <= max_seq_len <= 1) or (max_seq_len < -1):
+            raise ValueError(
+                '`max_seq_len` must be greater than `1` or equal to `-1`.'
+            )
+
+        if max_tokens < 1:
+            raise ValueError(
+                '`max_tokens` must be bigger than or equal to `1`.'
+            )
+
+        if seed < 1:
+            raise ValueError('`seed` must be bigger than or equal to `1`.')
+
+        if num_replicas < 1:
+            raise ValueError(
+                '`num_replicas` must be bigger than or equal to `1`.'
+            )
+
+        if not 0 <= rank < num_replicas:
+            raise ValueError(
+                '`rank` must be bigger than or equal to `0` and smaller than '
+                '`num_replicas`.'
+            )
+
+        # Encoded length of each sequence. `+2` for `[bos]` and `[eos]`.
+        lengths = [
+            len(tokenizer.tokenize(sequence)) + 2
+            for sequence in dataset
+        ]
+        if max_seq_len != -1:
+            lengths = [min(length, max_seq_len) for length in lengths]
+
+        self.epoch = 0
+        self.lengths = torch.LongTensor(lengths)
+        self.max_tokens = max_tokens
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.seed = seed
+        self.batch_sizes = self._pack(sorted(lengths))
+
+    def _pack(self, sorted_lengths: List[int]) -> List[int]:
+        r"""Greedily pack sorted lengths into mini-batches.
+
+        Since `sorted_lengths` is in ascending order, the longest sequence in
+        a mini-batch is always the last one added.
+
+        Returns:
+            Number of samples in each mini-batch.
+        """
+        batch_sizes = []
+        cur_size = 0
+
+        for length in sorted_lengths:
+            if cur_size and (cur_size + 1) * length > self.max_tokens:
+                batch_sizes.append(cur_size)
+                cur_size = 0
+            cur_size += 1
+
+        if cur_size:
+            batch_sizes.append(cur_size)
+
+        return batch_sizes
+
+    def set_epoch(self, epoch: int) -> None:
+        r"""Set epoch used to seed shuffling.
+
+        Args:
+            epoch:
+                Epoch number. Must be bigger than or equal to `0`.
+
+        Raises:
+            TypeError:
+                When `epoch` is not an instance of `int`.
+            ValueError:
+                When `epoch < 0`.
+        """
+        if not isinstance(epoch, int):
+            raise TypeError('`epoch` must be an instance of `int`.')
+
+        if epoch < 0:
+            raise ValueError('`epoch` must be bigger than or equal to `0`.')
+
+        self.epoch = epoch
+
+    def __iter__(self) -> Generator[List[int], None, None]:
+        r"""Iterate through mini-batches of current epoch.
+
+        Yields:
+            Sample indices of each mini-batch.
+        """
+        generator = torch.Generator()
+        generator.manual_seed(self.seed + self.epoch)
+        self.epoch += 1
+
+        # Shuffle first, then stable sort by length. Samples having the same
+        # length will thus be in random order.
+        indices = torch.randperm(len(self.lengths), generator=generator)
+        _, order = torch.sort(self.lengths[indices], stable=True)
+        indices = indices[order].tolist()
+
+        batches = []
+        start = 0
+        for batch_size in self.batch_sizes:
+            batches.append(indices[start:start + batch_size])
+            start += batch_size
+
+        # Shuffle mini-batches order.
+        batch_indices = torch.randperm(len(batches), generator=generator)
+
+        # Pad to make every process get the same number of mini-batches.
+        total_size = len(self) * self.num_replicas
+        if total_size > len(batches):
+            batch_indices = batch_indices.repeat(
+                math.ceil(total_size / len(batches))
+            )
+
+        for batch_index in batch_indices[
+                self.rank:total_size:self.num_replicas
+        ].tolist():
+            yield batches[batch_index]
+
+    def __len__(self) -> int:
+        r"""Number of mini-batches of current process in each epoch."""
+        return math.ceil(len(self.batch_sizes) / self.num_replicas)
@@ -11,6 +11,11 @@ Usage:
     model = lmp.model.LSTMModel(...)
     model = lmp.model.ResGRUModel(...)
     model = lmp.model.ResLSTMModel(...)
+
+    logits, state = model.step(...)
+    state = lmp.model.reorder_state(...)
+    state = lmp.model.select_state(...)
+    state = lmp.model.concat_state(...)
 """
 
 # built-in modules
@@ -31,3 +36,6 @@ from lmp.model._res_gru_block import ResGRUBlock
 from lmp.model._res_gru_model import ResGRUModel
 from lmp.model._res_lstm_block import ResLSTMBlock
 from lmp.model._res_lstm_model import ResLSTMModel
+from lmp.model._rnn_state import concat_state
+from lmp.model._rnn_state import reorder_state
+from lmp.model._rnn_state import select_state
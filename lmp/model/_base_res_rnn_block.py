@@ -5,6 +5,7 @@ Usage:
 
     block = lmp.model.BaseResRNNBlock(...)
     logits = block(...)
+    logits, state = block.step(...)
 """
 
 # built-in modules
@@ -14,6 +15,9 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from typing import Optional
+from typing import Tuple
+
 # 3rd-party modules
 
 import torch
@@ -77,3 +81,33 @@ class BaseResRNNBlock(torch.nn.Module):
         """
         ht, _ = self.rnn_layer(x)
         return self.dropout(self.act_fn(ht)) + x
+
+    def step(
+            self,
+            x: torch.Tensor,
+            state: Optional[Tuple[torch.Tensor, ...]] = None
+    ) -> Tuple[torch.Tensor, Tuple[torch.Tensor, ...]]:
+        r"""Perform forward pass starting from given recurrent state.
+
+        Args:
+            x:
+                Batch of hidden vectors with numeric type `torch.float32`.
+            state:
+                Recurrent state returned by previous call. Tensors have shape
+                (1, B, H), which is `(h,)` for RNN and GRU layers and
+                `(h, c)` for LSTM layers. Start from zero state when `None`.
+
+        Returns:
+            Residual blocks output tensors and recurrent state after last
+            hidden vector in `x`.
+        """
+        # LSTM layers take `(h, c)` while RNN and GRU layers take `h`.
+        if state is not None and len(state) == 1:
+            state = state[0]
+
+        ht, state = self.rnn_layer(x, state)
+
+        if not isinstance(state, tuple):
+            state = (state,)
+
+        return self.dropout(self.act_fn(ht)) + x, state
@@ -5,7 +5,9 @@ Usage:
 
     model = lmp.model.BaseResRNNModel(...)
     logits = model(...)
+    loss = model.loss(...)
     pred = model.predict(...)
+    logits, state = model.step(...)
 """
 
 # built-in modules
@@ -15,6 +17,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
 # 3rd-party modules
 
 import torch
@@ -23,6 +29,8 @@ import torch.nn
 # self-made modules
 
 from lmp.model._base_res_rnn_block import BaseResRNNBlock
+from lmp.model._chunked_cross_entropy import chunked_cross_entropy
+from lmp.model._sampled_softmax import sampled_softmax_loss
 
 
 class BaseResRNNModel(torch.nn.Module):
@@ -65,6 +73,14 @@ class BaseResRNNModel(torch.nn.Module):
         vocab_size:
             Embedding matrix vocabulary dimension. Must be bigger than or equal
             to `1`.
+        adaptive_softmax_cutoffs:
+            Cutoffs of `torch.nn.AdaptiveLogSoftmaxWithLoss` output layer.
+            Must be strictly increasing and range from `1` to
+            `vocab_size - 1`. Tokenizers assign token ids in descending
+            frequency order, so ids smaller than `adaptive_softmax_cutoffs[0]`
+            (most frequent tokens) form the head cluster and rare ids form
+            lower-dimensional tail clusters. Use empty sequence to predict
+            with embedding matrix (full softmax) instead.
 
     Raises:
         TypeError:
@@ -83,7 +99,8 @@ class BaseResRNNModel(torch.nn.Module):
             num_linear_layers: int,
             num_rnn_layers: int,
             pad_token_id: int,
-            vocab_size: int
+            vocab_size: int,
+            adaptive_softmax_cutoffs: Sequence[int] = ()
     ):
         super().__init__()
 
@@ -111,6 +128,18 @@ class BaseResRNNModel(torch.nn.Module):
         if not isinstance(vocab_size, int):
             raise TypeError('`vocab_size` must be an instance of `int`.')
 
+        if not (
+                isinstance(adaptive_softmax_cutoffs, (list, tuple)) and
+                all(map(
+                    lambda cutoff: isinstance(cutoff, int),
+                    adaptive_softmax_cutoffs
+                ))
+        ):
+            raise TypeError(
+                '`adaptive_softmax_cutoffs` must be an instance of '
+                '`Sequence[int]`.'
+            )
+
         # Value Check.
         if d_emb < 1:
             raise ValueError('`d_emb` must be bigger than or equal to `1`.')
@@ -146,6 +175,17 @@ class BaseResRNNModel(torch.nn.Module):
                 '`pad_token_id` must be smaller than `vocab_size`.'
             )
 
+        if list(adaptive_softmax_cutoffs) != sorted(
+                set(adaptive_softmax_cutoffs)
+        ) or not all(map(
+            lambda cutoff: 1 <= cutoff < vocab_size,
+            adaptive_softmax_cutoffs
+        )):
+            raise ValueError(
+                '`adaptive_softmax_cutoffs` must be strictly increasing and '
+                'range from `1` to `vocab_size - 1`.'
+            )
+
         # Token embedding layer.
         # Dimension: (V, E).
         self.emb_layer = torch.nn.Embedding(
@@ -198,8 +238,19 @@ class BaseResRNNModel(torch.nn.Module):
         proj_hid_to_emb.append(torch.nn.Dropout(dropout))
         self.proj_hid_to_emb = torch.nn.Sequential(*proj_hid_to_emb)
 
-    def forward(self, batch_sequences: torch.Tensor) -> torch.Tensor:
-        r"""Perform forward pass.
+        # Adaptive softmax output layer. Predict with embedding matrix when
+        # `adaptive_softmax_cutoffs` is empty.
+        # Dimension: (E, V).
+        self.adaptive_softmax = None
+        if adaptive_softmax_cutoffs:
+            self.adaptive_softmax = torch.nn.AdaptiveLogSoftmaxWithLoss(
+                in_features=d_emb,
+                n_classes=vocab_size,
+                cutoffs=list(adaptive_softmax_cutoffs)
+            )
+
+    def hidden_states(self, batch_sequences: torch.Tensor) -> torch.Tensor:
+        r"""Compute hidden vectors right before output projection.
 
         Args:
             batch_sequences:
@@ -207,7 +258,8 @@ class BaseResRNNModel(torch.nn.Module):
                 `lmp.tokenizer.BaseTokenizer` with numeric type `torch.int64`.
 
         Returns:
-            Logits for each token in sequences with numeric type `torch.float32`.
+            Hidden vectors with shape (B, S, E) and numeric type
+            `torch.float32`.
         """
         # 將 batch_sequences 中的所有 token_id 經過 embedding matrix
         # 轉換成 embedding vectors (共有 (B, S) 個維度為 E 的向量)
@@ -227,11 +279,164 @@ class BaseResRNNModel(torch.nn.Module):
         # ht 維度: (B, S, E)
         ht = self.proj_hid_to_emb(ht)
 
+        return ht
+
+    def forward(self, batch_sequences: torch.Tensor) -> torch.Tensor:
+        r"""Perform forward pass.
+
+        Args:
+            batch_sequences:
+                Batch of sequences which have been encoded by
+                `lmp.tokenizer.BaseTokenizer` with numeric type `torch.int64`.
+
+        Returns:
+            Logits for each token in sequences with numeric type `torch.float32`.
+        """
+        # ht 維度: (B, S, E)
+        ht = self.hidden_states(batch_sequences)
+
+        # 使用 adaptive softmax 時以每個 token 的 log probability 作為 logits
+        # return 維度: (B, S, V)
+        if self.adaptive_softmax is not None:
+            return self.adaptive_softmax.log_prob(
+                ht.reshape(-1, ht.size(-1))
+            ).reshape(*ht.size()[:-1], -1)
+
         # 與轉置後的 embedding matrix 進行矩陣乘法取得預測文字
         # 重複使用 embedding matrix 的目的為節省參數數量
         # return 維度: (B, S, V)
         return ht.matmul(self.emb_layer.weight.transpose(0, 1))
 
+    def loss(
+            self,
+            batch_sequences: torch.Tensor,
+            batch_next_tokens: torch.Tensor,
+            chunk_size: int = 128
+    ) -> torch.Tensor:
+        r"""Compute mean cross-entropy without full vocabulary logits.
+
+        Same as `torch.nn.functional.cross_entropy` on `self(batch_sequences)`,
+        but hidden vectors are projected onto embedding matrix `chunk_size`
+        tokens at a time (see `chunked_cross_entropy`), so (B, S, V) logits
+        are never materialized in both forward and backward pass. When using
+        adaptive softmax, only clusters containing targets are computed and
+        `chunk_size` is ignored.
+
+        Args:
+            batch_sequences:
+                Batch of sequences which have been encoded by
+                `lmp.tokenizer.BaseTokenizer` with numeric type `torch.int64`.
+            batch_next_tokens:
+                Prediction target of each token in `batch_sequences` with
+                numeric type `torch.int64`.
+            chunk_size:
+                Number of tokens projected at a time. Must be bigger than or
+                equal to `1`.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` or `batch_next_tokens` is not an
+                instance of `Tensor`, or `chunk_size` is not an instance of
+                `int`.
+            ValueError:
+                When `chunk_size < 1`.
+
+        Returns:
+            Mean cross-entropy with numeric type `torch.float32`.
+        """
+        # Type check
+        if not isinstance(batch_sequences, torch.Tensor):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Tensor`.'
+            )
+
+        if not isinstance(batch_next_tokens, torch.Tensor):
+            raise TypeError(
+                '`batch_next_tokens` must be an instance of `Tensor`.'
+            )
+
+        # ht 維度: (B, S, E)
+        ht = self.hidden_states(batch_sequences)
+
+        if self.adaptive_softmax is not None:
+            return self.adaptive_softmax(
+                ht.reshape(-1, ht.size(-1)),
+                batch_next_tokens.reshape(-1)
+            ).loss
+
+        return chunked_cross_entropy(
+            hidden=ht,
+            weight=self.emb_layer.weight,
+            target=batch_next_tokens,
+            chunk_size=chunk_size
+        )
+
+    def sampled_loss(
+            self,
+            batch_sequences: torch.Tensor,
+            batch_next_tokens: torch.Tensor,
+            noise_probs: torch.Tensor,
+            num_samples: int
+    ) -> torch.Tensor:
+        r"""Compute mean sampled softmax loss.
+
+        Each token is only scored against its target and `num_samples`
+        negative tokens sampled from `noise_probs` (see
+        `sampled_softmax_loss`), so cost does not grow with vocabulary size.
+        Only used in training; use `loss` or `predict` for exact full softmax.
+
+        Args:
+            batch_sequences:
+                Batch of sequences which have been encoded by
+                `lmp.tokenizer.BaseTokenizer` with numeric type `torch.int64`.
+            batch_next_tokens:
+                Prediction target of each token in `batch_sequences` with
+                numeric type `torch.int64`.
+            noise_probs:
+                Probability of sampling each token id as negative sample with
+                shape (V).
+            num_samples:
+                Number of negative samples. Must be bigger than or equal to
+                `1`.
+
+        Raises:
+            TypeError:
+                When `batch_sequences`, `batch_next_tokens` or `noise_probs`
+                is not an instance of `Tensor`, or `num_samples` is not an
+                instance of `int`.
+            ValueError:
+                When `num_samples < 1` or model is using adaptive softmax
+                output layer.
+
+        Returns:
+            Mean sampled softmax loss.
+        """
+        # Type check
+        if not isinstance(batch_sequences, torch.Tensor):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Tensor`.'
+            )
+
+        if not isinstance(batch_next_tokens, torch.Tensor):
+            raise TypeError(
+                '`batch_next_tokens` must be an instance of `Tensor`.'
+            )
+
+        # Value check
+        if self.adaptive_softmax is not None:
+            raise ValueError(
+                'Sampled softmax does not support adaptive softmax output '
+                'layer.'
+            )
+
+        return sampled_softmax_loss(
+            hidden=self.hidden_states(batch_sequences),
+            weight=self.emb_layer.weight,
+            target=batch_next_tokens,
+            noise_probs=noise_probs,
+            num_samples=num_samples
+        )
+
     def predict(self, batch_sequences: torch.Tensor) -> torch.Tensor:
         r"""Convert model output logits into prediction.
 
@@ -254,3 +459,92 @@ class BaseResRNNModel(torch.nn.Module):
             )
 
         return torch.nn.functional.softmax(self(batch_sequences), dim=-1)
+
+    def step(
+            self,
+            batch_sequences: torch.Tensor,
+            state: Optional[Tuple[torch.Tensor, ...]] = None
+    ) -> Tuple[torch.Tensor, Tuple[torch.Tensor, ...]]:
+        r"""Perform forward pass on new tokens starting from recurrent state.
+
+        Feeding a sequence in several calls (passing returned `state` to the
+        next call) gives the same logits as `forward` on the whole sequence,
+        but each call only runs residual RNN blocks over new tokens.
+        Decoding can thus feed the prompt once and then one token per step,
+        instead of re-running the whole prefix at every step.
+
+        Args:
+            batch_sequences:
+                Batch of new tokens which have been encoded by
+                `lmp.tokenizer.BaseTokenizer` with shape (B, S) and numeric
+                type `torch.int64`.
+            state:
+                Recurrent state returned by previous call. Start from zero
+                state when `None`. See `Returns` for its format.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` is not an instance of `Tensor` or
+                `state` is not an instance of `Tuple[Tensor, ...]`.
+
+        Returns:
+            Logits of the last token in each sequence with shape (B, V), and
+            recurrent state after the last token. Recurrent state is a tuple
+            of tensors with shape (L, B, H), which is `(h,)` for RNN and GRU
+            layers and `(h, c)` for LSTM layers. Use
+            `lmp.model.reorder_state` and `lmp.model.select_state` to
+            rearrange its batch.
+        """
+        # Type check
+        if not isinstance(batch_sequences, torch.Tensor):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Tensor`.'
+            )
+
+        if state is not None and not (
+                isinstance(state, tuple) and
+                all(map(
+                    lambda tensor: isinstance(tensor, torch.Tensor),
+                    state
+                ))
+        ):
+            raise TypeError(
+                '`state` must be an instance of `Tuple[Tensor, ...]`.'
+            )
+
+        # 將新的 token_id 轉換成 embedding vectors 後投影至 hidden dimension
+        # ht 維度: (B, S, H)
+        ht = self.proj_emb_to_hid(
+            self.emb_dropout(self.emb_layer(batch_sequences))
+        )
+
+        # 每個 residual block 從各自的 state 開始依序輸入 hidden vectors
+        # 各 block 的 state 維度: (1, B, H)
+        # ht 維度: (B, S, H)
+        block_states = []
+        for index, block in enumerate(self.rnn_layer):
+            block_state = None
+            if state is not None:
+                block_state = tuple(
+                    tensor[index:index + 1]
+                    for tensor in state
+                )
+
+            ht, block_state = block.step(x=ht, state=block_state)
+            block_states.append(block_state)
+
+        # 將所有 block 的 state 串接成維度 (L, B, H)
+        state = tuple(
+            torch.cat(tensors, dim=0)
+            for tensors in zip(*block_states)
+        )
+
+        # 只需要最後一個 token 的 hidden vector 進行預測
+        # ht 維度: (B, E)
+        ht = self.proj_hid_to_emb(ht[:, -1])
+
+        # return 維度: (B, V)
+        if self.adaptive_softmax is not None:
+            return self.adaptive_softmax.log_prob(ht), state
+
+        return ht.matmul(self.emb_layer.weight.transpose(0, 1)), state
@@ -0,0 +1,167 @@
+r"""Cross-entropy over tied output embedding computed in chunks.
+
+Usage:
+    from lmp.model._chunked_cross_entropy import chunked_cross_entropy
+
+    loss = chunked_cross_entropy(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Any
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+import torch.autograd
+import torch.nn.functional
+
+
+class _ChunkedCrossEntropyFunction(torch.autograd.Function):
+    r"""Fused output projection and cross-entropy.
+
+    Forward pass iterate through chunks of `hidden`. For each chunk, logits
+    are computed and reduced into log-sum-exp and target logit, and
+    gradients of loss with respect to chunk hidden vectors and `weight` are
+    computed right away from `softmax(logits) - one_hot(target)`. Chunk
+    logits are then freed. Backward pass only scale saved gradients by
+    incoming gradient.
+    """
+
+    @staticmethod
+    def forward(  # pylint: disable=W0221
+            ctx: Any,
+            hidden: torch.Tensor,
+            weight: torch.Tensor,
+            target: torch.Tensor,
+            chunk_size: int
+    ) -> torch.Tensor:
+        num_tokens = target.size(0)
+        requires_grad = ctx.needs_input_grad[0] or ctx.needs_input_grad[1]
+
+        total_loss = torch.zeros((), device=hidden.device)
+        if requires_grad:
+            grad_hidden = torch.empty_like(hidden)
+            grad_weight = torch.zeros_like(weight)
+
+        for start in range(0, num_tokens, chunk_size):
+            # hidden_chunk.size = (C, E)
+            # target_chunk.size = (C, 1)
+            hidden_chunk = hidden[start:start + chunk_size]
+            target_chunk = target[start:start + chunk_size].unsqueeze(-1)
+
+            # logits.size = (C, V)
+            logits = hidden_chunk.matmul(weight.transpose(0, 1)).float()
+
+            # Cross-entropy = log-sum-exp - target logit.
+            total_loss += (
+                logits.logsumexp(dim=-1) -
+                logits.gather(-1, target_chunk).squeeze(-1)
+            ).sum()
+
+            if requires_grad:
+                # Gradient of cross-entropy with respect to logits.
+                # grad_logits.size = (C, V)
+                grad_logits = logits.softmax(dim=-1)
+                grad_logits.scatter_add_(
+                    -1,
+                    target_chunk,
+                    -torch.ones_like(target_chunk, dtype=grad_logits.dtype)
+                )
+                grad_logits = grad_logits.to(hidden.dtype)
+
+                grad_hidden[start:start + chunk_size] = grad_logits.matmul(
+                    weight.to(hidden.dtype)
+                )
+                grad_weight += grad_logits.transpose(0, 1).matmul(
+                    hidden_chunk
+                ).to(weight.dtype)
+
+        if requires_grad:
+            ctx.save_for_backward(grad_hidden, grad_weight)
+        ctx.num_tokens = num_tokens
+
+        return total_loss / num_tokens
+
+    @staticmethod
+    def backward(  # pylint: disable=W0221
+            ctx: Any,
+            grad_output: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor, None, None]:
+        grad_hidden, grad_weight = ctx.saved_tensors
+        scale = grad_output / ctx.num_tokens
+        return (
+            grad_hidden * scale.to(grad_hidden.dtype),
+            grad_weight * scale.to(grad_weight.dtype),
+            None,
+            None,
+        )
+
+
+def chunked_cross_entropy(
+        hidden: torch.Tensor,
+        weight: torch.Tensor,
+        target: torch.Tensor,
+        chunk_size: int
+) -> torch.Tensor:
+    r"""Mean cross-entropy of `hidden.matmul(weight.T)` against `target`.
+
+    Result is the same as computing (N, V) logits and calling
+    `torch.nn.functional.cross_entropy`, but logits are only computed for
+    `chunk_size` hidden vectors at a time, and gradients of each chunk are
+    computed right after its loss. Peak memory is thus `O(chunk_size * V)`
+    instead of `O(N * V)`, without re-computing logits in backward pass.
+
+    Args:
+        hidden:
+            Hidden vectors with shape (..., E). All leading dimensions are
+            flattened into N.
+        weight:
+            Output embedding matrix with shape (V, E).
+        target:
+            Target token ids with shape (...) and `N` elements in total.
+        chunk_size:
+            Number of hidden vectors projected at a time. Must be bigger than
+            or equal to `1`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `chunk_size < 1`.
+
+    Returns:
+        Mean cross-entropy with numeric type `torch.float32`.
+    """
+    # Type check.
+    if not isinstance(hidden, torch.Tensor):
+        raise TypeError('`hidden` must be an instance of `Tensor`.')
+
+    if not isinstance(weight, torch.Tensor):
+        raise TypeError('`weight` must be an instance of `Tensor`.')
+
+    if not isinstance(target, torch.Tensor):
+        raise TypeError('`target` must be an instance of `Tensor`.')
+
+    if not isinstance(chunk_size, int):
+        raise TypeError('`chunk_size` must be an instance of `int`.')
+
+    # Value check.
+    if chunk_size < 1:
+        raise ValueError('`chunk_size` must be bigger than or equal to `1`.')
+
+    # hidden.size = (N, E)
+    # target.size = (N)
+    return _ChunkedCrossEntropyFunction.apply(
+        hidden.reshape(-1, hidden.size(-1)),
+        weight,
+        target.reshape(-1),
+        chunk_size
+    )
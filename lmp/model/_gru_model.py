@@ -15,6 +15,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from typing import Sequence
+
 # 3rd-party modules
 
 import torch
@@ -54,6 +56,10 @@ class GRUModel(BaseRNNModel):
         vocab_size:
             Embedding matrix vocabulary dimension. Must be bigger than or equal
             to `1`.
+        adaptive_softmax_cutoffs:
+            Cutoffs of adaptive softmax output layer. Must be strictly
+            increasing and range from `1` to `vocab_size - 1`. Use empty
+            sequence to predict with embedding matrix (full softmax) instead.
 
     Raises:
         TypeError:
@@ -72,7 +78,8 @@ class GRUModel(BaseRNNModel):
             num_linear_layers: int,
             num_rnn_layers: int,
             pad_token_id: int,
-            vocab_size: int
+            vocab_size: int,
+            adaptive_softmax_cutoffs: Sequence[int] = ()
     ):
         super().__init__(
             d_emb=d_emb,
@@ -81,7 +88,8 @@ class GRUModel(BaseRNNModel):
             num_linear_layers=num_linear_layers,
             num_rnn_layers=num_rnn_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
         # Override RNN layer(s) with GRU layer(s).
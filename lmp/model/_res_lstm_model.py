@@ -15,6 +15,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from typing import Sequence
 
 # 3rd-party modules
 
@@ -66,6 +67,10 @@ class ResLSTMModel(BaseResRNNModel):
         vocab_size:
             Embedding matrix vocabulary dimension. Must be bigger than or equal
             to `1`.
+        adaptive_softmax_cutoffs:
+            Cutoffs of adaptive softmax output layer. Must be strictly
+            increasing and range from `1` to `vocab_size - 1`. Use empty
+            sequence to predict with embedding matrix (full softmax) instead.
 
     Raises:
         TypeError:
@@ -84,7 +89,8 @@ class ResLSTMModel(BaseResRNNModel):
             num_linear_layers: int,
             num_rnn_layers: int,
             pad_token_id: int,
-            vocab_size: int
+            vocab_size: int,
+            adaptive_softmax_cutoffs: Sequence[int] = ()
     ):
         super().__init__(
             d_emb=d_emb,
@@ -93,7 +99,8 @@ class ResLSTMModel(BaseResRNNModel):
             num_linear_layers=num_linear_layers,
             num_rnn_layers=num_rnn_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
         # Override residual RNN layer(s) with residual LSTM layer(s).
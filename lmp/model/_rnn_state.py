@@ -0,0 +1,146 @@
+r"""Helper functions for recurrent states returned by `step`.
+
+Usage:
+    import lmp.model
+
+    logits, state = model.step(...)
+    state = lmp.model.reorder_state(state, index)
+    state = lmp.model.select_state(state, mask)
+    state = lmp.model.concat_state([state_1, state_2])
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Sequence
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+
+def _check_state(state: Tuple[torch.Tensor, ...]) -> None:
+    r"""Raise `TypeError` when `state` is not a tuple of tensors."""
+    if not (
+            isinstance(state, tuple) and
+            state and
+            all(map(lambda tensor: isinstance(tensor, torch.Tensor), state))
+    ):
+        raise TypeError('`state` must be an instance of `Tuple[Tensor, ...]`.')
+
+
+def concat_state(
+        states: Sequence[Tuple[torch.Tensor, ...]]
+) -> Tuple[torch.Tensor, ...]:
+    r"""Concatenate recurrent states of different batches.
+
+    Sequences of `states[0]` come first, followed by sequences of
+    `states[1]`, and so on. All states must be returned by the same model.
+
+    Args:
+        states:
+            Recurrent states returned by `step`.
+
+    Raises:
+        TypeError:
+            When `states` is not an instance of
+            `Sequence[Tuple[Tensor, ...]]`.
+        ValueError:
+            When `states` is empty.
+
+    Returns:
+        Recurrent state with batch size equal to sum of all batch sizes.
+    """
+    # Type check.
+    if not isinstance(states, (list, tuple)):
+        raise TypeError(
+            '`states` must be an instance of `Sequence[Tuple[Tensor, ...]]`.'
+        )
+
+    for state in states:
+        _check_state(state)
+
+    # Value check.
+    if not states:
+        raise ValueError('`states` must not be empty.')
+
+    return tuple(torch.cat(tensors, dim=1) for tensors in zip(*states))
+
+
+def reorder_state(
+        state: Tuple[torch.Tensor, ...],
+        index: torch.Tensor
+) -> Tuple[torch.Tensor, ...]:
+    r"""Gather batch of recurrent states by index.
+
+    Recurrent states returned by `step` are tuples of tensors with shape
+    (L, B, H), where batch is always the second dimension. Sequence `i` of
+    returned state is sequence `index[i]` of `state`. Indices can be
+    repeated, which is used to follow beam search backpointers.
+
+    Args:
+        state:
+            Recurrent state returned by `step`.
+        index:
+            Batch indices with shape (B') and numeric type `torch.int64`.
+
+    Raises:
+        TypeError:
+            When `state` is not an instance of `Tuple[Tensor, ...]` or
+            `index` is not an instance of `Tensor`.
+
+    Returns:
+        Recurrent state with batch size `B'`.
+    """
+    # Type check.
+    _check_state(state)
+
+    if not isinstance(index, torch.Tensor):
+        raise TypeError('`index` must be an instance of `Tensor`.')
+
+    index = index.to(state[0].device)
+    return tuple(tensor.index_select(1, index) for tensor in state)
+
+
+def select_state(
+        state: Tuple[torch.Tensor, ...],
+        mask: torch.Tensor
+) -> Tuple[torch.Tensor, ...]:
+    r"""Keep sequences of recurrent state selected by boolean mask.
+
+    Used to drop finished sequences from a decoding batch while preserving
+    order of remaining sequences.
+
+    Args:
+        state:
+            Recurrent state returned by `step`.
+        mask:
+            Boolean mask with shape (B). Sequence `i` is kept when `mask[i]`
+            is `True`.
+
+    Raises:
+        TypeError:
+            When `state` is not an instance of `Tuple[Tensor, ...]` or
+            `mask` is not an instance of `Tensor`.
+        ValueError:
+            When `mask` is not a boolean tensor with shape (B).
+
+    Returns:
+        Recurrent state of selected sequences.
+    """
+    # Type check.
+    _check_state(state)
+
+    if not isinstance(mask, torch.Tensor):
+        raise TypeError('`mask` must be an instance of `Tensor`.')
+
+    # Value check.
+    if mask.dtype != torch.bool or mask.size() != state[0].size()[1:2]:
+        raise ValueError('`mask` must be boolean tensor with shape (B).')
+
+    return reorder_state(state=state, index=mask.nonzero().squeeze(-1))
@@ -0,0 +1,124 @@
+r"""Sampled softmax over tied output embedding.
+
+Usage:
+    from lmp.model._sampled_softmax import sampled_softmax_loss
+
+    loss = sampled_softmax_loss(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+
+# 3rd-party modules
+
+import torch
+import torch.nn.functional
+
+
+def sampled_softmax_loss(
+        hidden: torch.Tensor,
+        weight: torch.Tensor,
+        target: torch.Tensor,
+        noise_probs: torch.Tensor,
+        num_samples: int
+) -> torch.Tensor:
+    r"""Mean sampled softmax loss of `hidden.matmul(weight.T)` on `target`.
+
+    `num_samples` negative token ids are drawn with replacement from
+    `noise_probs` and shared by all hidden vectors. Each hidden vector is
+    only scored against its target and the sampled negatives, so cost is
+    `O(N * num_samples * E)` instead of `O(N * V * E)`.
+
+    Logits are corrected by subtracting log of expected number of times each
+    token is sampled (`log(num_samples * noise_probs)`), which makes sampled
+    softmax an estimate of full softmax cross-entropy. Sampled negatives
+    equal to target (accidental hits) are masked out.
+
+    Args:
+        hidden:
+            Hidden vectors with shape (..., E). All leading dimensions are
+            flattened into N.
+        weight:
+            Output embedding matrix with shape (V, E).
+        target:
+            Target token ids with shape (...) and `N` elements in total.
+        noise_probs:
+            Probability of sampling each token id with shape (V). All
+            probabilities must be bigger than `0`.
+        num_samples:
+            Number of negative samples. Must be bigger than or equal to `1`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `num_samples < 1`.
+
+    Returns:
+        Mean sampled softmax loss.
+    """
+    # Type check.
+    if not isinstance(hidden, torch.Tensor):
+        raise TypeError('`hidden` must be an instance of `Tensor`.')
+
+    if not isinstance(weight, torch.Tensor):
+        raise TypeError('`weight` must be an instance of `Tensor`.')
+
+    if not isinstance(target, torch.Tensor):
+        raise TypeError('`target` must be an instance of `Tensor`.')
+
+    if not isinstance(noise_probs, torch.Tensor):
+        raise TypeError('`noise_probs` must be an instance of `Tensor`.')
+
+    if not isinstance(num_samples, int):
+        raise TypeError('`num_samples` must be an instance of `int`.')
+
+    # Value check.
+    if num_samples < 1:
+        raise ValueError('`num_samples` must be bigger than or equal to `1`.')
+
+    # hidden.size = (N, E)
+    # target.size = (N)
+    hidden = hidden.reshape(-1, hidden.size(-1))
+    target = target.reshape(-1)
+
+    # samples.size = (K)
+    samples = torch.multinomial(noise_probs, num_samples, replacement=True)
+
+    # Log of expected number of times each token is sampled.
+    # log_expected_count.size = (V)
+    log_expected_count = noise_probs.log() + math.log(num_samples)
+
+    # true_logits.size = (N, 1)
+    true_logits = (
+        (hidden * weight[target].to(hidden.dtype)).sum(dim=-1) -
+        log_expected_count[target]
+    ).unsqueeze(-1)
+
+    # sampled_logits.size = (N, K)
+    sampled_logits = (
+        hidden.matmul(weight[samples].to(hidden.dtype).transpose(0, 1)) -
+        log_expected_count[samples]
+    )
+
+    # Remove accidental hits.
+    sampled_logits = sampled_logits.masked_fill(
+        samples.unsqueeze(0) == target.unsqueeze(-1),
+        -math.inf
+    )
+
+    # Target is always at index 0.
+    # logits.size = (N, 1 + K)
+    logits = torch.cat([true_logits, sampled_logits], dim=-1).float()
+
+    return torch.nn.functional.cross_entropy(
+        logits,
+        torch.zeros_like(target)
+    )
@@ -60,6 +60,10 @@ class BaseDictTokenizer(BaseTokenizer):
         pad_token:
             Token represent padding of a sequence. Only used when sequence
             length is shorter than must.
+        token_freq:
+            Frequency of each token counted by `build_vocab`. Frequencies of
+            tokens discarded by `min_count` are added to unknown token. Both
+            `[bos]` and `[eos]` are counted once per sequence.
         token_to_id:
             Token to id look up data structure. Implemented with `dict` data
             structure.
@@ -85,6 +89,9 @@ class BaseDictTokenizer(BaseTokenizer):
         self.token_to_id = {}
         self.id_to_token = {}
 
+        # Token frequencies are counted in `build_vocab`.
+        self.token_freq = {}
+
         # Initialize with special tokens mapping.
         for token_id, token in enumerate(self.__class__.special_tokens()):
             self.token_to_id[token] = token_id
@@ -132,6 +139,7 @@ class BaseDictTokenizer(BaseTokenizer):
         self = cls(is_uncased=obj['is_uncased'])
         self.token_to_id = obj['token_to_id']
         self.id_to_token = {v: i for i, v in self.token_to_id.items()}
+        self.token_freq = obj.get('token_freq', {})
 
         return self
 
@@ -255,8 +263,10 @@ class BaseDictTokenizer(BaseTokenizer):
 
         try:
             token_freq_counter = {}
+            num_sequences = 0
 
             for sequence in batch_sequences:
+                num_sequences += 1
                 for token in self.tokenize(sequence):
                     if token not in token_freq_counter:
                         token_freq_counter[token] = 0
@@ -295,3 +305,16 @@ class BaseDictTokenizer(BaseTokenizer):
             new_token_id = fake_token_id + start_token_id
             self.token_to_id[new_token] = new_token_id
             self.id_to_token[new_token_id] = new_token
+
+        # Record token frequencies. Discarded tokens will be encoded as unknown
+        # token.
+        for token, freq in token_freq_counter.items():
+            if token not in self.token_to_id:
+                token = self.__class__.unk_token
+            self.token_freq[token] = self.token_freq.get(token, 0) + freq
+
+        # Each sequence is encoded with exactly one `[bos]` and one `[eos]`.
+        for token in (self.__class__.bos_token, self.__class__.eos_token):
+            self.token_freq[token] = (
+                self.token_freq.get(token, 0) + num_sequences
+            )
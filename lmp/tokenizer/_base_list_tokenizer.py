@@ -58,6 +58,10 @@ class BaseListTokenizer(BaseTokenizer):
         pad_token:
             Token represent padding of a sequence. Only used when sequence
             length is shorter than must.
+        token_freq:
+            Frequency of each token counted by `build_vocab`. Frequencies of
+            tokens discarded by `min_count` are added to unknown token. Both
+            `[bos]` and `[eos]` are counted once per sequence.
         token_to_id:
             Token to id look up data structure. Implemented with `list` data
             structure.
@@ -83,6 +87,9 @@ class BaseListTokenizer(BaseTokenizer):
         # and inverse look up.
         self.token_to_id = list(self.__class__.special_tokens())
 
+        # Token frequencies are counted in `build_vocab`.
+        self.token_freq = {}
+
     @classmethod
     def load(cls, experiment: str):
         r"""Load tokenizer JSON file.
@@ -124,6 +131,7 @@ class BaseListTokenizer(BaseTokenizer):
 
         self = cls(is_uncased=obj['is_uncased'])
         self.token_to_id = obj['token_to_id']
+        self.token_freq = obj.get('token_freq', {})
 
         return self
 
@@ -249,8 +257,10 @@ class BaseListTokenizer(BaseTokenizer):
 
         try:
             token_freq_counter = {}
+            num_sequences = 0
 
             for sequence in batch_sequences:
+                num_sequences += 1
                 for token in self.tokenize(sequence):
                     if token not in token_freq_counter:
                         token_freq_counter[token] = 0
@@ -284,3 +294,19 @@ class BaseListTokenizer(BaseTokenizer):
         # Add new tokens to vocabulary.
         for new_token in build_vocab_iterator:
             self.token_to_id.append(new_token)
+
+        # Use `set` to look up tokens in `list` vocabulary.
+        vocab = set(self.token_to_id)
+
+        # Record token frequencies. Discarded tokens will be encoded as unknown
+        # token.
+        for token, freq in token_freq_counter.items():
+            if token not in vocab:
+                token = self.__class__.unk_token
+            self.token_freq[token] = self.token_freq.get(token, 0) + freq
+
+        # Each sequence is encoded with exactly one `[bos]` and one `[eos]`.
+        for token in (self.__class__.bos_token, self.__class__.eos_token):
+            self.token_freq[token] = (
+                self.token_freq.get(token, 0) + num_sequences
+            )
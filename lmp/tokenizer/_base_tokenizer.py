@@ -16,6 +16,7 @@ from __future__ import unicode_literals
 
 import abc
 import json
+import math
 import os
 import re
 import unicodedata
@@ -48,6 +49,10 @@ class BaseTokenizer:
         pad_token:
             Token represent padding of a sequence. Only used when sequence
             length is shorter than must.
+        token_freq:
+            Frequency of each token counted by `build_vocab`. Frequencies of
+            tokens discarded by `min_count` are added to unknown token. Both
+            `[bos]` and `[eos]` are counted once per sequence.
         token_to_id:
             Token to id look up data structure.
         unk_token:
@@ -95,7 +100,7 @@ class BaseTokenizer:
     def reset_vocab(self) -> None:
         r"""Reset vocabulary to initial state.
 
-        This method must declare `self.token_to_id`.
+        This method must declare `self.token_freq` and `self.token_to_id`.
         """
         raise NotImplementedError(
             f'In class `{self.__class__.__name__}`: '
@@ -168,6 +173,7 @@ class BaseTokenizer:
                 json.dump(
                     {
                         'is_uncased': self.is_uncased,
+                        'token_freq': self.token_freq,
                         'token_to_id': self.token_to_id,
                     },
                     output_file,
@@ -265,6 +271,98 @@ class BaseTokenizer:
             'method `detokenize` not implemented yet.'
         )
 
+    @abc.abstractmethod
+    def stream_detokenize(
+            self,
+            tokens: Iterable[str]
+    ) -> Generator[str, None, None]:
+        r"""Convert tokens back to sequence incrementally.
+
+        Each time a token is taken from `tokens`, yield text appended to
+        sequence by that token. Thus `tokens` can be produced lazily (for
+        example, by language model one token at a time).
+
+        Args:
+            tokens:
+                Tokens to be converted.
+
+        Raises:
+            TypeError:
+                When `tokens` is not an instance of `Iterable[str]`.
+
+        Yields:
+            Text appended to sequence by each token.
+        """
+        raise NotImplementedError(
+            f'In class `{self.__class__.__name__}`: '
+            'method `stream_detokenize` not implemented yet.'
+        )
+
+    def _stream_join(
+            self,
+            tokens: Iterable[str],
+            separator: str
+    ) -> Generator[str, None, None]:
+        r"""Join tokens with `separator` and normalize incrementally.
+
+        Normalization is the same as `normalize`, but each token is
+        normalized alone, so cost of each token does not grow with sequence
+        length. Leading whitespace characters are dropped, and whitespace
+        characters are held back until next non-whitespace character comes.
+        Thus trailing whitespace characters are never yielded, and
+        consecutive whitespace characters are yielded as single whitespace
+        character. Concatenation of all yielded texts is the same as joining
+        tokens with `separator` then calling `normalize`, except that NFKC
+        composition across tokens (token starting with combining character)
+        is not performed.
+
+        Args:
+            tokens:
+                Tokens to be joined.
+            separator:
+                Text inserted between tokens.
+
+        Raises:
+            TypeError:
+                When `tokens` is not an instance of `Iterable[str]`.
+
+        Yields:
+            Text appended to sequence by each token.
+        """
+        # Whether any non-whitespace character was yielded.
+        has_text = False
+        # Whether whitespace characters were held back.
+        has_space = False
+
+        for index, token in enumerate(tokens):
+            if not isinstance(token, str):
+                raise TypeError(
+                    '`tokens` must be an instance of `Iterable[str]`.'
+                )
+
+            # NFKC normalization and case conversion of single token.
+            token = unicodedata.normalize('NFKC', token)
+            if self.is_uncased:
+                token = token.lower()
+
+            if index > 0:
+                token = separator + token
+
+            text = []
+            for char in token:
+                if char.isspace():
+                    has_space = has_text
+                    continue
+
+                if has_space:
+                    text.append(' ')
+                    has_space = False
+
+                text.append(char)
+                has_text = True
+
+            yield ''.join(text)
+
     @abc.abstractmethod
     def convert_token_to_id(self, token: str) -> int:
         r"""Perform token id look up.
@@ -636,6 +734,44 @@ class BaseTokenizer:
             'method `build_vocab` not implemented yet.'
         )
 
+    def unigram_distribution(self, alpha: float = 0.75) -> List[float]:
+        r"""Unigram distribution of token ids smoothed by power `alpha`.
+
+        Probability of each token id is proportional to `freq ** alpha`,
+        where `freq` is token's frequency in `self.token_freq`. Tokens without
+        recorded frequency (for example `[pad]`) are treated as appearing once,
+        so that every token has non-zero probability.
+        `alpha < 1.0` flattens distribution toward rare tokens.
+
+        Args:
+            alpha:
+                Smoothing power. Must be bigger than or equal to `0.0`.
+
+        Raises:
+            TypeError:
+                When `alpha` is not an instance of `float`.
+            ValueError:
+                When `alpha < 0.0`.
+
+        Returns:
+            Probability of each token id.
+        """
+        # Type check.
+        if not isinstance(alpha, float):
+            raise TypeError('`alpha` must be an instance of `float`.')
+
+        # Value check.
+        if alpha < 0.0 or math.isnan(alpha):
+            raise ValueError('`alpha` must be bigger than or equal to `0.0`.')
+
+        weights = []
+        for token_id in range(self.vocab_size):
+            token = self.convert_id_to_token(token_id)
+            weights.append(max(self.token_freq.get(token, 0), 1) ** alpha)
+        total_weight = sum(weights)
+
+        return [weight / total_weight for weight in weights]
+
     @property
     def vocab_size(self) -> int:
         r"""Vocabulary size of tokenizer."""
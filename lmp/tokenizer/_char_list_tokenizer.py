@@ -29,6 +29,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+from typing import Generator
 from typing import Iterable
 from typing import List
 
@@ -55,6 +56,10 @@ class CharListTokenizer(BaseListTokenizer):
         pad_token:
             Token represent padding of a sequence. Only used when sequence
             length is shorter than must.
+        token_freq:
+            Frequency of each token counted by `build_vocab`. Frequencies of
+            tokens discarded by `min_count` are added to unknown token. Both
+            `[bos]` and `[eos]` are counted once per sequence.
         token_to_id:
             Token to id look up data structure. Implemented with `list` data
             structure.
@@ -127,3 +132,32 @@ class CharListTokenizer(BaseListTokenizer):
 
         # First perform detokenization, then do normalization.
         return self.normalize(''.join(tokens))
+
+    def stream_detokenize(
+            self,
+            tokens: Iterable[str]
+    ) -> Generator[str, None, None]:
+        r"""Convert tokens back to sequence incrementally.
+
+        Since each tokens are originally tokenized as characters, each token is
+        appended to sequence without separator. Each token is normalized
+        alone, and whitespace characters are handled incrementally. Thus
+        concatenation of all yielded texts is the same as `detokenize(tokens)`,
+        while cost of each token does not grow with sequence length.
+
+        Args:
+            tokens:
+                Tokens to be converted. Can be produced lazily.
+
+        Raises:
+            TypeError:
+                When `tokens` is not an instance of `Iterable[str]`.
+
+        Yields:
+            Text appended to sequence by each token.
+        """
+        # Type check.
+        if not isinstance(tokens, Iterable):
+            raise TypeError('`tokens` must be an instance of `Iterable[str]`.')
+
+        return self._stream_join(tokens=tokens, separator='')
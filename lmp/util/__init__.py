@@ -27,21 +27,33 @@ from __future__ import unicode_literals
 from lmp.util._analogy_eval import analogy_eval
 from lmp.util._analogy_eval import analogy_inference
 from lmp.util._config import load_config
+from lmp.util._continuous_batching import ContinuousBatchScheduler
 from lmp.util._dataset import load_dataset
 from lmp.util._dataset import load_dataset_by_config
 from lmp.util._perplexity_eval import perplexity_eval
 from lmp.util._perplexity_eval import batch_perplexity_eval
+from lmp.util._generate_sequence import generate_batch
+from lmp.util._generate_sequence import generate_batch_by_config
 from lmp.util._generate_sequence import generate_sequence
 from lmp.util._generate_sequence import generate_sequence_by_config
+from lmp.util._generate_sequence import sample_batch
+from lmp.util._generate_sequence import sample_batch_by_config
+from lmp.util._generate_sequence import stream_sequence
+from lmp.util._generate_sequence import stream_sequence_by_config
+from lmp.util._generation_server import GenerationServer
 from lmp.util._model import load_model
 from lmp.util._model import load_model_by_config
 from lmp.util._optimizer import load_optimizer
 from lmp.util._optimizer import load_optimizer_by_config
+from lmp.util._prefetch import BatchPrefetcher
+from lmp.util._prefix_cache import PrefixStateCache
+from lmp.util._seed import seed_worker
 from lmp.util._seed import set_seed
 from lmp.util._seed import set_seed_by_config
 from lmp.util._tokenizer import load_tokenizer
 from lmp.util._tokenizer import load_tokenizer_by_config
 from lmp.util._train_model import train_model
 from lmp.util._train_model import train_model_by_config
+from lmp.util._train_model import train_model_hogwild_by_config
 from lmp.util._train_tokenizer import train_tokenizer
 from lmp.util._train_tokenizer import train_tokenizer_by_config
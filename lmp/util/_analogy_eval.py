@@ -20,7 +20,6 @@ from typing import Union
 
 import torch
 
-from sklearn.metrics import accuracy_score
 from tqdm import tqdm
 
 # self-made modules
@@ -29,6 +28,9 @@ import lmp.dataset
 import lmp.model
 import lmp.tokenizer
 
+# Number of samples evaluated at a time.
+_EVAL_BATCH_SIZE = 1000
+
 
 @torch.no_grad()
 def analogy_inference(
@@ -126,6 +128,7 @@ def analogy_inference(
     return tokenizer.convert_id_to_token(word_d_id)
 
 
+@torch.no_grad()
 def analogy_eval(
         dataset: lmp.dataset.AnalogyDataset,
         device: torch.device,
@@ -134,6 +137,13 @@ def analogy_eval(
 ) -> Dict[str, float]:
     r"""Helper function for calculating word analogy dataset accuracy.
 
+    All samples are encoded once by `lmp.dataset.AnalogyDataset.encode`, and
+    predictions are calculated for `_EVAL_BATCH_SIZE` samples at a time.
+    Prediction is the same as `analogy_inference`: the word whose embedding
+    has maximum cosine similarity with
+    `emb(word_b) - emb(word_a) + emb(word_c)`. Prediction is correct only if
+    `word_d` is in `tokenizer`'s vocabulary.
+
     Args:
         device:
             Model running device.
@@ -164,42 +174,72 @@ def analogy_eval(
             '`dataset` must be an instance of `lmp.dataset.AnalogyDataset`'
         )
 
-    # Save each `word_d` and `pred_word_d` for their respective category
-    # accuracy and total accuracy.
-    pred_per_cat = {
-        'total': {
-            'ans': [],
-            'pred': [],
-        }
-    }
-    for word_a, word_b, word_c, word_d, category in tqdm(dataset):
-        if category not in pred_per_cat:
-            pred_per_cat[category] = {
-                'ans': [],
-                'pred': [],
-            }
-
-        pred_per_cat[category]['ans'].append(word_d)
-        pred_per_cat['total']['ans'].append(word_d)
-
-        pred_word_d = analogy_inference(
-            device=device,
-            model=model,
-            tokenizer=tokenizer,
-            word_a=word_a,
-            word_b=word_b,
-            word_c=word_c
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
         )
 
-        pred_per_cat[category]['pred'].append(pred_word_d)
-        pred_per_cat['total']['pred'].append(pred_word_d)
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
 
-    acc_per_cat = {}
+    # Evaluation mode.
+    model.eval()
+    model = model.to(device)
 
-    for category in pred_per_cat:
-        acc_per_cat[category] = accuracy_score(
-            pred_per_cat[category]['ans'],
-            pred_per_cat[category]['pred'],
+    # Shape: `(N, 4)`, `(N)` and `(N, 4)`.
+    token_ids, category_ids, categories, is_oov = dataset.encode(tokenizer)
+
+    # Normalize embeddings once so that cosine similarity become matrix
+    # multiplication.
+    # Shape: `(V, E)`.
+    emb_weight = model.emb_layer.weight
+    norm_emb_weight = emb_weight / emb_weight.norm(
+        dim=1,
+        keepdim=True
+    ).clamp(min=1e-8)
+
+    # Whether each prediction is correct.
+    # Shape: `(N)`.
+    is_correct = []
+    for start in tqdm(range(0, len(token_ids), _EVAL_BATCH_SIZE)):
+        # Shape: `(B, 4)`.
+        batch_token_ids = token_ids[start:start + _EVAL_BATCH_SIZE].to(device)
+
+        # Perform analogy calculation.
+        # Shape: `(B, E)`.
+        out = (
+            model.emb_layer(batch_token_ids[:, 1]) -
+            model.emb_layer(batch_token_ids[:, 0]) +
+            model.emb_layer(batch_token_ids[:, 2])
         )
 
+        # Get the token id with maximum consine similarity.
+        # Shape: `(B)`.
+        pred_word_d_ids = (out @ norm_emb_weight.T).argmax(dim=1)
+
+        is_correct.append(
+            (pred_word_d_ids == batch_token_ids[:, 3]).to('cpu')
+        )
+
+    is_correct = torch.cat(is_correct) if is_correct else torch.BoolTensor()
+
+    # Out-of-vocabulary `word_d` can never be predicted.
+    is_correct = is_correct & ~is_oov[:, 3]
+
+    acc_per_cat = {'total': is_correct.double().mean().item()}
+
+    for category_id, category in enumerate(categories):
+        acc_per_cat[category] = is_correct[
+            category_ids == category_id
+        ].double().mean().item()
+
     return acc_per_cat
@@ -29,11 +29,17 @@ def load_config(args: argparse.Namespace) -> lmp.config.BaseConfig:
 
     Args:
         args:
-            Standard input argument parser object with attributes `batch_size`,
-            `checkpoint_step`, `d_emb`, `d_hid`, `dataset`, `dropout`, `epoch`,
-            `experiment`, `is_uncased`, `learning_rate`, `max_norm`,
-            `max_seq_len`, `min_count`, `model_class`, `num_linear_layers`,
-            `num_rnn_layers`, `optimizer_class`, `seed` and `tokenizer_class`.
+            Standard input argument parser object with attributes
+            `accumulation_steps`, `adaptive_softmax_cutoffs`, `batch_size`,
+            `checkpoint_step`, `d_emb`, `d_hid`, `dataset`, `dropout`,
+            `epoch`, `experiment`, `is_compact`, `is_file_backed`,
+            `is_uncased`, `learning_rate`, `max_norm`, `max_seq_len`,
+            `max_tokens`, `min_count`, `model_class`, `num_linear_layers`,
+            `num_negative_samples`, `num_preprocess_workers`,
+            `num_rnn_layers`, `num_workers`, `optimizer_class`,
+            `persistent_workers`, `pin_memory`, `prefetch_batches`,
+            `prefetch_factor`, `precision`, `seed`, `tokenizer_class` and
+            `unigram_alpha`.
 
     Raises:
         TypeError:
@@ -57,6 +63,8 @@ def load_config(args: argparse.Namespace) -> lmp.config.BaseConfig:
     # Create new configuration object.
     else:
         config = lmp.config.BaseConfig(
+            accumulation_steps=args.accumulation_steps,
+            adaptive_softmax_cutoffs=args.adaptive_softmax_cutoffs,
             batch_size=args.batch_size,
             checkpoint_step=args.checkpoint_step,
             d_emb=args.d_emb,
@@ -65,17 +73,29 @@ def load_config(args: argparse.Namespace) -> lmp.config.BaseConfig:
             dropout=args.dropout,
             epoch=args.epoch,
             experiment=args.experiment,
+            is_compact=args.is_compact,
+            is_file_backed=args.is_file_backed,
             is_uncased=args.is_uncased,
             learning_rate=args.learning_rate,
             max_norm=args.max_norm,
             max_seq_len=args.max_seq_len,
+            max_tokens=args.max_tokens,
             min_count=args.min_count,
             model_class=args.model_class,
             num_linear_layers=args.num_linear_layers,
+            num_negative_samples=args.num_negative_samples,
+            num_preprocess_workers=args.num_preprocess_workers,
             num_rnn_layers=args.num_rnn_layers,
+            num_workers=args.num_workers,
             optimizer_class=args.optimizer_class,
+            persistent_workers=args.persistent_workers,
+            pin_memory=args.pin_memory,
+            prefetch_batches=args.prefetch_batches,
+            prefetch_factor=args.prefetch_factor,
+            precision=args.precision,
             seed=args.seed,
-            tokenizer_class=args.tokenizer_class
+            tokenizer_class=args.tokenizer_class,
+            unigram_alpha=args.unigram_alpha
         )
 
     return config
@@ -0,0 +1,463 @@
+r"""Helper class for decoding with iteration-level (continuous) batching.
+
+Usage:
+    import lmp.util
+
+    scheduler = lmp.util.ContinuousBatchScheduler(...)
+    request_id = scheduler.add(...)
+    while len(scheduler) > 0:
+        for request_id, sequence in scheduler.step():
+            ...
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+import torch.nn.functional
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._generate_sequence import _sample_next_token
+
+
+class ContinuousBatchScheduler:
+    r"""Admit and retire sequences of decoding batch at every step.
+
+    Batched decoding (for example, `lmp.util.sample_batch`) runs until the
+    longest sequence of a batch finishes, so finished sequences leave idle
+    slots and waiting sequences can not start. `ContinuousBatchScheduler`
+    schedules each decoding step instead. Sequences added by `add` wait in a
+    queue, and each `step` call does the following:
+
+    1. Waiting sequences are admitted into free slots of running batch.
+       Recurrent states of admitted sequences start from zero state and are
+       concatenated after running batch (see `lmp.model.concat_state`).
+    2. Each running sequence feeds one token into model with a single
+       `model.step` call. Sequences just admitted feed their beginning of
+       sequences one token per step, and other sequences feed their last
+       generated token. Thus every step costs exactly one batched call, no
+       matter how many sequences are admitted.
+    3. Next token of every sequence which have fed its whole beginning of
+       sequence is sampled as in `lmp.util.sample_batch`.
+    4. Sequences generating `[eos]` or reaching `max_seq_len` are returned
+       and removed from running batch (see `lmp.model.select_state`).
+
+    Attributes:
+        device:
+            Model running device.
+        max_batch_size:
+            Maximum number of sequences decoded together.
+        max_seq_len:
+            Maximum of output sequences length.
+        model:
+            Language model.
+        num_steps:
+            Number of `model.step` calls.
+        num_tokens:
+            Number of tokens generated.
+        temperature:
+            Next token logits are divided by `temperature`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        top_k:
+            Only sample from `top_k` most likely tokens.
+        top_p:
+            Only sample from the smallest set of most likely tokens whose
+            total probability is at least `top_p`.
+
+    Args:
+        device:
+            Model running device.
+        max_batch_size:
+            Maximum number of sequences decoded together. Must be bigger
+            than or equal to `1`.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        seed:
+            Random seed of sampling. Use global random state when `seed` is
+            `None`. Must be bigger than or equal to `1`.
+        temperature:
+            Divide next token logits by `temperature`. Smaller temperature
+            makes sampling more greedy. Must be bigger than `0.0`.
+        top_k:
+            Only sample from `top_k` most likely tokens. Disable top-k
+            filtering when `top_k` is `0`. Use `1` for greedy decoding. Must
+            be bigger than or equal to `0`.
+        top_p:
+            Only sample from the smallest set of most likely tokens whose
+            total probability is at least `top_p`. Disable top-p filtering
+            when `top_p` is `1.0`. Must be bigger than `0.0` and smaller than
+            or equal to `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            device: torch.device,
+            max_batch_size: int,
+            max_seq_len: int,
+            model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+            tokenizer: lmp.tokenizer.BaseTokenizer,
+            seed: Optional[int] = None,
+            temperature: float = 1.0,
+            top_k: int = 0,
+            top_p: float = 1.0
+    ):
+        # Type check.
+        if not isinstance(device, torch.device):
+            raise TypeError('`device` must be an instance of `torch.device`.')
+
+        if not isinstance(max_batch_size, int):
+            raise TypeError('`max_batch_size` must be an instance of `int`.')
+
+        if not isinstance(max_seq_len, int):
+            raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+        if not isinstance(model, (
+                lmp.model.BaseRNNModel,
+                lmp.model.BaseResRNNModel
+        )):
+            raise TypeError(
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+            )
+
+        if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+            raise TypeError(
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.'
+            )
+
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError('`seed` must be an instance of `Optional[int]`.')
+
+        if not isinstance(temperature, float):
+            raise TypeError('`temperature` must be an instance of `float`.')
+
+        if not isinstance(top_k, int):
+            raise TypeError('`top_k` must be an instance of `int`.')
+
+        if not isinstance(top_p, float):
+            raise TypeError('`top_p` must be an instance of `float`.')
+
+        # Value check.
+        if max_batch_size < 1:
+            raise ValueError(
+                '`max_batch_size` must be bigger than or equal to `1`.'
+            )
+
+        if max_seq_len < 2:
+            raise ValueError(
+                '`max_seq_len` must be bigger than or equal to `2`.'
+            )
+
+        if seed is not None and seed < 1:
+            raise ValueError('`seed` must be bigger than or equal to `1`.')
+
+        if not temperature > 0.0:
+            raise ValueError('`temperature` must be bigger than `0.0`.')
+
+        if top_k < 0:
+            raise ValueError('`top_k` must be bigger than or equal to `0`.')
+
+        if not 0.0 < top_p <= 1.0:
+            raise ValueError(
+                '`top_p` must be bigger than `0.0` and smaller than or equal '
+                'to `1.0`.'
+            )
+
+        self.device = device
+        self.max_batch_size = max_batch_size
+        self.max_seq_len = max_seq_len
+        self.model = model
+        self.num_steps = 0
+        self.num_tokens = 0
+        self.temperature = temperature
+        self.tokenizer = tokenizer
+        self.top_k = top_k
+        self.top_p = top_p
+
+        # Use dedicated random number generator so that sampling is
+        # reproducible without changing global random state.
+        self._generator = None
+        if seed is not None:
+            self._generator = torch.Generator(device=device)
+            self._generator.manual_seed(seed)
+
+        self._eos_token_id = tokenizer.convert_token_to_id(
+            tokenizer.__class__.eos_token
+        )
+        self._next_request_id = 0
+
+        # Waiting sequences as pairs of request id and encoded beginning of
+        # sequence.
+        self._waiting = collections.deque()
+
+        # Running sequences. Row `i` of each tensor and recurrent state
+        # belongs to request `self._running[i]`. `self._prompt_ids` has shape
+        # (B, P) and other tensors have shape (B).
+        self._last_ids = None
+        self._num_steps = None
+        self._positions = None
+        self._prompt_ids = None
+        self._prompt_lens = None
+        self._running = []
+        self._state = None
+        self._token_ids = {}
+
+    def __len__(self) -> int:
+        r"""Number of waiting and running sequences."""
+        return len(self._waiting) + len(self._running)
+
+    def add(self, begin_of_sequence: str) -> int:
+        r"""Add sequence to waiting queue.
+
+        Args:
+            begin_of_sequence:
+                Begining of sequence which model will auto-complete.
+
+        Raises:
+            TypeError:
+                When `begin_of_sequence` is not an instance of `str`.
+
+        Returns:
+            Request id of added sequence, which is returned by `step` along
+            with generated sequence.
+        """
+        # Type check.
+        if not isinstance(begin_of_sequence, str):
+            raise TypeError(
+                '`begin_of_sequence` must be an instance of `str`.'
+            )
+
+        request_id = self._next_request_id
+        self._next_request_id += 1
+
+        # Remove `[eos]` since we are using begin of sentence.
+        self._waiting.append((
+            request_id,
+            self.tokenizer.encode(begin_of_sequence, max_seq_len=-1)[:-1]
+        ))
+
+        return request_id
+
+    def _admit(self) -> List[Tuple[int, str]]:
+        r"""Move waiting sequences into free slots of running batch.
+
+        Returns:
+            Waiting sequences already reaching `self.max_seq_len`, which are
+            finished without being fed into model.
+        """
+        finished = []
+        admitted = []
+        while (
+                self._waiting and
+                len(self._running) + len(admitted) < self.max_batch_size
+        ):
+            request_id, token_ids = self._waiting.popleft()
+            if len(token_ids) >= self.max_seq_len:
+                finished.append((
+                    request_id,
+                    self.tokenizer.decode(token_ids)
+                ))
+            else:
+                admitted.append(request_id)
+                self._token_ids[request_id] = token_ids
+
+        if not admitted:
+            return finished
+
+        # Pad beginning of sequences to the same length.
+        prompts = [self._token_ids[i] for i in admitted]
+        max_len = max(map(len, prompts))
+        if self._running:
+            max_len = max(max_len, self._prompt_ids.size(1))
+
+        # Admitted sequences have not fed any token yet.
+        prompt_ids = torch.LongTensor([
+            prompt + [0] * (max_len - len(prompt))
+            for prompt in prompts
+        ]).to(self.device)
+        prompt_lens = torch.LongTensor(list(map(len, prompts))).to(
+            self.device
+        )
+        last_ids = torch.zeros_like(prompt_lens)
+        num_steps = self.max_seq_len - prompt_lens
+        positions = torch.zeros_like(prompt_lens)
+        state = None
+
+        # Admitted sequences are appended after running sequences, and their
+        # recurrent states start from zero state.
+        if self._running:
+            prompt_ids = torch.cat([
+                torch.nn.functional.pad(
+                    self._prompt_ids,
+                    (0, max_len - self._prompt_ids.size(1))
+                ),
+                prompt_ids
+            ])
+            prompt_lens = torch.cat([self._prompt_lens, prompt_lens])
+            last_ids = torch.cat([self._last_ids, last_ids])
+            num_steps = torch.cat([self._num_steps, num_steps])
+            positions = torch.cat([self._positions, positions])
+            state = lmp.model.concat_state(states=[
+                self._state,
+                tuple(
+                    tensor.new_zeros(
+                        tensor.size(0),
+                        len(admitted),
+                        tensor.size(2)
+                    )
+                    for tensor in self._state
+                ),
+            ])
+
+        self._last_ids = last_ids
+        self._num_steps = num_steps
+        self._positions = positions
+        self._prompt_ids = prompt_ids
+        self._prompt_lens = prompt_lens
+        self._running.extend(admitted)
+        self._state = state
+
+        return finished
+
+    def _retire(self, alive: torch.Tensor) -> None:
+        r"""Remove finished sequences from running batch."""
+        alive_list = alive.tolist()
+        self._running = [
+            request_id
+            for request_id, is_alive in zip(self._running, alive_list)
+            if is_alive
+        ]
+
+        if not self._running:
+            self._last_ids = None
+            self._num_steps = None
+            self._positions = None
+            self._prompt_ids = None
+            self._prompt_lens = None
+            self._state = None
+            return
+
+        self._last_ids = self._last_ids[alive]
+        self._num_steps = self._num_steps[alive]
+        self._positions = self._positions[alive]
+        self._prompt_ids = self._prompt_ids[alive]
+        self._prompt_lens = self._prompt_lens[alive]
+        self._state = lmp.model.select_state(state=self._state, mask=alive)
+
+    @torch.no_grad()
+    def step(self) -> List[Tuple[int, str]]:
+        r"""Feed one token of every running sequence into model.
+
+        Waiting sequences are admitted into running batch first. Then one
+        token of every running sequence is fed into model, and next tokens
+        are sampled. Finished sequences are removed from running batch.
+
+        Returns:
+            Request id and generated sequence of sequences finished at this
+            step. Finished sequences end with `[eos]`, and unfinished
+            sequences have length `max_seq_len`.
+        """
+        # Evaluation mode.
+        self.model.eval()
+
+        finished = self._admit()
+        if not self._running:
+            return finished
+
+        # Feed next token of beginning of sequence, or last generated token
+        # when whole beginning of sequence has been fed.
+        # `input_ids` has shape (B).
+        prefilling = self._positions < self._prompt_lens
+        input_ids = torch.where(
+            prefilling,
+            self._prompt_ids.gather(
+                1,
+                self._positions.clamp(
+                    max=self._prompt_ids.size(1) - 1
+                ).unsqueeze(-1)
+            ).squeeze(-1),
+            self._last_ids
+        )
+
+        # `logits` has shape (B, V).
+        logits, self._state = self.model.step(
+            input_ids.unsqueeze(-1),
+            self._state
+        )
+        self._positions = self._positions + prefilling.long()
+        self.num_steps += 1
+
+        # Only sample sequences which have fed whole beginning of sequence.
+        ready = self._positions >= self._prompt_lens
+        if not ready.any():
+            return finished
+
+        ready_index = ready.nonzero().squeeze(-1)
+        ready_list = ready_index.tolist()
+        if len(ready_list) < len(self._running):
+            logits = logits[ready_index]
+
+        # `token_ids` has shape (R).
+        token_ids = _sample_next_token(
+            generator=self._generator,
+            logits=logits,
+            temperature=self.temperature,
+            top_k=self.top_k,
+            top_p=self.top_p
+        )
+        self._last_ids[ready_index] = token_ids
+        self._num_steps[ready_index] -= 1
+        self.num_tokens += len(ready_list)
+
+        for i, token_id in zip(ready_list, token_ids.tolist()):
+            self._token_ids[self._running[i]].append(token_id)
+
+        # Sequences stop when generating `[eos]` or reaching `max_seq_len`.
+        alive = torch.ones_like(ready)
+        alive[ready_index] = (
+            (token_ids != self._eos_token_id) &
+            (self._num_steps[ready_index] > 0)
+        )
+        if not alive.all():
+            for request_id, is_alive in zip(self._running, alive.tolist()):
+                if not is_alive:
+                    finished.append((
+                        request_id,
+                        self.tokenizer.decode(self._token_ids.pop(request_id))
+                    ))
+
+            self._retire(alive=alive)
+
+        return finished
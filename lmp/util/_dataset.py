@@ -14,10 +14,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bz2
+import collections
+import concurrent.futures
+import gzip
+import lzma
 import os
 import re
 import unicodedata
 
+from typing import IO
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import List
 from typing import Union
 
 # 3rd-party modules
@@ -30,15 +40,235 @@ import lmp.config
 import lmp.dataset
 import lmp.path
 
+# Number of rows in each chunk when reading CSV file.
+_CSV_CHUNK_SIZE = 10000
+
+# Number of samples in each chunk sent to normalization subprocesses.
+_NORMALIZE_CHUNK_SIZE = 1000
+
+# Pattern matching new lines and consecutive whitespaces.
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Supported compressed file extensions and their `open` functions.
+_COMPRESSED_FILE_OPEN_FNS = {
+    '.bz2': bz2.open,
+    '.gz': gzip.open,
+    '.xz': lzma.open,
+}
+
+
+def _find_file(file_name: str) -> str:
+    r"""Find `file_name` or its compressed version in `lmp.path.DATA_PATH`.
+
+    Uncompressed file is preferred. Otherwise files with extensions in
+    `_COMPRESSED_FILE_OPEN_FNS` (for example `news_collection.csv.gz`) are
+    searched in alphabetical order of extensions.
+
+    Args:
+        file_name:
+            Name of uncompressed file.
+
+    Raises:
+        FileNotFoundError:
+            When neither `file_name` nor its compressed version exists.
+
+    Returns:
+        Path to the found file.
+    """
+    file_path = os.path.join(f'{lmp.path.DATA_PATH}', file_name)
+
+    for ext in [''] + sorted(_COMPRESSED_FILE_OPEN_FNS.keys()):
+        if os.path.exists(f'{file_path}{ext}'):
+            return f'{file_path}{ext}'
+
+    raise FileNotFoundError(f'file {file_path} does not exist.')
+
+
+def _open_text_file(file_path: str) -> IO[str]:
+    r"""Open UTF-8 text file and decompress it as a stream if needed.
+
+    Compression is detected by file extension. Compressed file is decoded
+    on the fly while being read, thus it is never inflated to disk.
+
+    Args:
+        file_path:
+            Path to text file, optionally compressed.
+
+    Returns:
+        Text file object.
+    """
+    ext = os.path.splitext(file_path)[1]
+
+    if ext in _COMPRESSED_FILE_OPEN_FNS:
+        return _COMPRESSED_FILE_OPEN_FNS[ext](
+            file_path,
+            'rt',
+            encoding='utf8'
+        )
+
+    return open(file_path, 'r', encoding='utf8')
+
+
+def _normalize(sample: str) -> str:
+    r"""Normalize single sample in one pass.
+
+    Sample is normalized by unicode NFKC, then all new lines and consecutive
+    whitespaces are converted into single whitespace, and finally leading and
+    trailing whitespaces are stripped.
+
+    Args:
+        sample:
+            Sample to be normalized.
+
+    Returns:
+        Normalized sample.
+    """
+    return _WHITESPACE_PATTERN.sub(
+        ' ',
+        unicodedata.normalize('NFKC', sample)
+    ).strip()
+
+
+def _normalize_batch(batch_samples: List[str]) -> List[str]:
+    r"""Normalize each sample in `batch_samples` with `_normalize`.
+
+    Args:
+        batch_samples:
+            Samples to be normalized.
+
+    Returns:
+        Normalized samples in the same order.
+    """
+    return [_normalize(sample) for sample in batch_samples]
+
+
+def _normalize_chunks(
+        chunks: Iterable[List[str]],
+        num_workers: int
+) -> Generator[str, None, None]:
+    r"""Normalize chunks of samples and yield them in order.
+
+    When `num_workers > 0`, chunks are normalized in a
+    `concurrent.futures.ProcessPoolExecutor` with `num_workers` subprocesses.
+    At most `2 * num_workers` chunks are in-flight at any time, so that
+    `chunks` can be a lazy generator reading large file. Results are
+    reassembled in submission order, thus identical to `num_workers == 0`.
+    Normalized samples are yielded as soon as their chunk is done, so that
+    they can be streamed into `lmp.dataset.StringPool`.
+
+    Args:
+        chunks:
+            Chunks of samples to be normalized.
+        num_workers:
+            Number of subprocesses used to normalize chunks. Set to `0` to
+            normalize chunks in current process.
+
+    Yields:
+        Normalized samples of all chunks in order.
+    """
+    if num_workers == 0:
+        for chunk in chunks:
+            yield from _normalize_batch(chunk)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers
+    ) as executor:
+        futures = collections.deque()
+        for chunk in chunks:
+            futures.append(executor.submit(_normalize_batch, chunk))
+
+            if len(futures) >= 2 * num_workers:
+                yield from futures.popleft().result()
+
+        while futures:
+            yield from futures.popleft().result()
+
+
+def _create_language_model_dataset(
+        samples_fn: Callable[[], Iterable[str]],
+        source_path: str,
+        cache_name: str,
+        is_compact: bool,
+        is_file_backed: bool
+) -> lmp.dataset.LanguageModelDataset:
+    r"""Create language model dataset from normalized samples.
+
+    When `is_file_backed == True`, normalized samples are written into
+    `cache_name` under `lmp.path.DATA_PATH` with one sample per line, and
+    `lmp.dataset.FileLanguageModelDataset` is returned. Cached file is only
+    regenerated when it does not exist or is older than `source_path`, thus
+    normalization is done once across runs. Cached file is first written
+    into a temporary file and then renamed, so a partially written cache is
+    never used.
+
+    Args:
+        samples_fn:
+            Function returning normalized samples. Only called when samples
+            are needed.
+        source_path:
+            Path to downloaded file of samples.
+        cache_name:
+            File name of cached normalized samples.
+        is_compact:
+            Whether to store samples in `lmp.dataset.StringPool`. Ignored when
+            `is_file_backed == True`.
+        is_file_backed:
+            Whether to read samples from cached file on demand.
+
+    Returns:
+        `lmp.dataset.FileLanguageModelDataset` when `is_file_backed == True`,
+        `lmp.dataset.LanguageModelDataset` otherwise.
+    """
+    if not is_file_backed:
+        return lmp.dataset.LanguageModelDataset(
+            batch_sequences=samples_fn(),
+            is_compact=is_compact
+        )
+
+    cache_path = os.path.join(lmp.path.DATA_PATH, cache_name)
+
+    if (
+            not os.path.exists(cache_path)
+            or os.path.getmtime(cache_path) < os.path.getmtime(source_path)
+    ):
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            lmp.dataset.FileLanguageModelDataset.dump(
+                batch_sequences=samples_fn(),
+                file_path=tmp_path
+            )
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return lmp.dataset.FileLanguageModelDataset(file_path=cache_path)
+
 
 def _preprocess_news_collection(
-        column: str
+        column: str,
+        num_workers: int = 0,
+        is_compact: bool = False,
+        is_file_backed: bool = False
 ) -> lmp.dataset.LanguageModelDataset:
     r"""Preprocess `news_collection.csv` and convert into `lmp.dataset.LanguageModelDataset`.
 
+    Only `column` is parsed and file is read by chunks of `_CSV_CHUNK_SIZE`
+    rows, thus peak memory is bounded by size of a chunk instead of size of
+    the whole file.
+
     Args:
         column:
             Column name of `news_collection.csv`. Must be either `title` or `desc`.
+        num_workers:
+            Number of subprocesses used to normalize samples. Set to `0` to
+            normalize samples in current process.
+        is_compact:
+            Whether to store samples in `lmp.dataset.StringPool`.
+        is_file_backed:
+            Whether to cache normalized samples in `lmp.path.DATA_PATH` and
+            read them on demand with `lmp.dataset.FileLanguageModelDataset`.
 
     Raises:
         FileNotFoundError:
@@ -46,7 +276,11 @@ def _preprocess_news_collection(
         KeyError:
             When `column` is not available.
         TypeError:
-            When `column` is not instance of `str`.
+            When `column` is not instance of `str`, `num_workers` is not
+            instance of `int` or `is_compact` or `is_file_backed` is not
+            instance of `bool`.
+        ValueError:
+            When `num_workers < 0`.
 
     Returns:
         `lmp.dataset.LanguageModelDataset` from `news_collection.csv`.
@@ -54,42 +288,82 @@ def _preprocess_news_collection(
     if not isinstance(column, str):
         raise TypeError('`column` must be an instance of `str`.')
 
-    file_path = os.path.join(f'{lmp.path.DATA_PATH}', 'news_collection.csv')
-
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f'file {file_path} does not exist.')
-
-    df = pd.read_csv(file_path)
-    if column not in df.columns:
-        raise KeyError('`column` is not available.')
-
-    data = df[column].dropna().to_list()
-
-    # Normalized by unicode NFKC.
-    data = [unicodedata.normalize('NFKC', sample) for sample in data]
-
-    # Convert all new lines and consecutive whitespace into single whitespace.
-    data = [re.sub(r'\s+', ' ', sample) for sample in data]
-
-    # Strip leading and trailing whitespaces.
-    data = [sample.strip() for sample in data]
-
-    return lmp.dataset.LanguageModelDataset(batch_sequences=data)
+    if not isinstance(num_workers, int):
+        raise TypeError('`num_workers` must be an instance of `int`.')
+
+    if not isinstance(is_compact, bool):
+        raise TypeError('`is_compact` must be an instance of `bool`.')
+
+    if not isinstance(is_file_backed, bool):
+        raise TypeError('`is_file_backed` must be an instance of `bool`.')
+
+    if num_workers < 0:
+        raise ValueError('`num_workers` must be bigger than or equal to `0`.')
+
+    file_path = _find_file('news_collection.csv')
+
+    # Only parse header to check whether `column` is available.
+    with _open_text_file(file_path) as input_file:
+        if column not in pd.read_csv(input_file, nrows=0).columns:
+            raise KeyError('`column` is not available.')
+
+    def samples_fn():
+        with _open_text_file(file_path) as input_file:
+            yield from _normalize_chunks(
+                chunks=(
+                    chunk[column].dropna().to_list()
+                    for chunk in pd.read_csv(
+                        input_file,
+                        usecols=[column],
+                        # Without `dtype`, chunk with only numeric-looking
+                        # values would be parsed as numbers instead of
+                        # strings.
+                        dtype={column: str},
+                        chunksize=_CSV_CHUNK_SIZE
+                    )
+                ),
+                num_workers=num_workers
+            )
+
+    return _create_language_model_dataset(
+        samples_fn=samples_fn,
+        source_path=file_path,
+        cache_name=f'news_collection_{column}.normalized.txt',
+        is_compact=is_compact,
+        is_file_backed=is_file_backed
+    )
 
 
-def _preprocess_wiki_tokens(split: str) -> lmp.dataset.LanguageModelDataset:
+def _preprocess_wiki_tokens(
+        split: str,
+        num_workers: int = 0,
+        is_compact: bool = False,
+        is_file_backed: bool = False
+) -> lmp.dataset.LanguageModelDataset:
     r"""Preprocess `wiki.*.tokens` and convert into `lmp.dataset.LanguageModelDataset`.
 
     Args:
         split:
             Split of the Wiki long term dependency language modeling dataset.
             Must be either `train`, `valid` or `test`.
+        num_workers:
+            Number of subprocesses used to normalize samples. Set to `0` to
+            normalize samples in current process.
+        is_compact:
+            Whether to store samples in `lmp.dataset.StringPool`.
+        is_file_backed:
+            Whether to cache normalized samples in `lmp.path.DATA_PATH` and
+            read them on demand with `lmp.dataset.FileLanguageModelDataset`.
 
     Raises:
         FileNotFoundError:
             When file does not exist.
         TypeError:
-            When `split` is not instance of `str`.
+            When `split` is not instance of `str`, `num_workers` is not
+            instance of `int` or `is_compact` or `is_file_backed` is not
+            instance of `bool`.
+        ValueError:
+            When `num_workers < 0`.
 
     Returns:
         `lmp.dataset.LanguageModelDataset` from `wiki.*.tokens`.
@@ -97,33 +371,48 @@ def _preprocess_wiki_tokens(split: str) -> lmp.dataset.LanguageModelDataset:
     if not isinstance(split, str):
         raise TypeError('`split` must be an instance of `str`.')
 
-    file_path = os.path.join(f'{lmp.path.DATA_PATH}', f'wiki.{split}.tokens')
+    if not isinstance(num_workers, int):
+        raise TypeError('`num_workers` must be an instance of `int`.')
 
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f'file {file_path} does not exist.')
+    if not isinstance(is_compact, bool):
+        raise TypeError('`is_compact` must be an instance of `bool`.')
 
-    with open(file_path, 'r', encoding='utf8') as input_file:
-        data = input_file.read()
+    if not isinstance(is_file_backed, bool):
+        raise TypeError('`is_file_backed` must be an instance of `bool`.')
 
-    # Split based on section pattern.
-    data = re.split(r' \n( =){1,3} .+ (= ){1,3}\n ', data)
-    data = list(filter(
-        lambda sample: sample.strip()
-        and not re.match(r'( =){1,3}', sample)
-        and not re.match(r'(= ){1,3}', sample),
-        data
-    ))
+    if num_workers < 0:
+        raise ValueError('`num_workers` must be bigger than or equal to `0`.')
 
-    # Normalized by unicode NFKC.
-    data = [unicodedata.normalize('NFKC', sample) for sample in data]
+    file_path = _find_file(f'wiki.{split}.tokens')
 
-    # Convert all new lines and consecutive whitespace into single whitespace.
-    data = [re.sub(r'\s+', ' ', sample) for sample in data]
+    def samples_fn():
+        with _open_text_file(file_path) as input_file:
+            data = input_file.read()
 
-    # Strip leading and trailing whitespaces.
-    data = [sample.strip() for sample in data]
+        # Split based on section pattern.
+        data = re.split(r' \n( =){1,3} .+ (= ){1,3}\n ', data)
+        data = list(filter(
+            lambda sample: sample.strip()
+            and not re.match(r'( =){1,3}', sample)
+            and not re.match(r'(= ){1,3}', sample),
+            data
+        ))
 
-    return lmp.dataset.LanguageModelDataset(batch_sequences=data)
+        yield from _normalize_chunks(
+            chunks=(
+                data[start:start + _NORMALIZE_CHUNK_SIZE]
+                for start in range(0, len(data), _NORMALIZE_CHUNK_SIZE)
+            ),
+            num_workers=num_workers
+        )
+
+    return _create_language_model_dataset(
+        samples_fn=samples_fn,
+        source_path=file_path,
+        cache_name=f'wiki_{split}_tokens.normalized.txt',
+        is_compact=is_compact,
+        is_file_backed=is_file_backed
+    )
 
 
 def _preprocess_word_test_v1() -> lmp.dataset.AnalogyDataset:
@@ -132,14 +421,11 @@ def _preprocess_word_test_v1() -> lmp.dataset.AnalogyDataset:
     Returns:
         `lmp.dataset.AnalogyDataset` from `word-test.v1.txt`.
     """
-    file_path = os.path.join(f'{lmp.path.DATA_PATH}', 'word-test.v1.txt')
+    file_path = _find_file('word-test.v1.txt')
 
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f'file {file_path} does not exist.')
-
-    with open(file_path, 'r', encoding='utf8') as input_file:
+    with _open_text_file(file_path) as input_file:
         # Remove first line since it is just copyright.
-        samples = [line.strip() for line in input_file.readlines()][1:]
+        samples = [line.strip() for line in input_file][1:]
 
     # Parsing.
     category = ''
@@ -157,10 +443,17 @@ def _preprocess_word_test_v1() -> lmp.dataset.AnalogyDataset:
 
 
 def load_dataset(
-        dataset: str
+        dataset: str,
+        num_workers: int = 0,
+        is_compact: bool = False,
+        is_file_backed: bool = False
 ) -> Union[lmp.dataset.AnalogyDataset, lmp.dataset.LanguageModelDataset]:
     r"""Load dataset from downloaded files.
 
+    Downloaded files can be compressed by `gzip`, `xz` or `bzip2` (with file
+    extension `.gz`, `.xz` or `.bz2` respectively), in which case they are
+    decompressed as a stream while loading.
+
     Supported options:
         --dataset news_collection_desc
         --dataset news_collection_title
@@ -172,12 +465,28 @@ def load_dataset(
     Args:
         dataset:
             Name of the dataset to perform experiment.
+        num_workers:
+            Number of subprocesses used to normalize samples. Set to `0` to
+            normalize samples in current process. Output is identical
+            regardless of `num_workers`.
+        is_compact:
+            Whether to store samples of language model dataset in
+            `lmp.dataset.StringPool`. Samples are streamed into the pool, so
+            they are never held in a `list`.
+        is_file_backed:
+            Whether to write normalized samples of language model dataset
+            into `lmp.path.DATA_PATH` once and return
+            `lmp.dataset.FileLanguageModelDataset` which read samples on
+            demand. Cached file is reused until downloaded file changes.
+            `is_compact` is ignored when `is_file_backed == True`.
 
     Raises:
         TypeError:
-            When `dataset` is not an instance of `str`.
+            When `dataset` is not an instance of `str`, `num_workers` is not
+            an instance of `int` or `is_compact` or `is_file_backed` is not an
+            instance of `bool`.
         ValueError:
-            If `dataset` does not support.
+            If `dataset` does not support or `num_workers < 0`.
         FileNotFoundError
             If `dataset` does not exist.
 
@@ -189,20 +498,58 @@ def load_dataset(
     if not isinstance(dataset, str):
         raise TypeError('`dataset` must be an instance of `str`.')
 
+    if not isinstance(num_workers, int):
+        raise TypeError('`num_workers` must be an instance of `int`.')
+
+    if not isinstance(is_compact, bool):
+        raise TypeError('`is_compact` must be an instance of `bool`.')
+
+    if not isinstance(is_file_backed, bool):
+        raise TypeError('`is_file_backed` must be an instance of `bool`.')
+
+    # Value check.
+    if num_workers < 0:
+        raise ValueError('`num_workers` must be bigger than or equal to `0`.')
+
     if dataset == 'news_collection_desc':
-        return _preprocess_news_collection(column='desc')
+        return _preprocess_news_collection(
+            column='desc',
+            num_workers=num_workers,
+            is_compact=is_compact,
+            is_file_backed=is_file_backed
+        )
 
     if dataset == 'news_collection_title':
-        return _preprocess_news_collection(column='title')
+        return _preprocess_news_collection(
+            column='title',
+            num_workers=num_workers,
+            is_compact=is_compact,
+            is_file_backed=is_file_backed
+        )
 
     if dataset == 'wiki_train_tokens':
-        return _preprocess_wiki_tokens(split='train')
+        return _preprocess_wiki_tokens(
+            split='train',
+            num_workers=num_workers,
+            is_compact=is_compact,
+            is_file_backed=is_file_backed
+        )
 
     if dataset == 'wiki_valid_tokens':
-        return _preprocess_wiki_tokens(split='valid')
+        return _preprocess_wiki_tokens(
+            split='valid',
+            num_workers=num_workers,
+            is_compact=is_compact,
+            is_file_backed=is_file_backed
+        )
 
     if dataset == 'wiki_test_tokens':
-        return _preprocess_wiki_tokens(split='test')
+        return _preprocess_wiki_tokens(
+            split='test',
+            num_workers=num_workers,
+            is_compact=is_compact,
+            is_file_backed=is_file_backed
+        )
 
     if dataset == 'word_test_v1':
         return _preprocess_word_test_v1()
@@ -230,7 +577,8 @@ def load_dataset_by_config(
 
     Args:
         config:
-            Configuration object with attribute `dataset`.
+            Configuration object with attributes `dataset`, `is_compact`,
+            `is_file_backed` and `num_preprocess_workers`.
 
     Raise:
         TypeError:
@@ -245,4 +593,9 @@ def load_dataset_by_config(
             '`config` must be an instance of `lmp.config.BaseConfig`.'
         )
 
-    return load_dataset(dataset=config.dataset)
+    return load_dataset(
+        dataset=config.dataset,
+        num_workers=config.num_preprocess_workers,
+        is_compact=config.is_compact,
+        is_file_backed=config.is_file_backed
+    )
@@ -5,6 +5,16 @@ Usage:
 
     generated = lmp.util.generate_sequence(...)
     generated = lmp.util.generate_sequence_by_config(...)
+    generated = lmp.util.generate_batch(...)
+    generated = lmp.util.generate_batch_by_config(...)
+    generated = lmp.util.sample_batch(...)
+    generated = lmp.util.sample_batch_by_config(...)
+
+    prefix_cache = lmp.util.PrefixStateCache(...)
+    generated = lmp.util.sample_batch(..., prefix_cache=prefix_cache)
+
+    for text in lmp.util.stream_sequence(...):
+        print(text, end='', flush=True)
 """
 
 # built-in modules
@@ -13,7 +23,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+
+import math
+
+from typing import Generator
 from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 # 3rd-party modules
@@ -26,8 +43,734 @@ import lmp.config
 import lmp.model
 import lmp.tokenizer
 
+from lmp.util._prefix_cache import PrefixStateCache
+
+
+def _backtrack(
+        step_tokens: List[List[int]],
+        step_parents: List[List[int]],
+        step: int,
+        beam: int
+) -> List[int]:
+    r"""Recover generated token ids of beam `beam` at step `step`.
+
+    Token ids are collected by following backpointers from `step` back to
+    the first generation step.
+    """
+    token_ids = []
+    while step >= 0:
+        token_ids.append(step_tokens[step][beam])
+        beam = step_parents[step][beam]
+        step -= 1
+
+    return token_ids[::-1]
+
+
+def _prefill(
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prompts: List[List[int]],
+        prefix_cache: Optional[PrefixStateCache] = None
+) -> Tuple[torch.Tensor, Tuple[torch.Tensor, ...]]:
+    r"""Feed batch of encoded beginning of sequences into model.
+
+    Beginning of sequences with the same length are fed together, so that
+    no padding is fed into model. Recurrent states of all groups are then
+    concatenated and restored to original order.
+
+    When `prefix_cache` is given, each beginning of sequence starts from
+    recurrent state of its longest cached prefix (excluding its last token,
+    so that next token logits are computed), and only the rest is fed.
+    Feeding stops at `prefix_cache.cache_positions` to cache states there.
+
+    Returns:
+        Next token logits with shape (P, V) and recurrent state of batch
+        size P.
+    """
+    # Length of prefix which is already fed and its recurrent state.
+    starts = [0] * len(prompts)
+    start_states = [None] * len(prompts)
+    if prefix_cache is not None:
+        for i, prompt in enumerate(prompts):
+            if len(prompt) > 1:
+                starts[i], start_states[i] = prefix_cache.lookup(
+                    token_ids=prompt[:-1]
+                )
+
+    # Only the rest of beginning of sequences need to be fed.
+    lengths = [len(prompt) - start for prompt, start in zip(prompts, starts)]
+
+    group_logits = []
+    group_states = []
+    order = []
+    for length in sorted(set(lengths)):
+        index = [i for i in range(len(prompts)) if lengths[i] == length]
+
+        # Sequences without cached prefix start from zero state.
+        state = None
+        cached_states = [
+            start_states[i]
+            for i in index
+            if start_states[i] is not None
+        ]
+        if cached_states:
+            zero_state = tuple(map(torch.zeros_like, cached_states[0]))
+            state = lmp.model.concat_state(states=[
+                zero_state if start_states[i] is None else start_states[i]
+                for i in index
+            ])
+
+        # Prefix lengths where states are cached.
+        cache_positions = [[] for _ in index]
+        if prefix_cache is not None:
+            cache_positions = [
+                prefix_cache.cache_positions(
+                    end=len(prompts[i]) - 1,
+                    start=starts[i]
+                )
+                for i in index
+            ]
+
+        # Stop feeding at every prefix length where states are cached.
+        stops = sorted(set(
+            position - starts[i]
+            for i, positions in zip(index, cache_positions)
+            for position in positions
+        ) | {length})
+
+        fed = 0
+        for stop in stops:
+            logits, state = model.step(
+                torch.LongTensor([
+                    prompts[i][starts[i] + fed:starts[i] + stop]
+                    for i in index
+                ]).to(device),
+                state
+            )
+            fed = stop
+
+            for row, (i, positions) in enumerate(zip(index, cache_positions)):
+                if starts[i] + stop in positions:
+                    prefix_cache.insert(
+                        state=lmp.model.reorder_state(
+                            state=state,
+                            index=torch.LongTensor([row])
+                        ),
+                        token_ids=prompts[i][:starts[i] + stop]
+                    )
+
+        group_logits.append(logits)
+        group_states.append(state)
+        order.extend(index)
+
+    inverse = torch.LongTensor(order).argsort().to(device)
+    return (
+        torch.cat(group_logits)[inverse],
+        lmp.model.reorder_state(
+            state=lmp.model.concat_state(states=group_states),
+            index=inverse
+        )
+    )
+
+
+def _beam_search(
+        beam_width: int,
+        device: torch.device,
+        eos_token_id: int,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prefix_cache: Optional[PrefixStateCache],
+        prompts: List[List[int]]
+) -> List[List[List[int]]]:
+    r"""Beam search for batch of encoded beginning of sequences.
+
+    Returns:
+        Generated token ids (excluding beginning of sequence) of each
+        beginning of sequence ordered by log-likelihood.
+    """
+    num_prompts = len(prompts)
+
+    # `logits` has shape (P, V).
+    logits, state = _prefill(
+        device=device,
+        model=model,
+        prompts=prompts,
+        prefix_cache=prefix_cache
+    )
+
+    # Each beginning of sequence has `beam_width` beams. Only the first
+    # beam is valid at start, others have log-likelihood `-inf`.
+    # `logits` has shape (P x W, V).
+    beam_index = torch.arange(num_prompts, device=device)
+    logits = logits.repeat_interleave(beam_width, dim=0)
+    state = lmp.model.reorder_state(
+        state=state,
+        index=beam_index.repeat_interleave(beam_width)
+    )
+
+    # Accumulated log-likelihood of each beam with shape (P, W). Using log
+    # can change consecutive probability multiplication into sum of log
+    # probability which can avoid computational underflow.
+    beam_scores = torch.full((num_prompts, beam_width), -math.inf)
+    beam_scores[:, 0] = 0.0
+    beam_scores = beam_scores.to(device)
+
+    # New token id and parent beam index of each beam at each step. Both
+    # have shape (P, W).
+    step_tokens = []
+    step_parents = []
+
+    # Finished and truncated hypotheses. Each is recorded as beginning of
+    # sequence index, log-likelihood, last step, beam index at last step
+    # and whether ends with `[eos]`.
+    hypotheses: List[Tuple[int, float, int, int, bool]] = []
+
+    # Best `beam_width` finished log-likelihood of each beginning of
+    # sequence with shape (P, W).
+    best_finished = torch.full((num_prompts, beam_width), -math.inf)
+    best_finished = best_finished.to(device)
+
+    # Number of tokens each beginning of sequence can generate.
+    num_steps = torch.LongTensor([
+        max_seq_len - len(prompt)
+        for prompt in prompts
+    ]).to(device)
+
+    # Beginning of sequences which cannot generate any token.
+    done = num_steps <= 0
+    for prompt_index in done.nonzero().squeeze(-1).tolist():
+        hypotheses.append((prompt_index, 0.0, -1, 0, False))
+    beam_scores.masked_fill_(done.unsqueeze(-1), -math.inf)
+
+    for step in range(max(num_steps.max().item(), 0)):
+        # Log-likelihood of extending each beam with each token.
+        # `scores` has shape (P, W, V).
+        scores = beam_scores.unsqueeze(-1) + logits.log_softmax(
+            dim=-1
+        ).reshape(num_prompts, beam_width, -1)
+        vocab_size = scores.size(-1)
+
+        # Rank all candidates of each beginning of sequence at once. Take
+        # `2 * beam_width` candidates so that at least `beam_width` of them
+        # do not end with `[eos]` (each beam has only one `[eos]`
+        # candidate). All tensors below have shape (P, 2W).
+        cand_scores, cand_index = scores.reshape(num_prompts, -1).topk(
+            k=min(2 * beam_width, beam_width * vocab_size),
+            dim=-1
+        )
+        cand_parents = cand_index // vocab_size
+        cand_tokens = cand_index % vocab_size
+        is_eos = cand_tokens == eos_token_id
+
+        # Valid candidates ending with `[eos]` among top `beam_width`
+        # candidates are finished.
+        is_finished = is_eos & torch.isfinite(cand_scores)
+        is_finished[:, beam_width:] = False
+        finished_index = is_finished.nonzero()
+        if finished_index.size(0) > 0:
+            prompt_index, cand_rank = finished_index.unbind(dim=-1)
+            hypotheses.extend(zip(
+                prompt_index.tolist(),
+                cand_scores[prompt_index, cand_rank].tolist(),
+                [step - 1] * finished_index.size(0),
+                cand_parents[prompt_index, cand_rank].tolist(),
+                [True] * finished_index.size(0)
+            ))
+            best_finished = torch.cat([
+                best_finished,
+                cand_scores.masked_fill(~is_finished, -math.inf)
+            ], dim=-1).topk(k=beam_width, dim=-1).values
+
+        # Best `beam_width` candidates not ending with `[eos]` continue.
+        # Sorting with unique keys moves them to the front and keeps their
+        # ranking.
+        cand_rank = torch.arange(cand_index.size(-1), device=device)
+        alive = (
+            is_eos.long() * cand_index.size(-1) + cand_rank
+        ).argsort(dim=-1)[:, :beam_width]
+        beam_scores = cand_scores.gather(-1, alive).masked_fill(
+            is_eos.gather(-1, alive),
+            -math.inf
+        )
+        step_tokens.append(cand_tokens.gather(-1, alive))
+        step_parents.append(cand_parents.gather(-1, alive))
+
+        # Remaining beams are truncated when reaching `max_seq_len`.
+        is_last = (num_steps == step + 1) & ~done
+        truncated_index = (
+            is_last.unsqueeze(-1) & torch.isfinite(beam_scores)
+        ).nonzero()
+        if truncated_index.size(0) > 0:
+            prompt_index, beam = truncated_index.unbind(dim=-1)
+            hypotheses.extend(zip(
+                prompt_index.tolist(),
+                beam_scores[prompt_index, beam].tolist(),
+                [step] * truncated_index.size(0),
+                beam.tolist(),
+                [False] * truncated_index.size(0)
+            ))
+
+        # Search stops when no beam can be better than finished hypotheses,
+        # since extending a beam never increases its log-likelihood.
+        done = done | is_last | (
+            best_finished[:, -1] >= beam_scores.max(dim=-1).values
+        )
+        if done.all():
+            break
+
+        beam_scores.masked_fill_(done.unsqueeze(-1), -math.inf)
+
+        # Only feed new token of each beam.
+        logits, state = model.step(
+            step_tokens[-1].reshape(-1, 1),
+            lmp.model.reorder_state(
+                state=state,
+                index=(
+                    beam_index.unsqueeze(-1) * beam_width + step_parents[-1]
+                ).reshape(-1)
+            )
+        )
+
+    step_tokens = [tokens.tolist() for tokens in step_tokens]
+    step_parents = [parents.tolist() for parents in step_parents]
+
+    # Rank hypotheses of each beginning of sequence.
+    results = [[] for _ in range(num_prompts)]
+    for prompt_index, score, last_step, beam, ends_with_eos in hypotheses:
+        token_ids = _backtrack(
+            step_tokens=[tokens[prompt_index] for tokens in step_tokens],
+            step_parents=[parents[prompt_index] for parents in step_parents],
+            step=last_step,
+            beam=beam
+        )
+        if ends_with_eos:
+            token_ids.append(eos_token_id)
+        results[prompt_index].append((score, token_ids))
+
+    return [
+        [
+            token_ids
+            for _, token_ids in sorted(
+                result,
+                key=lambda hypothesis: hypothesis[0],
+                reverse=True
+            )[:beam_width]
+        ]
+        for result in results
+    ]
+
+
+def _sample_from_probs(
+        generator: Optional[torch.Generator],
+        probs: torch.Tensor
+) -> torch.Tensor:
+    r"""Draw one index from each row of `probs` by inverse transform sampling.
+
+    Only one uniform random number is needed for each row, and the index is
+    found by `torch.searchsorted` over cumulative probability. This is much
+    faster than `torch.multinomial` on CPU. Rows of `probs` do not need to
+    sum to `1`.
+
+    Returns:
+        Sampled indices with shape (B).
+    """
+    # `cdf` has shape (B, V).
+    cdf = probs.cumsum(dim=-1)
+
+    # Scale by total probability of each row. `uniform` has shape (B, 1).
+    uniform = torch.rand(
+        (probs.size(0), 1),
+        device=probs.device,
+        generator=generator
+    ) * cdf[:, -1:]
+
+    # Index with probability `0` is never selected since `cdf` does not
+    # increase on it.
+    return torch.searchsorted(cdf, uniform, right=True).clamp_(
+        max=probs.size(-1) - 1
+    ).squeeze(-1)
+
+
+def _sample_next_token(
+        generator: Optional[torch.Generator],
+        logits: torch.Tensor,
+        temperature: float,
+        top_k: int,
+        top_p: float
+) -> torch.Tensor:
+    r"""Sample next token ids from filtered next token logits.
+
+    Top-k filtering only keeps `top_k` most likely tokens, and top-p
+    filtering only keeps the smallest set of most likely tokens whose total
+    probability is at least `top_p`. Both filters only need candidates in
+    descending order, which are given by `topk` without sorting the whole
+    vocabulary. When only top-p filtering is used, `64` candidates are
+    taken first, and the whole vocabulary is sorted only when candidates of
+    some rows do not cover `top_p`.
+
+    Returns:
+        Sampled token ids with shape (B).
+    """
+    # Temperature scaling. Use `float32` so that filtering and sampling are
+    # numerically stable.
+    logits = logits.float() / temperature
+    vocab_size = logits.size(-1)
+
+    if 0 < top_k < vocab_size:
+        cand_logits, cand_ids = logits.topk(k=top_k, dim=-1)
+        cand_probs = cand_logits.softmax(dim=-1)
+    elif top_p < 1.0:
+        log_z = logits.logsumexp(dim=-1, keepdim=True)
+        cand_logits, cand_ids = logits.topk(k=min(64, vocab_size), dim=-1)
+        cand_probs = (cand_logits - log_z).exp()
+        if cand_probs.sum(dim=-1).min() < top_p:
+            cand_logits, cand_ids = logits.sort(dim=-1, descending=True)
+            cand_probs = (cand_logits - log_z).exp()
+    else:
+        return _sample_from_probs(
+            generator=generator,
+            probs=logits.softmax(dim=-1)
+        )
+
+    # Remove candidates whose more likely candidates already have total
+    # probability `top_p`. The most likely candidate is always kept.
+    if top_p < 1.0:
+        cand_probs = cand_probs.masked_fill(
+            cand_probs.cumsum(dim=-1) - cand_probs >= top_p,
+            0.0
+        )
+
+    return cand_ids.gather(-1, _sample_from_probs(
+        generator=generator,
+        probs=cand_probs
+    ).unsqueeze(-1)).squeeze(-1)
+
+
+def _sample(
+        device: torch.device,
+        eos_token_id: int,
+        generator: Optional[torch.Generator],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_samples: int,
+        prefix_cache: Optional[PrefixStateCache],
+        prompts: List[List[int]],
+        temperature: float,
+        top_k: int,
+        top_p: float
+) -> List[List[List[int]]]:
+    r"""Sample sequences for batch of encoded beginning of sequences.
+
+    Returns:
+        `num_samples` generated token ids (excluding beginning of sequence)
+        of each beginning of sequence.
+    """
+    num_prompts = len(prompts)
+
+    logits, state = _prefill(
+        device=device,
+        model=model,
+        prompts=prompts,
+        prefix_cache=prefix_cache
+    )
+
+    # Each beginning of sequence is repeated `num_samples` times. Samples
+    # are then decoded as a single batch with batch size P x N.
+    sample_index = torch.arange(num_prompts, device=device).repeat_interleave(
+        num_samples
+    )
+    logits = logits[sample_index]
+    state = lmp.model.reorder_state(state=state, index=sample_index)
+
+    # Number of tokens each sample can generate.
+    num_steps = torch.LongTensor([
+        max_seq_len - len(prompt)
+        for prompt in prompts
+    ]).to(device)[sample_index]
+
+    # Generated token ids and length of each sample.
+    generated = torch.zeros(
+        (sample_index.size(0), max(num_steps.max().item(), 0)),
+        dtype=torch.long,
+        device=device
+    )
+    lengths = torch.zeros_like(sample_index)
+
+    # Only samples which are still generating are fed into model.
+    alive = num_steps > 0
+    alive_index = alive.nonzero().squeeze(-1)
+    logits = logits[alive]
+    num_steps = num_steps[alive]
+    state = lmp.model.select_state(state=state, mask=alive)
+
+    step = 0
+    while alive_index.size(0) > 0:
+        # `tokens` has shape (B).
+        tokens = _sample_next_token(
+            generator=generator,
+            logits=logits,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p
+        )
+        generated[alive_index, step] = tokens
+        lengths[alive_index] += 1
+        step += 1
+
+        # Samples stop when generating `[eos]` or reaching `max_seq_len`.
+        alive = (tokens != eos_token_id) & (num_steps > step)
+        if not alive.all():
+            alive_index = alive_index[alive]
+            num_steps = num_steps[alive]
+            tokens = tokens[alive]
+            state = lmp.model.select_state(state=state, mask=alive)
+
+            if alive_index.size(0) == 0:
+                break
+
+        # Only feed new token of each sample.
+        logits, state = model.step(tokens.unsqueeze(-1), state)
+
+    generated = generated.tolist()
+    lengths = lengths.tolist()
+
+    return [
+        [
+            generated[i][:lengths[i]]
+            for i in range(
+                prompt_index * num_samples,
+                (prompt_index + 1) * num_samples
+            )
+        ]
+        for prompt_index in range(num_prompts)
+    ]
+
 
 @torch.no_grad()
+def _stream(
+        device: torch.device,
+        eos_token_id: int,
+        generator: Optional[torch.Generator],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prompt: List[int],
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float
+) -> Generator[str, None, None]:
+    r"""Sample single sequence and yield text token by token.
+
+    Yields:
+        Text of encoded beginning of sequence, then text appended by each
+        sampled token.
+    """
+
+    def token_generator() -> Generator[str, None, None]:
+        r"""Yield tokens of beginning of sequence, then sampled tokens.
+
+        Model is only called when next token is requested.
+        """
+        yield from tokenizer.convert_ids_to_tokens(prompt)
+
+        if len(prompt) >= max_seq_len:
+            return
+
+        logits, state = model.step(torch.LongTensor([prompt]).to(device))
+
+        num_steps = max_seq_len - len(prompt)
+        for step in range(num_steps):
+            # `token_id` has shape (1).
+            token_id = _sample_next_token(
+                generator=generator,
+                logits=logits,
+                temperature=temperature,
+                top_k=top_k,
+                top_p=top_p
+            )
+            yield tokenizer.convert_id_to_token(token_id.item())
+
+            # Stop when generating `[eos]` or reaching `max_seq_len`.
+            if token_id.item() == eos_token_id or step == num_steps - 1:
+                return
+
+            # Only feed new token.
+            logits, state = model.step(token_id.unsqueeze(-1), state)
+
+    # Yield beginning of sequence as a whole.
+    texts = tokenizer.stream_detokenize(token_generator())
+    text = ''.join(next(texts) for _ in prompt)
+    if text:
+        yield text
+
+    for text in texts:
+        if text:
+            yield text
+
+
+@torch.no_grad()
+def generate_batch(
+        batch_size: int,
+        beam_width: int,
+        device: torch.device,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prompts: Sequence[str],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        prefix_cache: Optional[PrefixStateCache] = None
+) -> List[List[str]]:
+    r"""Generate sequences of many beginning of sequences using beam search.
+
+    Beginning of sequences are sorted by length and split into batches of
+    `batch_size`. In each batch, beginning of sequences with the same
+    length are fed into model together (no padding is needed), and their
+    recurrent states are concatenated. All beams of all beginning of
+    sequences are then decoded together, each beam only feeding its last
+    token with recurrent state (see `model.step`).
+
+    At each step, log-likelihood of all `beam_width * V` candidates of each
+    beginning of sequence is computed by a single `log_softmax` and ranked
+    by a single `topk`. Each beam only records its new token and parent
+    beam (backpointer), and sequences are recovered from backpointers at
+    the end instead of being copied at every step.
+
+    Candidates ending with `[eos]` are removed from beam and kept as
+    finished hypotheses. Search of a beginning of sequence stops once
+    `beam_width` finished hypotheses are more likely than every remaining
+    beam, and decoding stops once all searches stop.
+
+    Args:
+        batch_size:
+            Number of beginning of sequences decoded together. Must be
+            bigger than or equal to `1`.
+        beam_width:
+            Number of candidate sequences to output for each beginning of
+            sequence. Must be bigger than or equal to `1`.
+        device:
+            Model running device.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        prompts:
+            Begining of sequences which model will auto-complete.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        prefix_cache:
+            Cache of recurrent states of prefixes. When given, feeding of
+            each beginning of sequence starts from its longest cached prefix
+            instead of from `[bos]`, and states of fed prefixes are cached
+            (see `lmp.util.PrefixStateCache`). Generated sequences are the
+            same with or without cache. Disable caching when `prefix_cache`
+            is `None`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generated sequences of each beginning of sequence in the same order
+        as `prompts`. Sequences are ordered by log-likelihood. Finished
+        sequences end with `[eos]`, and unfinished sequences have length
+        `max_seq_len`.
+    """
+    # Type check.
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    if not isinstance(beam_width, int):
+        raise TypeError('`beam_width` must be an instance of `int`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not (
+            isinstance(prompts, (list, tuple)) and
+            all(map(lambda prompt: isinstance(prompt, str), prompts))
+    ):
+        raise TypeError('`prompts` must be an instance of `Sequence[str]`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if prefix_cache is not None and not isinstance(
+            prefix_cache,
+            PrefixStateCache
+    ):
+        raise TypeError(
+            '`prefix_cache` must be an instance of '
+            '`Optional[lmp.util.PrefixStateCache]`.'
+        )
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    if beam_width < 1:
+        raise ValueError('`beam_width` must be bigger than or equal to `1`.')
+
+    if max_seq_len < 2:
+        raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
+
+    # Evaluation mode.
+    model.eval()
+
+    eos_token_id = tokenizer.convert_token_to_id(
+        tokenizer.__class__.eos_token
+    )
+
+    # Encode sequences. Remove `[eos]` since we are using begin of sentence.
+    prompts = [
+        tokenizer.encode(prompt, max_seq_len=-1)[:-1]
+        for prompt in prompts
+    ]
+
+    # Batch beginning of sequences with similar length together, so that
+    # each batch needs fewer calls to feed beginning of sequences.
+    order = sorted(range(len(prompts)), key=lambda i: len(prompts[i]))
+
+    generated_sequences = [[] for _ in prompts]
+    for start in range(0, len(order), batch_size):
+        batch_index = order[start:start + batch_size]
+        batch_results = _beam_search(
+            beam_width=beam_width,
+            device=device,
+            eos_token_id=eos_token_id,
+            max_seq_len=max_seq_len,
+            model=model,
+            prefix_cache=prefix_cache,
+            prompts=[prompts[i] for i in batch_index]
+        )
+
+        for i, results in zip(batch_index, batch_results):
+            generated_sequences[i] = tokenizer.batch_decode([
+                prompts[i] + token_ids
+                for token_ids in results
+            ])
+
+    return generated_sequences
+
+
 def generate_sequence(
         beam_width: int,
         begin_of_sequence: str,
@@ -38,6 +781,8 @@ def generate_sequence(
 ) -> List[str]:
     r"""Sequences generation using beam search.
 
+    See `generate_batch` for details of beam search.
+
     Args:
         beam_width:
             Number of candidate sequences to output. Must be bigger than or
@@ -63,7 +808,8 @@ def generate_sequence(
             docstring for arguments constraints.
 
     Returns:
-        Generated sequences.
+        Generated sequences ordered by log-likelihood. Finished sequences end
+        with `[eos]`, and unfinished sequences have length `max_seq_len`.
     """
     # Type check.
     if not isinstance(beam_width, int):
@@ -100,88 +846,15 @@ def generate_sequence(
     if max_seq_len < 2:
         raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
 
-    # Evaluation mode.
-    model.eval()
-
-    # Encode sequence and convert into tensor. Remove `[eos]`` since we are
-    # using begin of sentence.
-    cur_seq = tokenizer.encode(begin_of_sequence, max_seq_len=-1)
-    cur_seq = torch.LongTensor(cur_seq)[:-1].to(device)
-
-    # Get begin sequence length.
-    seq_len = cur_seq.size(-1)
-
-    # Generated sequence.
-    # Start shape (1, S).
-    # Final shape (B, S).
-    cur_seq = cur_seq.reshape(1, seq_len)
-
-    # Accumulated negative log-likelihood. Using log can change consecutive
-    # probability multiplication into sum of log probability which can
-    # avoid computational underflow. Initialized to zero with shape (B).
-    accum_prob = torch.zeros(beam_width).to(device)
-
-    for _ in range(max_seq_len - seq_len):
-        # Model prediction has shape (B, S, V).
-        pred_y = model.predict(cur_seq)
-
-        # Record all beams prediction.
-        # Each beam will predict `beam_width` different results.
-        # So we totally have `beam_width * beam_width` different results.
-        top_k_in_all_beams = []
-        for out_beam in range(cur_seq.size(0)):
-            # Get `beam_width` different prediction from beam `out_beam`.
-            # `top_k_prob_in_beam` has shape (B) and
-            # `top_k_index_in_beam` has shape (B).
-            top_k_prob_in_beam, top_k_index_in_beam = \
-                pred_y[out_beam, -1].topk(
-                    k=beam_width,
-                    dim=-1
-                )
-
-            # Record each beam's negative log-likelihood and concate
-            # next token id based on prediction.
-            for in_beam in range(beam_width):
-                # Accumulate negative log-likelihood. Since log out
-                # negative value when input is in range 0~1, we negate it
-                # to be postive.
-                prob = accum_prob[out_beam] - \
-                    top_k_prob_in_beam[in_beam].log()
-                prob = prob.unsqueeze(0)
-
-                # Concate next predicted token id.
-                seq = torch.cat([
-                    cur_seq[out_beam],
-                    top_k_index_in_beam[in_beam].unsqueeze(0)
-                ], dim=-1).unsqueeze(0)
-
-                # Record result.
-                top_k_in_all_beams.append({
-                    'prob': prob,
-                    'seq': seq
-                })
-
-        # Compare each recorded result in all beams. First concate tensor
-        # then use `topk` to get the `beam_width` highest prediction in all
-        # beams.
-        _, top_k_index_in_all_beams = torch.cat([
-            beam['prob']
-            for beam in top_k_in_all_beams
-        ]).topk(k=beam_width, dim=0)
-
-        # Update `cur_seq` which is the `beam_width` highest results.
-        cur_seq = torch.cat([
-            top_k_in_all_beams[index]['seq']
-            for index in top_k_index_in_all_beams
-        ], dim=0)
-
-        # Update accumlated negative log-likelihood.
-        accum_prob = torch.cat([
-            top_k_in_all_beams[index]['prob']
-            for index in top_k_index_in_all_beams
-        ], dim=0)
-
-    return tokenizer.batch_decode(cur_seq.tolist())
+    return generate_batch(
+        batch_size=1,
+        beam_width=beam_width,
+        device=device,
+        max_seq_len=max_seq_len,
+        model=model,
+        prompts=[begin_of_sequence],
+        tokenizer=tokenizer
+    )[0]
 
 
 def generate_sequence_by_config(
@@ -235,3 +908,589 @@ def generate_sequence_by_config(
         model=model,
         tokenizer=tokenizer
     )
+
+
+def generate_batch_by_config(
+        batch_size: int,
+        beam_width: int,
+        config: lmp.config.BaseConfig,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prompts: Sequence[str],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        prefix_cache: Optional[PrefixStateCache] = None
+) -> List[List[str]]:
+    r"""Helper function for batch sequences generation.
+
+    Args:
+        batch_size:
+            Number of beginning of sequences decoded together. Must be
+            bigger than or equal to `1`.
+        beam_width:
+            Number of candidate sequences to output for each beginning of
+            sequence. Must be bigger than or equal to `1`.
+        config:
+            Configuration object with attributes `device`.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        prompts:
+            Begining of sequences which model will auto-complete.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        prefix_cache:
+            Cache of recurrent states of prefixes. Disable caching when
+            `prefix_cache` is `None`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generated sequences of each beginning of sequence.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    return generate_batch(
+        batch_size=batch_size,
+        beam_width=beam_width,
+        device=config.device,
+        max_seq_len=max_seq_len,
+        model=model,
+        prompts=prompts,
+        tokenizer=tokenizer,
+        prefix_cache=prefix_cache
+    )
+
+
+@torch.no_grad()
+def sample_batch(
+        batch_size: int,
+        device: torch.device,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_samples: int,
+        prompts: Sequence[str],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        prefix_cache: Optional[PrefixStateCache] = None,
+        seed: Optional[int] = None,
+        temperature: float = 1.0,
+        top_k: int = 0,
+        top_p: float = 1.0
+) -> List[List[str]]:
+    r"""Generate sequences of many beginning of sequences by sampling.
+
+    Beginning of sequences are sorted by length and split into batches of
+    `batch_size`. In each batch, beginning of sequences are fed into model
+    as in `generate_batch`, and each of them is repeated `num_samples`
+    times. All samples are then decoded together as a single batch, each
+    sample only feeding its last token with recurrent state (see
+    `model.step`).
+
+    At each step, next token logits are divided by `temperature` and
+    filtered by top-k and top-p filtering. Next token of every sample is
+    then drawn at once by inverse transform sampling: a single uniform
+    random number of each sample is located in cumulative probability with
+    `torch.searchsorted`, which is faster than `torch.multinomial` on CPU.
+    Samples generating `[eos]` or reaching `max_seq_len` are removed from
+    batch (see `lmp.model.select_state`), so finished samples are never fed
+    into model.
+
+    Args:
+        batch_size:
+            Number of beginning of sequences decoded together. Must be
+            bigger than or equal to `1`.
+        device:
+            Model running device.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        num_samples:
+            Number of sequences to sample for each beginning of sequence.
+            Must be bigger than or equal to `1`.
+        prompts:
+            Begining of sequences which model will auto-complete.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        prefix_cache:
+            Cache of recurrent states of prefixes. When given, feeding of
+            each beginning of sequence starts from its longest cached prefix
+            instead of from `[bos]`, and states of fed prefixes are cached
+            (see `lmp.util.PrefixStateCache`). Generated sequences are the
+            same with or without cache. Disable caching when `prefix_cache`
+            is `None`.
+        seed:
+            Random seed of sampling. Sampled sequences are reproducible
+            with the same `seed` and `batch_size`. Use global random state
+            when `seed` is `None`. Must be bigger than or equal to `1`.
+        temperature:
+            Divide next token logits by `temperature`. Smaller temperature
+            makes sampling more greedy. Must be bigger than `0.0`.
+        top_k:
+            Only sample from `top_k` most likely tokens. Disable top-k
+            filtering when `top_k` is `0`. Must be bigger than or equal to
+            `0`.
+        top_p:
+            Only sample from the smallest set of most likely tokens whose
+            total probability is at least `top_p`. Disable top-p filtering
+            when `top_p` is `1.0`. Must be bigger than `0.0` and smaller than
+            or equal to `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        `num_samples` sampled sequences of each beginning of sequence in the
+        same order as `prompts`. Finished sequences end with `[eos]`, and
+        unfinished sequences have length `max_seq_len`.
+    """
+    # Type check.
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(num_samples, int):
+        raise TypeError('`num_samples` must be an instance of `int`.')
+
+    if not (
+            isinstance(prompts, (list, tuple)) and
+            all(map(lambda prompt: isinstance(prompt, str), prompts))
+    ):
+        raise TypeError('`prompts` must be an instance of `Sequence[str]`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if prefix_cache is not None and not isinstance(
+            prefix_cache,
+            PrefixStateCache
+    ):
+        raise TypeError(
+            '`prefix_cache` must be an instance of '
+            '`Optional[lmp.util.PrefixStateCache]`.'
+        )
+
+    if seed is not None and not isinstance(seed, int):
+        raise TypeError('`seed` must be an instance of `Optional[int]`.')
+
+    if not isinstance(temperature, float):
+        raise TypeError('`temperature` must be an instance of `float`.')
+
+    if not isinstance(top_k, int):
+        raise TypeError('`top_k` must be an instance of `int`.')
+
+    if not isinstance(top_p, float):
+        raise TypeError('`top_p` must be an instance of `float`.')
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    if max_seq_len < 2:
+        raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
+
+    if num_samples < 1:
+        raise ValueError('`num_samples` must be bigger than or equal to `1`.')
+
+    if seed is not None and seed < 1:
+        raise ValueError('`seed` must be bigger than or equal to `1`.')
+
+    if not temperature > 0.0:
+        raise ValueError('`temperature` must be bigger than `0.0`.')
+
+    if top_k < 0:
+        raise ValueError('`top_k` must be bigger than or equal to `0`.')
+
+    if not 0.0 < top_p <= 1.0:
+        raise ValueError(
+            '`top_p` must be bigger than `0.0` and smaller than or equal to '
+            '`1.0`.'
+        )
+
+    # Evaluation mode.
+    model.eval()
+
+    # Use dedicated random number generator so that sampling is
+    # reproducible without changing global random state.
+    generator = None
+    if seed is not None:
+        generator = torch.Generator(device=device)
+        generator.manual_seed(seed)
+
+    eos_token_id = tokenizer.convert_token_to_id(
+        tokenizer.__class__.eos_token
+    )
+
+    # Encode sequences. Remove `[eos]` since we are using begin of sentence.
+    prompts = [
+        tokenizer.encode(prompt, max_seq_len=-1)[:-1]
+        for prompt in prompts
+    ]
+
+    # Batch beginning of sequences with similar length together, so that
+    # each batch needs fewer calls to feed beginning of sequences.
+    order = sorted(range(len(prompts)), key=lambda i: len(prompts[i]))
+
+    sampled_sequences = [[] for _ in prompts]
+    for start in range(0, len(order), batch_size):
+        batch_index = order[start:start + batch_size]
+        batch_results = _sample(
+            device=device,
+            eos_token_id=eos_token_id,
+            generator=generator,
+            max_seq_len=max_seq_len,
+            model=model,
+            num_samples=num_samples,
+            prefix_cache=prefix_cache,
+            prompts=[prompts[i] for i in batch_index],
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p
+        )
+
+        for i, results in zip(batch_index, batch_results):
+            sampled_sequences[i] = tokenizer.batch_decode([
+                prompts[i] + token_ids
+                for token_ids in results
+            ])
+
+    return sampled_sequences
+
+
+def sample_batch_by_config(
+        batch_size: int,
+        config: lmp.config.BaseConfig,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_samples: int,
+        prompts: Sequence[str],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        prefix_cache: Optional[PrefixStateCache] = None,
+        seed: Optional[int] = None,
+        temperature: float = 1.0,
+        top_k: int = 0,
+        top_p: float = 1.0
+) -> List[List[str]]:
+    r"""Helper function for sampling batch sequences.
+
+    Args:
+        batch_size:
+            Number of beginning of sequences decoded together. Must be
+            bigger than or equal to `1`.
+        config:
+            Configuration object with attributes `device`.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        num_samples:
+            Number of sequences to sample for each beginning of sequence.
+            Must be bigger than or equal to `1`.
+        prompts:
+            Begining of sequences which model will auto-complete.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        prefix_cache:
+            Cache of recurrent states of prefixes. Disable caching when
+            `prefix_cache` is `None`.
+        seed:
+            Random seed of sampling. Use global random state when `seed` is
+            `None`. Must be bigger than or equal to `1`.
+        temperature:
+            Divide next token logits by `temperature`. Must be bigger than
+            `0.0`.
+        top_k:
+            Only sample from `top_k` most likely tokens. Disable top-k
+            filtering when `top_k` is `0`. Must be bigger than or equal to
+            `0`.
+        top_p:
+            Only sample from the smallest set of most likely tokens whose
+            total probability is at least `top_p`. Must be bigger than `0.0`
+            and smaller than or equal to `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        `num_samples` sampled sequences of each beginning of sequence.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    return sample_batch(
+        batch_size=batch_size,
+        device=config.device,
+        max_seq_len=max_seq_len,
+        model=model,
+        num_samples=num_samples,
+        prompts=prompts,
+        tokenizer=tokenizer,
+        prefix_cache=prefix_cache,
+        seed=seed,
+        temperature=temperature,
+        top_k=top_k,
+        top_p=top_p
+    )
+
+
+def stream_sequence(
+        begin_of_sequence: str,
+        device: torch.device,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        seed: Optional[int] = None,
+        temperature: float = 1.0,
+        top_k: int = 0,
+        top_p: float = 1.0
+) -> Generator[str, None, None]:
+    r"""Sample single sequence and yield text token by token.
+
+    Beginning of sequence is yielded first. Then it is fed into model once,
+    and each sampled token is yielded right after it is chosen, before next
+    token is computed. Thus first new text is available after a single model
+    step. Next token is sampled as in `sample_batch`, and only new token is
+    fed into model with recurrent state (see `model.step`).
+
+    Tokens are converted into text by `tokenizer.stream_detokenize`, which
+    normalizes each token alone. Concatenation of all yielded texts is the
+    same as output of `sample_batch` with `num_samples=1` and the same
+    `seed`.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        device:
+            Model running device.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        seed:
+            Random seed of sampling. Use global random state when `seed` is
+            `None`. Must be bigger than or equal to `1`.
+        temperature:
+            Divide next token logits by `temperature`. Must be bigger than
+            `0.0`.
+        top_k:
+            Only sample from `top_k` most likely tokens. Disable top-k
+            filtering when `top_k` is `0`. Use `top_k=1` for greedy decoding.
+            Must be bigger than or equal to `0`.
+        top_p:
+            Only sample from the smallest set of most likely tokens whose
+            total probability is at least `top_p`. Must be bigger than `0.0`
+            and smaller than or equal to `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generator yielding text of beginning of sequence, then text appended
+        by each sampled token. Empty texts are not yielded.
+    """
+    # Type check.
+    if not isinstance(begin_of_sequence, str):
+        raise TypeError('`begin_of_sequence` must be an instance of `str`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if seed is not None and not isinstance(seed, int):
+        raise TypeError('`seed` must be an instance of `Optional[int]`.')
+
+    if not isinstance(temperature, float):
+        raise TypeError('`temperature` must be an instance of `float`.')
+
+    if not isinstance(top_k, int):
+        raise TypeError('`top_k` must be an instance of `int`.')
+
+    if not isinstance(top_p, float):
+        raise TypeError('`top_p` must be an instance of `float`.')
+
+    # Value check.
+    if max_seq_len < 2:
+        raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
+
+    if seed is not None and seed < 1:
+        raise ValueError('`seed` must be bigger than or equal to `1`.')
+
+    if not temperature > 0.0:
+        raise ValueError('`temperature` must be bigger than `0.0`.')
+
+    if top_k < 0:
+        raise ValueError('`top_k` must be bigger than or equal to `0`.')
+
+    if not 0.0 < top_p <= 1.0:
+        raise ValueError(
+            '`top_p` must be bigger than `0.0` and smaller than or equal to '
+            '`1.0`.'
+        )
+
+    # Evaluation mode.
+    model.eval()
+
+    # Use dedicated random number generator so that sampling is
+    # reproducible without changing global random state.
+    generator = None
+    if seed is not None:
+        generator = torch.Generator(device=device)
+        generator.manual_seed(seed)
+
+    eos_token_id = tokenizer.convert_token_to_id(
+        tokenizer.__class__.eos_token
+    )
+
+    # Encode sequence. Remove `[eos]` since we are using begin of sentence.
+    prompt = tokenizer.encode(begin_of_sequence, max_seq_len=-1)[:-1]
+
+    return _stream(
+        device=device,
+        eos_token_id=eos_token_id,
+        generator=generator,
+        max_seq_len=max_seq_len,
+        model=model,
+        prompt=prompt,
+        temperature=temperature,
+        tokenizer=tokenizer,
+        top_k=top_k,
+        top_p=top_p
+    )
+
+
+def stream_sequence_by_config(
+        begin_of_sequence: str,
+        config: lmp.config.BaseConfig,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        seed: Optional[int] = None,
+        temperature: float = 1.0,
+        top_k: int = 0,
+        top_p: float = 1.0
+) -> Generator[str, None, None]:
+    r"""Helper function for streaming sequence generation.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        config:
+            Configuration object with attributes `device`.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal
+            to `2`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        seed:
+            Random seed of sampling. Use global random state when `seed` is
+            `None`. Must be bigger than or equal to `1`.
+        temperature:
+            Divide next token logits by `temperature`. Must be bigger than
+            `0.0`.
+        top_k:
+            Only sample from `top_k` most likely tokens. Disable top-k
+            filtering when `top_k` is `0`. Must be bigger than or equal to
+            `0`.
+        top_p:
+            Only sample from the smallest set of most likely tokens whose
+            total probability is at least `top_p`. Must be bigger than `0.0`
+            and smaller than or equal to `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generator yielding text token by token.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    return stream_sequence(
+        begin_of_sequence=begin_of_sequence,
+        device=config.device,
+        max_seq_len=max_seq_len,
+        model=model,
+        tokenizer=tokenizer,
+        seed=seed,
+        temperature=temperature,
+        top_k=top_k,
+        top_p=top_p
+    )
@@ -0,0 +1,385 @@
+r"""Helper class for serving sequences generation with dynamic micro-batching.
+
+Usage:
+    import asyncio
+    import lmp.util
+
+    server = lmp.util.GenerationServer(...)
+    asyncio.run(server.serve(...))
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import concurrent.futures
+import json
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+GenerateFn = Callable[[List[str]], List[List[str]]]
+
+
+class GenerationServer:
+    r"""Coalesce concurrent generation requests into batched decoding.
+
+    Model, tokenizer and configuration are loaded once by caller and wrapped
+    in `generate_fn`, which generates sequences for a batch of beginning of
+    sequences (for example, `lmp.util.generate_batch_by_config` or
+    `lmp.util.sample_batch_by_config` with every other argument fixed). Each
+    request thus only pays for decoding, not for loading.
+
+    Requests are put into a queue. A background task takes the first waiting
+    request, then keeps collecting requests until `max_batch_size` requests
+    are collected or `max_wait` seconds have passed, and feeds all of them
+    into a single `generate_fn` call. `generate_fn` is run on a worker thread
+    so that new requests keep being accepted during decoding. Requests
+    arriving during decoding are batched together in the next call, so batch
+    size grows with load without waiting at all.
+
+    Requests are served over HTTP with TCP or Unix domain socket. Send a
+    `POST` request to `/generate` with JSON body
+    `{"begin_of_sequence": "..."}`, and response JSON body is
+    `{"generated": ["...", ...]}`.
+
+    Attributes:
+        generate_fn:
+            Function generating sequences of batch of beginning of sequences.
+        max_batch_size:
+            Maximum number of requests generated together.
+        max_wait:
+            Maximum seconds to wait for more requests before generating.
+        num_batches:
+            Number of `generate_fn` calls finished.
+        num_requests:
+            Number of requests finished.
+
+    Args:
+        generate_fn:
+            Function taking list of beginning of sequences and returning list
+            of generated sequences of each beginning of sequence.
+        max_batch_size:
+            Maximum number of requests generated together. Must be bigger than
+            or equal to `1`.
+        max_wait:
+            Maximum seconds to wait for more requests before generating. Must
+            be bigger than or equal to `0.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            generate_fn: GenerateFn,
+            max_batch_size: int,
+            max_wait: float
+    ):
+        # Type check.
+        if not callable(generate_fn):
+            raise TypeError('`generate_fn` must be an instance of `Callable`.')
+
+        if not isinstance(max_batch_size, int):
+            raise TypeError('`max_batch_size` must be an instance of `int`.')
+
+        if not isinstance(max_wait, float):
+            raise TypeError('`max_wait` must be an instance of `float`.')
+
+        # Value check.
+        if max_batch_size < 1:
+            raise ValueError(
+                '`max_batch_size` must be bigger than or equal to `1`.'
+            )
+
+        if not max_wait >= 0.0:
+            raise ValueError(
+                '`max_wait` must be bigger than or equal to `0.0`.'
+            )
+
+        self.generate_fn = generate_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.num_batches = 0
+        self.num_requests = 0
+        self._batcher = None
+        self._queue = None
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        r"""Collect batch of waiting requests.
+
+        Block until the first request arrives. Requests already waiting are
+        taken right away, then wait at most `self.max_wait` seconds since the
+        first request for the rest.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run_batches(self) -> None:
+        r"""Generate sequences of collected batches forever.
+
+        Only one `generate_fn` call is running at a time. Exception raised by
+        `generate_fn` is passed to every request in the same batch. When
+        `generate_fn` does not return one result for each request,
+        `ValueError` is passed instead, so that no request waits forever.
+        """
+        loop = asyncio.get_running_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        try:
+            while True:
+                batch = await self._collect()
+
+                try:
+                    generated = await loop.run_in_executor(
+                        executor,
+                        self.generate_fn,
+                        [begin_of_sequence for begin_of_sequence, _ in batch]
+                    )
+
+                    if len(generated) != len(batch):
+                        raise ValueError(
+                            '`generate_fn` must return one result for each '
+                            'beginning of sequence.'
+                        )
+                except Exception as err:  # pylint: disable=W0703
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(err)
+                    continue
+
+                self.num_batches += 1
+                self.num_requests += len(batch)
+
+                for (_, future), sequences in zip(batch, generated):
+                    # Client may disconnect before generation finished.
+                    if not future.done():
+                        future.set_result(sequences)
+        finally:
+            executor.shutdown(wait=False)
+
+    async def generate(self, begin_of_sequence: str) -> List[str]:
+        r"""Generate sequences of single beginning of sequence.
+
+        Request is batched with other concurrent requests.
+
+        Args:
+            begin_of_sequence:
+                Beginning of sequence which model will auto-complete.
+
+        Raises:
+            TypeError:
+                When `begin_of_sequence` is not an instance of `str`.
+
+        Returns:
+            Generated sequences of `begin_of_sequence`.
+        """
+        # Type check.
+        if not isinstance(begin_of_sequence, str):
+            raise TypeError(
+                '`begin_of_sequence` must be an instance of `str`.'
+            )
+
+        # Start background task in current event loop.
+        if self._batcher is None or self._batcher.done():
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.ensure_future(self._run_batches())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((begin_of_sequence, future))
+
+        return await future
+
+    async def _respond(
+            self,
+            body: bytes,
+            method: str,
+            path: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        r"""Create HTTP response status and JSON body of single request."""
+        if path != '/generate':
+            return '404 Not Found', {'error': f'Path `{path}` not found.'}
+
+        if method != 'POST':
+            return (
+                '405 Method Not Allowed',
+                {'error': f'Method `{method}` not allowed.'}
+            )
+
+        try:
+            request = json.loads(body.decode('utf-8'))
+        except ValueError:
+            return '400 Bad Request', {'error': 'Invalid JSON body.'}
+
+        if not isinstance(request, dict) or not isinstance(
+                request.get('begin_of_sequence'),
+                str
+        ):
+            return (
+                '400 Bad Request',
+                {'error': '`begin_of_sequence` must be an instance of `str`.'}
+            )
+
+        try:
+            generated = await self.generate(
+                begin_of_sequence=request['begin_of_sequence']
+            )
+        except Exception as err:  # pylint: disable=W0703
+            return '500 Internal Server Error', {'error': str(err)}
+
+        return '200 OK', {'generated': generated}
+
+    async def _handle_connection(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        r"""Serve HTTP requests of single connection.
+
+        Connection is kept alive until client close it or send header
+        `Connection: close`.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'', b'\n', b'\r\n'):
+                        break
+
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, path, _ = request_line.decode('latin-1').split()
+                    body = await reader.readexactly(
+                        int(headers.get('content-length', '0'))
+                    )
+                except ValueError:
+                    status = '400 Bad Request'
+                    response = {'error': 'Invalid HTTP request.'}
+                    headers['connection'] = 'close'
+                else:
+                    status, response = await self._respond(
+                        body=body,
+                        method=method,
+                        path=path
+                    )
+
+                payload = json.dumps(response, ensure_ascii=False).encode(
+                    'utf-8'
+                )
+                writer.write(
+                    (
+                        f'HTTP/1.1 {status}\r\n'
+                        'Content-Type: application/json; charset=utf-8\r\n'
+                        f'Content-Length: {len(payload)}\r\n'
+                        '\r\n'
+                    ).encode('latin-1') + payload
+                )
+                await writer.drain()
+
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(
+            self,
+            host: str = 'localhost',
+            path: Optional[str] = None,
+            port: int = 8000
+    ) -> asyncio.AbstractServer:
+        r"""Start accepting HTTP connections.
+
+        Args:
+            host:
+                Host name or address of TCP socket.
+            path:
+                Path of Unix domain socket. Listen on Unix domain socket
+                instead of TCP socket when given.
+            port:
+                Port of TCP socket. Use `0` to pick any free port.
+
+        Raises:
+            TypeError:
+                When one of the arguments are not an instance of their type
+                annotation respectively.
+
+        Returns:
+            Started `asyncio` server.
+        """
+        # Type check.
+        if not isinstance(host, str):
+            raise TypeError('`host` must be an instance of `str`.')
+
+        if path is not None and not isinstance(path, str):
+            raise TypeError('`path` must be an instance of `Optional[str]`.')
+
+        if not isinstance(port, int):
+            raise TypeError('`port` must be an instance of `int`.')
+
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self._handle_connection,
+                path=path
+            )
+
+        return await asyncio.start_server(
+            self._handle_connection,
+            host=host,
+            port=port
+        )
+
+    async def serve(
+            self,
+            host: str = 'localhost',
+            path: Optional[str] = None,
+            port: int = 8000
+    ) -> None:
+        r"""Accept HTTP connections forever.
+
+        See `start` for arguments.
+        """
+        server = await self.start(host=host, path=path, port=port)
+
+        async with server:
+            await server.serve_forever()
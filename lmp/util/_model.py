@@ -16,6 +16,7 @@ from __future__ import unicode_literals
 
 import os
 
+from typing import Sequence
 from typing import Union
 
 # 3rd-party modules
@@ -40,7 +41,8 @@ def load_model(
         num_linear_layers: int,
         num_rnn_layers: int,
         pad_token_id: int,
-        vocab_size: int
+        vocab_size: int,
+        adaptive_softmax_cutoffs: Sequence[int] = ()
 ) -> Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]:
     r"""Helper function for constructing language model.
 
@@ -85,6 +87,10 @@ def load_model(
         vocab_size:
             Embedding matrix vocabulary dimension. Must be bigger than or equal
             to `1`.
+        adaptive_softmax_cutoffs:
+            Cutoffs of adaptive softmax output layer. Must be strictly
+            increasing and range from `1` to `vocab_size - 1`. Use empty
+            sequence to predict with embedding matrix (full softmax) instead.
 
     Raises:
         TypeError:
@@ -127,7 +133,8 @@ def load_model(
             num_rnn_layers=num_rnn_layers,
             num_linear_layers=num_linear_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
     elif model_class == 'gru':
@@ -138,7 +145,8 @@ def load_model(
             num_rnn_layers=num_rnn_layers,
             num_linear_layers=num_linear_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
     elif model_class == 'lstm':
@@ -149,7 +157,8 @@ def load_model(
             num_rnn_layers=num_rnn_layers,
             num_linear_layers=num_linear_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
     elif model_class == 'res_rnn':
@@ -160,7 +169,8 @@ def load_model(
             num_rnn_layers=num_rnn_layers,
             num_linear_layers=num_linear_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
     elif model_class == 'res_gru':
@@ -171,7 +181,8 @@ def load_model(
             num_rnn_layers=num_rnn_layers,
             num_linear_layers=num_linear_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
     elif model_class == 'res_lstm':
@@ -182,7 +193,8 @@ def load_model(
             num_rnn_layers=num_rnn_layers,
             num_linear_layers=num_linear_layers,
             pad_token_id=pad_token_id,
-            vocab_size=vocab_size
+            vocab_size=vocab_size,
+            adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
         )
 
     else:
@@ -233,9 +245,9 @@ def load_model_by_config(
             Pre-trained model's checkpoint. Must be bigger than or equal to
             `-1`.
         config:
-            Configuration object with attributes `d_emb`, `d_hid`, `dropout`,
-            `device`, `experiment`, `model_class`, `num_linear_layer` and
-            `num_rnn_layer`.
+            Configuration object with attributes `adaptive_softmax_cutoffs`,
+            `d_emb`, `d_hid`, `dropout`, `device`, `experiment`,
+            `model_class`, `num_linear_layer` and `num_rnn_layer`.
         tokenizer:
             Tokenizer object with attributes `pad_token_id` and `vocab_size`.
 
@@ -271,5 +283,6 @@ def load_model_by_config(
         num_linear_layers=config.num_linear_layers,
         num_rnn_layers=config.num_rnn_layers,
         pad_token_id=tokenizer.convert_token_to_id(tokenizer.pad_token),
-        vocab_size=tokenizer.vocab_size
+        vocab_size=tokenizer.vocab_size,
+        adaptive_softmax_cutoffs=config.adaptive_softmax_cutoffs
     )
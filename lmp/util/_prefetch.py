@@ -0,0 +1,208 @@
+r"""Helper class for prefetching mini-batches in background thread.
+
+Usage:
+    import lmp.util
+
+    prefetcher = lmp.util.BatchPrefetcher(...)
+    for x, y in prefetcher:
+        ...
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import queue
+import threading
+import time
+
+from typing import Any
+from typing import Generator
+
+# 3rd-party modules
+
+import torch
+import torch.utils.data
+
+
+class BatchPrefetcher:
+    r"""Prepare next mini-batches on background thread.
+
+    Iterate through `data_loader` on a background thread and put mini-batches
+    into a bounded queue with at most `num_batches` mini-batches. Training
+    loop can thus run forward and backward pass while next mini-batches are
+    being collated (tokenizer's regex and normalization calls release GIL).
+    Each tensor in mini-batch is moved to `device` on background thread too.
+
+    Every time training loop find the queue empty, it must block until next
+    mini-batch is ready. We count those events in `num_waits` and accumulate
+    blocking time in `wait_time`, so one can tell whether training is bounded
+    by data loading. Both counters are reset at the start of each epoch.
+
+    Attributes:
+        data_loader:
+            `torch.utils.data.DataLoader` to prefetch from.
+        device:
+            Device which tensors will be moved to.
+        num_batches:
+            Maximum number of prefetched mini-batches.
+        num_fetched:
+            Number of mini-batches yielded in current epoch.
+        num_waits:
+            Number of times training loop blocked waiting on data in current
+            epoch.
+        wait_time:
+            Total seconds training loop blocked waiting on data in current
+            epoch.
+
+    Args:
+        data_loader:
+            `torch.utils.data.DataLoader` to prefetch from.
+        device:
+            Device which tensors will be moved to.
+        num_batches:
+            Maximum number of prefetched mini-batches. Must be bigger than or
+            equal to `1`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `num_batches < 1`.
+    """
+
+    def __init__(
+            self,
+            data_loader: torch.utils.data.DataLoader,
+            device: torch.device,
+            num_batches: int
+    ):
+        # Type check.
+        if not isinstance(data_loader, torch.utils.data.DataLoader):
+            raise TypeError(
+                '`data_loader` must be an instance of '
+                '`torch.utils.data.DataLoader`.'
+            )
+
+        if not isinstance(device, torch.device):
+            raise TypeError('`device` must be an instance of `torch.device`.')
+
+        if not isinstance(num_batches, int):
+            raise TypeError('`num_batches` must be an instance of `int`.')
+
+        # Value check.
+        if num_batches < 1:
+            raise ValueError(
+                '`num_batches` must be bigger than or equal to `1`.'
+            )
+
+        self.data_loader = data_loader
+        self.device = device
+        self.num_batches = num_batches
+        self.num_fetched = 0
+        self.num_waits = 0
+        self.wait_time = 0.0
+
+    def _to_device(self, batch: Any) -> Any:
+        r"""Move every tensor in `batch` to `self.device`."""
+        if isinstance(batch, torch.Tensor):
+            return batch.to(
+                self.device,
+                non_blocking=self.data_loader.pin_memory
+            )
+
+        if isinstance(batch, (list, tuple)):
+            return type(batch)(self._to_device(item) for item in batch)
+
+        return batch
+
+    @staticmethod
+    def _put(
+            batch_queue: queue.Queue,
+            item: Any,
+            stop_event: threading.Event
+    ) -> None:
+        r"""Put `item` into `batch_queue` unless consumer has stopped.
+
+        Check `stop_event` periodically so that background thread can exit
+        when consumer stop early (for example, `break` out of the loop).
+        """
+        while not stop_event.is_set():
+            try:
+                batch_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(
+            self,
+            batch_queue: queue.Queue,
+            stop_event: threading.Event
+    ) -> None:
+        r"""Put mini-batches into `batch_queue` until exhausted or stopped.
+
+        Any exception raised while loading is put into `batch_queue` and
+        re-raised on consumer side. `None` marks the end of an epoch.
+        """
+        try:
+            for batch in self.data_loader:
+                if stop_event.is_set():
+                    return
+
+                self._put(batch_queue, self._to_device(batch), stop_event)
+        except Exception as err:  # pylint: disable=W0703
+            self._put(batch_queue, err, stop_event)
+            return
+
+        self._put(batch_queue, None, stop_event)
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        r"""Iterate through prefetched mini-batches of current epoch.
+
+        Yields:
+            Mini-batches from `self.data_loader` with tensors on
+            `self.device`.
+        """
+        self.num_fetched = 0
+        self.num_waits = 0
+        self.wait_time = 0.0
+
+        batch_queue = queue.Queue(maxsize=self.num_batches)
+        stop_event = threading.Event()
+        producer = threading.Thread(
+            target=self._produce,
+            args=(batch_queue, stop_event),
+            daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                try:
+                    item = batch_queue.get_nowait()
+                except queue.Empty:
+                    # Training loop is waiting on data.
+                    self.num_waits += 1
+                    start_time = time.perf_counter()
+                    item = batch_queue.get()
+                    self.wait_time += time.perf_counter() - start_time
+
+                if item is None:
+                    break
+
+                if isinstance(item, Exception):
+                    raise item
+
+                self.num_fetched += 1
+                yield item
+        finally:
+            stop_event.set()
+            producer.join()
+
+    def __len__(self) -> int:
+        r"""Number of mini-batches in each epoch."""
+        return len(self.data_loader)
@@ -0,0 +1,302 @@
+r"""Helper class for caching recurrent states of beginning of sequences.
+
+Usage:
+    import lmp.util
+
+    prefix_cache = lmp.util.PrefixStateCache(...)
+    generated = lmp.util.generate_batch(..., prefix_cache=prefix_cache)
+    generated = lmp.util.sample_batch(..., prefix_cache=prefix_cache)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+
+class _TrieNode:
+    r"""Node of token trie.
+
+    Path from root to node is the token ids of a prefix. `state` is the
+    recurrent state after feeding that prefix, or `None` when not cached.
+    """
+
+    def __init__(self):
+        self.children = {}
+        self.state = None
+
+
+class PrefixStateCache:
+    r"""Cache recurrent states of prefixes in a token trie.
+
+    Many beginning of sequences share common prefixes (for example,
+    templated openings). Instead of feeding the same prefix into model for
+    every request, recurrent state after feeding a prefix (see `model.step`)
+    is cached with encoded prefix as key. Feeding can then start from the
+    longest cached prefix instead of from `[bos]`.
+
+    Keys are stored in a token trie, so the longest cached prefix of a
+    sequence is found by walking down the trie once. Since the state of a
+    prefix is only available when feeding stops there, feeding stops at every
+    multiple of `block_size` tokens and right before the last token of each
+    beginning of sequence, and states are cached at those positions (see
+    `cache_positions`). Templated openings longer than `block_size` are thus
+    always partially shared, and repeated beginning of sequences are fully
+    shared.
+
+    Each cached state is a tuple of tensors with shape (L, 1, H). When total
+    size of cached tensors exceeds `max_bytes`, least recently used states
+    are evicted. Cached states depend on model parameters, thus each cache
+    must only be used with a single model, and must be cleared (see `clear`)
+    after model parameters are changed.
+
+    Attributes:
+        block_size:
+            Cache states at every `block_size` tokens of prefixes.
+        max_bytes:
+            Maximum total bytes of cached tensors.
+        num_bytes:
+            Total bytes of cached tensors.
+        num_hits:
+            Number of lookups which found a cached prefix.
+        num_misses:
+            Number of lookups which found no cached prefix.
+
+    Args:
+        block_size:
+            Cache states at every `block_size` tokens of prefixes. Must be
+            bigger than or equal to `1`.
+        max_bytes:
+            Maximum total bytes of cached tensors. Must be bigger than or
+            equal to `0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(self, block_size: int, max_bytes: int):
+        # Type check.
+        if not isinstance(block_size, int):
+            raise TypeError('`block_size` must be an instance of `int`.')
+
+        if not isinstance(max_bytes, int):
+            raise TypeError('`max_bytes` must be an instance of `int`.')
+
+        # Value check.
+        if block_size < 1:
+            raise ValueError(
+                '`block_size` must be bigger than or equal to `1`.'
+            )
+
+        if max_bytes < 0:
+            raise ValueError(
+                '`max_bytes` must be bigger than or equal to `0`.'
+            )
+
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.num_hits = 0
+        self.num_misses = 0
+        self._root = _TrieNode()
+
+        # Least recently used prefix comes first.
+        self._lru = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        r"""Number of cached prefixes."""
+        return len(self._lru)
+
+    @staticmethod
+    def _check_token_ids(token_ids: Sequence[int]) -> None:
+        r"""Raise `TypeError` when `token_ids` is not a sequence of `int`."""
+        if not (
+                isinstance(token_ids, (list, tuple)) and
+                all(map(lambda token_id: isinstance(token_id, int), token_ids))
+        ):
+            raise TypeError(
+                '`token_ids` must be an instance of `Sequence[int]`.'
+            )
+
+    def cache_positions(self, end: int, start: int) -> List[int]:
+        r"""Prefix lengths whose states should be cached.
+
+        Args:
+            end:
+                Prefix length right before the last token of beginning of
+                sequence.
+            start:
+                Prefix length where feeding starts.
+
+        Returns:
+            Multiples of `self.block_size` and `end` which are bigger than
+            `start` and smaller than or equal to `end`, in ascending order.
+        """
+        positions = list(range(
+            (start // self.block_size + 1) * self.block_size,
+            end + 1,
+            self.block_size
+        ))
+        if end > start and (not positions or positions[-1] != end):
+            positions.append(end)
+
+        return positions
+
+    def lookup(
+            self,
+            token_ids: Sequence[int]
+    ) -> Tuple[int, Optional[Tuple[torch.Tensor, ...]]]:
+        r"""Find cached state of the longest prefix of `token_ids`.
+
+        Args:
+            token_ids:
+                Encoded sequence to look up.
+
+        Raises:
+            TypeError:
+                When `token_ids` is not an instance of `Sequence[int]`.
+
+        Returns:
+            Length of the longest cached prefix and its recurrent state.
+            Return `0` and `None` when no prefix is cached.
+        """
+        # Type check.
+        self._check_token_ids(token_ids)
+
+        node = self._root
+        length = 0
+        state = None
+        for index, token_id in enumerate(token_ids):
+            node = node.children.get(token_id)
+            if node is None:
+                break
+
+            if node.state is not None:
+                length = index + 1
+                state = node.state
+
+        if state is None:
+            self.num_misses += 1
+            return 0, None
+
+        self.num_hits += 1
+        self._lru.move_to_end(tuple(token_ids[:length]))
+        return length, state
+
+    def insert(
+            self,
+            state: Tuple[torch.Tensor, ...],
+            token_ids: Sequence[int]
+    ) -> None:
+        r"""Cache recurrent state after feeding `token_ids`.
+
+        Least recently used states are evicted until total size is within
+        `self.max_bytes`. State larger than `self.max_bytes` is not cached.
+
+        Args:
+            state:
+                Recurrent state with batch size `1` returned by
+                `model.step`.
+            token_ids:
+                Encoded prefix fed into model. Must not be empty.
+
+        Raises:
+            TypeError:
+                When `state` is not an instance of `Tuple[Tensor, ...]` or
+                `token_ids` is not an instance of `Sequence[int]`.
+            ValueError:
+                When `token_ids` is empty.
+        """
+        # Type check.
+        if not (
+                isinstance(state, tuple) and
+                all(map(
+                    lambda tensor: isinstance(tensor, torch.Tensor),
+                    state
+                ))
+        ):
+            raise TypeError(
+                '`state` must be an instance of `Tuple[Tensor, ...]`.'
+            )
+
+        self._check_token_ids(token_ids)
+
+        # Value check.
+        if not token_ids:
+            raise ValueError('`token_ids` must not be empty.')
+
+        num_bytes = sum(
+            tensor.numel() * tensor.element_size()
+            for tensor in state
+        )
+        if num_bytes > self.max_bytes:
+            return
+
+        key = tuple(token_ids)
+        node = self._root
+        for token_id in key:
+            if token_id not in node.children:
+                node.children[token_id] = _TrieNode()
+            node = node.children[token_id]
+
+        if node.state is not None:
+            self.num_bytes -= sum(
+                tensor.numel() * tensor.element_size()
+                for tensor in node.state
+            )
+
+        node.state = state
+        self.num_bytes += num_bytes
+        self._lru[key] = node
+        self._lru.move_to_end(key)
+
+        while self.num_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        r"""Remove least recently used state and prune empty trie nodes."""
+        key, node = self._lru.popitem(last=False)
+        self.num_bytes -= sum(
+            tensor.numel() * tensor.element_size()
+            for tensor in node.state
+        )
+        node.state = None
+
+        # Remove nodes without state and children from leaf to root.
+        path = [self._root]
+        for token_id in key:
+            path.append(path[-1].children[token_id])
+
+        for token_id, parent, child in zip(
+                reversed(key),
+                reversed(path[:-1]),
+                reversed(path[1:])
+        ):
+            if child.children or child.state is not None:
+                break
+
+            del parent.children[token_id]
+
+    def clear(self) -> None:
+        r"""Remove all cached states. Counters are kept."""
+        self.num_bytes = 0
+        self._root = _TrieNode()
+        self._lru.clear()
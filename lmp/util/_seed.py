@@ -5,6 +5,7 @@ Usage:
 
     lmp.set_seed(...)
     lmp.set_seed_by_config(...)
+    torch.utils.data.DataLoader(..., worker_init_fn=lmp.util.seed_worker)
 """
 
 # built-in modules
@@ -58,6 +59,41 @@ def set_seed(seed: int) -> None:
         torch.backends.cudnn.benchmark = False
 
 
+def seed_worker(worker_id: int) -> None:
+    r"""Seed `random` and `numpy` in data loading subprocess.
+
+    Used as `worker_init_fn` of `torch.utils.data.DataLoader`. Each data
+    loading subprocess already has `torch` seeded with `base_seed + worker_id`,
+    where `base_seed` is drawn from main process's `torch` random generator
+    (which is seeded by `set_seed`). We seed `random` and `numpy` with the
+    same value so that data loading subprocesses are reproducible and do not
+    share the same `numpy` random state.
+
+    Args:
+        worker_id:
+            Data loading subprocess id. Must be bigger than or equal to `0`.
+
+    Raises:
+        TypeError:
+            When `worker_id` is not an instance of `int`.
+        ValueError:
+            When `worker_id < 0`.
+    """
+    # Type check.
+    if not isinstance(worker_id, int):
+        raise TypeError('`worker_id` must be an instance of `int`.')
+
+    # Value check.
+    if worker_id < 0:
+        raise ValueError('`worker_id` must be bigger than or equal to `0`.')
+
+    # `numpy` only accept seed range from `0` to `2 ** 32 - 1`.
+    worker_seed = torch.initial_seed() % 2 ** 32
+
+    random.seed(worker_seed)
+    np.random.seed(worker_seed)
+
+
 def set_seed_by_config(config: lmp.config.BaseConfig) -> None:
     r"""Helper function for setting random seed.
 
@@ -5,6 +5,7 @@ Usage:
 
     lmp.util.train_model(...)
     lmp.util.train_model_by_config(...)
+    lmp.util.train_model_hogwild_by_config(...)
 """
 
 # built-in modules
@@ -14,15 +15,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import contextlib
 import math
 import os
 
+from typing import Optional
 from typing import Union
 
 # 3rd-party modules
 
 import torch
+import torch.distributed
+import torch.multiprocessing
 import torch.nn
+import torch.nn.parallel
 import torch.optim
 import torch.utils.data
 import torch.utils.tensorboard
@@ -37,6 +43,59 @@ import lmp.model
 import lmp.path
 import lmp.tokenizer
 
+from lmp.util._optimizer import load_optimizer_by_config
+from lmp.util._prefetch import BatchPrefetcher
+from lmp.util._seed import seed_worker
+
+
+class _ModelLoss(torch.nn.Module):
+    r"""Expose `model.loss` or `model.sampled_loss` as `forward`.
+
+    `torch.nn.parallel.DistributedDataParallel` only synchronize gradients
+    of computation run through `forward`, thus training objective is wrapped
+    as `forward` of this module.
+
+    Args:
+        model:
+            Language model.
+        num_negative_samples:
+            Number of negative samples of `model.sampled_loss`. Use
+            `model.loss` when `num_negative_samples == 0`.
+        noise_probs:
+            Probability of sampling each token id as negative sample. Only
+            used when `num_negative_samples > 0`.
+    """
+
+    def __init__(
+            self,
+            model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+            num_negative_samples: int = 0,
+            noise_probs: Optional[torch.Tensor] = None
+    ):
+        super().__init__()
+        self.model = model
+        self.num_negative_samples = num_negative_samples
+        self.noise_probs = noise_probs
+
+    def forward(
+            self,
+            batch_sequences: torch.Tensor,
+            batch_next_tokens: torch.Tensor
+    ) -> torch.Tensor:
+        r"""Compute mean training loss of `model`."""
+        if self.num_negative_samples > 0:
+            return self.model.sampled_loss(
+                batch_sequences=batch_sequences,
+                batch_next_tokens=batch_next_tokens,
+                noise_probs=self.noise_probs,
+                num_samples=self.num_negative_samples
+            )
+
+        return self.model.loss(
+            batch_sequences=batch_sequences,
+            batch_next_tokens=batch_next_tokens
+        )
+
 
 def train_model(
         checkpoint: int,
@@ -48,20 +107,59 @@ def train_model(
         max_norm: float,
         model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
         optimizer: Union[torch.optim.SGD, torch.optim.Adam],
-        vocab_size: int
+        vocab_size: int,
+        prefetch_batches: int = 0,
+        is_main_process: bool = True,
+        accumulation_steps: int = 1,
+        precision: str = 'fp32',
+        num_negative_samples: int = 0,
+        noise_probs: Optional[torch.Tensor] = None
 ) -> None:
     r"""Helper function for training language model.
 
     Continue training from pre-trained checkpoint when `checkpoint != -1`.
 
+    Loss is computed by `model.loss`, which never materializes (B, S, V)
+    logits of whole mini-batch.
+
+    When `torch.distributed` process group is initialized, `model` is wrapped
+    by `torch.nn.parallel.DistributedDataParallel` so that gradients are
+    averaged across processes after each backward pass. Each process must
+    iterate through the same number of mini-batches (see
+    `lmp.dataset.DistributedShardSampler`). Only process with rank `0` saves
+    checkpoints and writes logs, and logged loss is averaged across
+    processes.
+
+    When `accumulation_steps > 1`, gradients of `accumulation_steps`
+    consecutive mini-batches are accumulated before each gradient clipping
+    and optimizer step, so effective batch size can grow without holding
+    larger logits in memory. `checkpoint`, `checkpoint_step` and logged steps
+    all count optimizer steps instead of mini-batches. Remaining mini-batches
+    at the end of each epoch form a smaller last accumulation.
+
+    When `precision == 'bf16'`, forward pass and loss are computed under
+    `torch.autocast` with `torch.bfloat16`, so matrix multiplications run in
+    bfloat16 while model parameters, gradients and optimizer states are kept
+    in float32.
+
+    When `num_negative_samples > 0`, loss is computed by `model.sampled_loss`
+    instead, which only scores each target against `num_negative_samples`
+    tokens sampled from `noise_probs`. Thus cost of output layer does not
+    grow with `vocab_size`. Sampled softmax is only used in training;
+    evaluation and generation still use exact full softmax.
+
     Args:
         checkpoint:
             Pre-trained model's checkpoint. Must be bigger than or equal to
             `-1`.
         checkpoint_step:
-            Checkpoint save interval. Must be bigger than or equal to `1`.
+            Checkpoint save interval based on number of optimizer steps. Must
+            be bigger than or equal to `1`.
         data_loader:
-            `torch.utils.data.DataLoader` for sampling.
+            `torch.utils.data.DataLoader` for sampling. When its
+            `batch_sampler` is `lmp.dataset.ResumableBatchSampler`,
+            mini-batches trained before `checkpoint` are skipped without being
+            loaded.
         device:
             Model running device.
         epoch:
@@ -76,6 +174,29 @@ def train_model(
             Language model's optimizer.
         vocab_size:
             Number of classes to predict. Must be bigger than or equal to `1`.
+        prefetch_batches:
+            Number of mini-batches prepared in advance on background thread
+            and moved to `device`. Number of times training blocked waiting
+            on data is logged at the end of each epoch. Set to `0` to disable
+            prefetching. Must be bigger than or equal to `0`.
+        is_main_process:
+            Whether current process save checkpoints and write logs. Set to
+            `False` in all but one process when multiple processes train the
+            same model.
+        accumulation_steps:
+            Number of mini-batches whose gradients are accumulated before each
+            optimizer step. Must be bigger than or equal to `1`.
+        precision:
+            Floating point precision of forward pass. Must be `'fp32'` or
+            `'bf16'`.
+        num_negative_samples:
+            Number of negative samples of sampled softmax. Must be bigger than
+            or equal to `0`. Set to `0` to train with full softmax. Must be
+            `0` when `model` is using adaptive softmax output layer.
+        noise_probs:
+            Probability of sampling each token id as negative sample with
+            shape `(vocab_size)`. Must be given when
+            `num_negative_samples > 0`.
 
     Raises:
         TypeError:
@@ -128,6 +249,26 @@ def train_model(
     if not isinstance(vocab_size, int):
         raise TypeError('`vocab_size` must be an instance of `int`.')
 
+    if not isinstance(prefetch_batches, int):
+        raise TypeError('`prefetch_batches` must be an instance of `int`.')
+
+    if not isinstance(is_main_process, bool):
+        raise TypeError('`is_main_process` must be an instance of `bool`.')
+
+    if not isinstance(accumulation_steps, int):
+        raise TypeError('`accumulation_steps` must be an instance of `int`.')
+
+    if not isinstance(precision, str):
+        raise TypeError('`precision` must be an instance of `str`.')
+
+    if not isinstance(num_negative_samples, int):
+        raise TypeError(
+            '`num_negative_samples` must be an instance of `int`.'
+        )
+
+    if noise_probs is not None and not isinstance(noise_probs, torch.Tensor):
+        raise TypeError('`noise_probs` must be an instance of `Tensor`.')
+
     # Value check.
     if checkpoint < -1:
         raise ValueError('`checkpoint` must be bigger than or equal to `-1`.')
@@ -149,24 +290,98 @@ def train_model(
     if vocab_size < 1:
         raise ValueError('`vocab_size` must be bigger than or equal to `1`.')
 
+    if prefetch_batches < 0:
+        raise ValueError(
+            '`prefetch_batches` must be bigger than or equal to `0`.'
+        )
+
+    if accumulation_steps < 1:
+        raise ValueError(
+            '`accumulation_steps` must be bigger than or equal to `1`.'
+        )
+
+    if precision not in ('bf16', 'fp32'):
+        raise ValueError(
+            f'precision `{precision}` does not support.\n' +
+            'Supported options:' +
+            ''.join(list(map(
+                lambda option: f'\n\t--precision {option}',
+                [
+                    'fp32',
+                    'bf16',
+                ]
+            )))
+        )
+
+    if num_negative_samples < 0:
+        raise ValueError(
+            '`num_negative_samples` must be bigger than or equal to `0`.'
+        )
+
+    if num_negative_samples > 0 and (
+            noise_probs is None or
+            noise_probs.size() != torch.Size([vocab_size])
+    ):
+        raise ValueError(
+            '`noise_probs` must have size `(vocab_size)` when '
+            '`num_negative_samples > 0`.'
+        )
+
+    # Sampled softmax does not support adaptive softmax output layer.
+    if num_negative_samples > 0 and model.adaptive_softmax is not None:
+        raise ValueError(
+            '`num_negative_samples` must be `0` when `model` is using '
+            'adaptive softmax output layer.'
+        )
+
+    # Average gradients across processes when running distributed training.
+    is_distributed = (
+        torch.distributed.is_available() and
+        torch.distributed.is_initialized()
+    )
+    # Compute loss by `model.loss` so that full vocabulary logits are never
+    # materialized, or by `model.sampled_loss` which only score sampled
+    # tokens.
+    if noise_probs is not None:
+        noise_probs = noise_probs.to(device)
+    loss_model = _ModelLoss(
+        model=model,
+        num_negative_samples=num_negative_samples,
+        noise_probs=noise_probs
+    )
+    if is_distributed:
+        # Only process with rank 0 save checkpoints and write logs.
+        is_main_process = (
+            is_main_process and
+            torch.distributed.get_rank() == 0
+        )
+        # Tail clusters of adaptive softmax get no gradient in mini-batches
+        # without their tokens as targets, so unused parameters must be
+        # detected in every iteration.
+        ddp_model = torch.nn.parallel.DistributedDataParallel(
+            loss_model,
+            find_unused_parameters=model.adaptive_softmax is not None
+        )
+    else:
+        ddp_model = loss_model
+
     # Set experiment output folder.
     file_dir = os.path.join(lmp.path.DATA_PATH, experiment)
     log_dir = os.path.join(lmp.path.DATA_PATH, 'log', experiment)
 
-    if not os.path.exists(file_dir):
-        os.makedirs(file_dir)
+    if is_main_process:
+        if not os.path.exists(file_dir):
+            os.makedirs(file_dir)
 
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
 
-    # Set experiment log folder.
-    writer = torch.utils.tensorboard.SummaryWriter(log_dir)
-
-    # Define objective function.
-    criterion = torch.nn.CrossEntropyLoss()
+        # Set experiment log folder.
+        writer = torch.utils.tensorboard.SummaryWriter(log_dir)
 
     # Step = number of updates.
-    # Every update must increment `step`.
+    # Every update must increment `step`. With gradient accumulation, each
+    # update consumes up to `accumulation_steps` mini-batches.
     step = 0
 
     # Set model to train mode.
@@ -178,48 +393,116 @@ def train_model(
     # Initialize total loss.
     total_loss = 0.0
 
+    # Continue training from previous checkpoint step. Updates before
+    # `checkpoint` are skipped.
+    num_skip_updates = max(0, checkpoint - 1)
+
+    # Skip mini-batches in index space when sampling with
+    # `lmp.dataset.ResumableBatchSampler`, so that they are never loaded.
+    batch_sampler = data_loader.batch_sampler
+    if not isinstance(batch_sampler, lmp.dataset.ResumableBatchSampler):
+        batch_sampler = None
+
+    # Prepare next mini-batches on background thread.
+    if prefetch_batches > 0:
+        data_loader = BatchPrefetcher(
+            data_loader=data_loader,
+            device=device,
+            num_batches=prefetch_batches
+        )
+
     for cur_epoch in range(epoch):
 
+        # Number of mini-batches in current epoch. Used to find the last
+        # (possibly smaller) accumulation of each epoch.
+        num_batches = len(data_loader)
+
+        # Skip updates of current epoch which are trained before checkpoint.
+        # Each skipped update consumes `accumulation_steps` mini-batches,
+        # except the last (possibly smaller) accumulation of epoch.
+        epoch_skip_updates = min(
+            num_skip_updates,
+            math.ceil(num_batches / accumulation_steps)
+        )
+        num_skip_updates -= epoch_skip_updates
+        step += epoch_skip_updates
+        num_skip_batches = min(
+            num_batches,
+            epoch_skip_updates * accumulation_steps
+        )
+
+        if batch_sampler is not None:
+            batch_sampler.skip(num_skip_batches)
+            start_batch_idx = num_skip_batches
+        else:
+            start_batch_idx = 0
+
         epoch_iterator = tqdm(
             data_loader,
-            desc=f'epoch: {cur_epoch}, loss: {0:.6f}'
+            desc=f'epoch: {cur_epoch}, loss: {0:.6f}',
+            disable=not is_main_process,
+            initial=start_batch_idx,
+            total=num_batches
         )
 
-        for x, y in epoch_iterator:
-            # Increment step for each update.
-            step += 1
-
-            # Continue training from previous checkpoint step.
-            if step < checkpoint:
+        for batch_idx, (x, y) in enumerate(epoch_iterator, start_batch_idx):
+            # Data loader without `lmp.dataset.ResumableBatchSampler` still
+            # yield skipped mini-batches.
+            if batch_idx < num_skip_batches:
                 continue
 
-            # Put tensors on to specified device (CPU or GPU). Reshape `y` into
-            # shape (B x S) for cross-entropy.
-            # x.size = (B, S)
-            # y.size = (B x S)
-            x = x.to(device)
-            y = y.reshape(-1).to(device)
-
-            # Forward pass.
-            # pred_y_logits.size = (B, S, V)
-            pred_y_logits = model(x)
-
-            # Reshape `pred_y_logits` into shape (B x S, V) for cross-entropy.
-            pred_y_logits = pred_y_logits.reshape(-1, vocab_size)
+            # Number of mini-batches accumulated into current update.
+            accumulation_start = batch_idx - batch_idx % accumulation_steps
+            num_accumulated = min(
+                accumulation_steps,
+                num_batches - accumulation_start
+            )
 
-            # Perform cross-entropy.
-            loss = criterion(pred_y_logits, y)
+            # Perform update after last mini-batch of each accumulation.
+            is_update = (
+                batch_idx + 1 == accumulation_start + num_accumulated
+            )
 
-            # Calculate total loss.
-            total_loss += loss.item()
+            # Put tensors on to specified device (CPU or GPU).
+            # x.size = (B, S)
+            # y.size = (B, S)
+            x = x.to(device)
+            y = y.to(device)
+
+            # Only synchronize gradients across processes on updates.
+            if is_distributed and not is_update:
+                sync_context = ddp_model.no_sync()
+            else:
+                sync_context = contextlib.nullcontext()
+
+            with sync_context:
+                # Run forward pass in lower precision when requested.
+                with torch.autocast(
+                        device_type=device.type,
+                        dtype=torch.bfloat16,
+                        enabled=precision == 'bf16'
+                ):
+                    # Forward pass and cross-entropy.
+                    loss = ddp_model(x, y)
+
+                # Backward pass. Scale loss so that accumulated gradients are
+                # averaged over mini-batches.
+                (loss / num_accumulated).backward()
+
+            # Calculate total loss. Each update contributes its average
+            # mini-batch loss.
+            total_loss += loss.item() / num_accumulated
 
             # Log loss.
             epoch_iterator.set_description(
                 f'epoch: {cur_epoch}, loss: {loss.item():.6f}'
             )
 
-            # Backward pass.
-            loss.backward()
+            if not is_update:
+                continue
+
+            # Increment step for each update.
+            step += 1
 
             # Perform gradient clipping to avoid gradient explosion.
             torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm)
@@ -232,26 +515,164 @@ def train_model(
 
             # Save checkpoint for each `checkpoint_step`.
             if step % checkpoint_step == 0:
-                torch.save(
-                    model.state_dict(),
-                    os.path.join(file_dir, f'model-{step}.pt')
-                )
-                torch.save(
-                    optimizer.state_dict(),
-                    os.path.join(file_dir, f'optimizer-{step}.pt')
-                )
-                # Log average loss.
-                writer.add_scalar('loss', total_loss / checkpoint_step, step)
+                # Average loss across processes.
+                if is_distributed:
+                    loss_tensor = torch.tensor([total_loss])
+                    torch.distributed.all_reduce(loss_tensor)
+                    total_loss = (
+                        loss_tensor.item() / torch.distributed.get_world_size()
+                    )
+
+                if is_main_process:
+                    torch.save(
+                        model.state_dict(),
+                        os.path.join(file_dir, f'model-{step}.pt')
+                    )
+                    torch.save(
+                        optimizer.state_dict(),
+                        os.path.join(file_dir, f'optimizer-{step}.pt')
+                    )
+                    # Log average loss.
+                    writer.add_scalar(
+                        'loss',
+                        total_loss / checkpoint_step,
+                        step
+                    )
                 total_loss = 0.0
 
+        # Log how often training blocked waiting on data.
+        if prefetch_batches > 0 and is_main_process:
+            writer.add_scalar('data_wait_count', data_loader.num_waits, step)
+            writer.add_scalar('data_wait_time', data_loader.wait_time, step)
+
     # Save last checkpoint.
-    torch.save(
-        model.state_dict(),
-        os.path.join(file_dir, f'model-{step}.pt')
+    if is_main_process:
+        torch.save(
+            model.state_dict(),
+            os.path.join(file_dir, f'model-{step}.pt')
+        )
+        torch.save(
+            optimizer.state_dict(),
+            os.path.join(file_dir, f'optimizer-{step}.pt')
+        )
+
+
+def _create_data_loader(
+        config: lmp.config.BaseConfig,
+        dataset: lmp.dataset.LanguageModelDataset,
+        num_replicas: int,
+        rank: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> torch.utils.data.DataLoader:
+    r"""Create `torch.utils.data.DataLoader` sampling from shard of dataset.
+
+    Args:
+        config:
+            Same as `train_model_by_config`.
+        dataset:
+            Source of text samples to train on.
+        num_replicas:
+            Number of processes participating in training.
+        rank:
+            Rank of current process.
+        tokenizer:
+            Tokenizer used to encode mini-batches.
+
+    Returns:
+        `torch.utils.data.DataLoader` sampling from shard `rank` of
+        `dataset`.
+    """
+    # Sample mini-batches by token budget.
+    if config.max_tokens != -1:
+        # Create collate_fn for sampling. Pad each mini-batch only to its
+        # longest sequence to fit in token budget.
+        collate_fn = lmp.dataset.LanguageModelDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=config.max_seq_len,
+            pad_to_longest=True
+        )
+
+        batch_sampler = lmp.dataset.TokenBudgetBatchSampler(
+            dataset=dataset,
+            max_seq_len=config.max_seq_len,
+            max_tokens=config.max_tokens,
+            seed=config.seed,
+            tokenizer=tokenizer,
+            num_replicas=num_replicas,
+            rank=rank
+        )
+
+    # Sample mini-batches by fixed batch size.
+    else:
+        # Create collate_fn for sampling.
+        collate_fn = lmp.dataset.LanguageModelDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=config.max_seq_len
+        )
+
+        # Each process sample from its own shard.
+        if num_replicas > 1:
+            sampler = lmp.dataset.DistributedShardSampler(
+                dataset=dataset,
+                num_replicas=num_replicas,
+                rank=rank,
+                seed=config.seed
+            )
+        else:
+            sampler = torch.utils.data.RandomSampler(dataset)
+
+        batch_sampler = torch.utils.data.BatchSampler(
+            sampler,
+            batch_size=config.batch_size,
+            drop_last=False
+        )
+
+    # Tokenize mini-batches in data loading subprocesses. `torch` only accept
+    # `persistent_workers` and `prefetch_factor` when `num_workers > 0`.
+    worker_kwargs = {}
+    if config.num_workers > 0:
+        worker_kwargs = {
+            'persistent_workers': config.persistent_workers,
+            'prefetch_factor': config.prefetch_factor,
+            'worker_init_fn': seed_worker,
+        }
+
+    # `torch` utility for sampling.
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        # Mini-batches trained before checkpoint can be skipped without being
+        # loaded.
+        batch_sampler=lmp.dataset.ResumableBatchSampler(batch_sampler),
+        collate_fn=collate_fn,
+        num_workers=config.num_workers,
+        pin_memory=config.pin_memory,
+        **worker_kwargs
     )
-    torch.save(
-        optimizer.state_dict(),
-        os.path.join(file_dir, f'optimizer-{step}.pt')
+
+    return data_loader
+
+
+def _create_noise_probs(
+        config: lmp.config.BaseConfig,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> Optional[torch.Tensor]:
+    r"""Create negative sampling distribution of sampled softmax.
+
+    Args:
+        config:
+            Same as `train_model_by_config`.
+        tokenizer:
+            Tokenizer with token frequencies counted by `build_vocab`.
+
+    Returns:
+        Unigram distribution of token ids smoothed by `config.unigram_alpha`
+        when `config.num_negative_samples > 0`, `None` otherwise.
+    """
+    if config.num_negative_samples == 0:
+        return None
+
+    return torch.tensor(
+        tokenizer.unigram_distribution(alpha=config.unigram_alpha)
     )
 
 
@@ -267,14 +688,21 @@ def train_model_by_config(
 
     Continue training from pre-trained checkpoint when `checkpoint != -1`.
 
+    When `torch.distributed` process group is initialized, `dataset` is
+    sharded across processes (see `lmp.dataset.DistributedShardSampler`), so
+    each process only train on its own disjoint shard in each epoch.
+
     Args:
         checkpoint:
             Pre-trained model's checkpoint. Must be bigger than or equal to
             `-1`.
         config:
-            Configuration object with attributes `batch_size`,
-            `checkpoint_step`, `device`, `epoch`, `experiment`, `max_norm` and
-            `max_seq_len`.
+            Configuration object with attributes `accumulation_steps`,
+            `batch_size`, `checkpoint_step`, `device`, `epoch`, `experiment`,
+            `max_norm`, `max_seq_len`, `max_tokens`, `num_negative_samples`,
+            `num_workers`, `persistent_workers`, `pin_memory`,
+            `prefetch_batches`, `prefetch_factor`, `precision`, `seed` and
+            `unigram_alpha`.
         dataset:
             Source of text samples to train on.
         model:
@@ -282,7 +710,7 @@ def train_model_by_config(
         optimizer:
             Language model's optimizer.
         tokenizer:
-            Tokenizer object with attribute `vocab_size`.
+            Tokenizer object with attributes `token_freq` and `vocab_size`.
 
     Raises:
         TypeError:
@@ -307,29 +735,189 @@ def train_model_by_config(
             '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
         )
 
-    # Create collate_fn for sampling.
-    collate_fn = lmp.dataset.LanguageModelDataset.create_collate_fn(
-        tokenizer=tokenizer,
-        max_seq_len=config.max_seq_len
+    # Shard dataset across processes when running distributed training.
+    if torch.distributed.is_available() and torch.distributed.is_initialized():
+        num_replicas = torch.distributed.get_world_size()
+        rank = torch.distributed.get_rank()
+    else:
+        num_replicas = 1
+        rank = 0
+
+    data_loader = _create_data_loader(
+        config=config,
+        dataset=dataset,
+        num_replicas=num_replicas,
+        rank=rank,
+        tokenizer=tokenizer
     )
 
-    # `torch` utility for sampling.
-    data_loader = torch.utils.data.DataLoader(
-        dataset,
-        batch_size=config.batch_size,
-        shuffle=True,
-        collate_fn=collate_fn
+    train_model(
+        checkpoint=checkpoint,
+        checkpoint_step=config.checkpoint_step,
+        data_loader=data_loader,
+        device=config.device,
+        epoch=config.epoch,
+        experiment=config.experiment,
+        max_norm=config.max_norm,
+        model=model,
+        optimizer=optimizer,
+        vocab_size=tokenizer.vocab_size,
+        prefetch_batches=config.prefetch_batches,
+        accumulation_steps=config.accumulation_steps,
+        precision=config.precision,
+        num_negative_samples=config.num_negative_samples,
+        noise_probs=_create_noise_probs(config=config, tokenizer=tokenizer)
+    )
+
+
+def _train_model_hogwild_worker(
+        rank: int,
+        checkpoint: int,
+        config: lmp.config.BaseConfig,
+        dataset: lmp.dataset.LanguageModelDataset,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_processes: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> None:
+    r"""Train shared `model` on shard `rank` of `dataset`.
+
+    Entry point of each process spawned by `train_model_hogwild_by_config`.
+    See `train_model_hogwild_by_config` for arguments.
+    """
+    # Split CPU cores evenly so that processes do not oversubscribe.
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // num_processes))
+
+    # Different processes must use different dropout masks.
+    torch.manual_seed(config.seed + rank)
+
+    # Each process own its optimizer state while sharing model parameters.
+    optimizer = load_optimizer_by_config(
+        checkpoint=checkpoint,
+        config=config,
+        model=model
+    )
+
+    data_loader = _create_data_loader(
+        config=config,
+        dataset=dataset,
+        num_replicas=num_processes,
+        rank=rank,
+        tokenizer=tokenizer
     )
 
     train_model(
         checkpoint=checkpoint,
         checkpoint_step=config.checkpoint_step,
         data_loader=data_loader,
-        device=config.device,
+        device=torch.device('cpu'),
         epoch=config.epoch,
         experiment=config.experiment,
         max_norm=config.max_norm,
         model=model,
         optimizer=optimizer,
-        vocab_size=tokenizer.vocab_size
+        vocab_size=tokenizer.vocab_size,
+        prefetch_batches=config.prefetch_batches,
+        is_main_process=rank == 0,
+        accumulation_steps=config.accumulation_steps,
+        precision=config.precision,
+        num_negative_samples=config.num_negative_samples,
+        noise_probs=_create_noise_probs(config=config, tokenizer=tokenizer)
+    )
+
+
+def train_model_hogwild_by_config(
+        checkpoint: int,
+        config: lmp.config.BaseConfig,
+        dataset: lmp.dataset.LanguageModelDataset,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_processes: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> None:
+    r"""Helper function for training language model with Hogwild.
+
+    Continue training from pre-trained checkpoint when `checkpoint != -1`.
+
+    `model` parameters are moved into shared memory and `num_processes`
+    processes are spawned. Each process train on its own disjoint shard of
+    `dataset` (see `lmp.dataset.DistributedShardSampler`) with its own
+    optimizer, and update shared parameters without any locking or gradient
+    synchronization. Only process with rank `0` save checkpoints and write
+    logs, thus checkpoints are counted by steps of process `0`.
+
+    Hogwild only support training on CPU, so `config.device` is ignored.
+
+    Args:
+        checkpoint:
+            Pre-trained model's checkpoint. Must be bigger than or equal to
+            `-1`.
+        config:
+            Same as `train_model_by_config`. Must also have attributes
+            `learning_rate` and `optimizer_class`.
+        dataset:
+            Source of text samples to train on.
+        model:
+            Language model on CPU.
+        num_processes:
+            Number of training processes. Must be bigger than or equal to
+            `1`.
+        tokenizer:
+            Tokenizer object with attributes `token_freq` and `vocab_size`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+    # Type check.
+    if not isinstance(checkpoint, int):
+        raise TypeError('`checkpoint` must be an instance of `int`.')
+
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    if not isinstance(dataset, lmp.dataset.LanguageModelDataset):
+        raise TypeError(
+            '`dataset` must be an instance of '
+            '`lmp.dataset.LanguageModelDataset`.'
+        )
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(num_processes, int):
+        raise TypeError('`num_processes` must be an instance of `int`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    # Value check.
+    if checkpoint < -1:
+        raise ValueError('`checkpoint` must be bigger than or equal to `-1`.')
+
+    if num_processes < 1:
+        raise ValueError(
+            '`num_processes` must be bigger than or equal to `1`.'
+        )
+
+    # Share parameters between processes.
+    model = model.to(torch.device('cpu'))
+    model.share_memory()
+
+    torch.multiprocessing.spawn(
+        _train_model_hogwild_worker,
+        args=(checkpoint, config, dataset, model, num_processes, tokenizer),
+        nprocs=num_processes
     )
@@ -1,5 +1,10 @@
 r"""Giving a text to generate rest sequence.
 
+Giving `--input_file` instead of `--begin_of_sequence` generates sequences
+for every line in the file in batches, so model is loaded only once. Sequences
+are generated by beam search, or by sampling when `--num_samples` is given.
+Giving `--stream` prints single sampled sequence token by token.
+
 Usage:
     python run_generate.py ...
 
@@ -14,6 +19,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import argparse
+import json
 
 # self-made modules
 
@@ -24,10 +30,18 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
 
     # Required arguments.
-    parser.add_argument(
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument(
         '--begin_of_sequence',
         help='Begining of sequence which model will auto-complete.',
-        required=True,
+        type=str
+    )
+    input_group.add_argument(
+        '--input_file',
+        help=(
+            'Text file with one begining of sequence per line. '
+            'Generate sequences for every line in batches.'
+        ),
         type=str
     )
     parser.add_argument(
@@ -44,6 +58,12 @@ if __name__ == '__main__':
     )
 
     # Optional arguments.
+    parser.add_argument(
+        '--batch_size',
+        default=32,
+        help='Number of begining of sequences generated together.',
+        type=int
+    )
     parser.add_argument(
         '--beam_width',
         default=4,
@@ -56,9 +76,64 @@ if __name__ == '__main__':
         help='Text sample max length.',
         type=int
     )
+    parser.add_argument(
+        '--num_samples',
+        default=0,
+        help=(
+            'Sample `num_samples` sequences for each begining of sequence '
+            'instead of using beam search.'
+        ),
+        type=int
+    )
+    parser.add_argument(
+        '--output_file',
+        help=(
+            'Write generated sequences of each line in `--input_file` as '
+            'JSON array in each line of this file. Print to standard output '
+            'if not given.'
+        ),
+        type=str
+    )
+    parser.add_argument(
+        '--seed',
+        help='Random seed of sampling.',
+        type=int
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help=(
+            'Sample single sequence of `--begin_of_sequence` and print it '
+            'token by token.'
+        )
+    )
+    parser.add_argument(
+        '--temperature',
+        default=1.0,
+        help='Sampling temperature.',
+        type=float
+    )
+    parser.add_argument(
+        '--top_k',
+        default=0,
+        help='Only sample from `top_k` most likely tokens. Disabled when `0`.',
+        type=int
+    )
+    parser.add_argument(
+        '--top_p',
+        default=1.0,
+        help=(
+            'Only sample from most likely tokens with total probability '
+            '`top_p`. Disabled when `1.0`.'
+        ),
+        type=float
+    )
 
     args = parser.parse_args()
 
+    if args.stream and args.input_file is not None:
+        parser.error('argument --stream: not allowed with argument --input_file')
+
     # Load pre-trained hyperparameters.
     config = lmp.config.BaseConfig.load(experiment=args.experiment)
 
@@ -75,16 +150,74 @@ if __name__ == '__main__':
         tokenizer=tokenizer
     )
 
-    # Sequences generation.
-    generated_sequences = lmp.util.generate_sequence_by_config(
-        beam_width=args.beam_width,
-        begin_of_sequence=args.begin_of_sequence,
-        config=config,
-        max_seq_len=args.max_seq_len,
-        model=model,
-        tokenizer=tokenizer
-    )
-
-    # Output generated sequences.
-    for sequence in generated_sequences:
-        print(sequence)
+    # Print sampled sequence token by token.
+    if args.stream:
+        for text in lmp.util.stream_sequence_by_config(
+                begin_of_sequence=args.begin_of_sequence,
+                config=config,
+                max_seq_len=args.max_seq_len,
+                model=model,
+                tokenizer=tokenizer,
+                seed=args.seed,
+                temperature=args.temperature,
+                top_k=args.top_k,
+                top_p=args.top_p
+        ):
+            print(text, end='', flush=True)
+        print()
+    else:
+        # Read begining of sequences.
+        if args.input_file is None:
+            prompts = [args.begin_of_sequence]
+        else:
+            with open(args.input_file, 'r', encoding='utf-8') as input_file:
+                prompts = [line.rstrip('\n') for line in input_file]
+
+        # Sequences generation by sampling.
+        if args.num_samples > 0:
+            generated_sequences = lmp.util.sample_batch_by_config(
+                batch_size=args.batch_size,
+                config=config,
+                max_seq_len=args.max_seq_len,
+                model=model,
+                num_samples=args.num_samples,
+                prompts=prompts,
+                tokenizer=tokenizer,
+                seed=args.seed,
+                temperature=args.temperature,
+                top_k=args.top_k,
+                top_p=args.top_p
+            )
+        # Sequences generation by beam search.
+        else:
+            generated_sequences = lmp.util.generate_batch_by_config(
+                batch_size=args.batch_size,
+                beam_width=args.beam_width,
+                config=config,
+                max_seq_len=args.max_seq_len,
+                model=model,
+                prompts=prompts,
+                tokenizer=tokenizer
+            )
+
+        # Output generated sequences of single begining of sequence.
+        if args.input_file is None:
+            for sequence in generated_sequences[0]:
+                print(sequence)
+        # Output generated sequences of every line in `--input_file`.
+        else:
+            lines = [
+                json.dumps(sequences, ensure_ascii=False)
+                for sequences in generated_sequences
+            ]
+            if args.output_file is None:
+                for line in lines:
+                    print(line)
+            else:
+                with open(
+                        args.output_file,
+                        'w',
+                        encoding='utf-8'
+                ) as output_file:
+                    for line in lines:
+                        output_file.write(f'{line}\n')
@@ -0,0 +1,204 @@
+r"""Serve sequences generation requests with pre-trained model.
+
+Experiment is loaded only once, then concurrent requests are generated
+together in batches. Sequences are generated by beam search, or by sampling
+when `--num_samples` is given.
+
+Usage:
+    python run_generate_server.py ...
+
+    curl -d '{"begin_of_sequence": "..."}' http://localhost:8000/generate
+
+Run 'python run_generate_server.py --help' for help.
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import asyncio
+import functools
+
+# self-made modules
+
+import lmp
+
+if __name__ == '__main__':
+    # Parse argument from standard input.
+    parser = argparse.ArgumentParser()
+
+    # Required arguments.
+    parser.add_argument(
+        '--checkpoint',
+        help='Load specific checkpoint.',
+        required=True,
+        type=int
+    )
+    parser.add_argument(
+        '--experiment',
+        help='Current experiment name.',
+        required=True,
+        type=str,
+    )
+
+    # Optional arguments.
+    parser.add_argument(
+        '--beam_width',
+        default=4,
+        help='using for generating `beam_width` sentences',
+        type=int
+    )
+    parser.add_argument(
+        '--host',
+        default='localhost',
+        help='Host name or address to listen on.',
+        type=str
+    )
+    parser.add_argument(
+        '--max_batch_size',
+        default=32,
+        help='Maximum number of requests generated together.',
+        type=int
+    )
+    parser.add_argument(
+        '--max_seq_len',
+        default=64,
+        help='Text sample max length.',
+        type=int
+    )
+    parser.add_argument(
+        '--max_wait',
+        default=0.005,
+        help=(
+            'Maximum seconds to wait for more requests before generating '
+            'a batch.'
+        ),
+        type=float
+    )
+    parser.add_argument(
+        '--num_samples',
+        default=0,
+        help=(
+            'Sample `num_samples` sequences for each request instead of '
+            'using beam search.'
+        ),
+        type=int
+    )
+    parser.add_argument(
+        '--port',
+        default=8000,
+        help='Port to listen on.',
+        type=int
+    )
+    parser.add_argument(
+        '--prefix_cache_block_size',
+        default=32,
+        help='Cache recurrent states at every this many prefix tokens.',
+        type=int
+    )
+    parser.add_argument(
+        '--prefix_cache_size',
+        default=0,
+        help=(
+            'Megabytes of recurrent states cached for common prefixes of '
+            'requests. Disabled when `0`.'
+        ),
+        type=int
+    )
+    parser.add_argument(
+        '--temperature',
+        default=1.0,
+        help='Sampling temperature.',
+        type=float
+    )
+    parser.add_argument(
+        '--top_k',
+        default=0,
+        help='Only sample from `top_k` most likely tokens. Disabled when `0`.',
+        type=int
+    )
+    parser.add_argument(
+        '--top_p',
+        default=1.0,
+        help=(
+            'Only sample from most likely tokens with total probability '
+            '`top_p`. Disabled when `1.0`.'
+        ),
+        type=float
+    )
+    parser.add_argument(
+        '--unix_socket',
+        help='Listen on this Unix domain socket path instead of TCP port.',
+        type=str
+    )
+
+    args = parser.parse_args()
+
+    # Load pre-trained hyperparameters.
+    config = lmp.config.BaseConfig.load(experiment=args.experiment)
+
+    # Load pre-trained tokenizer.
+    tokenizer = lmp.util.load_tokenizer_by_config(
+        checkpoint=args.checkpoint,
+        config=config
+    )
+
+    # Load pre-trained model.
+    model = lmp.util.load_model_by_config(
+        checkpoint=args.checkpoint,
+        config=config,
+        tokenizer=tokenizer
+    )
+
+    # Share recurrent states of common prefixes among requests.
+    prefix_cache = None
+    if args.prefix_cache_size > 0:
+        prefix_cache = lmp.util.PrefixStateCache(
+            block_size=args.prefix_cache_block_size,
+            max_bytes=args.prefix_cache_size * 2 ** 20
+        )
+
+    # Sequences generation by sampling.
+    if args.num_samples > 0:
+        generate_fn = functools.partial(
+            lmp.util.sample_batch_by_config,
+            batch_size=args.max_batch_size,
+            config=config,
+            max_seq_len=args.max_seq_len,
+            model=model,
+            num_samples=args.num_samples,
+            tokenizer=tokenizer,
+            prefix_cache=prefix_cache,
+            temperature=args.temperature,
+            top_k=args.top_k,
+            top_p=args.top_p
+        )
+    # Sequences generation by beam search.
+    else:
+        generate_fn = functools.partial(
+            lmp.util.generate_batch_by_config,
+            batch_size=args.max_batch_size,
+            beam_width=args.beam_width,
+            config=config,
+            max_seq_len=args.max_seq_len,
+            model=model,
+            tokenizer=tokenizer,
+            prefix_cache=prefix_cache
+        )
+
+    server = lmp.util.GenerationServer(
+        generate_fn=lambda prompts: generate_fn(prompts=prompts),
+        max_batch_size=args.max_batch_size,
+        max_wait=args.max_wait
+    )
+
+    print(f'Serving experiment {args.experiment} checkpoint {args.checkpoint}')
+    asyncio.run(server.serve(
+        host=args.host,
+        path=args.unix_socket,
+        port=args.port
+    ))
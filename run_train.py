@@ -14,12 +14,149 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import argparse
+import os
+import tempfile
 import time
 
+# 3rd-party modules
+
+import torch
+import torch.distributed
+import torch.multiprocessing
+
 # self-made modules
 
 import lmp
 
+
+def main(
+        rank: int,
+        args: argparse.Namespace,
+        init_method: str
+) -> None:
+    r"""Train language model in one process.
+
+    When `args.nproc > 1`, this function is run by `args.nproc` processes
+    and each process join the same `torch.distributed` process group with
+    `gloo` backend. Each process train on its own shard of dataset, and
+    gradients are averaged across processes. Only process with rank `0` save
+    configuration, tokenizer, checkpoints and logs.
+
+    When `args.hogwild` is set, this function is run by single process which
+    spawn `args.nproc` Hogwild training processes sharing one model instead
+    (see `lmp.util.train_model_hogwild_by_config`).
+
+    Args:
+        rank:
+            Rank of current process.
+        args:
+            Parsed command line arguments.
+        init_method:
+            URL used by processes to find each other.
+    """
+    is_main_process = rank == 0
+    is_distributed = args.nproc > 1 and not args.hogwild
+
+    if is_distributed:
+        torch.distributed.init_process_group(
+            backend='gloo',
+            init_method=init_method,
+            rank=rank,
+            world_size=args.nproc
+        )
+
+        # Split CPU cores evenly across processes.
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // args.nproc))
+
+    # Hyperparameters setup.
+    config = lmp.util.load_config(args)
+
+    # Wait until every process loaded configuration before overwriting it.
+    if is_distributed:
+        torch.distributed.barrier()
+
+    if is_main_process:
+        config.save()
+
+    # Initialize random seed. Every process must use the same seed so that
+    # dataset shards are disjoint and model parameters start the same.
+    lmp.util.set_seed_by_config(
+        config=config
+    )
+
+    # Load data. With file-backed dataset, only main process normalize
+    # samples into cached file while other processes wait and then read the
+    # cached file, so that samples are normalized once instead of once per
+    # process.
+    is_cache_shared = is_distributed and config.is_file_backed
+
+    if is_cache_shared and not is_main_process:
+        torch.distributed.barrier()
+
+    dataset = lmp.util.load_dataset_by_config(
+        config=config
+    )
+
+    if is_cache_shared and is_main_process:
+        torch.distributed.barrier()
+
+    # Load tokenizer.
+    tokenizer = lmp.util.load_tokenizer_by_config(
+        checkpoint=args.checkpoint,
+        config=config
+    )
+
+    # Train tokenizer from scratch if necessary. Training tokenizer is
+    # deterministic, thus every process get the same vocabulary.
+    if args.checkpoint == -1:
+        lmp.util.train_tokenizer_by_config(
+            config=config,
+            dataset=dataset,
+            tokenizer=tokenizer
+        )
+        if is_main_process:
+            tokenizer.save(experiment=config.experiment)
+
+    # Load model.
+    model = lmp.util.load_model_by_config(
+        checkpoint=args.checkpoint,
+        config=config,
+        tokenizer=tokenizer
+    )
+
+    # Train model with Hogwild. Each training process load its own optimizer.
+    if args.hogwild:
+        lmp.util.train_model_hogwild_by_config(
+            checkpoint=args.checkpoint,
+            config=config,
+            dataset=dataset,
+            model=model,
+            num_processes=args.nproc,
+            tokenizer=tokenizer
+        )
+        return
+
+    # Load optimizer
+    optimizer = lmp.util.load_optimizer_by_config(
+        checkpoint=args.checkpoint,
+        config=config,
+        model=model
+    )
+
+    # Train model.
+    lmp.util.train_model_by_config(
+        checkpoint=args.checkpoint,
+        config=config,
+        dataset=dataset,
+        model=model,
+        optimizer=optimizer,
+        tokenizer=tokenizer
+    )
+
+    if is_distributed:
+        torch.distributed.destroy_process_group()
+
+
 if __name__ == '__main__':
     # Record total execution time.
     start_time = time.time()
@@ -36,6 +173,22 @@ if __name__ == '__main__':
     )
 
     # Optional arguments.
+    parser.add_argument(
+        '--accumulation_steps',
+        default=1,
+        help='Number of mini-batches accumulated before each optimizer step.',
+        type=int
+    )
+    parser.add_argument(
+        '--adaptive_softmax_cutoffs',
+        default=[],
+        help=(
+            'Cutoffs of adaptive softmax output layer. '
+            'Use full softmax when not given.'
+        ),
+        nargs='*',
+        type=int
+    )
     parser.add_argument(
         '--batch_size',
         default=32,
@@ -84,6 +237,30 @@ if __name__ == '__main__':
         help='Number of training epochs.',
         type=int
     )
+    parser.add_argument(
+        '--hogwild',
+        action='store_true',
+        help=(
+            'Whether `--nproc` processes share one model and update it '
+            'asynchronously instead of averaging gradients.'
+        )
+    )
+    parser.add_argument(
+        '--is_compact',
+        action='store_true',
+        help=(
+            'Whether to store dataset samples in one contiguous buffer to '
+            'reduce memory usage.'
+        )
+    )
+    parser.add_argument(
+        '--is_file_backed',
+        action='store_true',
+        help=(
+            'Whether to cache normalized dataset samples in a file and read '
+            'them on demand instead of holding them in memory.'
+        )
+    )
     parser.add_argument(
         '--is_uncased',
         action='store_true',
@@ -107,6 +284,15 @@ if __name__ == '__main__':
         help='Text sample max length.',
         type=int
     )
+    parser.add_argument(
+        '--max_tokens',
+        default=-1,
+        help=(
+            'Maximum number of tokens in each mini-batch. '
+            'Use `-1` to batch by `--batch_size` instead.'
+        ),
+        type=int
+    )
     parser.add_argument(
         '--min_count',
         default=1,
@@ -119,24 +305,92 @@ if __name__ == '__main__':
         help="Language model's class.",
         type=str
     )
+    parser.add_argument(
+        '--nproc',
+        default=1,
+        help='Number of data parallel training processes.',
+        type=int
+    )
     parser.add_argument(
         '--num_linear_layers',
         default=2,
         help='Number of Linear layers.',
         type=int
     )
+    parser.add_argument(
+        '--num_negative_samples',
+        default=0,
+        help=(
+            'Number of negative samples of sampled softmax. '
+            'Use full softmax when set to 0.'
+        ),
+        type=int
+    )
+    parser.add_argument(
+        '--num_preprocess_workers',
+        default=0,
+        help=(
+            'Number of subprocesses used to normalize dataset samples. '
+            'Use `0` to normalize samples in the main process.'
+        ),
+        type=int
+    )
     parser.add_argument(
         '--num_rnn_layers',
         default=1,
         help='Number of rnn layers.',
         type=int
     )
+    parser.add_argument(
+        '--num_workers',
+        default=0,
+        help=(
+            'Number of subprocesses used for data loading. '
+            'Use `0` to load data in the main process.'
+        ),
+        type=int
+    )
     parser.add_argument(
         '--optimizer_class',
         default='adam',
         help="Optimizer's class.",
         type=str
     )
+    parser.add_argument(
+        '--persistent_workers',
+        action='store_true',
+        help='Whether to keep data loading subprocesses alive between epochs.'
+    )
+    parser.add_argument(
+        '--pin_memory',
+        action='store_true',
+        help='Whether to copy mini-batches into page-locked memory.'
+    )
+    parser.add_argument(
+        '--prefetch_batches',
+        default=0,
+        help=(
+            'Number of mini-batches prepared in advance on background thread. '
+            'Use `0` to disable prefetching.'
+        ),
+        type=int
+    )
+    parser.add_argument(
+        '--prefetch_factor',
+        default=2,
+        help='Number of mini-batches loaded in advance by each subprocess.',
+        type=int
+    )
+    parser.add_argument(
+        '--precision',
+        choices=['fp32', 'bf16'],
+        default='fp32',
+        help=(
+            'Floating point precision of forward pass. '
+            'Use `bf16` to run forward pass with `torch.bfloat16` autocast.'
+        ),
+        type=str
+    )
     parser.add_argument(
         '--seed',
         default=7,
@@ -149,64 +403,31 @@ if __name__ == '__main__':
         help="Tokenizer's class.",
         type=str
     )
-
-    args = parser.parse_args()
-
-    # Hyperparameters setup.
-    config = lmp.util.load_config(args)
-    config.save()
-
-    # Get model running device.
-    device = config.device
-
-    # Initialize random seed.
-    lmp.util.set_seed_by_config(
-        config=config
-    )
-
-    # Load data.
-    dataset = lmp.util.load_dataset_by_config(
-        config=config
-    )
-
-    # Load tokenizer.
-    tokenizer = lmp.util.load_tokenizer_by_config(
-        checkpoint=args.checkpoint,
-        config=config
+    parser.add_argument(
+        '--unigram_alpha',
+        default=0.75,
+        help='Smoothing power of negative sampling unigram distribution.',
+        type=float
     )
 
-    # Train tokenizer from scratch if necessary.
-    if args.checkpoint == -1:
-        lmp.util.train_tokenizer_by_config(
-            config=config,
-            dataset=dataset,
-            tokenizer=tokenizer
-        )
-        tokenizer.save(experiment=config.experiment)
-
-    # Load model.
-    model = lmp.util.load_model_by_config(
-        checkpoint=args.checkpoint,
-        config=config,
-        tokenizer=tokenizer
-    )
+    args = parser.parse_args()
 
-    # Load optimizer
-    optimizer = lmp.util.load_optimizer_by_config(
-        checkpoint=args.checkpoint,
-        config=config,
-        model=model
-    )
+    if args.nproc < 1:
+        parser.error('`--nproc` must be bigger than or equal to `1`.')
 
-    # Train model.
-    lmp.util.train_model_by_config(
-        checkpoint=args.checkpoint,
-        config=config,
-        dataset=dataset,
-        model=model,
-        optimizer=optimizer,
-        tokenizer=tokenizer
-    )
+    if args.nproc == 1 or args.hogwild:
+        main(rank=0, args=args, init_method='')
+    else:
+        # Processes find each other through a file on local file system.
+        with tempfile.TemporaryDirectory() as rendezvous_dir:
+            torch.multiprocessing.spawn(
+                main,
+                args=(
+                    args,
+                    f'file://{os.path.join(rendezvous_dir, "rendezvous")}'
+                ),
+                nprocs=args.nproc
+            )
 
     total_exec_time = time.time() - start_time
     print('Total execution time: {} hrs {} mins {} secs'.format(
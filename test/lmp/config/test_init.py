@@ -15,6 +15,8 @@ import inspect
 import math
 import unittest
 
+from typing import Sequence
+
 # self-made modules
 
 from lmp.config import BaseConfig
@@ -36,6 +38,18 @@ class TestInit(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='accumulation_steps',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                    inspect.Parameter(
+                        name='adaptive_softmax_cutoffs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[int],
+                        default=()
+                    ),
                     inspect.Parameter(
                         name='batch_size',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -84,6 +98,18 @@ class TestInit(unittest.TestCase):
                         annotation=str,
                         default=''
                     ),
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
+                    inspect.Parameter(
+                        name='is_file_backed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                     inspect.Parameter(
                         name='is_uncased',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -108,6 +134,12 @@ class TestInit(unittest.TestCase):
                         annotation=int,
                         default=60
                     ),
+                    inspect.Parameter(
+                        name='max_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=-1
+                    ),
                     inspect.Parameter(
                         name='min_count',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -126,18 +158,66 @@ class TestInit(unittest.TestCase):
                         annotation=int,
                         default=1
                     ),
+                    inspect.Parameter(
+                        name='num_negative_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='num_preprocess_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
                     inspect.Parameter(
                         name='num_rnn_layers',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=int,
                         default=1
                     ),
+                    inspect.Parameter(
+                        name='num_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
                     inspect.Parameter(
                         name='optimizer_class',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=str,
                         default='adam'
                     ),
+                    inspect.Parameter(
+                        name='persistent_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
+                    inspect.Parameter(
+                        name='pin_memory',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
+                    inspect.Parameter(
+                        name='prefetch_batches',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='prefetch_factor',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=2
+                    ),
+                    inspect.Parameter(
+                        name='precision',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default='fp32'
+                    ),
                     inspect.Parameter(
                         name='seed',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -149,6 +229,12 @@ class TestInit(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=str,
                         default='char_dict'
+                    ),
+                    inspect.Parameter(
+                        name='unigram_alpha',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=0.75
                     )
                 ],
                 return_annotation=inspect.Signature.empty
@@ -156,6 +242,76 @@ class TestInit(unittest.TestCase):
             msg=msg
         )
 
+    def test_invalid_input_accumulation_steps(self):
+        r"""Raise exception when input `accumulation_steps` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`accumulation_steps` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(accumulation_steps=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`accumulation_steps` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`accumulation_steps` must be bigger than or equal to '
+                    '`1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_adaptive_softmax_cutoffs(self):
+        r"""Raise exception when `adaptive_softmax_cutoffs` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`adaptive_softmax_cutoffs` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., (0.0,), [1j], ('1',), (None,),
+            (0,), [-1], (2, 1), [1, 1], (1, 3, 2),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(adaptive_softmax_cutoffs=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`adaptive_softmax_cutoffs` must be an instance of '
+                    '`Sequence[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`adaptive_softmax_cutoffs` must be strictly increasing '
+                    'and bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
     def test_invalid_input_batch_size(self):
         r"""Raise exception when input `batch_size` is invalid."""
         msg1 = (
@@ -420,6 +576,56 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    is_compact=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_compact` must be an instance of `bool`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_is_file_backed(self):
+        r"""Raise `TypeError` when input `is_file_backed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `is_file_backed` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    is_file_backed=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_file_backed` must be an instance of `bool`.',
+                msg=msg2
+            )
+
     def test_invalid_input_is_uncased(self):
         r"""Raise `TypeError` when input `is_uncased` is invalid."""
         msg1 = 'Must raise `TypeError` when input `is_uncased` is invalid.'
@@ -553,6 +759,44 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_max_tokens(self):
+        r"""Raise exception when input `max_tokens` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_tokens` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    max_tokens=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be bigger than or equal to `1` or '
+                    'equal to `-1`.',
+                    msg=msg2
+                )
+
     def test_invalid_input_min_count(self):
         r"""Raise exception when input `min_count` is invalid."""
         msg1 = (
@@ -664,6 +908,106 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_num_negative_samples(self):
+        r"""Raise exception when input `num_negative_samples` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`num_negative_samples` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    num_negative_samples=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_negative_samples` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_negative_samples` must be bigger than or equal to '
+                    '`0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_num_negative_samples_with_adaptive_softmax(self):
+        r"""Raise `ValueError` when using sampled and adaptive softmax."""
+        msg1 = (
+            'Must raise `ValueError` when `num_negative_samples > 0` and '
+            '`adaptive_softmax_cutoffs` is not empty.'
+        )
+        msg2 = 'Inconsistent error message.'
+
+        for num_negative_samples in (1, 2, 10):
+            with self.assertRaises(ValueError, msg=msg1) as ctx_man:
+                BaseConfig(
+                    adaptive_softmax_cutoffs=(2,),
+                    dataset='test',
+                    experiment='test',
+                    num_negative_samples=num_negative_samples
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`num_negative_samples` must be `0` when '
+                '`adaptive_softmax_cutoffs` is not empty.',
+                msg=msg2
+            )
+
+    def test_invalid_input_num_preprocess_workers(self):
+        r"""Raise exception when input `num_preprocess_workers` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`num_preprocess_workers` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    num_preprocess_workers=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_preprocess_workers` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_preprocess_workers` must be bigger than or equal '
+                    'to `0`.',
+                    msg=msg2
+                )
+
     def test_invalid_input_num_rnn_layers(self):
         r"""Raise exception when input `num_rnn_layers` is invalid."""
         msg1 = (
@@ -701,6 +1045,43 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_num_workers(self):
+        r"""Raise exception when input `num_workers` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`num_workers` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    num_workers=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_workers` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_workers` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
     def test_invalid_input_optimizer_class(self):
         r"""Raise exception when input `optimizer_class` is invalid."""
         msg1 = (
@@ -738,6 +1119,169 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_persistent_workers(self):
+        r"""Raise `TypeError` when input `persistent_workers` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `persistent_workers` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    persistent_workers=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`persistent_workers` must be an instance of `bool`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_pin_memory(self):
+        r"""Raise `TypeError` when input `pin_memory` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `pin_memory` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    pin_memory=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`pin_memory` must be an instance of `bool`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_prefetch_batches(self):
+        r"""Raise exception when input `prefetch_batches` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`prefetch_batches` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    prefetch_batches=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prefetch_batches` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prefetch_batches` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_prefetch_factor(self):
+        r"""Raise exception when input `prefetch_factor` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`prefetch_factor` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    prefetch_factor=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prefetch_factor` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prefetch_factor` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_precision(self):
+        r"""Raise exception when input `precision` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `precision` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., 'fp16', 'bf61',
+            'FP32', 'bf16 ',
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    precision=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`precision` must be an instance of `str`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    "`precision` must be either `'fp32'` or `'bf16'`.",
+                    msg=msg2
+                )
+
     def test_invalid_input_seed(self):
         r"""Raise exception when input `seed` is invalid."""
         msg1 = (
@@ -812,6 +1356,42 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_unigram_alpha(self):
+        r"""Raise exception when input `unigram_alpha` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`unigram_alpha` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -1.0, math.nan, -math.nan, -math.inf, 0j, 1j, '', b'', (), [],
+            {}, set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    unigram_alpha=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`unigram_alpha` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`unigram_alpha` must be bigger than or equal to `0.0`.',
+                    msg=msg2
+                )
+
     def test_instance_attributes(self):
         r"""Declare required instance attributes."""
         msg1 = 'Missing instance attribute `{}`.'
@@ -820,6 +1400,8 @@ class TestInit(unittest.TestCase):
 
         examples = (
             (
+                ('accumulation_steps', 1),
+                ('adaptive_softmax_cutoffs', (1, 2)),
                 ('batch_size', 111),
                 ('checkpoint_step', 222),
                 ('d_emb', 333),
@@ -828,19 +1410,33 @@ class TestInit(unittest.TestCase):
                 ('dropout', 0.42069),
                 ('epoch', 555),
                 ('experiment', 'world'),
+                ('is_compact', False),
+                ('is_file_backed', False),
                 ('is_uncased', True),
                 ('learning_rate', 0.69420),
                 ('max_norm', 6.9),
                 ('max_seq_len', 666),
+                ('max_tokens', 1024),
                 ('min_count', 777),
                 ('model_class', 'HELLO'),
                 ('num_linear_layers', 888),
+                ('num_negative_samples', 0),
+                ('num_preprocess_workers', 0),
                 ('num_rnn_layers', 999),
+                ('num_workers', 2),
                 ('optimizer_class', 'WORLD'),
+                ('persistent_workers', True),
+                ('pin_memory', False),
+                ('prefetch_batches', 2),
+                ('prefetch_factor', 2),
+                ('precision', 'fp32'),
                 ('seed', 101010),
                 ('tokenizer_class', 'hello world'),
+                ('unigram_alpha', 0.5),
             ),
             (
+                ('accumulation_steps', 2),
+                ('adaptive_softmax_cutoffs', ()),
                 ('batch_size', 101010),
                 ('checkpoint_step', 999),
                 ('d_emb', 888),
@@ -849,17 +1445,29 @@ class TestInit(unittest.TestCase):
                 ('dropout', 0.69420),
                 ('epoch', 666),
                 ('experiment', 'hello'),
+                ('is_compact', True),
+                ('is_file_backed', True),
                 ('is_uncased', True),
                 ('learning_rate', 0.42069),
                 ('max_norm', 4.20),
                 ('max_seq_len', 555),
+                ('max_tokens', 2048),
                 ('min_count', 444),
                 ('model_class', 'hello world'),
                 ('num_linear_layers', 333),
+                ('num_negative_samples', 2),
+                ('num_preprocess_workers', 3),
                 ('num_rnn_layers', 222),
+                ('num_workers', 4),
                 ('optimizer_class', 'WORLD'),
+                ('persistent_workers', False),
+                ('pin_memory', True),
+                ('prefetch_batches', 4),
+                ('prefetch_factor', 4),
+                ('precision', 'bf16'),
                 ('seed', 111),
                 ('tokenizer_class', 'HELLO'),
+                ('unigram_alpha', 1.0),
             ),
         )
 
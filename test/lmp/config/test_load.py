@@ -135,6 +135,8 @@ class TestLoad(unittest.TestCase):
         msg = 'Inconsistent load result.'
         examples = (
             {
+                'accumulation_steps': 1,
+                'adaptive_softmax_cutoffs': (1, 2),
                 'batch_size': 111,
                 'checkpoint_step': 222,
                 'd_emb': 333,
@@ -143,19 +145,33 @@ class TestLoad(unittest.TestCase):
                 'dropout': 0.42069,
                 'epoch': 555,
                 'experiment': 'world',
+                'is_compact': False,
+                'is_file_backed': False,
                 'is_uncased': True,
                 'learning_rate': 0.69420,
                 'max_norm': 6.9,
                 'max_seq_len': 666,
+                'max_tokens': 1024,
                 'min_count': 777,
                 'model_class': 'HELLO',
                 'num_linear_layers': 888,
+                'num_negative_samples': 0,
+                'num_preprocess_workers': 0,
                 'num_rnn_layers': 999,
+                'num_workers': 2,
                 'optimizer_class': 'WORLD',
+                'persistent_workers': True,
+                'pin_memory': False,
+                'prefetch_batches': 2,
+                'prefetch_factor': 2,
+                'precision': 'fp32',
                 'seed': 101010,
                 'tokenizer_class': 'hello world',
+                'unigram_alpha': 0.5,
             },
             {
+                'accumulation_steps': 2,
+                'adaptive_softmax_cutoffs': (),
                 'batch_size': 101010,
                 'checkpoint_step': 999,
                 'd_emb': 888,
@@ -164,17 +180,29 @@ class TestLoad(unittest.TestCase):
                 'dropout': 0.69420,
                 'epoch': 666,
                 'experiment': 'hello',
+                'is_compact': True,
+                'is_file_backed': True,
                 'is_uncased': True,
                 'learning_rate': 0.42069,
                 'max_norm': 4.20,
                 'max_seq_len': 555,
+                'max_tokens': 2048,
                 'min_count': 444,
                 'model_class': 'hello world',
                 'num_linear_layers': 333,
+                'num_negative_samples': 2,
+                'num_preprocess_workers': 3,
                 'num_rnn_layers': 222,
+                'num_workers': 4,
                 'optimizer_class': 'WORLD',
+                'persistent_workers': False,
+                'pin_memory': True,
+                'prefetch_batches': 4,
+                'prefetch_factor': 4,
+                'precision': 'bf16',
                 'seed': 111,
                 'tokenizer_class': 'HELLO',
+                'unigram_alpha': 1.0,
             },
         )
 
@@ -45,6 +45,11 @@ class TestDataset(unittest.TestCase):
         examples = (
             'LanguageModelDataset',
             'AnalogyDataset',
+            'FileLanguageModelDataset',
+            'StringPool',
+            'DistributedShardSampler',
+            'TokenBudgetBatchSampler',
+            'ResumableBatchSampler',
         )
 
         try:
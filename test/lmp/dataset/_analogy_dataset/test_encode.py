@@ -0,0 +1,157 @@
+r"""Test `lmp.dataset.AnalogyDataset.encode`.
+
+Usage:
+    python -m unittest test.lmp.dataset._analogy_dataset.test_encode
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.dataset._analogy_dataset import AnalogyDataset
+from lmp.dataset._analogy_dataset import EncodeReturn
+from lmp.tokenizer import BaseTokenizer
+from lmp.tokenizer import WhitespaceDictTokenizer
+from lmp.tokenizer import WhitespaceListTokenizer
+
+
+class TestEncode(unittest.TestCase):
+    r"""Test case for `lmp.dataset.AnalogyDataset.encode`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.samples = [
+            ['Taiwan', 'Taipei', 'Japan', 'Tokyo', 'capital'],
+            ['write', 'writes', 'sad', 'sads', 'grammer'],
+            ['Japan', 'Tokyo', 'Taiwan', 'Taipei', 'capital'],
+            ['[unk]', 'Tokyo', 'Taiwan', 'Kyoto', 'capital'],
+        ]
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.samples
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(AnalogyDataset.encode),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=EncodeReturn
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                AnalogyDataset(self.samples).encode(tokenizer=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_return_value(self):
+        r"""Return encoded token ids, categories and OOV mask."""
+        msg = 'Must return encoded token ids, categories and OOV mask.'
+
+        for tokenizer_cstr in (
+                WhitespaceDictTokenizer,
+                WhitespaceListTokenizer
+        ):
+            tokenizer = tokenizer_cstr()
+            tokenizer.build_vocab(['Taiwan Taipei Japan Tokyo write'])
+
+            for is_compact in (False, True):
+                dataset = AnalogyDataset(self.samples, is_compact=is_compact)
+                token_ids, category_ids, categories, is_oov = dataset.encode(
+                    tokenizer=tokenizer
+                )
+
+                self.assertIsInstance(token_ids, torch.Tensor, msg=msg)
+                self.assertEqual(token_ids.dtype, torch.int64, msg=msg)
+                self.assertEqual(
+                    token_ids.tolist(),
+                    [
+                        [
+                            tokenizer.convert_token_to_id(word)
+                            for word in sample[:4]
+                        ]
+                        for sample in self.samples
+                    ],
+                    msg=msg
+                )
+
+                self.assertIsInstance(category_ids, torch.Tensor, msg=msg)
+                self.assertEqual(category_ids.dtype, torch.int64, msg=msg)
+                self.assertEqual(category_ids.tolist(), [0, 1, 0, 0], msg=msg)
+                self.assertEqual(categories, ['capital', 'grammer'], msg=msg)
+
+                self.assertIsInstance(is_oov, torch.Tensor, msg=msg)
+                self.assertEqual(is_oov.dtype, torch.bool, msg=msg)
+                self.assertEqual(
+                    is_oov.tolist(),
+                    [
+                        [False, False, False, False],
+                        [False, True, True, True],
+                        [False, False, False, False],
+                        [False, False, False, True],
+                    ],
+                    msg=msg
+                )
+
+    def test_empty_dataset(self):
+        r"""Return empty tensors when dataset is empty."""
+        msg = 'Must return empty tensors when dataset is empty.'
+
+        token_ids, category_ids, categories, is_oov = AnalogyDataset(
+            []
+        ).encode(tokenizer=WhitespaceDictTokenizer())
+
+        self.assertEqual(token_ids.shape, (0, 4), msg=msg)
+        self.assertEqual(category_ids.shape, (0,), msg=msg)
+        self.assertEqual(categories, [], msg=msg)
+        self.assertEqual(is_oov.shape, (0, 4), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -136,9 +136,17 @@ class TestGetItem(unittest.TestCase):
         )
 
         for samples, size in examples:
-            dataset = AnalogyDataset(samples=samples)
-            for index in range(size):
-                self.assertEqual(dataset[index], samples[index], msg=msg)
+            for is_compact in (False, True):
+                dataset = AnalogyDataset(
+                    samples=samples,
+                    is_compact=is_compact
+                )
+                for index in range(size):
+                    self.assertEqual(
+                        dataset[index],
+                        list(samples[index]),
+                        msg=msg
+                    )
 
 
 if __name__ == '__main__':
@@ -20,6 +20,7 @@ from typing import Iterable
 # self-made modules
 
 from lmp.dataset._analogy_dataset import AnalogyDataset
+from lmp.dataset._string_pool import StringPool
 
 
 class TestInit(unittest.TestCase):
@@ -44,6 +45,12 @@ class TestInit(unittest.TestCase):
                         annotation=Iterable[Iterable[str]],
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                 ],
                 return_annotation=inspect.Signature.empty
             ),
@@ -90,23 +97,50 @@ class TestInit(unittest.TestCase):
                     '`samples` must be an instance of `Iterable[Iterable[str]]`.',
                     msg=msg2)
 
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                AnalogyDataset(samples=[], is_compact=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_compact` must be an instance of `bool`.',
+                msg=msg2
+            )
+
     def test_instance_attributes(self):
         r"""Declare required instance attributes."""
         msg1 = 'Missing instance attribute `{}`.'
         msg2 = 'Instance attribute `{}` must be an instance of `{}`.'
-        examples = (('samples', list),)
+        examples = (
+            (False, (('samples', list), ('is_compact', bool))),
+            (True, (('samples', StringPool), ('is_compact', bool))),
+        )
 
-        for attr, attr_type in examples:
-            dataset = AnalogyDataset(samples=[])
-            self.assertTrue(
-                hasattr(dataset, attr),
-                msg=msg1.format(attr)
-            )
-            self.assertIsInstance(
-                getattr(dataset, attr),
-                attr_type,
-                msg=msg2.format(attr, attr_type.__name__)
-            )
+        for is_compact, attrs in examples:
+            dataset = AnalogyDataset(samples=[], is_compact=is_compact)
+
+            for attr, attr_type in attrs:
+                self.assertTrue(
+                    hasattr(dataset, attr),
+                    msg=msg1.format(attr)
+                )
+                self.assertIsInstance(
+                    getattr(dataset, attr),
+                    attr_type,
+                    msg=msg2.format(attr, attr_type.__name__)
+                )
+
+            self.assertEqual(dataset.is_compact, is_compact, msg=msg1)
 
 
 if __name__ == '__main__':
@@ -68,14 +68,18 @@ class TestIter(unittest.TestCase):
         )
 
         for samples in examples:
-            dataset = AnalogyDataset(samples=samples)
-            self.assertIsInstance(dataset, Iterable, msg=msg)
-
-            for ans_sample, sample in zip(samples, dataset):
-                self.assertIsInstance(sample, list, msg=msg)
-                for item in sample:
-                    self.assertIsInstance(item, str, msg=msg)
-                self.assertEqual(sample, ans_sample, msg=msg)
+            for is_compact in (False, True):
+                dataset = AnalogyDataset(
+                    samples=samples,
+                    is_compact=is_compact
+                )
+                self.assertIsInstance(dataset, Iterable, msg=msg)
+
+                for ans_sample, sample in zip(samples, dataset):
+                    self.assertIsInstance(sample, list, msg=msg)
+                    for item in sample:
+                        self.assertIsInstance(item, str, msg=msg)
+                    self.assertEqual(sample, ans_sample, msg=msg)
 
 
 if __name__ == '__main__':
@@ -122,11 +122,15 @@ class TestLen(unittest.TestCase):
         )
 
         for samples, size in examples:
-            self.assertEqual(
-                len(AnalogyDataset(samples=samples)),
-                size,
-                msg=msg
-            )
+            for is_compact in (False, True):
+                self.assertEqual(
+                    len(AnalogyDataset(
+                        samples=samples,
+                        is_compact=is_compact
+                    )),
+                    size,
+                    msg=msg
+                )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,258 @@
+r"""Test `lmp.dataset.DistributedShardSampler.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._distributed_shard_sampler.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+from lmp.dataset._distributed_shard_sampler import DistributedShardSampler
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.DistributedShardSampler.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.dataset = LanguageModelDataset(['a', 'ab', 'abc', 'abcd', 'e'])
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.dataset
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(DistributedShardSampler.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.utils.data.Dataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_replicas',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='rank',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                DistributedShardSampler(
+                    dataset=invalid_input,
+                    num_replicas=1,
+                    rank=0,
+                    seed=1
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of `torch.utils.data.Dataset`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_num_replicas(self):
+        r"""Raise exception when input `num_replicas` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_replicas` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                DistributedShardSampler(
+                    dataset=self.dataset,
+                    num_replicas=invalid_input,
+                    rank=0,
+                    seed=1
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_replicas` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_replicas` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_rank(self):
+        r"""Raise exception when input `rank` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `rank` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            2, 3, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                DistributedShardSampler(
+                    dataset=self.dataset,
+                    num_replicas=2,
+                    rank=invalid_input,
+                    seed=1
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`rank` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`rank` must be bigger than or equal to `0` and smaller '
+                    'than `num_replicas`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                DistributedShardSampler(
+                    dataset=self.dataset,
+                    num_replicas=1,
+                    rank=0,
+                    seed=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        examples = (
+            (1, 0, 5, 5),
+            (2, 1, 3, 6),
+            (3, 2, 2, 6),
+            (5, 4, 1, 5),
+            (8, 7, 1, 8),
+        )
+
+        for num_replicas, rank, num_samples, total_size in examples:
+            sampler = DistributedShardSampler(
+                dataset=self.dataset,
+                num_replicas=num_replicas,
+                rank=rank,
+                seed=1
+            )
+
+            for attr, value in (
+                    ('dataset_size', 5),
+                    ('epoch', 0),
+                    ('num_replicas', num_replicas),
+                    ('num_samples', num_samples),
+                    ('rank', rank),
+                    ('seed', 1),
+                    ('total_size', total_size),
+            ):
+                self.assertEqual(
+                    getattr(sampler, attr),
+                    value,
+                    msg=msg.format(attr, value)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
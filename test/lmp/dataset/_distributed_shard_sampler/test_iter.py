@@ -0,0 +1,143 @@
+r"""Test `lmp.dataset.DistributedShardSampler.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._distributed_shard_sampler.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Generator
+from typing import Iterable
+
+# self-made modules
+
+from lmp.dataset._distributed_shard_sampler import DistributedShardSampler
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.DistributedShardSampler.__iter__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.dataset = LanguageModelDataset([str(i) for i in range(50)])
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.dataset
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(DistributedShardSampler.__iter__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Generator[int, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_yield_value(self):
+        r"""Is an iterable which yield disjoint shards covering dataset."""
+        msg = (
+            'Must be an iterable which yield disjoint shards covering '
+            'dataset.'
+        )
+
+        for num_replicas in (1, 2, 3, 7, 50, 64):
+            samplers = [
+                DistributedShardSampler(
+                    dataset=self.dataset,
+                    num_replicas=num_replicas,
+                    rank=rank,
+                    seed=1
+                )
+                for rank in range(num_replicas)
+            ]
+
+            for _ in range(2):
+                shards = []
+                for sampler in samplers:
+                    self.assertIsInstance(sampler, Iterable, msg=msg)
+
+                    shard = list(sampler)
+                    self.assertEqual(len(shard), len(sampler), msg=msg)
+                    shards.append(shard)
+
+                indices = [index for shard in shards for index in shard]
+
+                # Every index is sampled at least once.
+                self.assertEqual(
+                    sorted(set(indices)),
+                    list(range(len(self.dataset))),
+                    msg=msg
+                )
+
+                # Only padding is sampled twice.
+                self.assertEqual(
+                    len(indices) - len(set(indices)),
+                    samplers[0].total_size - len(self.dataset),
+                    msg=msg
+                )
+
+    def test_reproducible(self):
+        r"""Yield the same shard given the same seed and epoch."""
+        msg = 'Must yield the same shard given the same seed and epoch.'
+
+        sampler_1 = DistributedShardSampler(
+            dataset=self.dataset,
+            num_replicas=2,
+            rank=1,
+            seed=42
+        )
+        sampler_2 = DistributedShardSampler(
+            dataset=self.dataset,
+            num_replicas=2,
+            rank=1,
+            seed=42
+        )
+
+        for _ in range(3):
+            self.assertEqual(list(sampler_1), list(sampler_2), msg=msg)
+
+        self.assertEqual(sampler_1.epoch, 3, msg=msg)
+
+        sampler_1.set_epoch(1)
+        sampler_2.set_epoch(1)
+        self.assertEqual(list(sampler_1), list(sampler_2), msg=msg)
+
+        sampler_2.set_epoch(0)
+        self.assertNotEqual(list(sampler_1), list(sampler_2), msg=msg)
+
+    def test_empty_dataset(self):
+        r"""Yield nothing when dataset is empty."""
+        msg = 'Must yield nothing when dataset is empty.'
+
+        for rank in range(2):
+            sampler = DistributedShardSampler(
+                dataset=LanguageModelDataset([]),
+                num_replicas=2,
+                rank=rank,
+                seed=1
+            )
+            self.assertEqual(list(sampler), [], msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+r"""Test `lmp.dataset.DistributedShardSampler.__len__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._distributed_shard_sampler.test_len
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+# self-made modules
+
+from lmp.dataset._distributed_shard_sampler import DistributedShardSampler
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+
+
+class TestLen(unittest.TestCase):
+    r"""Test case for `lmp.dataset.DistributedShardSampler.__len__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(DistributedShardSampler.__len__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_return_shard_size(self):
+        r"""Return number of samples in each shard."""
+        msg = 'Must return number of samples in each shard.'
+        examples = (
+            (10, 1, 10),
+            (10, 2, 5),
+            (10, 3, 4),
+            (10, 20, 1),
+            (0, 2, 0),
+        )
+
+        for dataset_size, num_replicas, ans_len in examples:
+            for rank in range(num_replicas):
+                sampler = DistributedShardSampler(
+                    dataset=LanguageModelDataset(['a'] * dataset_size),
+                    num_replicas=num_replicas,
+                    rank=rank,
+                    seed=1
+                )
+
+                for _ in range(2):
+                    self.assertEqual(len(sampler), ans_len, msg=msg)
+                    self.assertEqual(len(list(sampler)), ans_len, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+r"""Test `lmp.dataset.FileLanguageModelDataset.dump`.
+
+Usage:
+    python -m unittest test.lmp.dataset._file_language_model_dataset.test_dump
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import os
+import tempfile
+import unittest
+
+from typing import Iterable
+
+# self-made modules
+
+from lmp.dataset._file_language_model_dataset import FileLanguageModelDataset
+
+
+class TestDump(unittest.TestCase):
+    r"""Test case for `lmp.dataset.FileLanguageModelDataset.dump`."""
+
+    def setUp(self):
+        r"""Create test directory."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.test_dir.name, 'dataset.txt')
+
+    def tearDown(self):
+        r"""Remove test directory."""
+        self.test_dir.cleanup()
+        del self.file_path
+        del self.test_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(FileLanguageModelDataset.dump),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='file_path',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=None
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sequences(self):
+        r"""Raise exception when input `batch_sequences` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`batch_sequences` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, object(), lambda x: x, type, None,
+            NotImplemented, ..., [False], [0], [0.0], [b''], [None],
+            ['\n'], ['a', 'b\nc'],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                FileLanguageModelDataset.dump(
+                    batch_sequences=invalid_input,
+                    file_path=self.file_path
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_sequences` must be an instance of '
+                    '`Iterable[str]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_sequences` must not contain new line.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_file_path(self):
+        r"""Raise `TypeError` when input `file_path` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `file_path` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, b'', (), [], {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                FileLanguageModelDataset.dump(
+                    batch_sequences=[],
+                    file_path=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`file_path` must be an instance of `str`.',
+                msg=msg2
+            )
+
+    def test_dump_result(self):
+        r"""Write one sequence per line."""
+        msg = 'Must write one sequence per line.'
+        examples = (
+            (['Hello', 'World'], 'Hello\nWorld\n'),
+            (['', '你好'], '\n你好\n'),
+            ([], ''),
+        )
+
+        for batch_sequences, content in examples:
+            FileLanguageModelDataset.dump(batch_sequences, self.file_path)
+
+            with open(self.file_path, 'r', encoding='utf-8') as input_file:
+                self.assertEqual(input_file.read(), content, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
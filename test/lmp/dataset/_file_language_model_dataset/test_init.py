@@ -0,0 +1,145 @@
+r"""Test `lmp.dataset.FileLanguageModelDataset.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._file_language_model_dataset.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import os
+import pickle
+import tempfile
+import unittest
+
+# self-made modules
+
+from lmp.dataset._file_language_model_dataset import FileLanguageModelDataset
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.FileLanguageModelDataset.__init__`."""
+
+    def setUp(self):
+        r"""Create test directory."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.test_dir.name, 'dataset.txt')
+
+    def tearDown(self):
+        r"""Remove test directory."""
+        self.test_dir.cleanup()
+        del self.file_path
+        del self.test_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(FileLanguageModelDataset.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='file_path',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_file_path(self):
+        r"""Raise exception when input `file_path` is invalid."""
+        msg1 = (
+            'Must raise `FileNotFoundError` or `TypeError` when input '
+            '`file_path` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, b'', (), [], {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., self.file_path,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (FileNotFoundError, TypeError),
+                    msg=msg1
+            ) as ctx_man:
+                FileLanguageModelDataset(file_path=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`file_path` must be an instance of `str`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    f'file {invalid_input} does not exist.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        examples = (
+            ('a\nbc\n\ndef\n', [0, 2, 5, 6, 10]),
+            ('a\nbc\n\ndef', [0, 2, 5, 6, 10]),
+            ('\n', [0, 1]),
+            ('', [0]),
+            ('你好\n世界\n', [0, 7, 14]),
+        )
+
+        for content, offsets in examples:
+            with open(self.file_path, 'w', encoding='utf-8') as out_file:
+                out_file.write(content)
+
+            dataset = FileLanguageModelDataset(file_path=self.file_path)
+
+            self.assertIsInstance(dataset, LanguageModelDataset, msg=msg)
+            self.assertEqual(
+                dataset.file_path,
+                self.file_path,
+                msg=msg.format('file_path', self.file_path)
+            )
+            self.assertEqual(
+                dataset.offsets.tolist(),
+                offsets,
+                msg=msg.format('offsets', offsets)
+            )
+
+    def test_picklable(self):
+        r"""Dataset must be picklable."""
+        msg = 'Dataset must be picklable.'
+        batch_sequences = ['Hello', 'World', 'Hello World', '']
+
+        FileLanguageModelDataset.dump(batch_sequences, self.file_path)
+        dataset = FileLanguageModelDataset(file_path=self.file_path)
+
+        # Access data once to open memory-mapped file.
+        self.assertEqual(dataset[0], 'Hello', msg=msg)
+
+        dataset = pickle.loads(pickle.dumps(dataset))
+
+        self.assertEqual(list(dataset), batch_sequences, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
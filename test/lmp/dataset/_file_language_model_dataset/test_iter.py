@@ -0,0 +1,78 @@
+r"""Test `lmp.dataset.FileLanguageModelDataset.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._file_language_model_dataset.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import os
+import tempfile
+import unittest
+
+from typing import Generator
+from typing import Iterable
+
+# self-made modules
+
+from lmp.dataset._file_language_model_dataset import FileLanguageModelDataset
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.FileLanguageModelDataset.__iter__`."""
+
+    def setUp(self):
+        r"""Create test directory."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.test_dir.name, 'dataset.txt')
+
+    def tearDown(self):
+        r"""Remove test directory."""
+        self.test_dir.cleanup()
+        del self.file_path
+        del self.test_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(FileLanguageModelDataset.__iter__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_yield_value(self):
+        r"""Is an iterable which yield each line in file."""
+        msg = 'Must be an iterable which yield each line in file.'
+        examples = (
+            ['Hello', 'World', 'Hello World'],
+            ['今天天氣真好', '', 'ÀÁÂÃÄÅ'],
+            [''],
+            [],
+        )
+
+        for batch_sequences in examples:
+            FileLanguageModelDataset.dump(batch_sequences, self.file_path)
+            dataset = FileLanguageModelDataset(file_path=self.file_path)
+            self.assertIsInstance(dataset, Iterable, msg=msg)
+            self.assertEqual(list(dataset), batch_sequences, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
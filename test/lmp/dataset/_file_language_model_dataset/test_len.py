@@ -0,0 +1,74 @@
+r"""Test `lmp.dataset.FileLanguageModelDataset.__len__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._file_language_model_dataset.test_len
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import os
+import tempfile
+import unittest
+
+# self-made modules
+
+from lmp.dataset._file_language_model_dataset import FileLanguageModelDataset
+
+
+class TestLen(unittest.TestCase):
+    r"""Test case for `lmp.dataset.FileLanguageModelDataset.__len__`."""
+
+    def setUp(self):
+        r"""Create test directory."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.test_dir.name, 'dataset.txt')
+
+    def tearDown(self):
+        r"""Remove test directory."""
+        self.test_dir.cleanup()
+        del self.file_path
+        del self.test_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(FileLanguageModelDataset.__len__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_return_value(self):
+        r"""Return dataset size."""
+        msg = 'Must return dataset size.'
+        examples = (
+            ['Hello', 'World', 'Hello World'],
+            ['', '', ''],
+            [''],
+            [],
+        )
+
+        for batch_sequences in examples:
+            FileLanguageModelDataset.dump(batch_sequences, self.file_path)
+            dataset = FileLanguageModelDataset(file_path=self.file_path)
+            self.assertEqual(len(dataset), len(batch_sequences), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -231,6 +231,91 @@ class TestCollateFn(unittest.TestCase):
                 self.assertEqual(x.size(-1), max_seq_len - 1, msg=msg)
                 self.assertEqual(y.size(-1), max_seq_len - 1, msg=msg)
 
+    def test_consistent_with_batch_encode(self):
+        r"""Encode the same token ids as `tokenizer.batch_encode`."""
+        msg = 'Must encode the same token ids as `tokenizer.batch_encode`.'
+        batch_sequences = [
+            'Mario use Kimura Lock on Luigi, and Luigi tap out.',
+            'Mario use Superman Punch.',
+            '',
+            'Luigi get TKO.',
+        ]
+
+        for tokenizer_class in self.__class__.tokenizer_class_range:
+            tokenizer = tokenizer_class()
+            tokenizer.build_vocab(batch_sequences)
+
+            for max_seq_len in self.__class__.max_seq_len_range + [64]:
+                for pad_to_longest in (False, True):
+                    collate_fn = LanguageModelDataset.create_collate_fn(
+                        tokenizer=tokenizer,
+                        max_seq_len=max_seq_len,
+                        pad_to_longest=pad_to_longest
+                    )
+                    x, y = collate_fn(batch_sequences)
+
+                    # Longest sequence is shorter than `64`.
+                    batch_max_seq_len = max_seq_len
+                    if pad_to_longest and max_seq_len == 64:
+                        batch_max_seq_len = -1
+
+                    expected = torch.LongTensor(tokenizer.batch_encode(
+                        batch_sequences,
+                        max_seq_len=batch_max_seq_len
+                    ))
+                    self.assertTrue(torch.equal(x, expected[:, :-1]), msg=msg)
+                    self.assertTrue(torch.equal(y, expected[:, 1:]), msg=msg)
+
+    def test_pad_to_longest(self):
+        r"""Pad to the longest sequence but still truncate to `max_seq_len`."""
+        msg = (
+            'Batch token ids\' length must be the longest sequence length '
+            'truncated by `max_seq_len`.'
+        )
+        examples = (
+            (
+                [
+                    'ab',
+                    'abcd',
+                ],
+                -1,
+                5,
+            ),
+            (
+                [
+                    'ab',
+                    'abcd',
+                ],
+                10,
+                5,
+            ),
+            (
+                [
+                    'ab',
+                    'abcd',
+                ],
+                4,
+                3,
+            ),
+            (
+                [''],
+                10,
+                1,
+            ),
+        )
+
+        for batch_sequences, max_seq_len, ans_seq_len in examples:
+            for tokenizer_class in (CharDictTokenizer, CharListTokenizer):
+                collate_fn = LanguageModelDataset.create_collate_fn(
+                    tokenizer=tokenizer_class(),
+                    max_seq_len=max_seq_len,
+                    pad_to_longest=True
+                )
+                x, y = collate_fn(batch_sequences)
+
+                self.assertEqual(x.size(-1), ans_seq_len, msg=msg)
+                self.assertEqual(y.size(-1), ans_seq_len, msg=msg)
+
 
 if __name__ == '__main__':
     unittest.main()
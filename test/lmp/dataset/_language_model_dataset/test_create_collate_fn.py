@@ -13,6 +13,7 @@ from __future__ import unicode_literals
 
 import inspect
 import math
+import pickle
 import unittest
 
 from typing import Callable
@@ -56,6 +57,12 @@ class TestCreateCollateFn(unittest.TestCase):
                         annotation=int,
                         default=-1
                     ),
+                    inspect.Parameter(
+                        name='pad_to_longest',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                 ],
                 return_annotation=Callable[
                     [Iterable[str]],
@@ -124,6 +131,31 @@ class TestCreateCollateFn(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_pad_to_longest(self):
+        r"""Raise `TypeError` when input `pad_to_longest` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `pad_to_longest` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as cxt_man:
+                LanguageModelDataset([]).create_collate_fn(
+                    tokenizer=CharDictTokenizer(),
+                    pad_to_longest=invalid_input
+                )
+
+            self.assertEqual(
+                cxt_man.exception.args[0],
+                '`pad_to_longest` must be an instance of `bool`.',
+                msg=msg2
+            )
+
     def test_return_type(self):
         r"""Return `collate_fn`."""
         msg = 'Must return `collate_fn`.'
@@ -138,7 +170,7 @@ class TestCreateCollateFn(unittest.TestCase):
             collate_fn = LanguageModelDataset([]).create_collate_fn(
                 tokenizer=tokenizer_class()
             )
-            self.assertTrue(inspect.isfunction(collate_fn))
+            self.assertTrue(callable(collate_fn))
             self.assertEqual(
                 inspect.signature(collate_fn),
                 inspect.Signature(
@@ -156,5 +188,30 @@ class TestCreateCollateFn(unittest.TestCase):
             )
 
 
+    def test_picklable(self):
+        r"""Return picklable `collate_fn`."""
+        msg = 'Must return picklable `collate_fn`.'
+        examples = (
+            (CharDictTokenizer, -1, False),
+            (CharListTokenizer, 10, True),
+            (WhitespaceDictTokenizer, -1, True),
+            (WhitespaceListTokenizer, 10, False),
+        )
+
+        for tokenizer_class, max_seq_len, pad_to_longest in examples:
+            collate_fn = LanguageModelDataset.create_collate_fn(
+                tokenizer=tokenizer_class(),
+                max_seq_len=max_seq_len,
+                pad_to_longest=pad_to_longest
+            )
+            unpickled_collate_fn = pickle.loads(pickle.dumps(collate_fn))
+
+            for batch_sequences in (['a', 'b c'], ['a b c d e f g h']):
+                x1, y1 = collate_fn(batch_sequences)
+                x2, y2 = unpickled_collate_fn(batch_sequences)
+                self.assertTrue(torch.equal(x1, x2), msg=msg)
+                self.assertTrue(torch.equal(y1, y2), msg=msg)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -120,9 +120,13 @@ class TestGetItem(unittest.TestCase):
         )
 
         for batch_sequences in examples:
-            dataset = LanguageModelDataset(batch_sequences=batch_sequences)
-            for i in range(len(dataset)):
-                self.assertEqual(dataset[i], batch_sequences[i], msg=msg)
+            for is_compact in (False, True):
+                dataset = LanguageModelDataset(
+                    batch_sequences=batch_sequences,
+                    is_compact=is_compact
+                )
+                for i in range(len(dataset)):
+                    self.assertEqual(dataset[i], batch_sequences[i], msg=msg)
 
 
 if __name__ == '__main__':
@@ -20,6 +20,7 @@ from typing import Iterable
 # self-made modules
 
 from lmp.dataset._language_model_dataset import LanguageModelDataset
+from lmp.dataset._string_pool import StringPool
 
 
 class TestInit(unittest.TestCase):
@@ -44,6 +45,12 @@ class TestInit(unittest.TestCase):
                         annotation=Iterable[str],
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                 ],
                 return_annotation=inspect.Signature.empty
             ),
@@ -70,13 +77,41 @@ class TestInit(unittest.TestCase):
             ['', NotImplemented], ['', ...],
         )
 
+        for invalid_input in examples:
+            for is_compact in (False, True):
+                with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                    LanguageModelDataset(
+                        batch_sequences=invalid_input,
+                        is_compact=is_compact
+                    )
+
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_sequences` must be an instance of '
+                    '`Iterable[str]`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
         for invalid_input in examples:
             with self.assertRaises(TypeError, msg=msg1) as ctx_man:
-                LanguageModelDataset(batch_sequences=invalid_input)
+                LanguageModelDataset(
+                    batch_sequences=[],
+                    is_compact=invalid_input
+                )
 
             self.assertEqual(
                 ctx_man.exception.args[0],
-                '`batch_sequences` must be an instance of `Iterable[str]`.',
+                '`is_compact` must be an instance of `bool`.',
                 msg=msg2
             )
 
@@ -84,20 +119,43 @@ class TestInit(unittest.TestCase):
         r"""Declare required instance attributes."""
         msg1 = 'Missing instance attribute `{}`.'
         msg2 = 'Instance attribute `{}` must be an instance of `{}`.'
-        examples = (('batch_sequences', list),)
+        examples = (
+            (False, (('batch_sequences', list), ('is_compact', bool))),
+            (True, (('batch_sequences', StringPool), ('is_compact', bool))),
+        )
 
-        for attr, attr_type in examples:
-            dataset = LanguageModelDataset(batch_sequences=[])
-            self.assertTrue(
-                hasattr(dataset, attr),
-                msg=msg1.format(attr)
+        for is_compact, attrs in examples:
+            dataset = LanguageModelDataset(
+                batch_sequences=[],
+                is_compact=is_compact
             )
-            self.assertIsInstance(
-                getattr(dataset, attr),
-                attr_type,
-                msg=msg2.format(attr, attr_type.__name__)
+
+            for attr, attr_type in attrs:
+                self.assertTrue(
+                    hasattr(dataset, attr),
+                    msg=msg1.format(attr)
+                )
+                self.assertIsInstance(
+                    getattr(dataset, attr),
+                    attr_type,
+                    msg=msg2.format(attr, attr_type.__name__)
+                )
+
+            self.assertEqual(dataset.is_compact, is_compact, msg=msg1)
+
+    def test_lazy_batch_sequences(self):
+        r"""Consume generator of sequences only once."""
+        msg = 'Must consume generator of sequences only once.'
+        batch_sequences = ['a', 'bc', '']
+
+        for is_compact in (False, True):
+            dataset = LanguageModelDataset(
+                batch_sequences=(sequence for sequence in batch_sequences),
+                is_compact=is_compact
             )
 
+            self.assertEqual(list(dataset), batch_sequences, msg=msg)
+
 
 if __name__ == '__main__':
     unittest.main()
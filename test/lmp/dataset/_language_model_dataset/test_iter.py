@@ -64,12 +64,16 @@ class TestIter(unittest.TestCase):
         )
 
         for batch_sequences in examples:
-            dataset = LanguageModelDataset(batch_sequences=batch_sequences)
-            self.assertIsInstance(dataset, Iterable, msg=msg)
-
-            for ans_sequence, sequence in zip(batch_sequences, dataset):
-                self.assertIsInstance(sequence, str, msg=msg)
-                self.assertEqual(sequence, ans_sequence, msg=msg)
+            for is_compact in (False, True):
+                dataset = LanguageModelDataset(
+                    batch_sequences=batch_sequences,
+                    is_compact=is_compact
+                )
+                self.assertIsInstance(dataset, Iterable, msg=msg)
+
+                for ans_sequence, sequence in zip(batch_sequences, dataset):
+                    self.assertIsInstance(sequence, str, msg=msg)
+                    self.assertEqual(sequence, ans_sequence, msg=msg)
 
 
 if __name__ == '__main__':
@@ -99,11 +99,15 @@ class TestLen(unittest.TestCase):
         )
 
         for batch_sequences, dataset_size in examples:
-            self.assertEqual(
-                len(LanguageModelDataset(batch_sequences=batch_sequences)),
-                dataset_size,
-                msg=msg
-            )
+            for is_compact in (False, True):
+                self.assertEqual(
+                    len(LanguageModelDataset(
+                        batch_sequences=batch_sequences,
+                        is_compact=is_compact
+                    )),
+                    dataset_size,
+                    msg=msg
+                )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,102 @@
+r"""Test `lmp.dataset.ResumableBatchSampler.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._resumable_batch_sampler.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+from lmp.dataset._resumable_batch_sampler import ResumableBatchSampler
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.ResumableBatchSampler.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResumableBatchSampler.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_sampler',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.utils.data.Sampler,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sampler(self):
+        r"""Raise `TypeError` when input `batch_sampler` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `batch_sampler` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., [[0], [1]],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                ResumableBatchSampler(batch_sampler=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`batch_sampler` must be an instance of '
+                '`torch.utils.data.Sampler`.',
+                msg=msg2
+            )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        batch_sampler = torch.utils.data.BatchSampler(
+            range(5),
+            batch_size=2,
+            drop_last=False
+        )
+        sampler = ResumableBatchSampler(batch_sampler=batch_sampler)
+
+        for attr, value in (
+                ('batch_sampler', batch_sampler),
+                ('num_skip_batches', 0),
+        ):
+            self.assertTrue(
+                hasattr(sampler, attr),
+                msg=msg.format(attr, value)
+            )
+            self.assertIs(
+                getattr(sampler, attr),
+                value,
+                msg=msg.format(attr, value)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+r"""Test `lmp.dataset.ResumableBatchSampler.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._resumable_batch_sampler.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Generator
+from typing import List
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+from lmp.dataset._distributed_shard_sampler import DistributedShardSampler
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+from lmp.dataset._resumable_batch_sampler import ResumableBatchSampler
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.ResumableBatchSampler.__iter__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.dataset = LanguageModelDataset([str(i) for i in range(10)])
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.dataset
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResumableBatchSampler.__iter__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Generator[List[int], None, None]
+            ),
+            msg=msg
+        )
+
+    def test_yield_value(self):
+        r"""Yield mini-batches after skipped ones only in next iteration."""
+        msg = 'Must yield mini-batches after skipped ones in next iteration.'
+        batches = [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+        for num_skip_batches in range(6):
+            sampler = ResumableBatchSampler(
+                batch_sampler=torch.utils.data.BatchSampler(
+                    torch.utils.data.SequentialSampler(self.dataset),
+                    batch_size=3,
+                    drop_last=False
+                )
+            )
+            sampler.skip(num_batches=num_skip_batches)
+
+            self.assertEqual(
+                list(sampler),
+                batches[num_skip_batches:],
+                msg=msg
+            )
+            self.assertEqual(sampler.num_skip_batches, 0, msg=msg)
+
+            # Following iterations are not skipped.
+            self.assertEqual(list(sampler), batches, msg=msg)
+
+    def test_same_random_state(self):
+        r"""Advance wrapped batch sampler as if nothing is skipped."""
+        msg = 'Must advance wrapped batch sampler as if nothing is skipped.'
+
+        def create_sampler():
+            return ResumableBatchSampler(
+                batch_sampler=torch.utils.data.BatchSampler(
+                    DistributedShardSampler(
+                        dataset=self.dataset,
+                        num_replicas=1,
+                        rank=0,
+                        seed=1
+                    ),
+                    batch_size=3,
+                    drop_last=False
+                )
+            )
+
+        sampler = create_sampler()
+        ans_epochs = [list(sampler) for _ in range(3)]
+
+        sampler = create_sampler()
+        sampler.skip(num_batches=4)
+        self.assertEqual(list(sampler), [], msg=msg)
+        sampler.skip(num_batches=1)
+        self.assertEqual(list(sampler), ans_epochs[1][1:], msg=msg)
+        self.assertEqual(list(sampler), ans_epochs[2], msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
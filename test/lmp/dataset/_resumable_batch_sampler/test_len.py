@@ -0,0 +1,71 @@
+r"""Test `lmp.dataset.ResumableBatchSampler.__len__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._resumable_batch_sampler.test_len
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+from lmp.dataset._resumable_batch_sampler import ResumableBatchSampler
+
+
+class TestLen(unittest.TestCase):
+    r"""Test case for `lmp.dataset.ResumableBatchSampler.__len__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResumableBatchSampler.__len__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_return_num_batches(self):
+        r"""Return number of mini-batches including skipped ones."""
+        msg = 'Must return number of mini-batches including skipped ones.'
+
+        for dataset_size, batch_size, num_skip_batches, ans_len in (
+                (0, 1, 0, 0),
+                (5, 2, 0, 3),
+                (5, 2, 2, 3),
+                (6, 3, 1, 2),
+        ):
+            sampler = ResumableBatchSampler(
+                batch_sampler=torch.utils.data.BatchSampler(
+                    range(dataset_size),
+                    batch_size=batch_size,
+                    drop_last=False
+                )
+            )
+            sampler.skip(num_batches=num_skip_batches)
+
+            self.assertEqual(len(sampler), ans_len, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+r"""Test `lmp.dataset.ResumableBatchSampler.skip`.
+
+Usage:
+    python -m unittest test.lmp.dataset._resumable_batch_sampler.test_skip
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+from lmp.dataset._resumable_batch_sampler import ResumableBatchSampler
+
+
+class TestSkip(unittest.TestCase):
+    r"""Test case for `lmp.dataset.ResumableBatchSampler.skip`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.sampler = ResumableBatchSampler(
+            batch_sampler=torch.utils.data.BatchSampler(
+                range(5),
+                batch_size=2,
+                drop_last=False
+            )
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.sampler
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResumableBatchSampler.skip),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_batches',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=None
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_num_batches(self):
+        r"""Raise exception when input `num_batches` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_batches` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                self.sampler.skip(num_batches=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_batches` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_batches` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_skip(self):
+        r"""Set number of mini-batches to skip in next iteration."""
+        msg = 'Must set number of mini-batches to skip in next iteration.'
+
+        for num_batches in (0, 1, 2, 5):
+            self.sampler.skip(num_batches=num_batches)
+            self.assertEqual(
+                self.sampler.num_skip_batches,
+                num_batches,
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+r"""Test `lmp.dataset.StringPool.__getitem__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._string_pool.test_getitem
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset._string_pool import StringPool
+
+
+class TestGetItem(unittest.TestCase):
+    r"""Test case for `lmp.dataset.StringPool.__getitem__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(StringPool.__getitem__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='index',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=str
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_index(self):
+        r"""Raise `IndexError` or `TypeError` when input `index` is invalid."""
+        msg1 = (
+            'Must raise `IndexError` or `TypeError` when input `index` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j,
+            '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (IndexError, TypeError),
+                    msg=msg1
+            ) as ctx_man:
+                StringPool([])[invalid_input]
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`index` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`index` out of range.',
+                    msg=msg2
+                )
+
+    def test_return_value(self):
+        r"""Decode single string using index."""
+        msg = 'Must decode single string using index.'
+        examples = (
+            [
+                'Hello',
+                'World',
+                'Hello World',
+            ],
+            [
+                '今天天氣真好',
+                '',
+                'ÀÁÂÃÄÅ',
+            ],
+            [''],
+            [],
+        )
+
+        for strings in examples:
+            string_pool = StringPool(strings=strings)
+
+            for i in range(len(string_pool)):
+                self.assertIsInstance(string_pool[i], str, msg=msg)
+                self.assertEqual(string_pool[i], strings[i], msg=msg)
+
+            for i in range(-1, -len(string_pool) - 1, -1):
+                self.assertEqual(string_pool[i], strings[i], msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+r"""Test `lmp.dataset.StringPool.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._string_pool.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import pickle
+import unittest
+
+from typing import Iterable
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.dataset._string_pool import StringPool
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.StringPool.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(StringPool.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='strings',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[str],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_strings(self):
+        r"""Raise `TypeError` when input `strings` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `strings` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, object(), lambda x: x, type, None,
+            NotImplemented, ..., [False], [True], [0], [1], [-1], [0.0],
+            [1.0], [math.nan], [-math.nan], [math.inf], [-math.inf], [0j],
+            [1j], [b''], [()], [[]], [{}], [set()], [object()],
+            [lambda x: x], [type], [None], [NotImplemented], [...], ['', 0],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                StringPool(strings=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`strings` must be an instance of `Iterable[str]`.',
+                msg=msg2
+            )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        examples = (
+            (['ab', '', 'c'], b'abc', [0, 2, 2, 3]),
+            (['你好', 'a'], '你好a'.encode('utf-8'), [0, 6, 7]),
+            ([''], b'', [0, 0]),
+            ([], b'', [0]),
+        )
+
+        for strings, buffer, offsets in examples:
+            string_pool = StringPool(strings=strings)
+
+            self.assertIsInstance(string_pool.buffer, torch.Tensor, msg=msg)
+            self.assertEqual(
+                string_pool.buffer.dtype,
+                torch.uint8,
+                msg=msg.format('buffer.dtype', torch.uint8)
+            )
+            self.assertEqual(
+                bytes(string_pool.buffer.tolist()),
+                buffer,
+                msg=msg.format('buffer', buffer)
+            )
+            self.assertIsInstance(string_pool.offsets, torch.Tensor, msg=msg)
+            self.assertEqual(
+                string_pool.offsets.dtype,
+                torch.int64,
+                msg=msg.format('offsets.dtype', torch.int64)
+            )
+            self.assertEqual(
+                string_pool.offsets.tolist(),
+                offsets,
+                msg=msg.format('offsets', offsets)
+            )
+
+    def test_picklable(self):
+        r"""String pool must be picklable."""
+        msg = 'String pool must be picklable.'
+        strings = ['Hello', 'World', '', '今天天氣真好']
+
+        for is_shared in (False, True):
+            string_pool = StringPool(strings=strings)
+            if is_shared:
+                self.assertIs(
+                    string_pool.share_memory_(),
+                    string_pool,
+                    msg=msg
+                )
+                self.assertTrue(string_pool.buffer.is_shared(), msg=msg)
+                self.assertTrue(string_pool.offsets.is_shared(), msg=msg)
+
+            string_pool = pickle.loads(pickle.dumps(string_pool))
+            self.assertEqual(list(string_pool), strings, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
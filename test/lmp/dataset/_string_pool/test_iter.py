@@ -0,0 +1,64 @@
+r"""Test `lmp.dataset.StringPool.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._string_pool.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Generator
+from typing import Iterable
+
+# self-made modules
+
+from lmp.dataset._string_pool import StringPool
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.StringPool.__iter__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(StringPool.__iter__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_yield_value(self):
+        r"""Is an iterable which yield each string in the pool."""
+        msg = 'Must be an iterable which yield each string in the pool.'
+        examples = (
+            ['Hello', 'World', 'Hello World'],
+            ['今天天氣真好', '', 'ÀÁÂÃÄÅ'],
+            [''],
+            [],
+        )
+
+        for strings in examples:
+            string_pool = StringPool(strings=strings)
+            self.assertIsInstance(string_pool, Iterable, msg=msg)
+            self.assertEqual(list(string_pool), strings, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
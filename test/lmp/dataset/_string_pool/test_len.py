@@ -0,0 +1,59 @@
+r"""Test `lmp.dataset.StringPool.__len__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._string_pool.test_len
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+# self-made modules
+
+from lmp.dataset._string_pool import StringPool
+
+
+class TestLen(unittest.TestCase):
+    r"""Test case for `lmp.dataset.StringPool.__len__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(StringPool.__len__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_return_pool_size(self):
+        r"""Return number of strings in the pool."""
+        msg = 'Must return number of strings in the pool.'
+        examples = (
+            (['Hello', 'World', 'Hello World'], 3),
+            (['', ''], 2),
+            ([''], 1),
+            ([], 0),
+        )
+
+        for strings, size in examples:
+            self.assertEqual(len(StringPool(strings=strings)), size, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
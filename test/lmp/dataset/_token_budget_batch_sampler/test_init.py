@@ -0,0 +1,390 @@
+r"""Test `lmp.dataset.TokenBudgetBatchSampler.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._token_budget_batch_sampler.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+from lmp.dataset._token_budget_batch_sampler import TokenBudgetBatchSampler
+from lmp.tokenizer import BaseTokenizer
+from lmp.tokenizer import CharDictTokenizer
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.TokenBudgetBatchSampler.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.dataset = LanguageModelDataset(['a', 'ab', 'abc'])
+        self.tokenizer = CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.dataset
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(TokenBudgetBatchSampler.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=LanguageModelDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_replicas',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                    inspect.Parameter(
+                        name='rank',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=invalid_input,
+                    max_seq_len=-1,
+                    max_tokens=10,
+                    seed=1,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of '
+                '`lmp.dataset.LanguageModelDataset`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_max_seq_len(self):
+        r"""Raise exception when input `max_seq_len` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_seq_len` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=invalid_input,
+                    max_tokens=10,
+                    seed=1,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be greater than `1` or equal to `-1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_max_tokens(self):
+        r"""Raise exception when input `max_tokens` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_tokens` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    max_tokens=invalid_input,
+                    seed=1,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_num_replicas(self):
+        r"""Raise exception when input `num_replicas` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_replicas` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    max_tokens=10,
+                    seed=1,
+                    tokenizer=self.tokenizer,
+                    num_replicas=invalid_input,
+                    rank=0
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_replicas` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertIn(
+                    ctx_man.exception.args[0],
+                    (
+                        '`num_replicas` must be bigger than or equal to `1`.',
+                        '`rank` must be bigger than or equal to `0` and '
+                        'smaller than `num_replicas`.',
+                    ),
+                    msg=msg2
+                )
+
+    def test_invalid_input_rank(self):
+        r"""Raise exception when input `rank` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `rank` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            True, 2, 3, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    max_tokens=10,
+                    seed=1,
+                    tokenizer=self.tokenizer,
+                    num_replicas=1,
+                    rank=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`rank` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`rank` must be bigger than or equal to `0` and smaller '
+                    'than `num_replicas`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    max_tokens=10,
+                    seed=invalid_input,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    max_tokens=10,
+                    seed=1,
+                    tokenizer=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        examples = (
+            (-1, 10, [3, 4, 5], [2, 1]),
+            (4, 10, [3, 4, 4], [2, 1]),
+            (-1, 1, [3, 4, 5], [1, 1, 1]),
+        )
+
+        for max_seq_len, max_tokens, lengths, batch_sizes in examples:
+            sampler = TokenBudgetBatchSampler(
+                dataset=self.dataset,
+                max_seq_len=max_seq_len,
+                max_tokens=max_tokens,
+                seed=1,
+                tokenizer=self.tokenizer
+            )
+
+            self.assertEqual(sampler.epoch, 0, msg=msg.format('epoch', 0))
+            self.assertEqual(
+                sampler.lengths.tolist(),
+                lengths,
+                msg=msg.format('lengths', lengths)
+            )
+            self.assertEqual(
+                sampler.batch_sizes,
+                batch_sizes,
+                msg=msg.format('batch_sizes', batch_sizes)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+r"""Test `lmp.dataset.TokenBudgetBatchSampler.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._token_budget_batch_sampler.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Generator
+from typing import Iterable
+from typing import List
+
+# self-made modules
+
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+from lmp.dataset._token_budget_batch_sampler import TokenBudgetBatchSampler
+from lmp.tokenizer import CharDictTokenizer
+from lmp.tokenizer import WhitespaceListTokenizer
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.TokenBudgetBatchSampler.__iter__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.dataset = LanguageModelDataset([
+            'a' * length
+            for length in range(1, 30)
+            for _ in range(3)
+        ])
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.dataset
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(TokenBudgetBatchSampler.__iter__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Generator[List[int], None, None]
+            ),
+            msg=msg
+        )
+
+    def test_yield_value(self):
+        r"""Is an iterable which yield every index once within budget."""
+        msg = 'Must be an iterable which yield every index once within budget.'
+        examples = (
+            (-1, 1),
+            (-1, 32),
+            (10, 32),
+            (-1, 100),
+            (16, 100),
+        )
+
+        for max_seq_len, max_tokens in examples:
+            sampler = TokenBudgetBatchSampler(
+                dataset=self.dataset,
+                max_seq_len=max_seq_len,
+                max_tokens=max_tokens,
+                seed=1,
+                tokenizer=CharDictTokenizer()
+            )
+
+            self.assertIsInstance(sampler, Iterable, msg=msg)
+
+            for _ in range(2):
+                indices = []
+                for batch in sampler:
+                    self.assertIsInstance(batch, list, msg=msg)
+                    indices.extend(batch)
+
+                    batch_tokens = len(batch) * max(
+                        sampler.lengths[index].item()
+                        for index in batch
+                    )
+                    self.assertTrue(
+                        len(batch) == 1 or batch_tokens <= max_tokens,
+                        msg=msg
+                    )
+
+                self.assertEqual(
+                    sorted(indices),
+                    list(range(len(self.dataset))),
+                    msg=msg
+                )
+
+    def test_shard(self):
+        r"""Split the same mini-batches across processes."""
+        msg = 'Must split the same mini-batches across processes.'
+
+        for num_replicas in (1, 2, 3, 4):
+            sampler = TokenBudgetBatchSampler(
+                dataset=self.dataset,
+                max_seq_len=-1,
+                max_tokens=32,
+                seed=1,
+                tokenizer=CharDictTokenizer()
+            )
+            shards = [
+                TokenBudgetBatchSampler(
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    max_tokens=32,
+                    seed=1,
+                    tokenizer=CharDictTokenizer(),
+                    num_replicas=num_replicas,
+                    rank=rank
+                )
+                for rank in range(num_replicas)
+            ]
+
+            for _ in range(2):
+                batches = list(sampler)
+                shard_batches = [list(shard) for shard in shards]
+
+                # Every process get the same number of mini-batches.
+                for batches_of_rank in shard_batches:
+                    self.assertEqual(
+                        len(batches_of_rank),
+                        len(shard_batches[0]),
+                        msg=msg
+                    )
+
+                # Interleaving shards recover mini-batches of single process
+                # (followed by padding).
+                interleaved = [
+                    batch
+                    for batches_of_step in zip(*shard_batches)
+                    for batch in batches_of_step
+                ]
+                self.assertEqual(
+                    interleaved[:len(batches)],
+                    batches,
+                    msg=msg
+                )
+
+    def test_reproducible(self):
+        r"""Yield the same mini-batches given the same seed and epoch."""
+        msg = 'Must yield the same mini-batches given the same seed and epoch.'
+
+        sampler_1 = TokenBudgetBatchSampler(
+            dataset=self.dataset,
+            max_seq_len=-1,
+            max_tokens=64,
+            seed=42,
+            tokenizer=WhitespaceListTokenizer()
+        )
+        sampler_2 = TokenBudgetBatchSampler(
+            dataset=self.dataset,
+            max_seq_len=-1,
+            max_tokens=64,
+            seed=42,
+            tokenizer=WhitespaceListTokenizer()
+        )
+
+        for _ in range(3):
+            self.assertEqual(list(sampler_1), list(sampler_2), msg=msg)
+
+        self.assertEqual(sampler_1.epoch, 3, msg=msg)
+
+        sampler_1.set_epoch(1)
+        sampler_2.set_epoch(1)
+        self.assertEqual(list(sampler_1), list(sampler_2), msg=msg)
+
+        sampler_2.set_epoch(0)
+        self.assertNotEqual(list(sampler_1), list(sampler_2), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
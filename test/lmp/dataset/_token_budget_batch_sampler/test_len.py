@@ -0,0 +1,101 @@
+r"""Test `lmp.dataset.TokenBudgetBatchSampler.__len__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._token_budget_batch_sampler.test_len
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+# self-made modules
+
+from lmp.dataset._language_model_dataset import LanguageModelDataset
+from lmp.dataset._token_budget_batch_sampler import TokenBudgetBatchSampler
+from lmp.tokenizer import CharDictTokenizer
+
+
+class TestLen(unittest.TestCase):
+    r"""Test case for `lmp.dataset.TokenBudgetBatchSampler.__len__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(TokenBudgetBatchSampler.__len__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_return_number_of_sharded_batches(self):
+        r"""Return number of mini-batches of each process in every epoch."""
+        msg = (
+            'Must return number of mini-batches of each process in every '
+            'epoch.'
+        )
+        examples = (
+            (['a', 'ab', 'abc'], 1, 2, 2),
+            (['a', 'ab', 'abc'], 1, 3, 1),
+            (['a', 'ab', 'abc'], 1, 4, 1),
+            (['abc'] * 10, 5, 3, 4),
+            ([], 10, 2, 0),
+        )
+
+        for batch_sequences, max_tokens, num_replicas, ans_len in examples:
+            for rank in range(num_replicas):
+                sampler = TokenBudgetBatchSampler(
+                    dataset=LanguageModelDataset(batch_sequences),
+                    max_seq_len=-1,
+                    max_tokens=max_tokens,
+                    seed=1,
+                    tokenizer=CharDictTokenizer(),
+                    num_replicas=num_replicas,
+                    rank=rank
+                )
+
+                self.assertEqual(len(sampler), ans_len, msg=msg)
+                self.assertEqual(len(list(sampler)), ans_len, msg=msg)
+
+    def test_return_number_of_batches(self):
+        r"""Return number of mini-batches in every epoch."""
+        msg = 'Must return number of mini-batches in every epoch.'
+        examples = (
+            (['a', 'ab', 'abc'], 10, 2),
+            (['a', 'ab', 'abc'], 1, 3),
+            (['a', 'ab', 'abc'], 100, 1),
+            (['abc'] * 10, 25, 2),
+            ([], 10, 0),
+        )
+
+        for batch_sequences, max_tokens, ans_len in examples:
+            sampler = TokenBudgetBatchSampler(
+                dataset=LanguageModelDataset(batch_sequences),
+                max_seq_len=-1,
+                max_tokens=max_tokens,
+                seed=1,
+                tokenizer=CharDictTokenizer()
+            )
+
+            for _ in range(3):
+                self.assertEqual(len(sampler), ans_len, msg=msg)
+                self.assertEqual(len(list(sampler)), ans_len, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -72,6 +72,35 @@ class TestModel(unittest.TestCase):
         except ImportError:
             self.fail(msg=msg3)
 
+    def test_module_functions(self):
+        r"""Declare required module functions."""
+        msg1 = 'Missing module attribute `{}`.'
+        msg2 = 'Module attribute `{}` must be a function.'
+        msg3 = 'Inconsistent module signature.'
+        examples = (
+            'concat_state',
+            'reorder_state',
+            'select_state',
+        )
+
+        try:
+            # pylint: disable=C0415
+            import lmp
+            import lmp.model
+            # pylint: enable=C0415
+
+            for attr in examples:
+                self.assertTrue(
+                    hasattr(lmp.model, attr),
+                    msg=msg1.format(attr)
+                )
+                self.assertTrue(
+                    inspect.isfunction(getattr(lmp.model, attr)),
+                    msg=msg2.format(attr)
+                )
+        except ImportError:
+            self.fail(msg=msg3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -181,5 +181,38 @@ class TestPredict(unittest.TestCase):
             self.assertEqual(pred.size(-1), vocab_size)
 
 
+    def test_adaptive_softmax(self):
+        r"""Predict with adaptive softmax output layer."""
+        msg = 'Must return probabilities of adaptive softmax output layer.'
+
+        model = BaseResRNNModel(
+            d_emb=16,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=10,
+            adaptive_softmax_cutoffs=[2, 5]
+        )
+        x = torch.randint(0, 10, (2, 3))
+        pred = model.predict(x)
+
+        self.assertEqual(pred.size(), torch.Size([2, 3, 10]), msg=msg)
+        self.assertTrue(
+            torch.allclose(pred.sum(dim=-1), torch.ones(2, 3)),
+            msg=msg
+        )
+        self.assertTrue(
+            torch.allclose(
+                pred,
+                model.adaptive_softmax.log_prob(
+                    model.hidden_states(x).reshape(-1, 16)
+                ).exp().reshape(2, 3, 10)
+            ),
+            msg=msg
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,8 @@ import inspect
 import math
 import unittest
 
+from typing import Sequence
+
 # 3rd-party modules
 
 import torch
@@ -149,6 +151,12 @@ class TestInit(unittest.TestCase):
                         annotation=int,
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='adaptive_softmax_cutoffs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[int],
+                        default=()
+                    ),
                 ],
                 return_annotation=inspect.Signature.empty
             ),
@@ -467,6 +475,51 @@ class TestInit(unittest.TestCase):
                 msg=msg2
             )
 
+    def test_invalid_input_adaptive_softmax_cutoffs(self):
+        r"""Raise exception when `adaptive_softmax_cutoffs` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`adaptive_softmax_cutoffs` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., (0.0,), [1j], ('1',), (None,),
+            (0,), [-1], (5,), [1, 10], (2, 1), [1, 1], (1, 3, 2),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseRNNModel(
+                    d_emb=1,
+                    d_hid=1,
+                    dropout=0.1,
+                    num_linear_layers=1,
+                    num_rnn_layers=1,
+                    pad_token_id=0,
+                    vocab_size=5,
+                    adaptive_softmax_cutoffs=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`adaptive_softmax_cutoffs` must be an instance of '
+                    '`Sequence[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`adaptive_softmax_cutoffs` must be strictly increasing '
+                    'and range from `1` to `vocab_size - 1`.',
+                    msg=msg2
+                )
+
     def test_inherit(self):
         r""""Is subclass of `torch.nn.Module`."""
         msg = 'Must be subclass of `torch.nn.Module`.'
@@ -622,5 +675,37 @@ class TestInit(unittest.TestCase):
             self.assertEqual(proj_layer[-1].p, dropout, msg=msg)
 
 
+    def test_adaptive_softmax(self):
+        r"""Declare adaptive softmax output layer only when cutoffs given."""
+        msg = 'Must declare correct adaptive softmax output layer.'
+
+        for model_obj in self.model_objs:
+            self.assertIsNone(model_obj['model'].adaptive_softmax, msg=msg)
+
+        for cutoffs in ([2], (2, 5), [1, 3]):
+            model = BaseRNNModel(
+                d_emb=16,
+                d_hid=8,
+                dropout=0.1,
+                num_linear_layers=1,
+                num_rnn_layers=1,
+                pad_token_id=0,
+                vocab_size=10,
+                adaptive_softmax_cutoffs=cutoffs
+            )
+            self.assertIsInstance(
+                model.adaptive_softmax,
+                torch.nn.AdaptiveLogSoftmaxWithLoss,
+                msg=msg
+            )
+            self.assertEqual(model.adaptive_softmax.in_features, 16, msg=msg)
+            self.assertEqual(model.adaptive_softmax.n_classes, 10, msg=msg)
+            self.assertEqual(
+                model.adaptive_softmax.cutoffs,
+                [*cutoffs, 10],
+                msg=msg
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,193 @@
+r"""Test `lmp.model.BaseRNNModel.loss`.
+
+Usage:
+    python -m unittest test.lmp.model._base_rnn_model.test_loss
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import BaseRNNModel
+
+
+class TestLoss(unittest.TestCase):
+    r"""Test case for `lmp.model.BaseRNNModel.loss`."""
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `BaseRNNModel`."""
+        torch.manual_seed(1)
+        self.model = BaseRNNModel(
+            d_emb=4,
+            d_hid=6,
+            dropout=0.0,
+            num_linear_layers=2,
+            num_rnn_layers=2,
+            pad_token_id=0,
+            vocab_size=10
+        )
+        self.x = torch.randint(0, 10, (3, 5))
+        self.y = torch.randint(0, 10, (3, 5))
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model
+        del self.x
+        del self.y
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(BaseRNNModel.loss),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_next_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='chunk_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=128
+                    ),
+                ],
+                return_annotation=torch.Tensor
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sequences(self):
+        r"""Raise `TypeError` when input `batch_sequences` is invalid."""
+        msg = 'Must raise `TypeError` when input `batch_sequences` is invalid.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg):
+                self.model.loss(
+                    batch_sequences=invalid_input,
+                    batch_next_tokens=self.y
+                )
+
+    def test_invalid_input_batch_next_tokens(self):
+        r"""Raise `TypeError` when input `batch_next_tokens` is invalid."""
+        msg = (
+            'Must raise `TypeError` when input `batch_next_tokens` is invalid.'
+        )
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg):
+                self.model.loss(
+                    batch_sequences=self.x,
+                    batch_next_tokens=invalid_input
+                )
+
+    def test_consistent_with_forward(self):
+        r"""Loss and gradients are the same as cross-entropy on logits."""
+        msg = 'Loss and gradients must be the same as cross-entropy on logits.'
+
+        expected_loss = torch.nn.functional.cross_entropy(
+            self.model(self.x).reshape(-1, 10),
+            self.y.reshape(-1)
+        )
+        expected_grads = torch.autograd.grad(
+            expected_loss,
+            list(self.model.parameters())
+        )
+
+        for chunk_size in (1, 4, 15, 128):
+            loss = self.model.loss(
+                batch_sequences=self.x,
+                batch_next_tokens=self.y,
+                chunk_size=chunk_size
+            )
+            grads = torch.autograd.grad(loss, list(self.model.parameters()))
+
+            self.assertTrue(torch.allclose(loss, expected_loss), msg=msg)
+            for grad, expected_grad in zip(grads, expected_grads):
+                self.assertTrue(
+                    torch.allclose(grad, expected_grad, atol=1e-6),
+                    msg=msg
+                )
+
+
+    def test_adaptive_softmax_consistent_with_forward(self):
+        r"""Adaptive softmax loss is the same as cross-entropy on logits."""
+        msg = 'Loss and gradients must be the same as cross-entropy on logits.'
+
+        torch.manual_seed(1)
+        model = BaseRNNModel(
+            d_emb=16,
+            d_hid=6,
+            dropout=0.0,
+            num_linear_layers=2,
+            num_rnn_layers=2,
+            pad_token_id=0,
+            vocab_size=10,
+            adaptive_softmax_cutoffs=[3, 6]
+        )
+        # Make sure every cluster contains targets.
+        y = torch.arange(15).reshape(3, 5) % 10
+
+        expected_loss = torch.nn.functional.cross_entropy(
+            model(self.x).reshape(-1, 10),
+            y.reshape(-1)
+        )
+        expected_grads = torch.autograd.grad(
+            expected_loss,
+            list(model.parameters())
+        )
+
+        loss = model.loss(batch_sequences=self.x, batch_next_tokens=y)
+        grads = torch.autograd.grad(loss, list(model.parameters()))
+
+        self.assertTrue(torch.allclose(loss, expected_loss), msg=msg)
+        for grad, expected_grad in zip(grads, expected_grads):
+            self.assertTrue(
+                torch.allclose(grad, expected_grad, atol=1e-6),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
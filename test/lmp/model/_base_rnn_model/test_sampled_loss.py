@@ -0,0 +1,197 @@
+r"""Test `lmp.model.BaseRNNModel.sampled_loss`.
+
+Usage:
+    python -m unittest test.lmp.model._base_rnn_model.test_sampled_loss
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import BaseRNNModel
+from lmp.model._sampled_softmax import sampled_softmax_loss
+
+
+class TestSampledLoss(unittest.TestCase):
+    r"""Test case for `lmp.model.BaseRNNModel.sampled_loss`."""
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `BaseRNNModel`."""
+        torch.manual_seed(1)
+        self.model = BaseRNNModel(
+            d_emb=4,
+            d_hid=6,
+            dropout=0.0,
+            num_linear_layers=2,
+            num_rnn_layers=2,
+            pad_token_id=0,
+            vocab_size=10
+        )
+        self.noise_probs = torch.full((10,), 0.1)
+        self.x = torch.randint(0, 10, (3, 5))
+        self.y = torch.randint(0, 10, (3, 5))
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model
+        del self.noise_probs
+        del self.x
+        del self.y
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(BaseRNNModel.sampled_loss),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_next_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='noise_probs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=torch.Tensor
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sequences(self):
+        r"""Raise `TypeError` when input `batch_sequences` is invalid."""
+        msg = 'Must raise `TypeError` when input `batch_sequences` is invalid.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg):
+                self.model.sampled_loss(
+                    batch_sequences=invalid_input,
+                    batch_next_tokens=self.y,
+                    noise_probs=self.noise_probs,
+                    num_samples=4
+                )
+
+    def test_invalid_input_batch_next_tokens(self):
+        r"""Raise `TypeError` when input `batch_next_tokens` is invalid."""
+        msg = (
+            'Must raise `TypeError` when input `batch_next_tokens` is invalid.'
+        )
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg):
+                self.model.sampled_loss(
+                    batch_sequences=self.x,
+                    batch_next_tokens=invalid_input,
+                    noise_probs=self.noise_probs,
+                    num_samples=4
+                )
+
+    def test_adaptive_softmax(self):
+        r"""Raise `ValueError` when using adaptive softmax."""
+        msg1 = 'Must raise `ValueError` when using adaptive softmax.'
+        msg2 = 'Inconsistent error message.'
+
+        model = BaseRNNModel(
+            d_emb=16,
+            d_hid=6,
+            dropout=0.0,
+            num_linear_layers=2,
+            num_rnn_layers=2,
+            pad_token_id=0,
+            vocab_size=10,
+            adaptive_softmax_cutoffs=[3, 6]
+        )
+
+        with self.assertRaises(ValueError, msg=msg1) as ctx_man:
+            model.sampled_loss(
+                batch_sequences=self.x,
+                batch_next_tokens=self.y,
+                noise_probs=self.noise_probs,
+                num_samples=4
+            )
+
+        self.assertEqual(
+            ctx_man.exception.args[0],
+            'Sampled softmax does not support adaptive softmax output layer.',
+            msg=msg2
+        )
+
+    def test_consistent_with_sampled_softmax_loss(self):
+        r"""Compute sampled softmax loss on hidden states."""
+        msg = 'Must compute sampled softmax loss on hidden states.'
+
+        torch.manual_seed(2)
+        loss = self.model.sampled_loss(
+            batch_sequences=self.x,
+            batch_next_tokens=self.y,
+            noise_probs=self.noise_probs,
+            num_samples=4
+        )
+
+        torch.manual_seed(2)
+        expected_loss = sampled_softmax_loss(
+            hidden=self.model.hidden_states(self.x),
+            weight=self.model.emb_layer.weight,
+            target=self.y,
+            noise_probs=self.noise_probs,
+            num_samples=4
+        )
+
+        self.assertTrue(torch.allclose(loss, expected_loss), msg=msg)
+
+        loss.backward()
+        for param in self.model.parameters():
+            self.assertIsNotNone(param.grad, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
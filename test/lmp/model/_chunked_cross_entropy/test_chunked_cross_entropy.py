@@ -0,0 +1,181 @@
+r"""Test `lmp.model._chunked_cross_entropy.chunked_cross_entropy`.
+
+Usage:
+    python -m unittest \
+        test.lmp.model._chunked_cross_entropy.test_chunked_cross_entropy
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.nn.functional
+
+# self-made modules
+
+from lmp.model._chunked_cross_entropy import chunked_cross_entropy
+
+
+class TestChunkedCrossEntropy(unittest.TestCase):
+    r"""Test case for `chunked_cross_entropy`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        torch.manual_seed(1)
+        self.hidden = torch.randn(2, 5, 3, requires_grad=True)
+        self.weight = torch.randn(7, 3, requires_grad=True)
+        self.target = torch.randint(0, 7, (2, 5))
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.hidden
+        del self.target
+        del self.weight
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(chunked_cross_entropy),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='hidden',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='weight',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='target',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='chunk_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=torch.Tensor
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_tensors(self):
+        r"""Raise `TypeError` when input tensors are invalid."""
+        msg1 = 'Must raise `TypeError` when input tensors are invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for name in ('hidden', 'weight', 'target'):
+            for invalid_input in examples:
+                kwargs = {
+                    'hidden': self.hidden,
+                    'weight': self.weight,
+                    'target': self.target,
+                    'chunk_size': 1,
+                }
+                kwargs[name] = invalid_input
+
+                with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                    chunked_cross_entropy(**kwargs)
+
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    f'`{name}` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_chunk_size(self):
+        r"""Raise exception when input `chunk_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `chunk_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                chunked_cross_entropy(
+                    hidden=self.hidden,
+                    weight=self.weight,
+                    target=self.target,
+                    chunk_size=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`chunk_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`chunk_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_consistent_with_cross_entropy(self):
+        r"""Loss and gradients are the same as full cross-entropy."""
+        msg = 'Loss and gradients must be the same as full cross-entropy.'
+
+        expected_loss = torch.nn.functional.cross_entropy(
+            self.hidden.matmul(self.weight.transpose(0, 1)).reshape(-1, 7),
+            self.target.reshape(-1)
+        )
+        expected_grads = torch.autograd.grad(
+            expected_loss,
+            (self.hidden, self.weight)
+        )
+
+        for chunk_size in (1, 3, 10, 11, 100):
+            loss = chunked_cross_entropy(
+                hidden=self.hidden,
+                weight=self.weight,
+                target=self.target,
+                chunk_size=chunk_size
+            )
+            grads = torch.autograd.grad(loss, (self.hidden, self.weight))
+
+            self.assertTrue(torch.allclose(loss, expected_loss), msg=msg)
+            for grad, expected_grad in zip(grads, expected_grads):
+                self.assertTrue(
+                    torch.allclose(grad, expected_grad, atol=1e-6),
+                    msg=msg
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
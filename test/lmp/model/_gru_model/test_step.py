@@ -0,0 +1,173 @@
+r"""Test `lmp.model.GRUModel.step`.
+
+Usage:
+    python -m unittest test.lmp.model._gru_model.test_step
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Optional
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import GRUModel
+
+
+class TestStep(unittest.TestCase):
+    r"""Test case for `lmp.model.GRUModel.step`."""
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `GRUModel`."""
+        torch.manual_seed(1)
+        self.model = GRUModel(
+            d_emb=16,
+            d_hid=6,
+            dropout=0.0,
+            num_linear_layers=2,
+            num_rnn_layers=2,
+            pad_token_id=0,
+            vocab_size=10
+        )
+        self.model.eval()
+        self.x = torch.randint(0, 10, (3, 5))
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model
+        del self.x
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(GRUModel.step),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='state',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[Tuple[torch.Tensor, ...]],
+                        default=None
+                    ),
+                ],
+                return_annotation=Tuple[
+                    torch.Tensor,
+                    Tuple[torch.Tensor, ...]
+                ]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sequences(self):
+        r"""Raise `TypeError` when input `batch_sequences` is invalid."""
+        msg = 'Must raise `TypeError` when input `batch_sequences` is invalid.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg):
+                self.model.step(batch_sequences=invalid_input)
+
+    def test_invalid_input_state(self):
+        r"""Raise `TypeError` when input `state` is invalid."""
+        msg = 'Must raise `TypeError` when input `state` is invalid.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', [], {}, set(), object(), lambda x: x,
+            type, NotImplemented, ..., torch.zeros(2, 3, 6),
+            (torch.zeros(2, 3, 6), None),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg):
+                self.model.step(batch_sequences=self.x, state=invalid_input)
+
+    def test_return_type(self):
+        r"""Return last token logits and recurrent state."""
+        msg = 'Must return last token logits and recurrent state.'
+
+        logits, state = self.model.step(batch_sequences=self.x)
+
+        self.assertIsInstance(logits, torch.Tensor, msg=msg)
+        self.assertEqual(logits.size(), torch.Size([3, 10]), msg=msg)
+        self.assertIsInstance(state, tuple, msg=msg)
+        self.assertEqual(len(state), 1, msg=msg)
+        for tensor in state:
+            self.assertIsInstance(tensor, torch.Tensor, msg=msg)
+            self.assertEqual(tensor.size(), torch.Size([2, 3, 6]), msg=msg)
+
+    def test_consistent_with_forward(self):
+        r"""Logits are the same as `forward` on whole sequences."""
+        msg = 'Logits must be the same as `forward` on whole sequences.'
+
+        for cutoffs in ((), (3, 6)):
+            torch.manual_seed(1)
+            model = GRUModel(
+                d_emb=16,
+                d_hid=6,
+                dropout=0.0,
+                num_linear_layers=2,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=10,
+                adaptive_softmax_cutoffs=cutoffs
+            )
+            model.eval()
+            expected_logits = model(self.x)
+
+            # Feed first two tokens at once, then one token at a time.
+            logits, state = model.step(batch_sequences=self.x[:, :2])
+            self.assertTrue(
+                torch.allclose(logits, expected_logits[:, 1], atol=1e-6),
+                msg=msg
+            )
+
+            for index in range(2, self.x.size(-1)):
+                logits, state = model.step(
+                    batch_sequences=self.x[:, index:index + 1],
+                    state=state
+                )
+                self.assertTrue(
+                    torch.allclose(
+                        logits,
+                        expected_logits[:, index],
+                        atol=1e-6
+                    ),
+                    msg=msg
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
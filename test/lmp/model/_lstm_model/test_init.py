@@ -16,6 +16,8 @@ import inspect
 import math
 import unittest
 
+from typing import Sequence
+
 # 3rd-party modules
 
 import torch
@@ -150,6 +152,12 @@ class TestInit(unittest.TestCase):
                         annotation=int,
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='adaptive_softmax_cutoffs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[int],
+                        default=()
+                    ),
                 ],
                 return_annotation=inspect.Signature.empty
             ),
@@ -0,0 +1,117 @@
+r"""Test `lmp.model.ResGRUBlock.step`.
+
+Usage:
+    python -m unittest test.lmp.model._res_gru_block.test_step
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import unittest
+
+from typing import Optional
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import ResGRUBlock
+
+
+class TestStep(unittest.TestCase):
+    r"""Test case for `lmp.model.ResGRUBlock.step`."""
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `ResGRUBlock`."""
+        torch.manual_seed(1)
+        self.model = ResGRUBlock(d_hid=6, dropout=0.0)
+        self.x = torch.rand(3, 5, 6)
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model
+        del self.x
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResGRUBlock.step),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='x',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='state',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[Tuple[torch.Tensor, ...]],
+                        default=None
+                    ),
+                ],
+                return_annotation=Tuple[
+                    torch.Tensor,
+                    Tuple[torch.Tensor, ...]
+                ]
+            ),
+            msg=msg
+        )
+
+    def test_return_type(self):
+        r"""Return output tensors and recurrent state."""
+        msg = 'Must return output tensors and recurrent state.'
+
+        out, state = self.model.step(x=self.x)
+
+        self.assertIsInstance(out, torch.Tensor, msg=msg)
+        self.assertEqual(out.size(), self.x.size(), msg=msg)
+        self.assertIsInstance(state, tuple, msg=msg)
+        self.assertEqual(len(state), 1, msg=msg)
+        for tensor in state:
+            self.assertIsInstance(tensor, torch.Tensor, msg=msg)
+            self.assertEqual(tensor.size(), torch.Size([1, 3, 6]), msg=msg)
+
+    def test_consistent_with_forward(self):
+        r"""Output is the same as `forward` on whole sequences."""
+        msg = 'Output must be the same as `forward` on whole sequences.'
+
+        expected_out = self.model(self.x)
+
+        state = None
+        for index in range(self.x.size(1)):
+            out, state = self.model.step(
+                x=self.x[:, index:index + 1],
+                state=state
+            )
+            self.assertTrue(
+                torch.allclose(
+                    out,
+                    expected_out[:, index:index + 1],
+                    atol=1e-6
+                ),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
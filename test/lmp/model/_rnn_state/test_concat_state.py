@@ -0,0 +1,125 @@
+r"""Test `lmp.model.concat_state`.
+
+Usage:
+    python -m unittest test.lmp.model._rnn_state.test_concat_state
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Sequence
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import concat_state
+
+
+class TestConcatState(unittest.TestCase):
+    r"""Test case for `lmp.model.concat_state`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        torch.manual_seed(1)
+        self.states = [
+            (torch.rand(2, 3, 4), torch.rand(2, 3, 4)),
+            (torch.rand(2, 1, 4), torch.rand(2, 1, 4)),
+        ]
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.states
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(concat_state),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='states',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[Tuple[torch.Tensor, ...]],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Tuple[torch.Tensor, ...]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_states(self):
+        r"""Raise exception when input `states` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `states` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., torch.rand(2, 3),
+            [torch.rand(2, 3)], [()], [(torch.rand(2, 3), None)],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                concat_state(states=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertIn(
+                    ctx_man.exception.args[0],
+                    (
+                        '`states` must be an instance of '
+                        '`Sequence[Tuple[Tensor, ...]]`.',
+                        '`state` must be an instance of '
+                        '`Tuple[Tensor, ...]`.',
+                    ),
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`states` must not be empty.',
+                    msg=msg2
+                )
+
+    def test_concat(self):
+        r"""Concatenate each tensor along batch dimension."""
+        msg = 'Must concatenate each tensor along batch dimension.'
+
+        state = concat_state(states=self.states)
+
+        self.assertIsInstance(state, tuple, msg=msg)
+        self.assertEqual(len(state), 2, msg=msg)
+        for index, tensor in enumerate(state):
+            self.assertEqual(tensor.size(), torch.Size([2, 4, 4]), msg=msg)
+            self.assertTrue(
+                torch.equal(tensor[:, :3], self.states[0][index]),
+                msg=msg
+            )
+            self.assertTrue(
+                torch.equal(tensor[:, 3:], self.states[1][index]),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+r"""Test `lmp.model.reorder_state`.
+
+Usage:
+    python -m unittest test.lmp.model._rnn_state.test_reorder_state
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import reorder_state
+
+
+class TestReorderState(unittest.TestCase):
+    r"""Test case for `lmp.model.reorder_state`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        torch.manual_seed(1)
+        self.state = (torch.rand(2, 3, 4), torch.rand(2, 3, 4))
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.state
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(reorder_state),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='state',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Tuple[torch.Tensor, ...],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='index',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Tuple[torch.Tensor, ...]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_state(self):
+        r"""Raise `TypeError` when input `state` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `state` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., torch.rand(2, 3),
+            [torch.rand(2, 3)], (torch.rand(2, 3), None),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                reorder_state(
+                    state=invalid_input,
+                    index=torch.tensor([0])
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`state` must be an instance of `Tuple[Tensor, ...]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_index(self):
+        r"""Raise `TypeError` when input `index` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `index` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                reorder_state(state=self.state, index=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`index` must be an instance of `Tensor`.',
+                msg=msg2
+            )
+
+    def test_reorder(self):
+        r"""Gather each tensor along batch dimension."""
+        msg = 'Must gather each tensor along batch dimension.'
+        examples = (
+            [0, 1, 2],
+            [2, 1, 0],
+            [1],
+            [0, 0, 2, 2],
+            [],
+        )
+
+        for index in examples:
+            state = reorder_state(
+                state=self.state,
+                index=torch.tensor(index, dtype=torch.int64)
+            )
+
+            self.assertIsInstance(state, tuple, msg=msg)
+            self.assertEqual(len(state), len(self.state), msg=msg)
+            for tensor, old_tensor in zip(state, self.state):
+                self.assertEqual(
+                    tensor.size(),
+                    torch.Size([2, len(index), 4]),
+                    msg=msg
+                )
+                for new_index, old_index in enumerate(index):
+                    self.assertTrue(
+                        torch.equal(
+                            tensor[:, new_index],
+                            old_tensor[:, old_index]
+                        ),
+                        msg=msg
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+r"""Test `lmp.model.select_state`.
+
+Usage:
+    python -m unittest test.lmp.model._rnn_state.test_select_state
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import select_state
+
+
+class TestSelectState(unittest.TestCase):
+    r"""Test case for `lmp.model.select_state`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        torch.manual_seed(1)
+        self.state = (torch.rand(2, 3, 4), torch.rand(2, 3, 4))
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.state
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(select_state),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='state',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Tuple[torch.Tensor, ...],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='mask',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Tuple[torch.Tensor, ...]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_state(self):
+        r"""Raise `TypeError` when input `state` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `state` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., torch.rand(2, 3),
+            [torch.rand(2, 3)], (torch.rand(2, 3), None),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                select_state(
+                    state=invalid_input,
+                    mask=torch.tensor([True, False, True])
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`state` must be an instance of `Tuple[Tensor, ...]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_mask(self):
+        r"""Raise exception when input `mask` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `mask` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+            torch.tensor([1, 0, 1]), torch.tensor([True, False]),
+            torch.tensor([[True, False, True]]),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                select_state(state=self.state, mask=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`mask` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`mask` must be boolean tensor with shape (B).',
+                    msg=msg2
+                )
+
+    def test_select(self):
+        r"""Keep masked sequences in order."""
+        msg = 'Must keep masked sequences in order.'
+        examples = (
+            ([True, True, True], [0, 1, 2]),
+            ([True, False, True], [0, 2]),
+            ([False, True, False], [1]),
+            ([False, False, False], []),
+        )
+
+        for mask, index in examples:
+            state = select_state(state=self.state, mask=torch.tensor(mask))
+
+            self.assertIsInstance(state, tuple, msg=msg)
+            self.assertEqual(len(state), len(self.state), msg=msg)
+            for tensor, old_tensor in zip(state, self.state):
+                self.assertTrue(
+                    torch.equal(tensor, old_tensor[:, index]),
+                    msg=msg
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+r"""Test `lmp.model._sampled_softmax.sampled_softmax_loss`.
+
+Usage:
+    python -m unittest \
+        test.lmp.model._sampled_softmax.test_sampled_softmax_loss
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.nn.functional
+
+# self-made modules
+
+from lmp.model._sampled_softmax import sampled_softmax_loss
+
+
+class TestSampledSoftmaxLoss(unittest.TestCase):
+    r"""Test case for `sampled_softmax_loss`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        torch.manual_seed(1)
+        self.hidden = torch.randn(2, 5, 3, requires_grad=True)
+        self.weight = torch.randn(7, 3, requires_grad=True)
+        self.target = torch.randint(0, 7, (2, 5))
+        self.noise_probs = torch.softmax(torch.randn(7), dim=-1)
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.hidden
+        del self.noise_probs
+        del self.target
+        del self.weight
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(sampled_softmax_loss),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='hidden',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='weight',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='target',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='noise_probs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=torch.Tensor
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_tensors(self):
+        r"""Raise `TypeError` when input tensors are invalid."""
+        msg1 = 'Must raise `TypeError` when input tensors are invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for name in ('hidden', 'weight', 'target', 'noise_probs'):
+            for invalid_input in examples:
+                kwargs = {
+                    'hidden': self.hidden,
+                    'weight': self.weight,
+                    'target': self.target,
+                    'noise_probs': self.noise_probs,
+                    'num_samples': 1,
+                }
+                kwargs[name] = invalid_input
+
+                with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                    sampled_softmax_loss(**kwargs)
+
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    f'`{name}` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_num_samples(self):
+        r"""Raise exception when input `num_samples` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_samples` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                sampled_softmax_loss(
+                    hidden=self.hidden,
+                    weight=self.weight,
+                    target=self.target,
+                    noise_probs=self.noise_probs,
+                    num_samples=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_samples` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_samples` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_log_q_correction(self):
+        r"""Score target and sampled tokens with log-Q correction."""
+        msg = 'Must score target and sampled tokens with log-Q correction.'
+
+        for num_samples in (1, 3, 10):
+            torch.manual_seed(2)
+            loss = sampled_softmax_loss(
+                hidden=self.hidden,
+                weight=self.weight,
+                target=self.target,
+                noise_probs=self.noise_probs,
+                num_samples=num_samples
+            )
+
+            # Draw the same samples.
+            torch.manual_seed(2)
+            samples = torch.multinomial(
+                self.noise_probs,
+                num_samples,
+                replacement=True
+            )
+
+            hidden = self.hidden.reshape(-1, 3)
+            target = self.target.reshape(-1)
+            log_q = (self.noise_probs * num_samples).log()
+
+            expected_losses = []
+            for h, y in zip(hidden, target):
+                logits = [h @ self.weight[y] - log_q[y]]
+                for sample in samples:
+                    # Accidental hits are removed.
+                    if sample != y:
+                        logits.append(h @ self.weight[sample] - log_q[sample])
+                logits = torch.stack(logits)
+                expected_losses.append(logits.logsumexp(dim=-1) - logits[0])
+
+            self.assertTrue(
+                torch.allclose(loss, torch.stack(expected_losses).mean()),
+                msg=msg
+            )
+
+    def test_sampled_rows_only(self):
+        r"""Only target and sampled rows of `weight` receive gradients."""
+        msg = 'Only target and sampled rows must receive gradients.'
+
+        # Only sample token `1`, `2` and `3`.
+        noise_probs = torch.tensor([0.0, 0.4, 0.4, 0.2, 0.0, 0.0, 0.0])
+        target = torch.full((2, 5), 3)
+
+        loss = sampled_softmax_loss(
+            hidden=self.hidden,
+            weight=self.weight,
+            target=target,
+            noise_probs=noise_probs,
+            num_samples=4
+        )
+        loss.backward()
+
+        self.assertTrue(torch.isfinite(loss), msg=msg)
+        self.assertTrue((self.weight.grad[[0, 4, 5, 6]] == 0).all(), msg=msg)
+        self.assertTrue((self.weight.grad[3] != 0).any(), msg=msg)
+
+    def test_accidental_hits(self):
+        r"""Remove sampled tokens equal to target."""
+        msg = 'Must remove sampled tokens equal to target.'
+
+        # Every sample is equal to target, thus only target is scored.
+        noise_probs = torch.tensor([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+        target = torch.full((2, 5), 3)
+
+        loss = sampled_softmax_loss(
+            hidden=self.hidden,
+            weight=self.weight,
+            target=target,
+            noise_probs=noise_probs,
+            num_samples=5
+        )
+
+        self.assertEqual(loss.item(), 0.0, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
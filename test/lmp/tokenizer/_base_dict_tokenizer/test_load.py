@@ -120,6 +120,11 @@ class TestLoad(unittest.TestCase):
         examples = (
             {
                 'is_uncased': False,
+                'token_freq': {
+                    'A': 3,
+                    'B': 2,
+                    'C': 1,
+                },
                 'token_to_id': {
                     'A': 0,
                     'B': 1,
@@ -156,6 +161,8 @@ class TestLoad(unittest.TestCase):
                         'is_uncased': obj['is_uncased'],
                         'token_to_id': obj['token_to_id']
                     }
+                    if 'token_freq' in obj:
+                        tmp['token_freq'] = obj['token_freq']
                     json.dump(tmp, output_file)
 
                 tokenizer = BaseDictTokenizer.load(
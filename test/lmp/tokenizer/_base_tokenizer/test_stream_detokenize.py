@@ -0,0 +1,85 @@
+r"""Test `lmp.tokenizer.BaseTokenizer.stream_detokenize`.
+
+Usage:
+    python -m unittest \
+        test.lmp.tokenizer._base_tokenizer.test_stream_detokenize
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Generator
+from typing import Iterable
+
+# self-made modules
+
+from lmp.tokenizer import BaseTokenizer
+
+
+class TestStreamDetokenize(unittest.TestCase):
+    r"""Test case for `lmp.tokenizer.BaseTokenizer.stream_detokenize`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(BaseTokenizer.stream_detokenize),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[str],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_abstract_method(self):
+        r"""Raise `NotImplementedError` when subclass did not implement."""
+        msg1 = (
+            'Must raise `NotImplementedError` when subclass did not implement.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (True, False)
+
+        # pylint: disable=W0223
+        # pylint: disable=W0231
+        class SubClassTokenizer(BaseTokenizer):
+            r"""Intented to not implement `stream_detokenize`."""
+
+            def reset_vocab(self):
+                pass
+        # pylint: enable=W0231
+        # pylint: enable=W0223
+
+        for is_uncased in examples:
+            with self.assertRaises(NotImplementedError, msg=msg1) as ctx_man:
+                SubClassTokenizer(is_uncased=is_uncased).stream_detokenize([])
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                'In class `SubClassTokenizer`: '
+                'method `stream_detokenize` not implemented yet.',
+                msg=msg2
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
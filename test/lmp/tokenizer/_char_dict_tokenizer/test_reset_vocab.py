@@ -91,5 +91,16 @@ class TestResetVocab(unittest.TestCase):
             self.assertEqual(tokenizer.id_to_token, id_to_token, msg=msg)
 
 
+    def test_reset_token_freq(self):
+        r"""Reset `token_freq`."""
+        msg = 'Must reset `token_freq`.'
+
+        for tokenizer in self.tokenizers:
+            tokenizer.build_vocab(['Hello World!', 'I am a legend.'])
+            tokenizer.reset_vocab()
+            self.assertTrue(hasattr(tokenizer, 'token_freq'), msg=msg)
+            self.assertEqual(tokenizer.token_freq, {}, msg=msg)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,216 @@
+r"""Test `lmp.tokenizer.CharDictTokenizer.stream_detokenize`.
+
+Usage:
+    python -m unittest \
+        test.lmp.tokenizer._char_dict_tokenizer.test_stream_detokenize
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unicodedata
+import unittest
+
+from typing import Generator
+from typing import Iterable
+
+# self-made modules
+
+from lmp.tokenizer import CharDictTokenizer
+
+
+class TestStreamDetokenize(unittest.TestCase):
+    r"""Test case for `lmp.tokenizer.CharDictTokenizer.stream_detokenize`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.vocab_source = [
+            'Hello World!',
+            'I am a legend.',
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.vocab_source
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup both cased and uncased tokenizer instances."""
+        self.cased_tokenizer = CharDictTokenizer()
+        self.cased_tokenizer.build_vocab(self.__class__.vocab_source)
+        self.uncased_tokenizer = CharDictTokenizer(is_uncased=True)
+        self.uncased_tokenizer.build_vocab(self.__class__.vocab_source)
+        self.tokenizers = [self.cased_tokenizer, self.uncased_tokenizer]
+
+    def tearDown(self):
+        r"""Delete both cased and uncased tokenizer instances."""
+        del self.tokenizers
+        del self.cased_tokenizer
+        del self.uncased_tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(CharDictTokenizer.stream_detokenize),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[str],
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_tokens(self):
+        r"""Raise `TypeError` when input `tokens` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokens` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, object(), lambda x: x, type, None,
+            NotImplemented, ..., [False], [True], [0], [1], [-1], [0.0], [1.0],
+            [math.nan], [-math.nan], [math.inf], [-math.inf], [0j], [1j],
+            [b''], [()], [[]], [{}], [set()], [object()], [lambda x: x],
+            [type], [None], [NotImplemented], [...], ['', False], ['', True],
+            ['', 0], ['', 1], ['', -1], ['', 0.0], ['', 1.0], ['', math.nan],
+            ['', -math.nan], ['', math.inf], ['', -math.inf], ['', 0j],
+            ['', 1j], ['', b''], ['', ()], ['', []], ['', {}], ['', set()],
+            ['', object()], ['', lambda x: x], ['', type], ['', None],
+            ['', NotImplemented], ['', ...],
+        )
+
+        for invalid_input in examples:
+            for tokenizer in self.tokenizers:
+                with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                    list(tokenizer.stream_detokenize(tokens=invalid_input))
+
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`tokens` must be an instance of `Iterable[str]`.',
+                    msg=msg2
+                )
+
+    def test_yield_type(self):
+        r"""Yield `str`."""
+        msg = 'Must yield `str`.'
+        examples = (
+            ('H', 'e', 'L', 'l', 'O', ' ', 'W', 'o', 'R', 'l', 'd', '!'),
+            (''),
+            (),
+        )
+
+        for tokens in examples:
+            for tokenizer in self.tokenizers:
+                for text in tokenizer.stream_detokenize(tokens):
+                    self.assertIsInstance(text, str, msg=msg)
+
+    def test_normalize(self):
+        r"""Concatenation of yielded texts is normalized."""
+        msg = 'Concatenation of yielded texts must be normalized.'
+        examples = (
+            (
+                (
+                    ' ', 'H', 'e', 'L', 'l', 'O', ' ',
+                    'W', 'o', 'R', 'l', 'D', '!',
+                ),
+                'HeLlO WoRlD!',
+                'hello world!',
+            ),
+            (
+                (
+                    'H', 'e', 'L', 'l', 'O', ' ',
+                    'W', 'o', 'R', 'l', 'D', '!', ' ',
+                ),
+                'HeLlO WoRlD!',
+                'hello world!',
+            ),
+            (
+                (
+                    ' ', ' ', 'H', 'e', 'L', 'l', 'O', ' ', ' ',
+                    'W', 'o', 'R', 'l', 'D', '!', ' ', ' ',
+                ),
+                'HeLlO WoRlD!',
+                'hello world!',
+            ),
+            (
+                ('０'),
+                '0',
+                '0',
+            ),
+            (
+                ('é'),
+                unicodedata.normalize('NFKC', 'é'),
+                unicodedata.normalize('NFKC', 'é'),
+            ),
+            (
+                ('０', 'é'),
+                unicodedata.normalize('NFKC', '0é'),
+                unicodedata.normalize('NFKC', '0é'),
+            ),
+            (
+                (),
+                '',
+                '',
+            ),
+        )
+
+        for tokens, cased_sequence, uncased_sequence in examples:
+            self.assertEqual(
+                ''.join(self.cased_tokenizer.stream_detokenize(tokens)),
+                cased_sequence,
+                msg=msg
+            )
+            self.assertEqual(
+                ''.join(self.uncased_tokenizer.stream_detokenize(tokens)),
+                uncased_sequence,
+                msg=msg
+            )
+
+    def test_lazy(self):
+        r"""Yield text right after each token is taken."""
+        msg = 'Must yield text right after each token is taken.'
+        tokens = ('[bos]', ' ', 'HeLlO', ' ', 'WoRlD', '!', ' ', '[eos]')
+
+        for tokenizer in self.tokenizers:
+            taken = []
+
+            def token_generator():
+                for token in tokens:
+                    taken.append(token)
+                    yield token
+
+            texts = []
+            for text in tokenizer.stream_detokenize(token_generator()):
+                self.assertEqual(len(taken), len(texts) + 1, msg=msg)
+                texts.append(text)
+
+            self.assertEqual(len(texts), len(tokens), msg=msg)
+            self.assertEqual(
+                ''.join(texts),
+                tokenizer.detokenize(tokens),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
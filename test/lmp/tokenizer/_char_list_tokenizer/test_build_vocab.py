@@ -291,5 +291,45 @@ class TestBuildVocab(unittest.TestCase):
                 )
 
 
+    def test_token_freq(self):
+        r"""Count token frequencies and add discarded ones to unknown token."""
+        msg = 'Must count token frequencies.'
+        examples = (
+            (
+                ('aab', 'a', 'c'),
+                1,
+                {'[bos]': 3, '[eos]': 3, 'a': 3, 'b': 1, 'c': 1},
+            ),
+            (
+                ('aab', 'a', 'c'),
+                2,
+                {'[bos]': 3, '[eos]': 3, 'a': 3, '[unk]': 2},
+            ),
+        )
+
+        for batch_sequences, min_count, token_freq in examples:
+            for tokenizer in self.tokenizers:
+                tokenizer.reset_vocab()
+                tokenizer.build_vocab(
+                    batch_sequences=batch_sequences,
+                    min_count=min_count
+                )
+                self.assertEqual(tokenizer.token_freq, token_freq, msg=msg)
+
+                # Frequencies accumulate when building vocabulary again.
+                tokenizer.build_vocab(
+                    batch_sequences=batch_sequences,
+                    min_count=min_count
+                )
+                self.assertEqual(
+                    tokenizer.token_freq,
+                    {
+                        token: 2 * freq
+                        for token, freq in token_freq.items()
+                    },
+                    msg=msg
+                )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -120,6 +120,11 @@ class TestLoad(unittest.TestCase):
         examples = (
             {
                 'is_uncased': False,
+                'token_freq': {
+                    'A': 3,
+                    'B': 2,
+                    'C': 1,
+                },
                 'token_to_id': {
                     'A': 0,
                     'B': 1,
@@ -73,5 +73,16 @@ class TestResetVocab(unittest.TestCase):
             self.assertEqual(tokenizer.token_to_id, token_to_id, msg=msg)
 
 
+    def test_reset_token_freq(self):
+        r"""Reset `token_freq`."""
+        msg = 'Must reset `token_freq`.'
+
+        for tokenizer in self.tokenizers:
+            tokenizer.build_vocab(['Hello World!', 'I am a legend.'])
+            tokenizer.reset_vocab()
+            self.assertTrue(hasattr(tokenizer, 'token_freq'), msg=msg)
+            self.assertEqual(tokenizer.token_freq, {}, msg=msg)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -118,7 +118,7 @@ class TestSave(unittest.TestCase):
         r"""Create `tokenizer.json`."""
         msg1 = 'Must create `tokenizer.json`.'
         msg2 = 'Inconsistent `tokenizer.json` format.'
-        examples = ('is_uncased', 'token_to_id')
+        examples = ('is_uncased', 'token_freq', 'token_to_id')
 
         test_path = os.path.join(self.__class__.test_dir, 'tokenizer.json')
         for tokenizer in self.tokenizers:
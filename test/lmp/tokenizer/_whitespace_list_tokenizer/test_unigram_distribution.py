@@ -0,0 +1,158 @@
+r"""Test `lmp.tokenizer.WhitespaceListTokenizer.unigram_distribution`.
+
+Usage:
+    python -m unittest \
+        test.lmp.tokenizer._whitespace_list_tokenizer.test_unigram_distribution
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+
+# self-made modules
+
+from lmp.tokenizer import WhitespaceListTokenizer
+
+
+class TestUnigramDistribution(unittest.TestCase):
+    r"""Test case for `lmp.tokenizer.WhitespaceListTokenizer.unigram_distribution`."""
+
+    def setUp(self):
+        r"""Setup both cased and uncased tokenizer instances."""
+        self.cased_tokenizer = WhitespaceListTokenizer()
+        self.uncased_tokenizer = WhitespaceListTokenizer(is_uncased=True)
+        self.tokenizers = [self.cased_tokenizer, self.uncased_tokenizer]
+
+    def tearDown(self):
+        r"""Delete both cased and uncased tokenizer instances."""
+        del self.tokenizers
+        del self.cased_tokenizer
+        del self.uncased_tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(WhitespaceListTokenizer.unigram_distribution),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='alpha',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=0.75
+                    ),
+                ],
+                return_annotation=List[float]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_alpha(self):
+        r"""Raise exception when input `alpha` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `alpha` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, -1.0, math.nan, -math.nan, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            for tokenizer in self.tokenizers:
+                with self.assertRaises(
+                        (TypeError, ValueError),
+                        msg=msg1
+                ) as ctx_man:
+                    tokenizer.unigram_distribution(alpha=invalid_input)
+
+                if isinstance(ctx_man.exception, TypeError):
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        '`alpha` must be an instance of `float`.',
+                        msg=msg2
+                    )
+                else:
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        '`alpha` must be bigger than or equal to `0.0`.',
+                        msg=msg2
+                    )
+
+    def test_unigram_distribution(self):
+        r"""Probabilities are proportional to smoothed token frequencies."""
+        msg = 'Probabilities must be proportional to smoothed frequencies.'
+        examples = (
+            # `[bos]` and `[eos]` appear once per sequence. `[pad]` and
+            # `[unk]` are treated as appearing once.
+            (0.0, (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)),
+            (
+                0.5,
+                (
+                    math.sqrt(3.0), math.sqrt(3.0), 1.0, 1.0, math.sqrt(3.0),
+                    1.0, 1.0,
+                ),
+            ),
+            (1.0, (3.0, 3.0, 1.0, 1.0, 3.0, 1.0, 1.0)),
+        )
+
+        for alpha, weights in examples:
+            for tokenizer in self.tokenizers:
+                tokenizer.reset_vocab()
+                tokenizer.build_vocab(['a a b', 'a', 'c'])
+
+                self.assertEqual(
+                    tokenizer.convert_token_to_id('a'),
+                    4,
+                    msg=msg
+                )
+
+                probs = tokenizer.unigram_distribution(alpha=alpha)
+                self.assertIsInstance(probs, list, msg=msg)
+                self.assertEqual(len(probs), tokenizer.vocab_size, msg=msg)
+
+                for prob, weight in zip(probs, weights):
+                    self.assertAlmostEqual(
+                        prob,
+                        weight / sum(weights),
+                        msg=msg
+                    )
+
+    def test_without_token_frequency(self):
+        r"""Return uniform distribution when no frequency is counted."""
+        msg = 'Must return uniform distribution.'
+
+        for tokenizer in self.tokenizers:
+            probs = tokenizer.unigram_distribution()
+            self.assertEqual(len(probs), tokenizer.vocab_size, msg=msg)
+
+            for prob in probs:
+                self.assertAlmostEqual(
+                    prob,
+                    1 / tokenizer.vocab_size,
+                    msg=msg
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,8 @@ class TestUtil(unittest.TestCase):
         msg3 = 'Inconsistent module signature.'
         examples = (
             'batch_perplexity_eval',
+            'generate_batch',
+            'generate_batch_by_config',
             'generate_sequence',
             'generate_sequence_by_config',
             'load_config',
@@ -53,8 +55,13 @@ class TestUtil(unittest.TestCase):
             'load_tokenizer',
             'load_tokenizer_by_config',
             'perplexity_eval',
+            'sample_batch',
+            'sample_batch_by_config',
+            'seed_worker',
             'set_seed',
             'set_seed_by_config',
+            'stream_sequence',
+            'stream_sequence_by_config',
             'train_model',
             'train_model_by_config',
             'train_tokenizer',
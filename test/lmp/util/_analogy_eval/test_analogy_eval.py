@@ -321,5 +321,66 @@ class TestAnalogyEval(unittest.TestCase):
                 self.assertGreaterEqual(score, 0.0, msg=msg)
 
 
+    def test_consistent_with_analogy_inference(self):
+        r"""Accuracy must be consistent with `analogy_inference`."""
+        msg = 'Accuracy must be consistent with `analogy_inference`.'
+        dataset = lmp.dataset.AnalogyDataset([
+            ['a', 'b', 'c', 'd', 'cat1'],
+            ['b', 'c', 'd', 'a', 'cat1'],
+            ['c', 'a', 'b', 'e', 'cat2'],
+            ['d', 'd', 'd', 'd', 'cat2'],
+            ['e', 'e', 'e', 'e', 'cat3'],
+        ])
+        tokenizer = lmp.tokenizer.WhitespaceListTokenizer()
+        tokenizer.build_vocab(['a b c d'])
+
+        for _ in range(5):
+            model = lmp.model.BaseRNNModel(
+                d_emb=2,
+                d_hid=1,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=1,
+                pad_token_id=0,
+                vocab_size=tokenizer.vocab_size
+            )
+
+            ans_per_cat = {}
+            for word_a, word_b, word_c, word_d, category in dataset:
+                pred_word_d = lmp.util.analogy_inference(
+                    device=self.device,
+                    model=model,
+                    tokenizer=tokenizer,
+                    word_a=word_a,
+                    word_b=word_b,
+                    word_c=word_c
+                )
+                for key in ('total', category):
+                    ans_per_cat.setdefault(key, [])
+                    ans_per_cat[key].append(pred_word_d == word_d)
+
+            acc_per_cat = analogy_eval(
+                dataset=dataset,
+                device=self.device,
+                model=model,
+                tokenizer=tokenizer
+            )
+
+            self.assertEqual(
+                list(acc_per_cat.keys()),
+                list(ans_per_cat.keys()),
+                msg=msg
+            )
+            for category, ans in ans_per_cat.items():
+                self.assertAlmostEqual(
+                    acc_per_cat[category],
+                    sum(ans) / len(ans),
+                    msg=msg
+                )
+
+            # Out-of-vocabulary `word_d` is always wrong.
+            self.assertEqual(acc_per_cat['cat3'], 0.0, msg=msg)
+
+
 if __name__ == '__main__':
     unittest.main()
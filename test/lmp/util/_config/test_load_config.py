@@ -72,6 +72,12 @@ class TestLoadConfig(unittest.TestCase):
         r"""Setup argparse namespace for config."""
         self.parser = argparse.ArgumentParser()
         self.parser.add_argument('--experiment', type=str)
+        self.parser.add_argument('--accumulation_steps', type=int)
+        self.parser.add_argument(
+            '--adaptive_softmax_cutoffs',
+            nargs='*',
+            type=int
+        )
         self.parser.add_argument('--batch_size', type=int)
         self.parser.add_argument('--checkpoint', type=int)
         self.parser.add_argument('--checkpoint_step', type=int)
@@ -80,17 +86,33 @@ class TestLoadConfig(unittest.TestCase):
         self.parser.add_argument('--dataset', type=str)
         self.parser.add_argument('--dropout', type=float)
         self.parser.add_argument('--epoch', type=int)
+        self.parser.add_argument('--is_compact', action='store_true')
+        self.parser.add_argument('--is_file_backed', action='store_true')
         self.parser.add_argument('--is_uncased', action='store_true')
         self.parser.add_argument('--learning_rate', type=float)
         self.parser.add_argument('--max_norm', type=float)
         self.parser.add_argument('--max_seq_len', type=int)
+        self.parser.add_argument('--max_tokens', type=int)
         self.parser.add_argument('--min_count', type=int)
         self.parser.add_argument('--model_class', type=str)
         self.parser.add_argument('--num_linear_layers', type=int)
+        self.parser.add_argument('--num_negative_samples', type=int)
+        self.parser.add_argument('--num_preprocess_workers', type=int)
         self.parser.add_argument('--num_rnn_layers', type=int)
+        self.parser.add_argument('--num_workers', type=int)
         self.parser.add_argument('--optimizer_class', type=str)
+        self.parser.add_argument('--persistent_workers', action='store_true')
+        self.parser.add_argument('--pin_memory', action='store_true')
+        self.parser.add_argument('--prefetch_batches', type=int)
+        self.parser.add_argument('--prefetch_factor', type=int)
+        self.parser.add_argument(
+            '--precision',
+            choices=['fp32', 'bf16'],
+            type=str
+        )
         self.parser.add_argument('--seed', type=int)
         self.parser.add_argument('--tokenizer_class', type=str)
+        self.parser.add_argument('--unigram_alpha', type=float)
 
     def tearDown(self):
         r"""Delete `self.parser`."""
@@ -142,6 +164,8 @@ class TestLoadConfig(unittest.TestCase):
         msg = 'Must return `lmp.config.BaseConfig`.'
         examples = (
             [
+                '--accumulation_steps', str(1),
+                '--adaptive_softmax_cutoffs', str(1), str(2),
                 '--batch_size', str(1),
                 '--checkpoint', str(1),
                 '--checkpoint_step', str(500),
@@ -154,15 +178,26 @@ class TestLoadConfig(unittest.TestCase):
                 '--learning_rate', str(1e-4),
                 '--max_norm', str(1.0),
                 '--max_seq_len', str(60),
+                '--max_tokens', str(1024),
                 '--min_count', str(1),
                 '--model_class', 'lstm',
                 '--num_linear_layers', str(1),
+                '--num_negative_samples', str(0),
+                '--num_preprocess_workers', str(0),
                 '--num_rnn_layers', str(1),
+                '--num_workers', str(2),
                 '--optimizer_class', 'adam',
+                '--persistent_workers',
+                '--prefetch_batches', str(2),
+                '--prefetch_factor', str(2),
+                '--precision', 'fp32',
                 '--seed', str(1),
                 '--tokenizer_class', 'char_dict',
+                '--unigram_alpha', str(0.5),
             ],
             [
+                '--accumulation_steps', str(2),
+                '--adaptive_softmax_cutoffs',
                 '--batch_size', str(101010),
                 '--checkpoint', str(-1),
                 '--checkpoint_step', str(999),
@@ -172,17 +207,28 @@ class TestLoadConfig(unittest.TestCase):
                 '--dropout', str(0.69420),
                 '--epoch', str(666),
                 '--experiment', 'test',
+                '--is_compact',
+                '--is_file_backed',
                 '--is_uncased',
                 '--learning_rate', str(0.42069),
                 '--max_norm', str(4.20),
                 '--max_seq_len', str(555),
+                '--max_tokens', str(2048),
                 '--min_count', str(444),
                 '--model_class', 'hello world',
                 '--num_linear_layers', str(333),
+                '--num_negative_samples', str(2),
+                '--num_preprocess_workers', str(3),
                 '--num_rnn_layers', str(222),
+                '--num_workers', str(4),
                 '--optimizer_class', 'WORLD',
+                '--pin_memory',
+                '--prefetch_batches', str(4),
+                '--prefetch_factor', str(4),
+                '--precision', 'bf16',
                 '--seed', str(111),
                 '--tokenizer_class', 'HELLO',
+                '--unigram_alpha', str(1.0),
             ],
         )
 
@@ -200,6 +246,9 @@ class TestLoadConfig(unittest.TestCase):
         examples = (
             (
                 [
+                    '--accumulation_steps', str(cls.config.accumulation_steps),
+                    '--adaptive_softmax_cutoffs',
+                    *map(str, cls.config.adaptive_softmax_cutoffs),
                     '--batch_size', str(cls.config.batch_size),
                     '--checkpoint', str(1),
                     '--checkpoint_step', str(cls.config.checkpoint_step),
@@ -212,15 +261,29 @@ class TestLoadConfig(unittest.TestCase):
                     '--learning_rate', str(cls.config.learning_rate),
                     '--max_norm', str(cls.config.max_norm),
                     '--max_seq_len', str(cls.config.max_seq_len),
+                    '--max_tokens', str(cls.config.max_tokens),
                     '--min_count', str(cls.config.min_count),
                     '--model_class', cls.config.model_class,
                     '--num_linear_layers', str(cls.config.num_linear_layers),
+                    '--num_negative_samples',
+                    str(cls.config.num_negative_samples),
+                    '--num_preprocess_workers',
+                    str(cls.config.num_preprocess_workers),
                     '--num_rnn_layers', str(cls.config.num_rnn_layers),
+                    '--num_workers', str(cls.config.num_workers),
                     '--optimizer_class', cls.config.optimizer_class,
+                    '--prefetch_batches', str(cls.config.prefetch_batches),
+                    '--prefetch_factor', str(cls.config.prefetch_factor),
+                    '--precision', cls.config.precision,
                     '--seed', str(cls.config.seed),
                     '--tokenizer_class', cls.config.tokenizer_class,
+                    '--unigram_alpha', str(cls.config.unigram_alpha),
                 ],
                 {
+                    'accumulation_steps': cls.config.accumulation_steps,
+                    'adaptive_softmax_cutoffs': (
+                        cls.config.adaptive_softmax_cutoffs
+                    ),
                     'batch_size': cls.config.batch_size,
                     'checkpoint_step': 1,
                     'd_emb': cls.config.d_emb,
@@ -229,21 +292,37 @@ class TestLoadConfig(unittest.TestCase):
                     'dropout': cls.config.dropout,
                     'epoch': cls.config.epoch,
                     'experiment': cls.config.experiment,
+                    'is_compact': cls.config.is_compact,
+                    'is_file_backed': cls.config.is_file_backed,
                     'is_uncased': cls.config.is_uncased,
                     'learning_rate': cls.config.learning_rate,
                     'max_norm': cls.config.max_norm,
                     'max_seq_len': cls.config.max_seq_len,
+                    'max_tokens': cls.config.max_tokens,
                     'min_count': cls.config.min_count,
                     'model_class': cls.config.model_class,
                     'num_linear_layers': cls.config.num_linear_layers,
+                    'num_negative_samples': cls.config.num_negative_samples,
+                    'num_preprocess_workers': (
+                        cls.config.num_preprocess_workers
+                    ),
                     'num_rnn_layers': cls.config.num_rnn_layers,
+                    'num_workers': cls.config.num_workers,
                     'optimizer_class': cls.config.optimizer_class,
+                    'persistent_workers': cls.config.persistent_workers,
+                    'pin_memory': cls.config.pin_memory,
+                    'prefetch_batches': cls.config.prefetch_batches,
+                    'prefetch_factor': cls.config.prefetch_factor,
+                    'precision': cls.config.precision,
                     'seed': cls.config.seed,
                     'tokenizer_class': cls.config.tokenizer_class,
+                    'unigram_alpha': cls.config.unigram_alpha,
                 },
             ),
             (
                 [
+                    '--accumulation_steps', str(1),
+                    '--adaptive_softmax_cutoffs', str(1), str(2),
                     '--batch_size', str(101010),
                     '--checkpoint', str(-1),
                     '--checkpoint_step', str(999),
@@ -253,19 +332,32 @@ class TestLoadConfig(unittest.TestCase):
                     '--dropout', str(0.69420),
                     '--epoch', str(666),
                     '--experiment', 'test',
+                    '--is_compact',
+                    '--is_file_backed',
                     '--is_uncased',
                     '--learning_rate', str(0.42069),
                     '--max_norm', str(4.20),
                     '--max_seq_len', str(555),
+                    '--max_tokens', str(1024),
                     '--min_count', str(444),
                     '--model_class', 'hello world',
                     '--num_linear_layers', str(333),
+                    '--num_negative_samples', str(0),
+                    '--num_preprocess_workers', str(3),
                     '--num_rnn_layers', str(222),
+                    '--num_workers', str(2),
                     '--optimizer_class', 'WORLD',
+                    '--persistent_workers',
+                    '--prefetch_batches', str(2),
+                    '--prefetch_factor', str(2),
+                    '--precision', 'fp32',
                     '--seed', str(111),
                     '--tokenizer_class', 'HELLO',
+                    '--unigram_alpha', str(0.5),
                 ],
                 {
+                    'accumulation_steps': 1,
+                    'adaptive_softmax_cutoffs': (1, 2),
                     'batch_size': 101010,
                     'checkpoint_step': 999,
                     'd_emb': 888,
@@ -274,17 +366,29 @@ class TestLoadConfig(unittest.TestCase):
                     'dropout': 0.69420,
                     'epoch': 666,
                     'experiment': 'test',
+                    'is_compact': True,
+                    'is_file_backed': True,
                     'is_uncased': True,
                     'learning_rate': 0.42069,
                     'max_norm': 4.20,
                     'max_seq_len': 555,
+                    'max_tokens': 1024,
                     'min_count': 444,
                     'model_class': 'hello world',
                     'num_linear_layers': 333,
+                    'num_negative_samples': 0,
+                    'num_preprocess_workers': 3,
                     'num_rnn_layers': 222,
+                    'num_workers': 2,
                     'optimizer_class': 'WORLD',
+                    'persistent_workers': True,
+                    'pin_memory': False,
+                    'prefetch_batches': 2,
+                    'prefetch_factor': 2,
+                    'precision': 'fp32',
                     'seed': 111,
                     'tokenizer_class': 'HELLO',
+                    'unigram_alpha': 0.5,
                 },
             ),
         )
@@ -0,0 +1,126 @@
+r"""Test `lmp.util.ContinuousBatchScheduler.add`.
+
+Usage:
+    python -m unittest test.lmp.util._continuous_batching.test_add
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestAdd(unittest.TestCase):
+    r"""Test case for `lmp.util.ContinuousBatchScheduler.add`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.scheduler = lmp.util.ContinuousBatchScheduler(
+            device=torch.device('cpu'),
+            max_batch_size=2,
+            max_seq_len=8,
+            model=lmp.model.BaseRNNModel(
+                d_emb=1,
+                d_hid=1,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=1,
+                pad_token_id=0,
+                vocab_size=5
+            ),
+            tokenizer=lmp.tokenizer.CharDictTokenizer()
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.scheduler
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.ContinuousBatchScheduler.add),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_begin_of_sequence(self):
+        r"""Raise `TypeError` when input `begin_of_sequence` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `begin_of_sequence` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, b'', (), [], {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                self.scheduler.add(begin_of_sequence=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`begin_of_sequence` must be an instance of `str`.',
+                msg=msg2
+            )
+
+        self.assertEqual(len(self.scheduler), 0, msg=msg2)
+
+    def test_return_value(self):
+        r"""Return unique request id and queue sequence."""
+        msg = 'Must return unique request id and queue sequence.'
+
+        for i, begin_of_sequence in enumerate(('', 'a', 'abc', 'a' * 10)):
+            self.assertEqual(
+                self.scheduler.add(begin_of_sequence=begin_of_sequence),
+                i,
+                msg=msg
+            )
+            self.assertEqual(len(self.scheduler), i + 1, msg=msg)
+
+        # Request id keeps increasing after decoding.
+        while len(self.scheduler) > 0:
+            self.scheduler.step()
+
+        self.assertEqual(self.scheduler.add(begin_of_sequence=''), 4, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
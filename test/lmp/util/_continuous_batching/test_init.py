@@ -0,0 +1,462 @@
+r"""Test `lmp.util.ContinuousBatchScheduler.__init__`.
+
+Usage:
+    python -m unittest test.lmp.util._continuous_batching.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.util.ContinuousBatchScheduler.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.device = torch.device('cpu')
+        self.max_batch_size = 1
+        self.max_seq_len = 2
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.device
+        del self.max_batch_size
+        del self.max_seq_len
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def _kwargs(self, **kwargs):
+        r"""Keyword arguments with fixed parameters as default."""
+        default = {
+            'device': self.device,
+            'max_batch_size': self.max_batch_size,
+            'max_seq_len': self.max_seq_len,
+            'model': self.model,
+            'tokenizer': self.tokenizer,
+        }
+        default.update(kwargs)
+        return default
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.ContinuousBatchScheduler.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[int],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_device(self):
+        r"""Raise `TypeError` when input `device` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `device` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(device=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`device` must be an instance of `torch.device`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_max_batch_size(self):
+        r"""Raise exception when input `max_batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`max_batch_size` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(max_batch_size=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_max_seq_len(self):
+        r"""Raise exception when input `max_seq_len` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_seq_len` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(max_seq_len=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be bigger than or equal to `2`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(model=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(tokenizer=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(seed=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `Optional[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_temperature(self):
+        r"""Raise exception when input `temperature` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `temperature` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, -1.0, math.nan, -math.nan, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(temperature=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`temperature` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`temperature` must be bigger than `0.0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_top_k(self):
+        r"""Raise exception when input `top_k` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `top_k` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j,
+            '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(top_k=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_k` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_k` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_top_p(self):
+        r"""Raise exception when input `top_p` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `top_p` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, -1.0, 1.1, math.nan, -math.nan,
+            math.inf, -math.inf, 0j, 1j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.ContinuousBatchScheduler(
+                    **self._kwargs(top_p=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_p` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_p` must be bigger than `0.0` and smaller than or '
+                    'equal to `1.0`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+
+        for max_batch_size in range(1, 4):
+            scheduler = lmp.util.ContinuousBatchScheduler(**self._kwargs(
+                max_batch_size=max_batch_size,
+                temperature=0.5,
+                top_k=2,
+                top_p=0.9
+            ))
+
+            for attr, value in (
+                    ('device', self.device),
+                    ('max_batch_size', max_batch_size),
+                    ('max_seq_len', self.max_seq_len),
+                    ('model', self.model),
+                    ('num_steps', 0),
+                    ('num_tokens', 0),
+                    ('temperature', 0.5),
+                    ('tokenizer', self.tokenizer),
+                    ('top_k', 2),
+                    ('top_p', 0.9),
+            ):
+                self.assertEqual(
+                    getattr(scheduler, attr),
+                    value,
+                    msg=msg.format(attr, value)
+                )
+
+            self.assertEqual(len(scheduler), 0, msg=msg.format('len', 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
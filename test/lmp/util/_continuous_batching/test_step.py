@@ -0,0 +1,273 @@
+r"""Test `lmp.util.ContinuousBatchScheduler.step`.
+
+Usage:
+    python -m unittest test.lmp.util._continuous_batching.test_step
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class FixedLogitsModel(lmp.model.BaseRNNModel):
+    r"""Model always predicting the same next token logits."""
+
+    def __init__(self, logits: torch.Tensor):
+        super().__init__(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=logits.size(0)
+        )
+        self.logits = logits
+
+    def step(self, batch_sequences, state=None):
+        logits, state = super().step(batch_sequences, state)
+        return self.logits.expand_as(logits), state
+
+
+def _run(scheduler):
+    r"""Step until all sequences finished and collect results of each step."""
+    step_results = []
+    while len(scheduler) > 0:
+        step_results.append(scheduler.step())
+
+    return step_results
+
+
+class TestStep(unittest.TestCase):
+    r"""Test case for `lmp.util.ContinuousBatchScheduler.step`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.device = torch.device('cpu')
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abc'])
+
+        # Only sample characters, thus sequences never finish before
+        # reaching `max_seq_len`.
+        logits = torch.full((self.tokenizer.vocab_size,), -math.inf)
+        for char in 'abc':
+            logits[self.tokenizer.convert_token_to_id(char)] = 0.0
+        self.model = FixedLogitsModel(logits)
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.device
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.ContinuousBatchScheduler.step),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[Tuple[int, str]]
+            ),
+            msg=msg
+        )
+
+    def test_admit_and_retire(self):
+        r"""Admit waiting sequences and retire finished ones every step."""
+        msg = 'Must admit and retire sequences at every step.'
+        scheduler = lmp.util.ContinuousBatchScheduler(
+            device=self.device,
+            max_batch_size=2,
+            max_seq_len=5,
+            model=self.model,
+            tokenizer=self.tokenizer,
+            seed=1
+        )
+
+        # Each sequence feeds its beginning of sequence (with `[bos]`) and
+        # then its generated tokens except the last one, thus taking
+        # `max_seq_len - 1` steps. Number of tokens to generate are 4, 1, 2,
+        # 0 and 3.
+        prompts = ['', 'abc', 'ab', 'aaaaaa', 'a']
+        for prompt in prompts:
+            scheduler.add(begin_of_sequence=prompt)
+
+        step_results = []
+        step_sizes = []
+        num_tokens = 0
+        while len(scheduler) > 0:
+            step_results.append(scheduler.step())
+            step_sizes.append(scheduler.num_tokens - num_tokens)
+            num_tokens = scheduler.num_tokens
+
+        # Request `2` is admitted right after requests `0` and `1` retire.
+        # Request `3` is too long and finished without taking a slot, so
+        # request `4` is admitted in the same step.
+        self.assertEqual(
+            [
+                [request_id for request_id, _ in results]
+                for results in step_results
+            ],
+            [[], [], [], [0, 1], [3], [], [], [2, 4]],
+            msg=msg
+        )
+        self.assertEqual(step_sizes, [1, 1, 1, 2, 0, 1, 2, 2], msg=msg)
+        self.assertEqual(scheduler.num_steps, 8, msg=msg)
+        self.assertEqual(scheduler.num_tokens, 10, msg=msg)
+
+        for results in step_results:
+            for request_id, sequence in results:
+                prompt = prompts[request_id]
+                self.assertTrue(
+                    sequence.startswith(f'[bos]{prompt}'),
+                    msg=msg
+                )
+                self.assertEqual(
+                    len(sequence),
+                    len(f'[bos]{prompt}') + max(4 - len(prompt), 0),
+                    msg=msg
+                )
+
+        # Scheduler can be reused.
+        scheduler.add(begin_of_sequence='abc')
+        self.assertEqual(
+            [
+                [request_id for request_id, _ in results]
+                for results in _run(scheduler)
+            ],
+            [[], [], [], [5]],
+            msg=msg
+        )
+
+    def test_empty(self):
+        r"""Return empty list when no sequence is waiting or running."""
+        msg = 'Must return empty list when no sequence is waiting or running.'
+        scheduler = lmp.util.ContinuousBatchScheduler(
+            device=self.device,
+            max_batch_size=2,
+            max_seq_len=5,
+            model=self.model,
+            tokenizer=self.tokenizer
+        )
+
+        self.assertEqual(scheduler.step(), [], msg=msg)
+        self.assertEqual(scheduler.num_steps, 0, msg=msg)
+        self.assertEqual(scheduler.num_tokens, 0, msg=msg)
+
+    def test_consistent_with_sample_batch(self):
+        r"""Greedy decoding result is the same as `sample_batch`."""
+        msg = 'Greedy decoding result must be the same as `sample_batch`.'
+        prompts = ['ab', '', 'c', 'abcabcabc', 'a', 'bc', 'cab']
+
+        for model_class in (
+                lmp.model.BaseRNNModel,
+                lmp.model.GRUModel,
+                lmp.model.LSTMModel,
+                lmp.model.BaseResRNNModel,
+                lmp.model.ResGRUModel,
+                lmp.model.ResLSTMModel,
+        ):
+            torch.manual_seed(1)
+            model = model_class(
+                d_emb=4,
+                d_hid=4,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=self.tokenizer.vocab_size
+            )
+            expected = lmp.util.sample_batch(
+                batch_size=len(prompts),
+                device=self.device,
+                max_seq_len=8,
+                model=model,
+                num_samples=1,
+                prompts=prompts,
+                tokenizer=self.tokenizer,
+                top_k=1
+            )
+
+            for max_batch_size in (1, 2, 3, 10):
+                scheduler = lmp.util.ContinuousBatchScheduler(
+                    device=self.device,
+                    max_batch_size=max_batch_size,
+                    max_seq_len=8,
+                    model=model,
+                    tokenizer=self.tokenizer,
+                    top_k=1
+                )
+                request_ids = [
+                    scheduler.add(begin_of_sequence=prompt)
+                    for prompt in prompts
+                ]
+
+                generated = {}
+                for results in _run(scheduler):
+                    generated.update(results)
+
+                self.assertEqual(
+                    [[generated[request_id]] for request_id in request_ids],
+                    expected,
+                    msg=msg
+                )
+
+    def test_seed(self):
+        r"""Sample the same sequences with the same `seed`."""
+        msg = 'Must sample the same sequences with the same `seed`.'
+
+        def run(seed):
+            scheduler = lmp.util.ContinuousBatchScheduler(
+                device=self.device,
+                max_batch_size=2,
+                max_seq_len=16,
+                model=self.model,
+                tokenizer=self.tokenizer,
+                seed=seed
+            )
+            for prompt in ('a', 'bc', '', 'abc'):
+                scheduler.add(begin_of_sequence=prompt)
+
+            return _run(scheduler)
+
+        step_results = run(seed=1)
+
+        # Global random state must not affect sampling.
+        torch.manual_seed(1)
+        self.assertEqual(run(seed=1), step_results, msg=msg)
+        torch.manual_seed(2)
+        self.assertEqual(run(seed=1), step_results, msg=msg)
+        self.assertNotEqual(run(seed=2), step_results, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
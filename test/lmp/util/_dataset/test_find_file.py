@@ -0,0 +1,96 @@
+r"""Test `lmp.util._dataset._find_file`.
+
+Usage:
+    python -m unittest test.lmp.util._dataset.test_find_file
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import os
+import tempfile
+import unittest
+
+# self-made modules
+
+import lmp.path
+import lmp.util
+
+
+# pylint: disable=W0212
+class TestFindFile(unittest.TestCase):
+    r"""Test case of `lmp.util._dataset._find_file`"""
+
+    def setUp(self):
+        r"""Set `lmp.path.DATA_PATH` to test directory."""
+        self.data_path = lmp.path.DATA_PATH
+        self.test_dir = tempfile.TemporaryDirectory()
+        lmp.path.DATA_PATH = self.test_dir.name
+
+    def tearDown(self):
+        r"""Restore `lmp.path.DATA_PATH` and remove test directory."""
+        lmp.path.DATA_PATH = self.data_path
+        self.test_dir.cleanup()
+        del self.data_path
+        del self.test_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+        self.assertEqual(
+            inspect.signature(lmp.util._dataset._find_file),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='file_name',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=str
+            ),
+            msg=msg
+        )
+
+    def test_file_not_found(self):
+        r"""Raise `FileNotFoundError` when no file is found."""
+        msg1 = 'Must raise `FileNotFoundError` when no file is found.'
+        msg2 = 'Inconsistent error message.'
+        file_path = os.path.join(self.test_dir.name, 'data.txt')
+
+        with self.assertRaises(FileNotFoundError, msg=msg1) as ctx_man:
+            lmp.util._dataset._find_file('data.txt')
+
+        self.assertEqual(
+            ctx_man.exception.args[0],
+            f'file {file_path} does not exist.',
+            msg=msg2
+        )
+
+    def test_return_value(self):
+        r"""Return uncompressed file first, then compressed ones."""
+        msg = 'Must return uncompressed file first, then compressed ones.'
+        examples = ('data.txt', 'data.txt.bz2', 'data.txt.gz', 'data.txt.xz')
+
+        # Create files in reverse order of priority.
+        for file_name in reversed(examples):
+            file_path = os.path.join(self.test_dir.name, file_name)
+            with open(file_path, 'w', encoding='utf8'):
+                pass
+
+            self.assertEqual(
+                lmp.util._dataset._find_file('data.txt'),
+                file_path,
+                msg=msg
+            )
+# pylint: enable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
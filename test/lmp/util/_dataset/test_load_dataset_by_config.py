@@ -13,6 +13,8 @@ from __future__ import unicode_literals
 
 import inspect
 import math
+import os
+import tempfile
 import unittest
 
 from typing import Union
@@ -21,6 +23,7 @@ from typing import Union
 
 import lmp.config
 import lmp.dataset
+import lmp.path
 import lmp.util
 
 
@@ -124,5 +127,129 @@ class TestLoadDatasetByConfig(unittest.TestCase):
             self.assertIsInstance(dataset, dataset_cstr, msg=msg)
 
 
+    def test_file_backed(self):
+        r"""Cache normalized samples once and read them from file."""
+        msg = 'Must cache normalized samples once and read them from file.'
+        data_path = lmp.path.DATA_PATH
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            source_path = os.path.join(test_dir, 'wiki.train.tokens')
+            cache_path = os.path.join(
+                test_dir,
+                'wiki_train_tokens.normalized.txt'
+            )
+
+            with open(source_path, 'w', encoding='utf8') as output_file:
+                output_file.write(
+                    ' \n = A = \n Ｈｅｌｌｏ \n  World \n \n'
+                    ' = B = \n foo bar \n'
+                )
+
+            try:
+                lmp.path.DATA_PATH = test_dir
+                config = lmp.config.BaseConfig(
+                    dataset='wiki_train_tokens',
+                    experiment='util_load_dataset_by_config_unittest',
+                    is_file_backed=True
+                )
+                dataset = lmp.util.load_dataset_by_config(config)
+
+                self.assertIsInstance(
+                    dataset,
+                    lmp.dataset.FileLanguageModelDataset,
+                    msg=msg
+                )
+                self.assertEqual(dataset.file_path, cache_path, msg=msg)
+                self.assertEqual(
+                    list(dataset),
+                    list(lmp.util.load_dataset(dataset='wiki_train_tokens')),
+                    msg=msg
+                )
+                self.assertEqual(
+                    list(dataset),
+                    ['Hello World', 'foo bar'],
+                    msg=msg
+                )
+
+                # Reuse cached file instead of normalizing again.
+                with open(cache_path, 'w', encoding='utf8') as output_file:
+                    output_file.write('cached\n')
+                os.utime(
+                    source_path,
+                    (0, os.path.getmtime(cache_path) - 1)
+                )
+                self.assertEqual(
+                    list(lmp.util.load_dataset_by_config(config)),
+                    ['cached'],
+                    msg=msg
+                )
+
+                # Regenerate cached file when downloaded file is newer.
+                os.utime(
+                    source_path,
+                    (0, os.path.getmtime(cache_path) + 1)
+                )
+                self.assertEqual(
+                    list(lmp.util.load_dataset_by_config(config)),
+                    ['Hello World', 'foo bar'],
+                    msg=msg
+                )
+                self.assertEqual(
+                    sorted(os.listdir(test_dir)),
+                    ['wiki.train.tokens', 'wiki_train_tokens.normalized.txt'],
+                    msg=msg
+                )
+            finally:
+                lmp.path.DATA_PATH = data_path
+
+
+    def test_num_preprocess_workers(self):
+        r"""Normalize samples with `num_preprocess_workers` subprocesses."""
+        msg = 'Must normalize samples with `num_preprocess_workers`.'
+        data_path = lmp.path.DATA_PATH
+        normalize_chunks = lmp.util._dataset._normalize_chunks
+        used_num_workers = []
+
+        def spy_normalize_chunks(chunks, num_workers):
+            used_num_workers.append(num_workers)
+            return normalize_chunks(chunks=chunks, num_workers=num_workers)
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            with open(
+                    os.path.join(test_dir, 'wiki.train.tokens'),
+                    'w',
+                    encoding='utf8'
+            ) as output_file:
+                output_file.write(' \n = A = \n Ｈｅｌｌｏ \n  World \n')
+
+            try:
+                lmp.path.DATA_PATH = test_dir
+                lmp.util._dataset._normalize_chunks = spy_normalize_chunks
+
+                for num_preprocess_workers in (0, 2):
+                    dataset = lmp.util.load_dataset_by_config(
+                        lmp.config.BaseConfig(
+                            dataset='wiki_train_tokens',
+                            experiment='util_load_dataset_by_config_unittest',
+                            num_preprocess_workers=num_preprocess_workers,
+                            num_workers=1
+                        )
+                    )
+
+                    self.assertEqual(
+                        list(dataset),
+                        ['Hello World'],
+                        msg=msg
+                    )
+                    self.assertEqual(
+                        used_num_workers.pop(),
+                        num_preprocess_workers,
+                        msg=msg
+                    )
+            finally:
+                lmp.path.DATA_PATH = data_path
+                lmp.util._dataset._normalize_chunks = normalize_chunks
+
+
 if __name__ == '__main__':
     unittest.main()
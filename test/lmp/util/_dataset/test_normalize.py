@@ -0,0 +1,67 @@
+r"""Test `lmp.util._dataset._normalize`.
+
+Usage:
+    python -m unittest test.lmp.util._dataset.test_normalize
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+# self-made modules
+
+import lmp.util
+
+
+# pylint: disable=W0212
+class TestNormalize(unittest.TestCase):
+    r"""Test case of `lmp.util._dataset._normalize`"""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+        self.assertEqual(
+            inspect.signature(lmp.util._dataset._normalize),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='sample',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=str
+            ),
+            msg=msg
+        )
+
+    def test_return_value(self):
+        r"""Return normalized sample."""
+        msg = 'Must return normalized sample.'
+        examples = (
+            ('ＨＥＬＬＯ ｗｏｒｌｄ', 'HELLO world'),
+            ('ｶﾀｶﾅ', 'カタカナ'),
+            ('  Hello \n\t World  \r\n', 'Hello World'),
+            ('Hello　World', 'Hello World'),
+            ('\n \t', ''),
+            ('', ''),
+        )
+
+        for sample, ans_sample in examples:
+            self.assertEqual(
+                lmp.util._dataset._normalize(sample),
+                ans_sample,
+                msg=msg
+            )
+# pylint: enable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+r"""Test `lmp.util._dataset._normalize_chunks`.
+
+Usage:
+    python -m unittest test.lmp.util._dataset.test_normalize_chunks
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Generator
+from typing import Iterable
+from typing import List
+
+# self-made modules
+
+import lmp.util
+
+
+# pylint: disable=W0212
+class TestNormalizeChunks(unittest.TestCase):
+    r"""Test case of `lmp.util._dataset._normalize_chunks`"""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+        self.assertEqual(
+            inspect.signature(lmp.util._dataset._normalize_chunks),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='chunks',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[List[str]],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_yield_value(self):
+        r"""Yield normalized samples in order regardless of `num_workers`."""
+        msg = (
+            'Must yield normalized samples in order regardless of '
+            '`num_workers`.'
+        )
+        samples = [
+            f' ＨＥＬＬＯ \n ｗｏｒｌｄ {i}\t' for i in range(100)
+        ]
+        ans_samples = [f'HELLO world {i}' for i in range(100)]
+
+        for num_workers in (0, 1, 2):
+            for chunk_size in (1, 7, 100):
+                self.assertEqual(
+                    list(lmp.util._dataset._normalize_chunks(
+                        chunks=(
+                            samples[start:start + chunk_size]
+                            for start in range(0, len(samples), chunk_size)
+                        ),
+                        num_workers=num_workers
+                    )),
+                    ans_samples,
+                    msg=msg
+                )
+
+            self.assertEqual(
+                list(lmp.util._dataset._normalize_chunks(
+                    chunks=[],
+                    num_workers=num_workers
+                )),
+                [],
+                msg=msg
+            )
+
+    def test_lazy_chunks(self):
+        r"""Consume chunks lazily while yielding normalized samples."""
+        msg = 'Must consume chunks lazily while yielding normalized samples.'
+        consumed = []
+
+        def chunks():
+            for i in range(10):
+                consumed.append(i)
+                yield [str(i)]
+
+        generator = lmp.util._dataset._normalize_chunks(
+            chunks=chunks(),
+            num_workers=0
+        )
+        self.assertEqual(consumed, [], msg=msg)
+        self.assertEqual(next(generator), '0', msg=msg)
+        self.assertEqual(consumed, [0], msg=msg)
+        self.assertEqual(list(generator), [str(i) for i in range(1, 10)])
+# pylint: enable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+r"""Test `lmp.util._dataset._open_text_file`.
+
+Usage:
+    python -m unittest test.lmp.util._dataset.test_open_text_file
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bz2
+import gzip
+import inspect
+import lzma
+import os
+import tempfile
+import unittest
+
+from typing import IO
+
+# self-made modules
+
+import lmp.util
+
+
+# pylint: disable=W0212
+class TestOpenTextFile(unittest.TestCase):
+    r"""Test case of `lmp.util._dataset._open_text_file`"""
+
+    def setUp(self):
+        r"""Create test directory."""
+        self.test_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        r"""Remove test directory."""
+        self.test_dir.cleanup()
+        del self.test_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+        self.assertEqual(
+            inspect.signature(lmp.util._dataset._open_text_file),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='file_path',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=IO[str]
+            ),
+            msg=msg
+        )
+
+    def test_decompress(self):
+        r"""Read text from uncompressed and compressed files."""
+        msg = 'Must read text from uncompressed and compressed files.'
+        text = 'Hello World\n今天天氣真好\n'
+        examples = (
+            ('data.txt', lambda data: data),
+            ('data.txt.bz2', bz2.compress),
+            ('data.txt.gz', gzip.compress),
+            ('data.txt.xz', lzma.compress),
+        )
+
+        for file_name, compress_fn in examples:
+            file_path = os.path.join(self.test_dir.name, file_name)
+            with open(file_path, 'wb') as output_file:
+                output_file.write(compress_fn(text.encode('utf8')))
+
+            with lmp.util._dataset._open_text_file(file_path) as input_file:
+                self.assertEqual(
+                    list(input_file),
+                    text.splitlines(True),
+                    msg=msg
+                )
+# pylint: enable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,10 +13,13 @@ from __future__ import unicode_literals
 
 import inspect
 import math
+import os
+import tempfile
 import unittest
 
 # self-made modules
 
+import lmp.path
 import lmp.util
 
 
@@ -36,6 +39,26 @@ class TestPreprocessNewsCollection(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=str,
                         default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    )
+               ,
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    )
+               ,
+                    inspect.Parameter(
+                        name='is_file_backed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
                     )
                 ],
                 return_annotation=lmp.dataset.LanguageModelDataset
@@ -73,6 +96,90 @@ class TestPreprocessNewsCollection(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_num_workers(self):
+        r"""Raise exception when input `num_workers` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_workers` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util._dataset._preprocess_news_collection(
+                    column='desc',
+                    num_workers=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_workers` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_workers` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util._dataset._preprocess_news_collection(
+                    column='desc',
+                    is_compact=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_compact` must be an instance of `bool`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_is_file_backed(self):
+        r"""Raise `TypeError` when input `is_file_backed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `is_file_backed` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util._dataset._preprocess_news_collection(
+                    column='desc',
+                    is_file_backed=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_file_backed` must be an instance of `bool`.',
+                msg=msg2
+            )
+
     def test_return_type(self):
         r"""Return `lmp.dataset.LanguageModelDataset`"""
         msg = 'Must return `lmp.dataset.LanguageModelDataset`.'
@@ -85,6 +192,43 @@ class TestPreprocessNewsCollection(unittest.TestCase):
                 lmp.dataset.LanguageModelDataset,
                 msg=msg
             )
+
+    def test_numeric_chunk(self):
+        r"""Parse numeric-looking samples as strings in every chunk."""
+        msg = 'Must parse numeric-looking samples as strings in every chunk.'
+        data_path = lmp.path.DATA_PATH
+        csv_chunk_size = lmp.util._dataset._CSV_CHUNK_SIZE
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            with open(
+                    os.path.join(test_dir, 'news_collection.csv'),
+                    'w',
+                    encoding='utf8'
+            ) as output_file:
+                output_file.write(
+                    'title,desc\n'
+                    'Hello  World,abc\n'
+                    '2020,def\n'
+                    '1.50,ghi\n'
+                    ',jkl\n'
+                    '007,mno\n'
+                )
+
+            try:
+                lmp.path.DATA_PATH = test_dir
+                lmp.util._dataset._CSV_CHUNK_SIZE = 2
+                dataset = lmp.util._dataset._preprocess_news_collection(
+                    'title'
+                )
+            finally:
+                lmp.path.DATA_PATH = data_path
+                lmp.util._dataset._CSV_CHUNK_SIZE = csv_chunk_size
+
+        self.assertEqual(
+            list(dataset),
+            ['Hello World', '2020', '1.50', '007'],
+            msg=msg
+        )
 # pylint: enable=W0212
 
 if __name__ == '__main__':
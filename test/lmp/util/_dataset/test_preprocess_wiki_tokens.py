@@ -38,6 +38,26 @@ class TestPreprocessWikiTokens(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=str,
                         default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    )
+               ,
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    )
+               ,
+                    inspect.Parameter(
+                        name='is_file_backed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
                     )
                 ],
                 return_annotation=lmp.dataset.LanguageModelDataset
@@ -82,6 +102,90 @@ class TestPreprocessWikiTokens(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_num_workers(self):
+        r"""Raise exception when input `num_workers` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_workers` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util._dataset._preprocess_wiki_tokens(
+                    split='train',
+                    num_workers=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_workers` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_workers` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util._dataset._preprocess_wiki_tokens(
+                    split='train',
+                    is_compact=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_compact` must be an instance of `bool`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_is_file_backed(self):
+        r"""Raise `TypeError` when input `is_file_backed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `is_file_backed` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util._dataset._preprocess_wiki_tokens(
+                    split='train',
+                    is_file_backed=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_file_backed` must be an instance of `bool`.',
+                msg=msg2
+            )
+
     def test_return_type(self):
         r"""Return `lmp.dataset.LanguageModelDataset`"""
         msg = 'Must return `lmp.dataset.LanguageModelDataset`.'
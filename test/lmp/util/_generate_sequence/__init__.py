@@ -43,8 +43,14 @@ class TestUtilGenerateSequence(unittest.TestCase):
         msg2 = 'Module attribute `{}` must be a function.'
         msg3 = 'Inconsistent module signature.'
         examples = (
+            'generate_batch',
+            'generate_batch_by_config',
             'generate_sequence',
             'generate_sequence_by_config',
+            'sample_batch',
+            'sample_batch_by_config',
+            'stream_sequence',
+            'stream_sequence_by_config',
         )
 
         try:
@@ -0,0 +1,452 @@
+r"""Test `lmp.util.generate_batch.`.
+
+Usage:
+    python -m unittest test.lmp.util._generate_sequence.test_generate_batch
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.util
+
+
+class TestGenerateBatch(unittest.TestCase):
+    r"""Test case for `lmp.util.generate_batch`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.batch_size = 1
+        self.beam_width = 1
+        self.device = torch.device('cpu')
+        self.max_seq_len = 2
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        self.prompts = ['']
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.batch_size
+        del self.beam_width
+        del self.device
+        del self.max_seq_len
+        del self.model
+        del self.prompts
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.generate_batch),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='beam_width',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prompts',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.util.PrefixStateCache],
+                        default=None
+                    )
+                ],
+                return_annotation=List[List[str]]
+            ),
+            msg=msg
+        )
+
+    def _kwargs(self, **kwargs):
+        r"""Keyword arguments with fixed parameters as default."""
+        default = {
+            'batch_size': self.batch_size,
+            'beam_width': self.beam_width,
+            'device': self.device,
+            'max_seq_len': self.max_seq_len,
+            'model': self.model,
+            'prompts': self.prompts,
+            'tokenizer': self.tokenizer,
+        }
+        default.update(kwargs)
+        return default
+
+    def test_invalid_input_batch_size_and_beam_width(self):
+        r"""Raise exception when input `batch_size` or `beam_width` is invalid.
+        """
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'or `beam_width` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for name in ('batch_size', 'beam_width'):
+            for invalid_input in examples:
+                with self.assertRaises(
+                        (TypeError, ValueError),
+                        msg=msg1
+                ) as ctx_man:
+                    lmp.util.generate_batch(
+                        **self._kwargs(**{name: invalid_input})
+                    )
+
+                if isinstance(ctx_man.exception, TypeError):
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be an instance of `int`.',
+                        msg=msg2
+                    )
+                else:
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be bigger than or equal to `1`.',
+                        msg=msg2
+                    )
+
+    def test_invalid_input_device(self):
+        r"""Raise `TypeError` when input `device` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `device` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.generate_batch(**self._kwargs(device=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`device` must be an instance of `torch.device`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_max_seq_len(self):
+        r"""Raise exception when input `max_seq_len` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_seq_len` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.generate_batch(
+                    **self._kwargs(max_seq_len=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be bigger than or equal to `2`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.generate_batch(**self._kwargs(model=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_prompts(self):
+        r"""Raise `TypeError` when input `prompts` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `prompts` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., [False], [0], [b''], [None],
+            ('', 0),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.generate_batch(**self._kwargs(prompts=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`prompts` must be an instance of `Sequence[str]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.generate_batch(
+                    **self._kwargs(tokenizer=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_prefix_cache(self):
+        r"""Raise `TypeError` when input `prefix_cache` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `prefix_cache` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.generate_batch(
+                    **self._kwargs(prefix_cache=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`prefix_cache` must be an instance of '
+                '`Optional[lmp.util.PrefixStateCache]`.',
+                msg=msg2
+            )
+
+    def test_return_type(self):
+        r"""Return `List[List[str]]`."""
+        msg = 'Must return `List[List[str]]`.'
+
+        for prompts in ([], [''], ['a', 'bc', '']):
+            generated_sequences = lmp.util.generate_batch(
+                **self._kwargs(beam_width=2, max_seq_len=4, prompts=prompts)
+            )
+            self.assertIsInstance(generated_sequences, list, msg=msg)
+            self.assertEqual(len(generated_sequences), len(prompts), msg=msg)
+            for sequences in generated_sequences:
+                self.assertIsInstance(sequences, list, msg=msg)
+                for sequence in sequences:
+                    self.assertIsInstance(sequence, str, msg=msg)
+
+    def test_consistent_with_generate_sequence(self):
+        r"""Generate the same sequences as `generate_sequence`."""
+        msg = 'Must generate the same sequences as `generate_sequence`.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        prompts = ['ab', '', 'abcde', 'c', 'ea', 'abcdeabcd', 'd']
+
+        for model_class in (
+                lmp.model.GRUModel,
+                lmp.model.LSTMModel,
+                lmp.model.ResLSTMModel,
+        ):
+            torch.manual_seed(1)
+            model = model_class(
+                d_emb=4,
+                d_hid=4,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=tokenizer.vocab_size
+            )
+
+            expected = [
+                lmp.util.generate_sequence(
+                    beam_width=3,
+                    begin_of_sequence=prompt,
+                    device=self.device,
+                    max_seq_len=8,
+                    model=model,
+                    tokenizer=tokenizer
+                )
+                for prompt in prompts
+            ]
+
+            for batch_size in (1, 2, 3, len(prompts)):
+                generated_sequences = lmp.util.generate_batch(
+                    batch_size=batch_size,
+                    beam_width=3,
+                    device=self.device,
+                    max_seq_len=8,
+                    model=model,
+                    prompts=prompts,
+                    tokenizer=tokenizer
+                )
+                self.assertEqual(generated_sequences, expected, msg=msg)
+
+    def test_prefix_cache(self):
+        r"""Generate the same sequences with or without `prefix_cache`."""
+        msg = 'Must generate the same sequences with or without cache.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        prompts = ['abcab', 'abc', '', 'abcabcd', 'a', 'abcab', 'eabc']
+
+        for model_class in (
+                lmp.model.GRUModel,
+                lmp.model.LSTMModel,
+                lmp.model.ResLSTMModel,
+        ):
+            torch.manual_seed(1)
+            model = model_class(
+                d_emb=4,
+                d_hid=4,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=tokenizer.vocab_size
+            )
+            kwargs = self._kwargs(
+                batch_size=3,
+                beam_width=2,
+                max_seq_len=10,
+                model=model,
+                prompts=prompts,
+                tokenizer=tokenizer
+            )
+            expected = lmp.util.generate_batch(**kwargs)
+
+            for block_size in (1, 2, 3, 16):
+                prefix_cache = lmp.util.PrefixStateCache(
+                    block_size=block_size,
+                    max_bytes=2 ** 20
+                )
+                self.assertEqual(
+                    lmp.util.generate_batch(
+                        **kwargs,
+                        prefix_cache=prefix_cache
+                    ),
+                    expected,
+                    msg=msg
+                )
+
+                # Every beginning of sequence (except empty one) is fully
+                # cached after the first call.
+                num_hits = prefix_cache.num_hits
+                self.assertEqual(
+                    lmp.util.generate_batch(
+                        **kwargs,
+                        prefix_cache=prefix_cache
+                    ),
+                    expected,
+                    msg=msg
+                )
+                self.assertEqual(
+                    prefix_cache.num_hits - num_hits,
+                    len(prompts) - 1,
+                    msg=msg
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ import inspect
 import math
 import unittest
 
+from itertools import product
 from typing import List
 from typing import Union
 
@@ -419,8 +420,8 @@ class TestGenerateSequence(unittest.TestCase):
                 self.assertIsInstance(sequence, str, msg=msg)
 
     def test_return_result(self):
-        r"""Return `beam_width` sequences with length `max_seq_len`."""
-        msg = 'Must return `beam_width` sequences with length `max_seq_len`.'
+        r"""Return `beam_width` sequences within length `max_seq_len`."""
+        msg = 'Must return `beam_width` sequences within `max_seq_len`.'
         examples = (
             (
                 self.beam_width,
@@ -530,11 +531,115 @@ class TestGenerateSequence(unittest.TestCase):
             )
             self.assertEqual(len(generated_sequences), beam_width, msg=msg)
             for sequence in generated_sequences:
-                self.assertEqual(
-                    len(sequence),
-                    len(tokenizer.detokenize(['[unk]'] * max_seq_len)),
-                    msg=msg
-                )
+                max_len = len(tokenizer.detokenize(['[unk]'] * max_seq_len))
+                self.assertLessEqual(len(sequence), max_len, msg=msg)
+
+                # Only finished sequences can be shorter than `max_seq_len`.
+                if len(sequence) < max_len:
+                    self.assertTrue(sequence.endswith('[eos]'), msg=msg)
+
+    def test_exhaustive_search(self):
+        r"""Rank all sequences when beam is wide enough."""
+        msg = 'Must rank all sequences when beam is wide enough.'
+        torch.manual_seed(1)
+        model = lmp.model.LSTMModel(
+            d_emb=4,
+            d_hid=4,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        bos_token_id = tokenizer.convert_token_to_id('[bos]')
+        eos_token_id = tokenizer.convert_token_to_id('[eos]')
+
+        # Enumerate all sequences with at most 3 new tokens. Only sequences
+        # with 3 new tokens can be unfinished.
+        hypotheses = []
+        for num_tokens in range(1, 4):
+            for token_ids in product(range(5), repeat=num_tokens):
+                if eos_token_id in token_ids[:-1]:
+                    continue
+                if num_tokens < 3 and token_ids[-1] != eos_token_id:
+                    continue
+                hypotheses.append([bos_token_id] + list(token_ids))
+
+        model.eval()
+        scores = []
+        with torch.no_grad():
+            for token_ids in hypotheses:
+                log_prob = model(
+                    torch.LongTensor([token_ids[:-1]])
+                ).log_softmax(dim=-1)[0]
+                scores.append(sum(
+                    log_prob[index, token_id].item()
+                    for index, token_id in enumerate(token_ids[1:])
+                ))
+
+        expected = tokenizer.batch_decode([
+            hypotheses[index]
+            for index in sorted(
+                range(len(hypotheses)),
+                key=lambda index: scores[index],
+                reverse=True
+            )
+        ])
+
+        generated_sequences = lmp.util.generate_sequence(
+            beam_width=len(hypotheses),
+            begin_of_sequence='',
+            device=torch.device('cpu'),
+            max_seq_len=4,
+            model=model,
+            tokenizer=tokenizer
+        )
+
+        self.assertEqual(generated_sequences, expected, msg=msg)
+
+    def test_early_termination(self):
+        r"""Stop when finished sequences are better than all beams."""
+        msg = 'Must stop when finished sequences are better than all beams.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        eos_token_id = tokenizer.convert_token_to_id('[eos]')
+
+        class EosModel(lmp.model.BaseRNNModel):
+            r"""Model always predicting `[eos]` with high probability."""
+
+            def step(self, batch_sequences, state=None):
+                self.num_calls += 1
+                logits, state = super().step(batch_sequences, state)
+                logits = torch.zeros_like(logits)
+                logits[:, eos_token_id] = 5.0
+                return logits, state
+
+        model = EosModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        model.num_calls = 0
+
+        generated_sequences = lmp.util.generate_sequence(
+            beam_width=2,
+            begin_of_sequence='',
+            device=torch.device('cpu'),
+            max_seq_len=20,
+            model=model,
+            tokenizer=tokenizer
+        )
+
+        # Feed `[bos]` and then one new token.
+        self.assertEqual(model.num_calls, 2, msg=msg)
+        self.assertEqual(len(generated_sequences), 2, msg=msg)
+        self.assertEqual(generated_sequences[0], '[bos][eos]', msg=msg)
+        for sequence in generated_sequences:
+            self.assertTrue(sequence.endswith('[eos]'), msg=msg)
 
 
 if __name__ == '__main__':
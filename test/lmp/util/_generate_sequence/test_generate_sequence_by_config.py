@@ -422,8 +422,8 @@ class TestGenerateSequenceByConfig(unittest.TestCase):
                 self.assertIsInstance(sequence, str, msg=msg)
 
     def test_return_result(self):
-        r"""Return `beam_width` sequences with length `max_seq_len`."""
-        msg = 'Must return `beam_width` sequences with length `max_seq_len`.'
+        r"""Return `beam_width` sequences within length `max_seq_len`."""
+        msg = 'Must return `beam_width` sequences within `max_seq_len`.'
         examples = (
             (
                 self.beam_width,
@@ -533,11 +533,12 @@ class TestGenerateSequenceByConfig(unittest.TestCase):
             )
             self.assertEqual(len(generated_sequences), beam_width, msg=msg)
             for sequence in generated_sequences:
-                self.assertEqual(
-                    len(sequence),
-                    len(tokenizer.detokenize(['[unk]'] * max_seq_len)),
-                    msg=msg
-                )
+                max_len = len(tokenizer.detokenize(['[unk]'] * max_seq_len))
+                self.assertLessEqual(len(sequence), max_len, msg=msg)
+
+                # Only finished sequences can be shorter than `max_seq_len`.
+                if len(sequence) < max_len:
+                    self.assertTrue(sequence.endswith('[eos]'), msg=msg)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,718 @@
+r"""Test `lmp.util.sample_batch.`.
+
+Usage:
+    python -m unittest test.lmp.util._generate_sequence.test_sample_batch
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.util
+
+
+class FixedLogitsModel(lmp.model.BaseRNNModel):
+    r"""Model always predicting the same next token logits."""
+
+    def __init__(self, logits: torch.Tensor):
+        super().__init__(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=logits.size(0)
+        )
+        self.logits = logits
+
+    def step(self, batch_sequences, state=None):
+        logits, state = super().step(batch_sequences, state)
+        return self.logits.expand_as(logits), state
+
+
+class TestSampleBatch(unittest.TestCase):
+    r"""Test case for `lmp.util.sample_batch`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.batch_size = 1
+        self.device = torch.device('cpu')
+        self.max_seq_len = 2
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        self.num_samples = 1
+        self.prompts = ['']
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.batch_size
+        del self.device
+        del self.max_seq_len
+        del self.model
+        del self.num_samples
+        del self.prompts
+        del self.tokenizer
+        gc.collect()
+
+    def _kwargs(self, **kwargs):
+        r"""Keyword arguments with fixed parameters as default."""
+        default = {
+            'batch_size': self.batch_size,
+            'device': self.device,
+            'max_seq_len': self.max_seq_len,
+            'model': self.model,
+            'num_samples': self.num_samples,
+            'prompts': self.prompts,
+            'tokenizer': self.tokenizer,
+        }
+        default.update(kwargs)
+        return default
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.sample_batch),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prompts',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.util.PrefixStateCache],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[int],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                ],
+                return_annotation=List[List[str]]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_size_and_num_samples(self):
+        r"""Raise exception when input `batch_size` or `num_samples` is
+        invalid.
+        """
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'or `num_samples` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for name in ('batch_size', 'num_samples'):
+            for invalid_input in examples:
+                with self.assertRaises(
+                        (TypeError, ValueError),
+                        msg=msg1
+                ) as ctx_man:
+                    lmp.util.sample_batch(
+                        **self._kwargs(**{name: invalid_input})
+                    )
+
+                if isinstance(ctx_man.exception, TypeError):
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be an instance of `int`.',
+                        msg=msg2
+                    )
+                else:
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be bigger than or equal to `1`.',
+                        msg=msg2
+                    )
+
+    def test_invalid_input_device(self):
+        r"""Raise `TypeError` when input `device` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `device` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(device=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`device` must be an instance of `torch.device`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_max_seq_len(self):
+        r"""Raise exception when input `max_seq_len` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_seq_len` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.sample_batch(
+                    **self._kwargs(max_seq_len=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be bigger than or equal to `2`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(model=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_prompts(self):
+        r"""Raise `TypeError` when input `prompts` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `prompts` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., [False], [0], [b''], [None],
+            ('', 0),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(prompts=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`prompts` must be an instance of `Sequence[str]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(tokenizer=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_prefix_cache(self):
+        r"""Raise `TypeError` when input `prefix_cache` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `prefix_cache` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sample_batch(
+                    **self._kwargs(prefix_cache=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`prefix_cache` must be an instance of '
+                '`Optional[lmp.util.PrefixStateCache]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(seed=invalid_input))
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `Optional[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_temperature(self):
+        r"""Raise exception when input `temperature` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `temperature` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, -1.0, math.nan, -math.nan, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.sample_batch(
+                    **self._kwargs(temperature=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`temperature` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`temperature` must be bigger than `0.0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_top_k(self):
+        r"""Raise exception when input `top_k` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `top_k` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j,
+            '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(top_k=invalid_input))
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_k` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_k` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_top_p(self):
+        r"""Raise exception when input `top_p` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `top_p` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, -1.0, 1.1, math.nan, -math.nan,
+            math.inf, -math.inf, 0j, 1j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.sample_batch(**self._kwargs(top_p=invalid_input))
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_p` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_p` must be bigger than `0.0` and smaller than or '
+                    'equal to `1.0`.',
+                    msg=msg2
+                )
+
+    def test_return_result(self):
+        r"""Return `num_samples` sequences within length `max_seq_len`."""
+        msg = 'Must return `num_samples` sequences within `max_seq_len`.'
+        prompts = ['ab', '', 'c', 'abcdeabcdeabc']
+
+        for model_class in (
+                lmp.model.BaseRNNModel,
+                lmp.model.GRUModel,
+                lmp.model.LSTMModel,
+                lmp.model.BaseResRNNModel,
+                lmp.model.ResGRUModel,
+                lmp.model.ResLSTMModel,
+        ):
+            model = model_class(
+                d_emb=2,
+                d_hid=2,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=5
+            )
+            generated_sequences = lmp.util.sample_batch(**self._kwargs(
+                batch_size=2,
+                max_seq_len=6,
+                model=model,
+                num_samples=3,
+                prompts=prompts
+            ))
+
+            self.assertIsInstance(generated_sequences, list, msg=msg)
+            self.assertEqual(len(generated_sequences), len(prompts), msg=msg)
+            for prompt, sequences in zip(prompts, generated_sequences):
+                self.assertIsInstance(sequences, list, msg=msg)
+                self.assertEqual(len(sequences), 3, msg=msg)
+
+                # Beginning of sequence longer than `max_seq_len` is
+                # returned as is.
+                max_len = len(self.tokenizer.detokenize(['[unk]'] * max(
+                    6,
+                    len(self.tokenizer.encode(prompt, max_seq_len=-1)) - 1
+                )))
+                for sequence in sequences:
+                    self.assertIsInstance(sequence, str, msg=msg)
+                    self.assertLessEqual(len(sequence), max_len, msg=msg)
+
+                    # Only finished sequences can be shorter than
+                    # `max_seq_len`.
+                    if len(sequence) < max_len:
+                        self.assertTrue(sequence.endswith('[eos]'), msg=msg)
+
+    def test_seed(self):
+        r"""Sample the same sequences with the same `seed`."""
+        msg = 'Must sample the same sequences with the same `seed`.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcdefghij'])
+        model = FixedLogitsModel(torch.zeros(tokenizer.vocab_size))
+
+        kwargs = self._kwargs(
+            batch_size=2,
+            max_seq_len=16,
+            model=model,
+            num_samples=4,
+            prompts=['a', 'bc', ''],
+            tokenizer=tokenizer
+        )
+        generated_sequences = lmp.util.sample_batch(**kwargs, seed=1)
+
+        # Global random state must not affect sampling.
+        torch.manual_seed(1)
+        self.assertEqual(
+            lmp.util.sample_batch(**kwargs, seed=1),
+            generated_sequences,
+            msg=msg
+        )
+        torch.manual_seed(2)
+        self.assertEqual(
+            lmp.util.sample_batch(**kwargs, seed=1),
+            generated_sequences,
+            msg=msg
+        )
+        self.assertNotEqual(
+            lmp.util.sample_batch(**kwargs, seed=2),
+            generated_sequences,
+            msg=msg
+        )
+
+    def test_prefix_cache(self):
+        r"""Sample the same sequences with or without `prefix_cache`."""
+        msg = 'Must sample the same sequences with or without cache.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        prompts = ['abcab', 'abc', '', 'abcabcd', 'a', 'abcab', 'eabc']
+
+        for model_class in (
+                lmp.model.BaseRNNModel,
+                lmp.model.LSTMModel,
+                lmp.model.ResGRUModel,
+        ):
+            torch.manual_seed(1)
+            model = model_class(
+                d_emb=4,
+                d_hid=4,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=tokenizer.vocab_size
+            )
+            kwargs = self._kwargs(
+                batch_size=3,
+                max_seq_len=10,
+                model=model,
+                num_samples=2,
+                prompts=prompts,
+                seed=1,
+                tokenizer=tokenizer
+            )
+            expected = lmp.util.sample_batch(**kwargs)
+
+            # Small memory budget keeps evicting cached states.
+            for max_bytes in (0, 256, 2 ** 20):
+                prefix_cache = lmp.util.PrefixStateCache(
+                    block_size=2,
+                    max_bytes=max_bytes
+                )
+                for _ in range(2):
+                    self.assertEqual(
+                        lmp.util.sample_batch(
+                            **kwargs,
+                            prefix_cache=prefix_cache
+                        ),
+                        expected,
+                        msg=msg
+                    )
+                    self.assertLessEqual(
+                        prefix_cache.num_bytes,
+                        max_bytes,
+                        msg=msg
+                    )
+
+                self.assertEqual(
+                    prefix_cache.num_hits + prefix_cache.num_misses,
+                    2 * (len(prompts) - 1),
+                    msg=msg
+                )
+                if max_bytes == 0:
+                    self.assertEqual(prefix_cache.num_hits, 0, msg=msg)
+                else:
+                    self.assertGreater(prefix_cache.num_hits, 0, msg=msg)
+
+    def test_filtering(self):
+        r"""Only sample tokens kept by top-k and top-p filtering."""
+        msg = 'Must only sample tokens kept by top-k and top-p filtering.'
+        chars = ''.join(map(chr, range(0x4e00, 0x4e00 + 95)))
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab([chars])
+
+        # First three characters have probability `0.4`, `0.3` and `0.2`.
+        # Other characters share the rest. Special tokens (including
+        # `[eos]`) are never sampled. Top-p filtering is applied on
+        # probability re-normalized by top-k filtering.
+        probs = torch.zeros(tokenizer.vocab_size)
+        for char in chars:
+            probs[tokenizer.convert_token_to_id(char)] = 0.1 / 92
+        for char, prob in zip(chars, (0.4, 0.3, 0.2)):
+            probs[tokenizer.convert_token_to_id(char)] = prob
+        model = FixedLogitsModel(probs.log())
+
+        for kwargs, expected in (
+                ({'top_k': 1}, chars[:1]),
+                ({'top_k': 2}, chars[:2]),
+                ({'top_p': 0.3}, chars[:1]),
+                ({'top_p': 0.6}, chars[:2]),
+                ({'top_p': 0.8}, chars[:3]),
+                ({'top_k': 2, 'top_p': 0.5}, chars[:1]),
+                ({'top_k': 3, 'top_p': 0.7}, chars[:2]),
+                ({'temperature': 1e-3}, chars[:1]),
+        ):
+            generated_sequences = lmp.util.sample_batch(**self._kwargs(
+                max_seq_len=33,
+                model=model,
+                num_samples=128,
+                seed=1,
+                tokenizer=tokenizer,
+                **kwargs
+            ))
+
+            sampled_chars = set()
+            for sequence in generated_sequences[0]:
+                sampled_chars.update(sequence[len('[bos]'):])
+
+            self.assertEqual(sampled_chars, set(expected), msg=msg)
+
+        # Nucleus of `top_p=0.99` has `86` characters, which is larger than
+        # initial candidates of top-p filtering.
+        generated_sequences = lmp.util.sample_batch(**self._kwargs(
+            max_seq_len=33,
+            model=model,
+            num_samples=256,
+            seed=1,
+            tokenizer=tokenizer,
+            top_p=0.99
+        ))
+
+        sampled_chars = set()
+        for sequence in generated_sequences[0]:
+            sampled_chars.update(sequence[len('[bos]'):])
+
+        self.assertTrue(sampled_chars <= set(chars), msg=msg)
+        self.assertGreater(len(sampled_chars), 64, msg=msg)
+        self.assertLessEqual(len(sampled_chars), 86, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+r"""Test `lmp.util.sample_batch_by_config.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._generate_sequence.test_sample_batch_by_config
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+# self-made modules
+
+import lmp
+import lmp.config
+import lmp.util
+
+
+class TestSampleBatchByConfig(unittest.TestCase):
+    r"""Test case for `lmp.util.sample_batch_by_config`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.batch_size = 2
+        self.config = lmp.config.BaseConfig(
+            experiment='I-AM-TEST-EXPERIMENT',
+            dataset='I-AM-TEST-DATASET',
+            model_class='rnn',
+            tokenizer_class='char_dict'
+        )
+        self.max_seq_len = 4
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        self.num_samples = 2
+        self.prompts = ['', 'a', 'bc']
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.batch_size
+        del self.config
+        del self.max_seq_len
+        del self.model
+        del self.num_samples
+        del self.prompts
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.sample_batch_by_config),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='config',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.config.BaseConfig,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prompts',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.util.PrefixStateCache],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[int],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                ],
+                return_annotation=List[List[str]]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_config(self):
+        r"""Raise `TypeError` when input `config` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `config` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sample_batch_by_config(
+                    batch_size=self.batch_size,
+                    config=invalid_input,
+                    max_seq_len=self.max_seq_len,
+                    model=self.model,
+                    num_samples=self.num_samples,
+                    prompts=self.prompts,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`config` must be an instance of `lmp.config.BaseConfig`.',
+                msg=msg2
+            )
+
+    def test_return_result(self):
+        r"""Return `num_samples` sequences for each prompt in order."""
+        msg = 'Must return `num_samples` sequences for each prompt in order.'
+
+        generated_sequences = lmp.util.sample_batch_by_config(
+            batch_size=self.batch_size,
+            config=self.config,
+            max_seq_len=self.max_seq_len,
+            model=self.model.to(self.config.device),
+            num_samples=self.num_samples,
+            prompts=self.prompts,
+            tokenizer=self.tokenizer,
+            seed=1,
+            temperature=0.5,
+            top_k=3,
+            top_p=0.9
+        )
+
+        self.assertEqual(len(generated_sequences), len(self.prompts), msg=msg)
+        for prompt, sequences in zip(self.prompts, generated_sequences):
+            self.assertEqual(len(sequences), self.num_samples, msg=msg)
+            prefix = self.tokenizer.batch_decode([
+                self.tokenizer.encode(prompt, max_seq_len=-1)[:-1]
+            ])[0]
+            for sequence in sequences:
+                self.assertTrue(sequence.startswith(prefix), msg=msg)
+
+    def test_prefix_cache(self):
+        r"""Pass `prefix_cache` to `sample_batch`."""
+        msg = 'Must pass `prefix_cache` to `sample_batch`.'
+        prefix_cache = lmp.util.PrefixStateCache(block_size=1, max_bytes=1024)
+
+        for _ in range(2):
+            lmp.util.sample_batch_by_config(
+                batch_size=self.batch_size,
+                config=self.config,
+                max_seq_len=self.max_seq_len,
+                model=self.model.to(self.config.device),
+                num_samples=self.num_samples,
+                prompts=self.prompts,
+                tokenizer=self.tokenizer,
+                prefix_cache=prefix_cache
+            )
+
+        # Empty beginning of sequence is never looked up, and all lookups
+        # in the second call hit.
+        self.assertEqual(
+            prefix_cache.num_hits + prefix_cache.num_misses,
+            4,
+            msg=msg
+        )
+        self.assertGreaterEqual(prefix_cache.num_hits, 2, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
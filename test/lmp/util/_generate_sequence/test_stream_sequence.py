@@ -0,0 +1,527 @@
+r"""Test `lmp.util.stream_sequence.`.
+
+Usage:
+    python -m unittest test.lmp.util._generate_sequence.test_stream_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Generator
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.util
+
+
+class FixedLogitsModel(lmp.model.BaseRNNModel):
+    r"""Model always predicting the same next token logits."""
+
+    def __init__(self, logits: torch.Tensor):
+        super().__init__(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=logits.size(0)
+        )
+        self.logits = logits
+
+    def step(self, batch_sequences, state=None):
+        logits, state = super().step(batch_sequences, state)
+        return self.logits.expand_as(logits), state
+
+
+class TestStreamSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.stream_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.begin_of_sequence = ''
+        self.device = torch.device('cpu')
+        self.max_seq_len = 2
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.begin_of_sequence
+        del self.device
+        del self.max_seq_len
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def _kwargs(self, **kwargs):
+        r"""Keyword arguments with fixed parameters as default."""
+        default = {
+            'begin_of_sequence': self.begin_of_sequence,
+            'device': self.device,
+            'max_seq_len': self.max_seq_len,
+            'model': self.model,
+            'tokenizer': self.tokenizer,
+        }
+        default.update(kwargs)
+        return default
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.stream_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[int],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_begin_of_sequence(self):
+        r"""Raise `TypeError` when input `begin_of_sequence` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `begin_of_sequence` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, b'', (), [], {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence(
+                    **self._kwargs(begin_of_sequence=invalid_input)
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`begin_of_sequence` must be an instance of `str`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_device(self):
+        r"""Raise `TypeError` when input `device` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `device` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence(**self._kwargs(device=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`device` must be an instance of `torch.device`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_max_seq_len(self):
+        r"""Raise exception when input `max_seq_len` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_seq_len` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.stream_sequence(
+                    **self._kwargs(max_seq_len=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be bigger than or equal to `2`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence(**self._kwargs(model=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence(**self._kwargs(tokenizer=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.stream_sequence(**self._kwargs(seed=invalid_input))
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `Optional[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_temperature(self):
+        r"""Raise exception when input `temperature` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `temperature` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, -1.0, math.nan, -math.nan, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.stream_sequence(
+                    **self._kwargs(temperature=invalid_input)
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`temperature` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`temperature` must be bigger than `0.0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_top_k(self):
+        r"""Raise exception when input `top_k` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `top_k` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j,
+            '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.stream_sequence(**self._kwargs(top_k=invalid_input))
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_k` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_k` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_top_p(self):
+        r"""Raise exception when input `top_p` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `top_p` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, -1.0, 1.1, math.nan, -math.nan,
+            math.inf, -math.inf, 0j, 1j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.stream_sequence(**self._kwargs(top_p=invalid_input))
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_p` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`top_p` must be bigger than `0.0` and smaller than or '
+                    'equal to `1.0`.',
+                    msg=msg2
+                )
+
+    def test_consistent_with_sample_batch(self):
+        r"""Yield the same sequence as `sample_batch` with the same `seed`."""
+        msg = (
+            'Must yield the same sequence as `sample_batch` with the same '
+            '`seed`.'
+        )
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde fg'])
+
+        for model_class in (
+                lmp.model.BaseRNNModel,
+                lmp.model.GRUModel,
+                lmp.model.LSTMModel,
+                lmp.model.BaseResRNNModel,
+                lmp.model.ResGRUModel,
+                lmp.model.ResLSTMModel,
+        ):
+            model = model_class(
+                d_emb=2,
+                d_hid=2,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=2,
+                pad_token_id=0,
+                vocab_size=tokenizer.vocab_size
+            )
+
+            for begin_of_sequence, kwargs in (
+                    ('', {}),
+                    ('ab', {'top_k': 2}),
+                    ('a b', {'temperature': 0.5, 'top_p': 0.5}),
+                    ('abcde fgab', {}),
+            ):
+                texts = list(lmp.util.stream_sequence(
+                    begin_of_sequence=begin_of_sequence,
+                    device=self.device,
+                    max_seq_len=10,
+                    model=model,
+                    tokenizer=tokenizer,
+                    seed=1,
+                    **kwargs
+                ))
+
+                for text in texts:
+                    self.assertIsInstance(text, str, msg=msg)
+                    self.assertTrue(text, msg=msg)
+
+                self.assertEqual(
+                    ''.join(texts),
+                    lmp.util.sample_batch(
+                        batch_size=1,
+                        device=self.device,
+                        max_seq_len=10,
+                        model=model,
+                        num_samples=1,
+                        prompts=[begin_of_sequence],
+                        tokenizer=tokenizer,
+                        seed=1,
+                        **kwargs
+                    )[0][0],
+                    msg=msg
+                )
+
+    def test_lazy(self):
+        r"""Yield each token right after a single model step."""
+        msg = 'Must yield each token right after a single model step.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        eos_token_id = tokenizer.convert_token_to_id('[eos]')
+
+        # Never sample `[eos]`.
+        logits = torch.zeros(tokenizer.vocab_size)
+        logits[eos_token_id] = -math.inf
+
+        class CountingModel(FixedLogitsModel):
+            r"""Count number of model steps."""
+
+            def step(self, batch_sequences, state=None):
+                self.num_calls += 1
+                return super().step(batch_sequences, state)
+
+        model = CountingModel(logits)
+        model.num_calls = 0
+
+        texts = lmp.util.stream_sequence(**self._kwargs(
+            begin_of_sequence='ab',
+            max_seq_len=8,
+            model=model,
+            tokenizer=tokenizer
+        ))
+
+        # Beginning of sequence is yielded before model is called.
+        self.assertEqual(next(texts), '[bos]ab', msg=msg)
+        self.assertEqual(model.num_calls, 0, msg=msg)
+
+        # Each new token needs one model step, and the last token is not fed
+        # into model.
+        for num_calls in range(1, 6):
+            next(texts)
+            self.assertEqual(model.num_calls, num_calls, msg=msg)
+
+        with self.assertRaises(StopIteration, msg=msg):
+            next(texts)
+        self.assertEqual(model.num_calls, 5, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
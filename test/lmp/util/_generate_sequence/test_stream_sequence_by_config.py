@@ -0,0 +1,184 @@
+r"""Test `lmp.util.stream_sequence_by_config.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._generate_sequence.test_stream_sequence_by_config
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Generator
+from typing import Optional
+from typing import Union
+
+# self-made modules
+
+import lmp
+import lmp.config
+import lmp.util
+
+
+class TestStreamSequenceByConfig(unittest.TestCase):
+    r"""Test case for `lmp.util.stream_sequence_by_config`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.begin_of_sequence = 'a'
+        self.config = lmp.config.BaseConfig(
+            experiment='I-AM-TEST-EXPERIMENT',
+            dataset='I-AM-TEST-DATASET',
+            model_class='rnn',
+            tokenizer_class='char_dict'
+        )
+        self.max_seq_len = 8
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=5
+        )
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.begin_of_sequence
+        del self.config
+        del self.max_seq_len
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.stream_sequence_by_config),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='config',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.config.BaseConfig,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[int],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=1.0
+                    ),
+                ],
+                return_annotation=Generator[str, None, None]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_config(self):
+        r"""Raise `TypeError` when input `config` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `config` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence_by_config(
+                    begin_of_sequence=self.begin_of_sequence,
+                    config=invalid_input,
+                    max_seq_len=self.max_seq_len,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`config` must be an instance of `lmp.config.BaseConfig`.',
+                msg=msg2
+            )
+
+    def test_yield_result(self):
+        r"""Yield beginning of sequence first, then sampled tokens."""
+        msg = 'Must yield beginning of sequence first, then sampled tokens.'
+
+        texts = list(lmp.util.stream_sequence_by_config(
+            begin_of_sequence=self.begin_of_sequence,
+            config=self.config,
+            max_seq_len=self.max_seq_len,
+            model=self.model.to(self.config.device),
+            tokenizer=self.tokenizer,
+            seed=1,
+            temperature=0.5,
+            top_k=3,
+            top_p=0.9
+        ))
+
+        self.assertEqual(texts[0], '[bos][unk]', msg=msg)
+        self.assertLessEqual(len(texts), self.max_seq_len - 1, msg=msg)
+        for text in texts:
+            self.assertIsInstance(text, str, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
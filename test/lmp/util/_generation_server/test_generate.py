@@ -0,0 +1,262 @@
+r"""Test `lmp.util.GenerationServer.generate`.
+
+Usage:
+    python -m unittest test.lmp.util._generation_server.test_generate
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import inspect
+import math
+import unittest
+
+from typing import List
+
+# self-made modules
+
+import lmp.util
+
+
+class RecordingGenerateFn:
+    r"""Echo each beginning of sequence and record batch sizes."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, prompts):
+        self.batch_sizes.append(len(prompts))
+        return [[prompt, prompt[::-1]] for prompt in prompts]
+
+
+def _invalid_generate_fn(prompts):
+    r"""Always fail."""
+    raise ValueError('invalid batch')
+
+
+def _short_generate_fn(prompts):
+    r"""Drop result of the last beginning of sequence."""
+    return [[prompt] for prompt in prompts[:-1]]
+
+
+class TestGenerate(unittest.TestCase):
+    r"""Test case for `lmp.util.GenerationServer.generate`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.prompts = [f'{i}ab' for i in range(10)]
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.prompts
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.GenerationServer.generate),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[str]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_begin_of_sequence(self):
+        r"""Raise `TypeError` when input `begin_of_sequence` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `begin_of_sequence` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, b'', (), [], {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ...
+        )
+        server = lmp.util.GenerationServer(
+            generate_fn=RecordingGenerateFn(),
+            max_batch_size=1,
+            max_wait=0.0
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                asyncio.run(server.generate(begin_of_sequence=invalid_input))
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`begin_of_sequence` must be an instance of `str`.',
+                msg=msg2
+            )
+
+    def test_return_value(self):
+        r"""Return generated sequences of each request."""
+        msg = 'Must return generated sequences of each request.'
+
+        async def run(server):
+            return await asyncio.gather(*[
+                server.generate(begin_of_sequence=prompt)
+                for prompt in self.prompts
+            ])
+
+        for max_batch_size in range(1, 12):
+            server = lmp.util.GenerationServer(
+                generate_fn=RecordingGenerateFn(),
+                max_batch_size=max_batch_size,
+                max_wait=0.0
+            )
+
+            self.assertEqual(
+                asyncio.run(run(server)),
+                [[prompt, prompt[::-1]] for prompt in self.prompts],
+                msg=msg
+            )
+
+    def test_micro_batching(self):
+        r"""Concurrent requests are generated together in batches."""
+        msg = 'Concurrent requests must be generated together in batches.'
+
+        async def run(server):
+            await asyncio.gather(*[
+                server.generate(begin_of_sequence=prompt)
+                for prompt in self.prompts
+            ])
+
+        for max_batch_size in range(1, 12):
+            generate_fn = RecordingGenerateFn()
+            server = lmp.util.GenerationServer(
+                generate_fn=generate_fn,
+                max_batch_size=max_batch_size,
+                max_wait=0.0
+            )
+            asyncio.run(run(server))
+
+            num_batches = math.ceil(len(self.prompts) / max_batch_size)
+            self.assertEqual(
+                generate_fn.batch_sizes,
+                [max_batch_size] * (num_batches - 1) + [
+                    len(self.prompts) - max_batch_size * (num_batches - 1)
+                ],
+                msg=msg
+            )
+            self.assertEqual(server.num_batches, num_batches, msg=msg)
+            self.assertEqual(
+                server.num_requests,
+                len(self.prompts),
+                msg=msg
+            )
+
+    def test_max_wait(self):
+        r"""Wait at most `max_wait` seconds for more requests."""
+        msg = 'Must wait at most `max_wait` seconds for more requests.'
+
+        async def run(server, delay):
+            async def delayed_generate(prompt):
+                await asyncio.sleep(delay)
+                return await server.generate(begin_of_sequence=prompt)
+
+            await asyncio.gather(
+                server.generate(begin_of_sequence=self.prompts[0]),
+                delayed_generate(self.prompts[1])
+            )
+
+        for max_wait, delay, batch_sizes in (
+                (1.0, 0.01, [2]),
+                (0.0, 0.01, [1, 1]),
+        ):
+            generate_fn = RecordingGenerateFn()
+            server = lmp.util.GenerationServer(
+                generate_fn=generate_fn,
+                max_batch_size=2,
+                max_wait=max_wait
+            )
+            asyncio.run(run(server, delay))
+
+            self.assertEqual(generate_fn.batch_sizes, batch_sizes, msg=msg)
+
+    def test_generate_fn_error(self):
+        r"""Raise exception raised by `generate_fn`."""
+        msg = 'Must raise exception raised by `generate_fn`.'
+
+        async def run(server):
+            return await asyncio.gather(
+                *[
+                    server.generate(begin_of_sequence=prompt)
+                    for prompt in self.prompts
+                ],
+                return_exceptions=True
+            )
+
+        server = lmp.util.GenerationServer(
+            generate_fn=_invalid_generate_fn,
+            max_batch_size=4,
+            max_wait=0.0
+        )
+
+        for err in asyncio.run(run(server)):
+            self.assertIsInstance(err, ValueError, msg=msg)
+            self.assertEqual(err.args[0], 'invalid batch', msg=msg)
+
+        self.assertEqual(server.num_batches, 0, msg=msg)
+        self.assertEqual(server.num_requests, 0, msg=msg)
+
+    def test_generate_fn_missing_results(self):
+        r"""Raise `ValueError` when `generate_fn` return too few results."""
+        msg = (
+            'Must raise `ValueError` when `generate_fn` return too few '
+            'results.'
+        )
+
+        async def run(server):
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    *[
+                        server.generate(begin_of_sequence=prompt)
+                        for prompt in self.prompts
+                    ],
+                    return_exceptions=True
+                ),
+                timeout=10.0
+            )
+
+        server = lmp.util.GenerationServer(
+            generate_fn=_short_generate_fn,
+            max_batch_size=4,
+            max_wait=0.0
+        )
+
+        # Every request in the same batch fails instead of waiting forever.
+        for err in asyncio.run(run(server)):
+            self.assertIsInstance(err, ValueError, msg=msg)
+            self.assertEqual(
+                err.args[0],
+                '`generate_fn` must return one result for each beginning of '
+                'sequence.',
+                msg=msg
+            )
+
+        self.assertEqual(server.num_batches, 0, msg=msg)
+        self.assertEqual(server.num_requests, 0, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
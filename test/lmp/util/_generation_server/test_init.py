@@ -0,0 +1,209 @@
+r"""Test `lmp.util.GenerationServer.__init__`.
+
+Usage:
+    python -m unittest test.lmp.util._generation_server.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Callable
+from typing import List
+
+# self-made modules
+
+import lmp.util
+
+
+def _generate_fn(prompts):
+    r"""Echo each beginning of sequence."""
+    return [[prompt] for prompt in prompts]
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.util.GenerationServer.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.GenerationServer.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='generate_fn',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Callable[[List[str]], List[List[str]]],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_wait',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_generate_fn(self):
+        r"""Raise `TypeError` when input `generate_fn` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `generate_fn` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(), None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.GenerationServer(
+                    generate_fn=invalid_input,
+                    max_batch_size=1,
+                    max_wait=0.0
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`generate_fn` must be an instance of `Callable`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_max_batch_size(self):
+        r"""Raise exception when input `max_batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`max_batch_size` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.GenerationServer(
+                    generate_fn=_generate_fn,
+                    max_batch_size=invalid_input,
+                    max_wait=0.0
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_max_wait(self):
+        r"""Raise exception when input `max_wait` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_wait` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, -1.0, math.nan, -math.nan, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.GenerationServer(
+                    generate_fn=_generate_fn,
+                    max_batch_size=1,
+                    max_wait=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_wait` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_wait` must be bigger than or equal to `0.0`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+
+        for max_batch_size in range(1, 5):
+            for max_wait in (0.0, 0.01, 1.0):
+                server = lmp.util.GenerationServer(
+                    generate_fn=_generate_fn,
+                    max_batch_size=max_batch_size,
+                    max_wait=max_wait
+                )
+
+                self.assertIs(
+                    server.generate_fn,
+                    _generate_fn,
+                    msg=msg.format('generate_fn', _generate_fn)
+                )
+                self.assertEqual(
+                    server.max_batch_size,
+                    max_batch_size,
+                    msg=msg.format('max_batch_size', max_batch_size)
+                )
+                self.assertEqual(
+                    server.max_wait,
+                    max_wait,
+                    msg=msg.format('max_wait', max_wait)
+                )
+                self.assertEqual(
+                    server.num_batches,
+                    0,
+                    msg=msg.format('num_batches', 0)
+                )
+                self.assertEqual(
+                    server.num_requests,
+                    0,
+                    msg=msg.format('num_requests', 0)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+r"""Test `lmp.util.GenerationServer.start`.
+
+Usage:
+    python -m unittest test.lmp.util._generation_server.test_start
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import inspect
+import json
+import math
+import os
+import tempfile
+import unittest
+
+from typing import Optional
+
+# self-made modules
+
+import lmp.util
+
+
+def _generate_fn(prompts):
+    r"""Echo each beginning of sequence."""
+    return [[prompt, prompt[::-1]] for prompt in prompts]
+
+
+async def _request(reader, writer, request):
+    r"""Send raw HTTP request and return response status and JSON body."""
+    writer.write(request)
+    await writer.drain()
+
+    status = (await reader.readline()).decode('latin-1').split(' ', 1)[1]
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b'\r\n':
+            break
+
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    body = await reader.readexactly(int(headers['content-length']))
+    return status.strip(), json.loads(body.decode('utf-8'))
+
+
+def _post(body, path='/generate'):
+    r"""Create raw HTTP `POST` request."""
+    return (
+        f'POST {path} HTTP/1.1\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        '\r\n'
+    ).encode('latin-1') + body
+
+
+class TestStart(unittest.TestCase):
+    r"""Test case for `lmp.util.GenerationServer.start`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.server = lmp.util.GenerationServer(
+            generate_fn=_generate_fn,
+            max_batch_size=4,
+            max_wait=0.0
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.server
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.GenerationServer.start),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='host',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default='localhost'
+                    ),
+                    inspect.Parameter(
+                        name='path',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[str],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='port',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=8000
+                    ),
+                ],
+                return_annotation=asyncio.AbstractServer
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise `TypeError` when input arguments are invalid."""
+        msg1 = 'Must raise `TypeError` when input arguments are invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            ('host', '`host` must be an instance of `str`.', (
+                False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan,
+                math.inf, -math.inf, 0j, 1j, b'', (), [], {}, set(), object(),
+                lambda x: x, type, None, NotImplemented, ...
+            )),
+            ('path', '`path` must be an instance of `Optional[str]`.', (
+                False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan,
+                math.inf, -math.inf, 0j, 1j, b'', (), [], {}, set(), object(),
+                lambda x: x, type, NotImplemented, ...
+            )),
+            ('port', '`port` must be an instance of `int`.', (
+                0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j,
+                '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+                NotImplemented, ...
+            )),
+        )
+
+        for name, error_message, invalid_inputs in examples:
+            for invalid_input in invalid_inputs:
+                with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                    asyncio.run(self.server.start(**{name: invalid_input}))
+
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    error_message,
+                    msg=msg2
+                )
+
+    def test_tcp(self):
+        r"""Serve requests over TCP socket with keep-alive connection."""
+        msg = 'Must serve requests over TCP socket.'
+
+        async def run():
+            server = await self.server.start(host='localhost', port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('localhost', port)
+
+            responses = [
+                await _request(reader, writer, _post(
+                    json.dumps({'begin_of_sequence': prompt}).encode('utf-8')
+                ))
+                for prompt in ('ab', '今天')
+            ]
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return responses
+
+        self.assertEqual(
+            asyncio.run(run()),
+            [
+                ('200 OK', {'generated': ['ab', 'ba']}),
+                ('200 OK', {'generated': ['今天', '天今']}),
+            ],
+            msg=msg
+        )
+
+    @unittest.skipUnless(
+        hasattr(asyncio, 'start_unix_server'),
+        'Unix domain socket is not supported.'
+    )
+    def test_unix_socket(self):
+        r"""Serve requests over Unix domain socket."""
+        msg = 'Must serve requests over Unix domain socket.'
+
+        async def run(path):
+            server = await self.server.start(path=path)
+            reader, writer = await asyncio.open_unix_connection(path)
+
+            response = await _request(reader, writer, _post(
+                json.dumps({'begin_of_sequence': 'ab'}).encode('utf-8')
+            ))
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return response
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            self.assertEqual(
+                asyncio.run(run(os.path.join(dir_path, 'server.sock'))),
+                ('200 OK', {'generated': ['ab', 'ba']}),
+                msg=msg
+            )
+
+    def test_invalid_request(self):
+        r"""Respond error status when request is invalid."""
+        msg = 'Must respond error status when request is invalid.'
+        examples = (
+            (
+                _post(b'{"begin_of_sequence": "ab"}', path='/'),
+                '404 Not Found',
+            ),
+            (
+                b'GET /generate HTTP/1.1\r\n\r\n',
+                '405 Method Not Allowed',
+            ),
+            (
+                _post(b'not json'),
+                '400 Bad Request',
+            ),
+            (
+                _post(b'{"begin_of_sequence": 1}'),
+                '400 Bad Request',
+            ),
+            (
+                _post(b'["ab"]'),
+                '400 Bad Request',
+            ),
+        )
+
+        async def run():
+            server = await self.server.start(host='localhost', port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('localhost', port)
+
+            statuses = []
+            for request, _ in examples:
+                status, body = await _request(reader, writer, request)
+                self.assertIn('error', body, msg=msg)
+                statuses.append(status)
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return statuses
+
+        self.assertEqual(
+            asyncio.run(run()),
+            [status for _, status in examples],
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,7 @@ import os
 import unittest
 
 from itertools import product
+from typing import Sequence
 from typing import Union
 
 # 3rd-party modules
@@ -170,6 +171,12 @@ class TestLoadModel(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=int,
                         default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='adaptive_softmax_cutoffs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[int],
+                        default=()
                     )
                 ],
                 return_annotation=Union[
@@ -865,5 +872,64 @@ class TestLoadModel(unittest.TestCase):
                 os.remove(test_path)
 
 
+    def test_adaptive_softmax(self):
+        r"""Load model with adaptive softmax output layer."""
+        msg = 'Must load model with adaptive softmax output layer.'
+
+        test_path = os.path.join(
+            self.__class__.test_dir,
+            f'model-{self.__class__.checkpoint}.pt'
+        )
+
+        for model_class, model_cstr in self.__class__.model_parameters[
+                'model'
+        ]:
+            try:
+                # Create test file.
+                ans_model = model_cstr(
+                    d_emb=16,
+                    d_hid=4,
+                    dropout=0.1,
+                    num_linear_layers=1,
+                    num_rnn_layers=1,
+                    pad_token_id=0,
+                    vocab_size=10,
+                    adaptive_softmax_cutoffs=[2, 5]
+                )
+                torch.save(ans_model.state_dict(), test_path)
+
+                model = lmp.util.load_model(
+                    checkpoint=self.__class__.checkpoint,
+                    d_emb=16,
+                    d_hid=4,
+                    device=torch.device('cpu'),
+                    dropout=0.1,
+                    experiment=self.__class__.experiment,
+                    model_class=model_class,
+                    num_linear_layers=1,
+                    num_rnn_layers=1,
+                    pad_token_id=0,
+                    vocab_size=10,
+                    adaptive_softmax_cutoffs=[2, 5]
+                )
+
+                self.assertIsInstance(
+                    model.adaptive_softmax,
+                    torch.nn.AdaptiveLogSoftmaxWithLoss,
+                    msg=msg
+                )
+                self.assertEqual(
+                    model.adaptive_softmax.cutoffs,
+                    [2, 5, 10],
+                    msg=msg
+                )
+
+                for p1, p2 in zip(ans_model.parameters(), model.parameters()):
+                    self.assertTrue((p1 == p2).all().item(), msg=msg)
+            finally:
+                # Clean up test file.
+                os.remove(test_path)
+
+
 if __name__ == '__main__':
     unittest.main()
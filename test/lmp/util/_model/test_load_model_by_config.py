@@ -355,5 +355,35 @@ class TestLoadModelByConfig(unittest.TestCase):
                 os.remove(test_path)
 
 
+    def test_adaptive_softmax(self):
+        r"""Construct adaptive softmax output layer from configuration."""
+        msg = 'Must construct adaptive softmax output layer.'
+
+        for model_class, _ in self.__class__.model_parameters['model']:
+            config = lmp.config.BaseConfig(
+                adaptive_softmax_cutoffs=(2,),
+                d_emb=4,
+                dataset=self.__class__.dataset,
+                experiment=self.__class__.experiment,
+                model_class=model_class
+            )
+            model = lmp.util.load_model_by_config(
+                checkpoint=self.checkpoint,
+                config=config,
+                tokenizer=self.tokenizer
+            )
+
+            self.assertIsInstance(
+                model.adaptive_softmax,
+                torch.nn.AdaptiveLogSoftmaxWithLoss,
+                msg=msg
+            )
+            self.assertEqual(
+                model.adaptive_softmax.cutoffs,
+                [2, self.tokenizer.vocab_size],
+                msg=msg
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,208 @@
+r"""Test `lmp.util.BatchPrefetcher.__init__`.
+
+Usage:
+    python -m unittest test.lmp.util._prefetch.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.utils.data
+
+# self-made modules
+
+import lmp.util
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.util.BatchPrefetcher.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.data_loader = torch.utils.data.DataLoader(list(range(10)))
+        self.device = torch.device('cpu')
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.data_loader
+        del self.device
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.BatchPrefetcher.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='data_loader',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.utils.data.DataLoader,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_batches',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_data_loader(self):
+        r"""Raise `TypeError` when input `data_loader` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `data_loader` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.BatchPrefetcher(
+                    data_loader=invalid_input,
+                    device=self.device,
+                    num_batches=1
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`data_loader` must be an instance of '
+                '`torch.utils.data.DataLoader`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_device(self):
+        r"""Raise `TypeError` when input `device` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `device` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.BatchPrefetcher(
+                    data_loader=self.data_loader,
+                    device=invalid_input,
+                    num_batches=1
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`device` must be an instance of `torch.device`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_num_batches(self):
+        r"""Raise exception when input `num_batches` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_batches` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.BatchPrefetcher(
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    num_batches=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_batches` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_batches` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+
+        for num_batches in range(1, 5):
+            prefetcher = lmp.util.BatchPrefetcher(
+                data_loader=self.data_loader,
+                device=self.device,
+                num_batches=num_batches
+            )
+
+            self.assertIs(
+                prefetcher.data_loader,
+                self.data_loader,
+                msg=msg.format('data_loader', self.data_loader)
+            )
+            self.assertEqual(
+                prefetcher.device,
+                self.device,
+                msg=msg.format('device', self.device)
+            )
+            self.assertEqual(
+                prefetcher.num_batches,
+                num_batches,
+                msg=msg.format('num_batches', num_batches)
+            )
+            self.assertEqual(
+                prefetcher.num_fetched,
+                0,
+                msg=msg.format('num_fetched', 0)
+            )
+            self.assertEqual(
+                prefetcher.num_waits,
+                0,
+                msg=msg.format('num_waits', 0)
+            )
+            self.assertEqual(
+                prefetcher.wait_time,
+                0.0,
+                msg=msg.format('wait_time', 0.0)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+r"""Test `lmp.util.BatchPrefetcher.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.util._prefetch.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.utils.data
+
+# self-made modules
+
+import lmp.util
+
+
+def _collate_fn(batch):
+    r"""Return mini-batch as pair of tensors."""
+    x = torch.LongTensor(batch)
+    return x, x + 1
+
+
+def _invalid_collate_fn(batch):
+    r"""Always fail."""
+    raise ValueError('invalid mini-batch')
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.util.BatchPrefetcher.__iter__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.data_loader = torch.utils.data.DataLoader(
+            list(range(10)),
+            batch_size=3,
+            collate_fn=_collate_fn
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.data_loader
+
+    def test_yield_value(self):
+        r"""Yield the same mini-batches as `data_loader` in order."""
+        msg = 'Must yield the same mini-batches as `data_loader` in order.'
+
+        for num_batches in range(1, 5):
+            prefetcher = lmp.util.BatchPrefetcher(
+                data_loader=self.data_loader,
+                device=torch.device('cpu'),
+                num_batches=num_batches
+            )
+
+            self.assertEqual(len(prefetcher), 4, msg=msg)
+
+            # Iterate through multiple epochs.
+            for _ in range(2):
+                batches = list(prefetcher)
+                self.assertEqual(len(batches), 4, msg=msg)
+
+                for (x1, y1), (x2, y2) in zip(batches, self.data_loader):
+                    self.assertIsInstance(x1, torch.Tensor, msg=msg)
+                    self.assertIsInstance(y1, torch.Tensor, msg=msg)
+                    self.assertTrue(torch.equal(x1, x2), msg=msg)
+                    self.assertTrue(torch.equal(y1, y2), msg=msg)
+
+                self.assertEqual(prefetcher.num_fetched, 4, msg=msg)
+                self.assertGreaterEqual(prefetcher.num_waits, 0, msg=msg)
+                self.assertLessEqual(prefetcher.num_waits, 5, msg=msg)
+                self.assertGreaterEqual(prefetcher.wait_time, 0.0, msg=msg)
+
+    def test_raise_loading_error(self):
+        r"""Re-raise exception raised while loading mini-batches."""
+        msg = 'Must re-raise exception raised while loading mini-batches.'
+
+        prefetcher = lmp.util.BatchPrefetcher(
+            data_loader=torch.utils.data.DataLoader(
+                list(range(10)),
+                collate_fn=_invalid_collate_fn
+            ),
+            device=torch.device('cpu'),
+            num_batches=2
+        )
+
+        with self.assertRaises(ValueError, msg=msg) as ctx_man:
+            list(prefetcher)
+
+        self.assertEqual(
+            ctx_man.exception.args[0],
+            'invalid mini-batch',
+            msg=msg
+        )
+
+    def test_stop_early(self):
+        r"""Stop background thread when iteration stop early."""
+        msg = 'Must stop background thread when iteration stop early.'
+
+        prefetcher = lmp.util.BatchPrefetcher(
+            data_loader=self.data_loader,
+            device=torch.device('cpu'),
+            num_batches=1
+        )
+        num_threads = threading.active_count()
+
+        iterator = iter(prefetcher)
+        next(iterator)
+        iterator.close()
+
+        self.assertEqual(threading.active_count(), num_threads, msg=msg)
+        self.assertEqual(prefetcher.num_fetched, 1, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
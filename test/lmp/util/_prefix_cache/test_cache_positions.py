@@ -0,0 +1,86 @@
+r"""Test `lmp.util.PrefixStateCache.cache_positions`.
+
+Usage:
+    python -m unittest test.lmp.util._prefix_cache.test_cache_positions
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import List
+
+# self-made modules
+
+import lmp.util
+
+
+class TestCachePositions(unittest.TestCase):
+    r"""Test case for `lmp.util.PrefixStateCache.cache_positions`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.PrefixStateCache.cache_positions),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='end',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='start',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[int]
+            ),
+            msg=msg
+        )
+
+    def test_return_value(self):
+        r"""Return block boundaries and `end` within range."""
+        msg = 'Must return block boundaries and `end` within range.'
+
+        for block_size, end, start, expected in (
+                (1, 0, 0, []),
+                (1, 3, 0, [1, 2, 3]),
+                (1, 3, 2, [3]),
+                (2, 5, 0, [2, 4, 5]),
+                (2, 4, 0, [2, 4]),
+                (2, 5, 2, [4, 5]),
+                (2, 5, 3, [4, 5]),
+                (2, 5, 5, []),
+                (4, 3, 0, [3]),
+                (4, 9, 1, [4, 8, 9]),
+        ):
+            prefix_cache = lmp.util.PrefixStateCache(
+                block_size=block_size,
+                max_bytes=0
+            )
+            self.assertEqual(
+                prefix_cache.cache_positions(end=end, start=start),
+                expected,
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
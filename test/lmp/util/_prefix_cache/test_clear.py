@@ -0,0 +1,82 @@
+r"""Test `lmp.util.PrefixStateCache.clear`.
+
+Usage:
+    python -m unittest test.lmp.util._prefix_cache.test_clear
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import unittest
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.util
+
+
+class TestClear(unittest.TestCase):
+    r"""Test case for `lmp.util.PrefixStateCache.clear`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.prefix_cache = lmp.util.PrefixStateCache(
+            block_size=1,
+            max_bytes=1024
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.prefix_cache
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.PrefixStateCache.clear),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=None
+            ),
+            msg=msg
+        )
+
+    def test_clear(self):
+        r"""Remove all cached states but keep counters."""
+        msg = 'Must remove all cached states but keep counters.'
+
+        self.prefix_cache.insert(state=(torch.zeros(1, 1, 2),), token_ids=[1])
+        self.prefix_cache.lookup(token_ids=[1, 2])
+        self.prefix_cache.lookup(token_ids=[2])
+        self.prefix_cache.clear()
+
+        self.assertEqual(len(self.prefix_cache), 0, msg=msg)
+        self.assertEqual(self.prefix_cache.num_bytes, 0, msg=msg)
+        self.assertEqual(self.prefix_cache.num_hits, 1, msg=msg)
+        self.assertEqual(self.prefix_cache.num_misses, 1, msg=msg)
+        self.assertEqual(
+            self.prefix_cache.lookup(token_ids=[1]),
+            (0, None),
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+r"""Test `lmp.util.PrefixStateCache.__init__`.
+
+Usage:
+    python -m unittest test.lmp.util._prefix_cache.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# self-made modules
+
+import lmp.util
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.util.PrefixStateCache.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.PrefixStateCache.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='block_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_bytes',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_block_size(self):
+        r"""Raise exception when input `block_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `block_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.PrefixStateCache(
+                    block_size=invalid_input,
+                    max_bytes=0
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`block_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`block_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_max_bytes(self):
+        r"""Raise exception when input `max_bytes` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_bytes` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.PrefixStateCache(
+                    block_size=1,
+                    max_bytes=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_bytes` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_bytes` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+
+        for block_size in range(1, 4):
+            for max_bytes in (0, 1, 1024):
+                prefix_cache = lmp.util.PrefixStateCache(
+                    block_size=block_size,
+                    max_bytes=max_bytes
+                )
+
+                for attr, value in (
+                        ('block_size', block_size),
+                        ('max_bytes', max_bytes),
+                        ('num_bytes', 0),
+                        ('num_hits', 0),
+                        ('num_misses', 0),
+                ):
+                    self.assertEqual(
+                        getattr(prefix_cache, attr),
+                        value,
+                        msg=msg.format(attr, value)
+                    )
+
+                self.assertEqual(
+                    len(prefix_cache),
+                    0,
+                    msg=msg.format('len', 0)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,257 @@
+r"""Test `lmp.util.PrefixStateCache.insert`.
+
+Usage:
+    python -m unittest test.lmp.util._prefix_cache.test_insert
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Sequence
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.util
+
+
+def _state(value: float) -> Tuple[torch.Tensor, ...]:
+    r"""Recurrent state of LSTM with batch size `1` and 16 bytes tensors."""
+    return (torch.full((1, 1, 4), value), torch.full((1, 1, 4), value))
+
+
+# Size of each state returned by `_state`.
+STATE_BYTES = 32
+
+
+class TestInsert(unittest.TestCase):
+    r"""Test case for `lmp.util.PrefixStateCache.insert`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.prefix_cache = lmp.util.PrefixStateCache(
+            block_size=1,
+            max_bytes=3 * STATE_BYTES
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.prefix_cache
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.PrefixStateCache.insert),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='state',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Tuple[torch.Tensor, ...],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='token_ids',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[int],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=None
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_state(self):
+        r"""Raise `TypeError` when input `state` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `state` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', [], {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., torch.zeros(1, 1, 1),
+            [torch.zeros(1, 1, 1)], (torch.zeros(1, 1, 1), None),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                self.prefix_cache.insert(state=invalid_input, token_ids=[1])
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`state` must be an instance of `Tuple[Tensor, ...]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_token_ids(self):
+        r"""Raise exception when input `token_ids` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `token_ids` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., [0.0], [''], (None,), [[1]], [],
+            (),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                self.prefix_cache.insert(
+                    state=_state(0.0),
+                    token_ids=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`token_ids` must be an instance of `Sequence[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`token_ids` must not be empty.',
+                    msg=msg2
+                )
+
+        self.assertEqual(len(self.prefix_cache), 0, msg=msg2)
+
+    def test_insert(self):
+        r"""Cache state and count its size."""
+        msg = 'Must cache state and count its size.'
+
+        for i, token_ids in enumerate(([1], [1, 2], (3,))):
+            expected = _state(float(i))
+            self.prefix_cache.insert(state=expected, token_ids=token_ids)
+            self.assertEqual(len(self.prefix_cache), i + 1, msg=msg)
+            self.assertEqual(
+                self.prefix_cache.num_bytes,
+                (i + 1) * STATE_BYTES,
+                msg=msg
+            )
+
+            length, state = self.prefix_cache.lookup(token_ids=token_ids)
+            self.assertEqual(length, len(token_ids), msg=msg)
+            self.assertTrue(torch.equal(state[0], expected[0]), msg=msg)
+
+        # Replace cached state of the same prefix.
+        self.prefix_cache.insert(state=_state(5.0), token_ids=[1, 2])
+        self.assertEqual(len(self.prefix_cache), 3, msg=msg)
+        self.assertEqual(
+            self.prefix_cache.num_bytes,
+            3 * STATE_BYTES,
+            msg=msg
+        )
+        _, state = self.prefix_cache.lookup(token_ids=[1, 2])
+        self.assertTrue(torch.equal(state[0], _state(5.0)[0]), msg=msg)
+
+    def test_evict(self):
+        r"""Evict least recently used states when exceeding memory budget."""
+        msg = 'Must evict least recently used states within memory budget.'
+
+        for i in range(1, 6):
+            self.prefix_cache.insert(state=_state(float(i)), token_ids=[i, i])
+            self.assertLessEqual(
+                self.prefix_cache.num_bytes,
+                self.prefix_cache.max_bytes,
+                msg=msg
+            )
+
+        self.assertEqual(len(self.prefix_cache), 3, msg=msg)
+        for i in range(1, 6):
+            self.assertEqual(
+                self.prefix_cache.lookup(token_ids=[i, i])[0],
+                0 if i <= 2 else 2,
+                msg=msg
+            )
+
+        # Evicted prefixes are removed from token trie.
+        # pylint: disable=W0212
+        self.assertEqual(
+            set(self.prefix_cache._root.children),
+            {3, 4, 5},
+            msg=msg
+        )
+        # pylint: enable=W0212
+
+    def test_prune(self):
+        r"""Keep trie nodes which are still on path of cached prefixes."""
+        msg = 'Must keep trie nodes on path of cached prefixes.'
+
+        self.prefix_cache.insert(state=_state(1.0), token_ids=[1, 2, 3])
+        self.prefix_cache.insert(state=_state(2.0), token_ids=[1, 2])
+        self.prefix_cache.insert(state=_state(3.0), token_ids=[1, 4])
+        self.prefix_cache.lookup(token_ids=[1, 2, 3])
+        self.prefix_cache.insert(state=_state(4.0), token_ids=[5])
+
+        # Prefix `[1, 2]` is evicted, but `[1, 2, 3]` is still cached.
+        self.assertEqual(
+            self.prefix_cache.lookup(token_ids=[1, 2, 4])[0],
+            0,
+            msg=msg
+        )
+        self.assertEqual(
+            self.prefix_cache.lookup(token_ids=[1, 2, 3])[0],
+            3,
+            msg=msg
+        )
+
+        # Evicting `[1, 4]` only removes its last node.
+        self.prefix_cache.insert(state=_state(6.0), token_ids=[6])
+        # pylint: disable=W0212
+        self.assertEqual(
+            set(self.prefix_cache._root.children[1].children),
+            {2},
+            msg=msg
+        )
+        # pylint: enable=W0212
+
+    def test_too_large(self):
+        r"""Do not cache state larger than memory budget."""
+        msg = 'Must not cache state larger than memory budget.'
+
+        for max_bytes in (0, STATE_BYTES - 1):
+            prefix_cache = lmp.util.PrefixStateCache(
+                block_size=1,
+                max_bytes=max_bytes
+            )
+            prefix_cache.insert(state=_state(1.0), token_ids=[1])
+
+            self.assertEqual(len(prefix_cache), 0, msg=msg)
+            self.assertEqual(prefix_cache.num_bytes, 0, msg=msg)
+            self.assertEqual(
+                prefix_cache.lookup(token_ids=[1]),
+                (0, None),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+r"""Test `lmp.util.PrefixStateCache.lookup`.
+
+Usage:
+    python -m unittest test.lmp.util._prefix_cache.test_lookup
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.util
+
+
+def _state(value: float) -> Tuple[torch.Tensor, ...]:
+    r"""Recurrent state of single layer with batch size `1`."""
+    return (torch.full((1, 1, 2), value),)
+
+
+class TestLookup(unittest.TestCase):
+    r"""Test case for `lmp.util.PrefixStateCache.lookup`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.prefix_cache = lmp.util.PrefixStateCache(
+            block_size=1,
+            max_bytes=1024
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.prefix_cache
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.PrefixStateCache.lookup),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='token_ids',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Sequence[int],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Tuple[
+                    int,
+                    Optional[Tuple[torch.Tensor, ...]]
+                ]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_token_ids(self):
+        r"""Raise `TypeError` when input `token_ids` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `token_ids` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', {}, set(), object(), lambda x: x,
+            type, None, NotImplemented, ..., [0.0], [''], (None,), [[1]],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                self.prefix_cache.lookup(token_ids=invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`token_ids` must be an instance of `Sequence[int]`.',
+                msg=msg2
+            )
+
+        self.assertEqual(self.prefix_cache.num_misses, 0, msg=msg2)
+
+    def test_longest_prefix(self):
+        r"""Return state of the longest cached prefix."""
+        msg = 'Must return state of the longest cached prefix.'
+
+        self.prefix_cache.insert(state=_state(1.0), token_ids=[1])
+        self.prefix_cache.insert(state=_state(3.0), token_ids=[1, 2, 3])
+        self.prefix_cache.insert(state=_state(4.0), token_ids=[1, 2, 4])
+
+        for token_ids, expected_length, expected_value in (
+                ([1], 1, 1.0),
+                ((1, 2), 1, 1.0),
+                ([1, 2, 3], 3, 3.0),
+                ([1, 2, 3, 4, 5], 3, 3.0),
+                ((1, 2, 4, 3), 3, 4.0),
+                ([1, 3, 2], 1, 1.0),
+        ):
+            length, state = self.prefix_cache.lookup(token_ids=token_ids)
+            self.assertEqual(length, expected_length, msg=msg)
+            self.assertTrue(
+                torch.equal(state[0], _state(expected_value)[0]),
+                msg=msg
+            )
+
+        self.assertEqual(self.prefix_cache.num_hits, 6, msg=msg)
+        self.assertEqual(self.prefix_cache.num_misses, 0, msg=msg)
+
+    def test_miss(self):
+        r"""Return `0` and `None` when no prefix is cached."""
+        msg = 'Must return `0` and `None` when no prefix is cached.'
+
+        self.prefix_cache.insert(state=_state(2.0), token_ids=[1, 2])
+
+        for i, token_ids in enumerate(([], [1], [2, 1], (3, 1, 2))):
+            self.assertEqual(
+                self.prefix_cache.lookup(token_ids=token_ids),
+                (0, None),
+                msg=msg
+            )
+            self.assertEqual(self.prefix_cache.num_misses, i + 1, msg=msg)
+
+        self.assertEqual(self.prefix_cache.num_hits, 0, msg=msg)
+
+    def test_recently_used(self):
+        r"""Mark found prefix as most recently used."""
+        msg = 'Must mark found prefix as most recently used.'
+        prefix_cache = lmp.util.PrefixStateCache(
+            block_size=1,
+            max_bytes=2 * _state(0.0)[0].numel() * 4
+        )
+
+        prefix_cache.insert(state=_state(1.0), token_ids=[1])
+        prefix_cache.insert(state=_state(2.0), token_ids=[2])
+        prefix_cache.lookup(token_ids=[1, 3])
+
+        # Prefix `[2]` is evicted instead of `[1]`.
+        prefix_cache.insert(state=_state(3.0), token_ids=[3])
+        self.assertEqual(prefix_cache.lookup(token_ids=[1])[0], 1, msg=msg)
+        self.assertEqual(prefix_cache.lookup(token_ids=[2])[0], 0, msg=msg)
+        self.assertEqual(prefix_cache.lookup(token_ids=[3])[0], 1, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -40,6 +40,7 @@ class TestUtilSeed(unittest.TestCase):
         msg2 = 'Module attribute `{}` must be a function.'
         msg3 = 'Inconsistent module signature.'
         examples = (
+            'seed_worker',
             'set_seed',
             'set_seed_by_config',
         )
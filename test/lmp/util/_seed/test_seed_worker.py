@@ -0,0 +1,114 @@
+r"""Test `lmp.util.seed_worker`.
+
+Usage:
+    python -m unittest test.lmp.util._seed.test_seed_worker
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import random
+import unittest
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+import torch.utils.data
+
+# self-made modules
+
+import lmp.util
+
+
+def _collate_fn(batch):
+    r"""Return random numbers drawn in data loading subprocess."""
+    return batch[0], random.random(), float(np.random.rand())
+
+
+class TestSeedWorker(unittest.TestCase):
+    r"""Test case for `lmp.util.seed_worker`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.seed_worker),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='worker_id',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=None
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_worker_id(self):
+        r"""Raise exception when input `worker_id` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `worker_id` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.seed_worker(worker_id=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`worker_id` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`worker_id` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_control_random(self):
+        r"""Control randomness in data loading subprocesses."""
+        msg = 'Must control randomness in data loading subprocesses.'
+
+        results = []
+        for _ in range(2):
+            lmp.util.set_seed(1)
+            data_loader = torch.utils.data.DataLoader(
+                list(range(4)),
+                batch_size=1,
+                collate_fn=_collate_fn,
+                num_workers=2,
+                worker_init_fn=lmp.util.seed_worker
+            )
+            results.append(list(data_loader))
+
+        self.assertEqual(results[0], results[1], msg=msg)
+
+        # Different subprocesses must not share the same random state.
+        self.assertNotEqual(results[0][0][1:], results[0][1][1:], msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,6 +42,7 @@ class TestUtilTrainModel(unittest.TestCase):
         examples = (
             'train_model',
             'train_model_by_config',
+            'train_model_hogwild_by_config',
         )
 
         try:
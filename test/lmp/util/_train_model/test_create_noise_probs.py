@@ -0,0 +1,95 @@
+r"""Test `lmp.util._train_model._create_noise_probs`.
+
+Usage:
+    python -m unittest test.lmp.util._train_model.test_create_noise_probs
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.config
+import lmp.tokenizer
+import lmp.util
+
+
+# pylint: disable=W0212
+class TestCreateNoiseProbs(unittest.TestCase):
+    r"""Test case for `lmp.util._train_model._create_noise_probs`."""
+
+    def setUp(self):
+        r"""Setup tokenizers with vocabulary built on test sequences."""
+        self.batch_sequences = ['abcde', 'fgh', 'ijklmno', 'pqrs'] * 5
+        self.tokenizers = [
+            lmp.tokenizer.CharDictTokenizer(),
+            lmp.tokenizer.CharListTokenizer(),
+        ]
+
+        for tokenizer in self.tokenizers:
+            tokenizer.build_vocab(self.batch_sequences)
+
+    def tearDown(self):
+        r"""Delete test sequences and tokenizers."""
+        del self.batch_sequences
+        del self.tokenizers
+
+    def test_without_negative_samples(self):
+        r"""Return `None` when sampled softmax is not used."""
+        msg = 'Must return `None` when `num_negative_samples == 0`.'
+        config = lmp.config.BaseConfig(dataset='test', experiment='test')
+
+        for tokenizer in self.tokenizers:
+            self.assertIsNone(
+                lmp.util._train_model._create_noise_probs(
+                    config=config,
+                    tokenizer=tokenizer
+                ),
+                msg=msg
+            )
+
+    def test_eos_probability(self):
+        r"""Sample `[eos]` as often as it appears in training targets."""
+        msg = 'Probability of `[eos]` must be close to `1 / avg_seq_len`.'
+
+        # Each target sequence is `t1 t2 ... tn [eos]`.
+        avg_seq_len = sum(
+            len(sequence) + 1
+            for sequence in self.batch_sequences
+        ) / len(self.batch_sequences)
+
+        config = lmp.config.BaseConfig(
+            dataset='test',
+            experiment='test',
+            num_negative_samples=1,
+            unigram_alpha=1.0
+        )
+
+        for tokenizer in self.tokenizers:
+            noise_probs = lmp.util._train_model._create_noise_probs(
+                config=config,
+                tokenizer=tokenizer
+            )
+            eos_id = tokenizer.convert_token_to_id(tokenizer.eos_token)
+
+            self.assertIsInstance(noise_probs, torch.Tensor, msg=msg)
+            self.assertLess(
+                abs(noise_probs[eos_id].item() * avg_seq_len - 1.0),
+                0.5,
+                msg=msg
+            )
+# pylint: enable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,14 +15,18 @@ import gc
 import inspect
 import math
 import os
+import tempfile
 import unittest
 
 from itertools import product
+from typing import Optional
 from typing import Union
 
 # 3rd-party modules
 
 import torch
+import torch.distributed
+import torch.multiprocessing
 
 # self-made modules
 
@@ -31,6 +35,85 @@ import lmp.tokenizer
 import lmp.util
 
 
+def _train_distributed(
+        rank: int,
+        world_size: int,
+        experiment: str,
+        result_dir: str,
+        use_adaptive_softmax: bool = False
+) -> None:
+    r"""Train tiny model on shard of dataset in one of `world_size` processes.
+
+    Trained parameters are saved into `result_dir` for comparison. When
+    `use_adaptive_softmax == True`, model has an adaptive softmax tail
+    cluster whose tokens are never targets, thus tail cluster never gets
+    gradient.
+    """
+    torch.distributed.init_process_group(
+        backend='gloo',
+        init_method=f'file://{os.path.join(result_dir, "rendezvous")}',
+        rank=rank,
+        world_size=world_size
+    )
+
+    # Use different initial parameters in each process.
+    torch.manual_seed(rank)
+
+    tokenizer = lmp.tokenizer.CharDictTokenizer()
+    tokenizer.build_vocab(['abcde'])
+    dataset = lmp.dataset.LanguageModelDataset(['abc', 'de', 'abcde'] * 4)
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=2,
+        sampler=lmp.dataset.DistributedShardSampler(
+            dataset=dataset,
+            num_replicas=world_size,
+            rank=rank,
+            seed=1
+        ),
+        collate_fn=lmp.dataset.LanguageModelDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=-1
+        )
+    )
+    vocab_size = tokenizer.vocab_size
+    adaptive_softmax_cutoffs = ()
+    if use_adaptive_softmax:
+        vocab_size += 2
+        adaptive_softmax_cutoffs = (tokenizer.vocab_size,)
+
+    model = lmp.model.BaseRNNModel(
+        d_emb=2,
+        d_hid=2,
+        dropout=0.0,
+        num_linear_layers=1,
+        num_rnn_layers=1,
+        pad_token_id=0,
+        vocab_size=vocab_size,
+        adaptive_softmax_cutoffs=adaptive_softmax_cutoffs
+    )
+    optimizer = torch.optim.SGD(params=model.parameters(), lr=1e-1)
+
+    lmp.util.train_model(
+        checkpoint=-1,
+        checkpoint_step=1,
+        data_loader=data_loader,
+        device=torch.device('cpu'),
+        epoch=2,
+        experiment=experiment,
+        max_norm=1.0,
+        model=model,
+        optimizer=optimizer,
+        vocab_size=vocab_size
+    )
+
+    torch.save(
+        model.state_dict(),
+        os.path.join(result_dir, f'rank-{rank}.pt')
+    )
+    torch.distributed.destroy_process_group()
+
+
 class TestTrainModel(unittest.TestCase):
     r"""Test case for `lmp.util.train_model`."""
 
@@ -210,6 +293,42 @@ class TestTrainModel(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=int,
                         default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefetch_batches',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='is_main_process',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=True
+                    ),
+                    inspect.Parameter(
+                        name='accumulation_steps',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                    inspect.Parameter(
+                        name='precision',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default='fp32'
+                    ),
+                    inspect.Parameter(
+                        name='num_negative_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=0
+                    ),
+                    inspect.Parameter(
+                        name='noise_probs',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Tensor],
+                        default=None
                     )
                 ],
                 return_annotation=None
@@ -608,6 +727,580 @@ class TestTrainModel(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_prefetch_batches(self):
+        r"""Raise exception when input `prefetch_batches` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`prefetch_batches` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    vocab_size=self.vocab_size,
+                    prefetch_batches=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prefetch_batches` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prefetch_batches` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_is_main_process(self):
+        r"""Raise `TypeError` when input `is_main_process` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` when input `is_main_process` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    vocab_size=self.vocab_size,
+                    is_main_process=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_main_process` must be an instance of `bool`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_accumulation_steps(self):
+        r"""Raise exception when input `accumulation_steps` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`accumulation_steps` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    vocab_size=self.vocab_size,
+                    accumulation_steps=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`accumulation_steps` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`accumulation_steps` must be bigger than or equal to '
+                    '`1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_precision(self):
+        r"""Raise exception when input `precision` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `precision` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., 'fp16', 'BF16',
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    vocab_size=self.vocab_size,
+                    precision=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`precision` must be an instance of `str`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    f'precision `{invalid_input}` does not support.\n' +
+                    'Supported options:' +
+                    '\n\t--precision fp32' +
+                    '\n\t--precision bf16',
+                    msg=msg2
+                )
+
+    def test_invalid_input_num_negative_samples(self):
+        r"""Raise exception when input `num_negative_samples` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`num_negative_samples` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    vocab_size=self.vocab_size,
+                    num_negative_samples=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_negative_samples` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_negative_samples` must be bigger than or equal to '
+                    '`0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_noise_probs(self):
+        r"""Raise exception when input `noise_probs` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `noise_probs` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, NotImplemented, ..., None,
+            torch.ones(self.vocab_size - 1), torch.ones(1, self.vocab_size),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    vocab_size=self.vocab_size,
+                    num_negative_samples=1,
+                    noise_probs=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`noise_probs` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`noise_probs` must have size `(vocab_size)` when '
+                    '`num_negative_samples > 0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_num_negative_samples_with_adaptive_softmax(self):
+        r"""Raise `ValueError` when using sampled and adaptive softmax."""
+        msg1 = (
+            'Must raise `ValueError` when `num_negative_samples > 0` and '
+            '`model` is using adaptive softmax output layer.'
+        )
+        msg2 = 'Inconsistent error message.'
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=self.vocab_size,
+            adaptive_softmax_cutoffs=(2,)
+        )
+
+        with self.assertRaises(ValueError, msg=msg1) as ctx_man:
+            lmp.util.train_model(
+                checkpoint=self.checkpoint,
+                checkpoint_step=self.checkpoint_step,
+                data_loader=self.data_loader,
+                device=self.device,
+                epoch=self.epoch,
+                experiment=self.__class__.experiment,
+                max_norm=self.max_norm,
+                model=model,
+                optimizer=torch.optim.SGD(params=model.parameters(), lr=1e-4),
+                vocab_size=self.vocab_size,
+                num_negative_samples=1,
+                noise_probs=torch.ones(self.vocab_size)
+            )
+
+        self.assertEqual(
+            ctx_man.exception.args[0],
+            '`num_negative_samples` must be `0` when `model` is using '
+            'adaptive softmax output layer.',
+            msg=msg2
+        )
+
+    def test_sampled_softmax(self):
+        r"""Train with sampled softmax when `num_negative_samples > 0`."""
+        msg = (
+            'Must train with sampled softmax when `num_negative_samples > 0`.'
+        )
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        model = lmp.model.LSTMModel(
+            d_emb=4,
+            d_hid=4,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=tokenizer.vocab_size
+        )
+        optimizer = torch.optim.SGD(params=model.parameters(), lr=1e-1)
+        params = [param.clone() for param in model.parameters()]
+        num_calls = []
+        sampled_loss = model.sampled_loss
+
+        def count_sampled_loss(**kwargs):
+            num_calls.append(kwargs['num_samples'])
+            return sampled_loss(**kwargs)
+
+        model.sampled_loss = count_sampled_loss
+
+        try:
+            lmp.util.train_model(
+                checkpoint=-1,
+                checkpoint_step=1,
+                data_loader=torch.utils.data.DataLoader(
+                    lmp.dataset.LanguageModelDataset(['abc', 'de', 'abcde']),
+                    batch_size=1,
+                    collate_fn=(
+                        lmp.dataset.LanguageModelDataset.create_collate_fn(
+                            tokenizer=tokenizer,
+                            max_seq_len=-1
+                        )
+                    )
+                ),
+                device=torch.device('cpu'),
+                epoch=1,
+                experiment=self.__class__.experiment,
+                max_norm=self.max_norm,
+                model=model,
+                optimizer=optimizer,
+                vocab_size=tokenizer.vocab_size,
+                num_negative_samples=3,
+                noise_probs=torch.tensor(tokenizer.unigram_distribution())
+            )
+
+            self.assertEqual(num_calls, [3, 3, 3], msg=msg)
+            for old_param, new_param in zip(params, model.parameters()):
+                self.assertTrue(torch.isfinite(new_param).all(), msg=msg)
+                self.assertFalse(torch.equal(old_param, new_param), msg=msg)
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_bf16_precision(self):
+        r"""Keep float32 parameters when training with bfloat16 autocast."""
+        msg = 'Must keep float32 parameters when training with bfloat16.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        model = lmp.model.LSTMModel(
+            d_emb=4,
+            d_hid=4,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=tokenizer.vocab_size
+        )
+        optimizer = torch.optim.Adam(params=model.parameters(), lr=1e-2)
+        params = [param.clone() for param in model.parameters()]
+
+        try:
+            lmp.util.train_model(
+                checkpoint=-1,
+                checkpoint_step=1,
+                data_loader=torch.utils.data.DataLoader(
+                    lmp.dataset.LanguageModelDataset(['abc', 'de', 'abcde']),
+                    batch_size=1,
+                    collate_fn=(
+                        lmp.dataset.LanguageModelDataset.create_collate_fn(
+                            tokenizer=tokenizer,
+                            max_seq_len=-1
+                        )
+                    )
+                ),
+                device=torch.device('cpu'),
+                epoch=1,
+                experiment=self.__class__.experiment,
+                max_norm=self.max_norm,
+                model=model,
+                optimizer=optimizer,
+                vocab_size=tokenizer.vocab_size,
+                precision='bf16'
+            )
+
+            for old_param, new_param in zip(params, model.parameters()):
+                self.assertEqual(new_param.dtype, torch.float32, msg=msg)
+                self.assertTrue(torch.isfinite(new_param).all(), msg=msg)
+                self.assertFalse(torch.equal(old_param, new_param), msg=msg)
+
+            for state in optimizer.state.values():
+                self.assertEqual(
+                    state['exp_avg'].dtype,
+                    torch.float32,
+                    msg=msg
+                )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_accumulate_gradients(self):
+        r"""Accumulated mini-batches update like one large mini-batch."""
+        msg = 'Accumulated mini-batches must update like one large mini-batch.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        dataset = lmp.dataset.LanguageModelDataset(['abc', 'dea', 'cbe'] * 2)
+        collate_fn = lmp.dataset.LanguageModelDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=-1
+        )
+        state_dicts = []
+
+        try:
+            for batch_size, accumulation_steps in ((3, 1), (1, 3)):
+                torch.manual_seed(1)
+                model = lmp.model.BaseRNNModel(
+                    d_emb=2,
+                    d_hid=2,
+                    dropout=0.0,
+                    num_rnn_layers=1,
+                    num_linear_layers=1,
+                    pad_token_id=0,
+                    vocab_size=tokenizer.vocab_size
+                )
+                optimizer = torch.optim.SGD(
+                    params=model.parameters(),
+                    lr=1e-1
+                )
+                lmp.util.train_model(
+                    checkpoint=-1,
+                    checkpoint_step=1,
+                    data_loader=torch.utils.data.DataLoader(
+                        dataset,
+                        batch_size=batch_size,
+                        collate_fn=collate_fn
+                    ),
+                    device=torch.device('cpu'),
+                    epoch=1,
+                    experiment=self.__class__.experiment,
+                    max_norm=1e9,
+                    model=model,
+                    optimizer=optimizer,
+                    vocab_size=tokenizer.vocab_size,
+                    accumulation_steps=accumulation_steps
+                )
+                state_dicts.append(model.state_dict())
+
+            for name, param in state_dicts[0].items():
+                self.assertTrue(
+                    torch.allclose(param, state_dicts[1][name], atol=1e-6),
+                    msg=msg
+                )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_accumulation_checkpoint_step(self):
+        r"""Count optimizer steps when accumulating gradients."""
+        msg = 'Must count optimizer steps when accumulating gradients.'
+        data_loader = torch.utils.data.DataLoader(
+            lmp.dataset.LanguageModelDataset([''] * 5),
+            batch_size=1,
+            collate_fn=lmp.dataset.LanguageModelDataset.create_collate_fn(
+                tokenizer=lmp.tokenizer.CharDictTokenizer(),
+                max_seq_len=-1
+            )
+        )
+
+        try:
+            # 5 mini-batches per epoch, accumulated into 3 updates.
+            lmp.util.train_model(
+                checkpoint=self.checkpoint,
+                checkpoint_step=1,
+                data_loader=data_loader,
+                device=self.device,
+                epoch=2,
+                experiment=self.__class__.experiment,
+                max_norm=self.max_norm,
+                model=self.model,
+                optimizer=self.optimizer,
+                vocab_size=self.vocab_size,
+                accumulation_steps=2
+            )
+
+            self.assertEqual(
+                sorted(os.listdir(self.__class__.test_dir)),
+                sorted(
+                    f'{prefix}-{step}.pt'
+                    for prefix in ('model', 'optimizer')
+                    for step in range(1, 7)
+                ),
+                msg=msg
+            )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_not_main_process(self):
+        r"""Do not save checkpoint when `is_main_process=False`."""
+        msg = 'Must not save checkpoint when `is_main_process=False`.'
+
+        try:
+            lmp.util.train_model(
+                checkpoint=self.checkpoint,
+                checkpoint_step=self.checkpoint_step,
+                data_loader=torch.utils.data.DataLoader(
+                    lmp.dataset.LanguageModelDataset([''] * 4),
+                    batch_size=1,
+                    collate_fn=(
+                        lmp.dataset.LanguageModelDataset.create_collate_fn(
+                            tokenizer=lmp.tokenizer.CharDictTokenizer(),
+                            max_seq_len=-1
+                        )
+                    )
+                ),
+                device=self.device,
+                epoch=self.epoch,
+                experiment=self.__class__.experiment,
+                max_norm=self.max_norm,
+                model=self.model,
+                optimizer=self.optimizer,
+                vocab_size=self.vocab_size,
+                is_main_process=False
+            )
+
+            self.assertEqual(os.listdir(self.__class__.test_dir), [], msg=msg)
+            self.assertEqual(
+                os.listdir(self.__class__.test_log_dir),
+                [],
+                msg=msg
+            )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
     def test_save_checkpoint(self):
         r"""Save checkpoint at each `checkpoint_step`."""
         msg = 'Must save checkpoint at each `checkpoint_step`.'
@@ -681,6 +1374,84 @@ class TestTrainModel(unittest.TestCase):
                 for log in os.listdir(self.__class__.test_log_dir):
                     os.remove(os.path.join(self.__class__.test_log_dir, log))
 
+    def test_distributed(self):
+        r"""Synchronize parameters and only save checkpoint on rank 0."""
+        msg = 'Must synchronize parameters and only save checkpoint on rank 0.'
+        world_size = 2
+
+        try:
+            with tempfile.TemporaryDirectory() as result_dir:
+                torch.multiprocessing.spawn(
+                    _train_distributed,
+                    args=(world_size, self.__class__.experiment, result_dir),
+                    nprocs=world_size
+                )
+
+                state_dicts = [
+                    torch.load(os.path.join(result_dir, f'rank-{rank}.pt'))
+                    for rank in range(world_size)
+                ]
+
+            for name, param in state_dicts[0].items():
+                self.assertTrue(
+                    torch.equal(param, state_dicts[1][name]),
+                    msg=msg
+                )
+
+            # 12 samples, 6 samples per process, 3 steps per epoch.
+            self.assertEqual(
+                sorted(os.listdir(self.__class__.test_dir)),
+                sorted(
+                    f'{prefix}-{step}.pt'
+                    for prefix in ('model', 'optimizer')
+                    for step in range(1, 7)
+                ),
+                msg=msg
+            )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_distributed_adaptive_softmax(self):
+        r"""Train adaptive softmax when tail cluster gets no gradient."""
+        msg = (
+            'Must train adaptive softmax when tail cluster gets no gradient.'
+        )
+        world_size = 2
+
+        try:
+            with tempfile.TemporaryDirectory() as result_dir:
+                torch.multiprocessing.spawn(
+                    _train_distributed,
+                    args=(
+                        world_size,
+                        self.__class__.experiment,
+                        result_dir,
+                        True,
+                    ),
+                    nprocs=world_size
+                )
+
+                state_dicts = [
+                    torch.load(os.path.join(result_dir, f'rank-{rank}.pt'))
+                    for rank in range(world_size)
+                ]
+
+            for name, param in state_dicts[0].items():
+                self.assertTrue(
+                    torch.equal(param, state_dicts[1][name]),
+                    msg=msg
+                )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
     def test_log_loss(self):
         r"""Log loss."""
         msg = 'Must log loss.'
@@ -827,6 +1598,95 @@ class TestTrainModel(unittest.TestCase):
                 for log in os.listdir(self.__class__.test_log_dir):
                     os.remove(os.path.join(self.__class__.test_log_dir, log))
 
+    def test_keep_training_skip_batches(self):
+        r"""Skip mini-batches trained before `checkpoint` without loading."""
+        msg = 'Must skip mini-batches trained before `checkpoint`.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abcde'])
+        dataset = lmp.dataset.LanguageModelDataset(['a', 'b', 'c', 'd', 'e'])
+        collate_fn = lmp.dataset.LanguageModelDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=-1
+        )
+
+        for is_resumable, prefetch_batches in product(
+                (False, True),
+                (0, 1)
+        ):
+            loaded_batches = []
+
+            def record_collate_fn(batch_sequences):
+                loaded_batches.append(batch_sequences)
+                return collate_fn(batch_sequences)
+
+            batch_sampler = torch.utils.data.BatchSampler(
+                torch.utils.data.SequentialSampler(dataset),
+                batch_size=1,
+                drop_last=False
+            )
+            if is_resumable:
+                batch_sampler = lmp.dataset.ResumableBatchSampler(
+                    batch_sampler
+                )
+
+            model = lmp.model.BaseRNNModel(
+                d_emb=1,
+                d_hid=1,
+                dropout=0.0,
+                num_rnn_layers=1,
+                num_linear_layers=1,
+                pad_token_id=0,
+                vocab_size=tokenizer.vocab_size
+            )
+
+            try:
+                # 5 mini-batches per epoch, accumulated into 3 updates. Skip
+                # all updates of first epoch and first update of second epoch.
+                lmp.util.train_model(
+                    checkpoint=5,
+                    checkpoint_step=1,
+                    data_loader=torch.utils.data.DataLoader(
+                        dataset,
+                        batch_sampler=batch_sampler,
+                        collate_fn=record_collate_fn
+                    ),
+                    device=self.device,
+                    epoch=2,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=model,
+                    optimizer=torch.optim.SGD(
+                        params=model.parameters(),
+                        lr=1e-4
+                    ),
+                    vocab_size=tokenizer.vocab_size,
+                    prefetch_batches=prefetch_batches,
+                    accumulation_steps=2
+                )
+
+                self.assertEqual(
+                    sorted(os.listdir(self.__class__.test_dir)),
+                    sorted(
+                        f'{prefix}-{step}.pt'
+                        for prefix in ('model', 'optimizer')
+                        for step in (5, 6)
+                    ),
+                    msg=msg
+                )
+
+                if is_resumable:
+                    self.assertEqual(
+                        loaded_batches,
+                        [['c'], ['d'], ['e']],
+                        msg=msg
+                    )
+            finally:
+                # Clean up test file.
+                for ckpt in os.listdir(self.__class__.test_dir):
+                    os.remove(os.path.join(self.__class__.test_dir, ckpt))
+                for log in os.listdir(self.__class__.test_log_dir):
+                    os.remove(os.path.join(self.__class__.test_log_dir, log))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,398 @@
+r"""Test `lmp.util.train_model_hogwild_by_config.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._train_model.test_train_model_hogwild_by_config
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import os
+import unittest
+
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.config
+import lmp.dataset
+import lmp.model
+import lmp.path
+import lmp.tokenizer
+import lmp.util
+
+
+class TestTrainModelHogwildByConfig(unittest.TestCase):
+    r"""Test case for `lmp.util.train_model_hogwild_by_config`."""
+
+    @classmethod
+    def setUpClass(cls):
+        r"""Create test directory."""
+        cls.dataset = 'I-AM-A-TEST-DATASET'
+        cls.experiment = 'I-AM-A-TEST-FOLDER'
+        cls.test_dir = os.path.join(lmp.path.DATA_PATH, cls.experiment)
+        cls.test_log_dir = os.path.join(
+            lmp.path.DATA_PATH,
+            'log',
+            cls.experiment
+        )
+        os.makedirs(cls.test_dir)
+        os.makedirs(cls.test_log_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        r"""Remove test directory."""
+        os.removedirs(cls.test_dir)
+        os.removedirs(cls.test_log_dir)
+        del cls.dataset
+        del cls.experiment
+        del cls.test_dir
+        del cls.test_log_dir
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.checkpoint = -1
+        self.config = lmp.config.BaseConfig(
+            batch_size=1,
+            checkpoint_step=1,
+            dataset=self.__class__.dataset,
+            epoch=1,
+            experiment=self.__class__.experiment,
+            learning_rate=1e-1,
+            model_class='rnn',
+            optimizer_class='sgd',
+            tokenizer_class='char_dict'
+        )
+        self.dataset = lmp.dataset.LanguageModelDataset(
+            ['abc', 'de', 'abcde', 'cba']
+        )
+        self.num_processes = 2
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcde'])
+        torch.manual_seed(1)
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=4,
+            d_hid=4,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.checkpoint
+        del self.config
+        del self.dataset
+        del self.model
+        del self.num_processes
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.train_model_hogwild_by_config),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='checkpoint',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='config',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.config.BaseConfig,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.LanguageModelDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_processes',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    )
+                ],
+                return_annotation=None
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_checkpoint(self):
+        r"""Raise exception when input `checkpoint` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `checkpoint` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j, '',
+            b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model_hogwild_by_config(
+                    checkpoint=invalid_input,
+                    config=self.config,
+                    dataset=self.dataset,
+                    model=self.model,
+                    num_processes=self.num_processes,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`checkpoint` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`checkpoint` must be bigger than or equal to `-1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_config(self):
+        r"""Raise `TypeError` when input `config` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `config` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.train_model_hogwild_by_config(
+                    checkpoint=self.checkpoint,
+                    config=invalid_input,
+                    dataset=self.dataset,
+                    model=self.model,
+                    num_processes=self.num_processes,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`config` must be an instance of `lmp.config.BaseConfig`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.train_model_hogwild_by_config(
+                    checkpoint=self.checkpoint,
+                    config=self.config,
+                    dataset=invalid_input,
+                    model=self.model,
+                    num_processes=self.num_processes,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of '
+                '`lmp.dataset.LanguageModelDataset`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.train_model_hogwild_by_config(
+                    checkpoint=self.checkpoint,
+                    config=self.config,
+                    dataset=self.dataset,
+                    model=invalid_input,
+                    num_processes=self.num_processes,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_num_processes(self):
+        r"""Raise exception when input `num_processes` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`num_processes` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model_hogwild_by_config(
+                    checkpoint=self.checkpoint,
+                    config=self.config,
+                    dataset=self.dataset,
+                    model=self.model,
+                    num_processes=invalid_input,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_processes` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_processes` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.train_model_hogwild_by_config(
+                    checkpoint=self.checkpoint,
+                    config=self.config,
+                    dataset=self.dataset,
+                    model=self.model,
+                    num_processes=self.num_processes,
+                    tokenizer=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_update_shared_model(self):
+        r"""Update shared parameters and only save checkpoint on rank 0."""
+        msg = (
+            'Must update shared parameters and only save checkpoint on rank 0.'
+        )
+        params = [param.clone() for param in self.model.parameters()]
+
+        try:
+            lmp.util.train_model_hogwild_by_config(
+                checkpoint=self.checkpoint,
+                config=self.config,
+                dataset=self.dataset,
+                model=self.model,
+                num_processes=self.num_processes,
+                tokenizer=self.tokenizer
+            )
+
+            # Updates made by subprocesses are visible to parent process.
+            self.assertTrue(
+                any(
+                    not torch.equal(old_param, new_param)
+                    for old_param, new_param in zip(
+                        params,
+                        self.model.parameters()
+                    )
+                ),
+                msg=msg
+            )
+
+            # 4 samples, 2 samples per process, 2 steps in rank 0.
+            self.assertEqual(
+                sorted(os.listdir(self.__class__.test_dir)),
+                sorted(
+                    f'{prefix}-{step}.pt'
+                    for prefix in ('model', 'optimizer')
+                    for step in range(1, 3)
+                ),
+                msg=msg
+            )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+
+if __name__ == '__main__':
+    unittest.main()